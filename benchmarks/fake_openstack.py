@@ -0,0 +1,1290 @@
+#!/usr/bin/env python3
+"""
+Fake OpenStack API Server
+
+Self-contained stand-in for Keystone, Nova, Neutron, Cinder, Glance, Placement,
+Heat and Octavia that serves a deterministic synthetic dataset of configurable
+size, so tool performance can be measured without a real cloud. Each service
+listens on its own port (like the MCP server's OS_*_PORT settings); the
+Keystone catalog points Octavia at its port.
+
+Latency and error rates can be injected globally or per service. Every port
+also serves GET /__fake__/stats (request counts per method and path template)
+and POST /__fake__/stats/reset.
+
+Usage:
+    python benchmarks/fake_openstack.py --servers 10000 --ports 50000 \\
+        --latency-ms 20 --jitter-ms 10 --error-rate 0.01 --port-base 15000
+
+    # then point the MCP server at it (printed at startup):
+    OS_AUTH_HOST=127.0.0.1 OS_AUTH_PORT=15000 OS_COMPUTE_PORT=15001 ...
+
+Only the read APIs used by the MCP tools are implemented; list endpoints
+support the filters, pagination (limit / marker, links) and field selection
+the OpenStack SDK relies on.
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+SERVICES = ('identity', 'compute', 'network', 'volume', 'image', 'placement', 'orchestration', 'load-balancer')
+
+# Environment variables of the MCP server for each service port
+PORT_ENV = {
+    'identity': 'OS_AUTH_PORT',
+    'compute': 'OS_COMPUTE_PORT',
+    'network': 'OS_NETWORK_PORT',
+    'volume': 'OS_VOLUME_PORT',
+    'image': 'OS_IMAGE_PORT',
+    'placement': 'OS_PLACEMENT_PORT',
+    'orchestration': 'OS_HEAT_STACK_PORT',
+}
+
+# Catalog service type -> (service name, version path)
+CATALOG = {
+    'identity': ('keystone', ''),
+    'compute': ('nova', '/v2.1'),
+    'network': ('neutron', ''),
+    'volumev3': ('cinderv3', '/v3'),
+    'block-storage': ('cinder', '/v3'),
+    'image': ('glance', ''),
+    'placement': ('placement', ''),
+    'orchestration': ('heat', '/v1'),
+    'load-balancer': ('octavia', ''),
+}
+
+PROJECT_ID = 'b0a7f1a2c3d44e5f8a9b0c1d2e3f4a5b'
+PROJECT_NAME = 'bench'
+USER_ID = '9f8e7d6c5b4a49382716051a2b3c4d5e'
+DOMAIN_ID = 'default'
+
+# Default page size of paginated list APIs when no limit is given
+MAX_LIMIT = {'compute': 1000, 'volume': 1000, 'image': 25, 'load-balancer': 1000}
+
+_ID_SEGMENT = re.compile(r"^([0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}"
+                         r"|[0-9a-fA-F]{32}|\d+|req-[0-9a-f-]+)$")
+_VERSION_SEGMENT = re.compile(r"^v\d+(\.\d+)?$")
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+class Dataset:
+    """Deterministic synthetic cloud inventory."""
+
+    def __init__(self, servers: int, ports: int, networks: int, volumes: int, images: int,
+                 hypervisors: int, load_balancers: int, stacks: int, seed: int = 42):
+        rng = random.Random(seed)
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.collections: Dict[str, List[Dict[str, Any]]] = {}
+
+        self.flavors = []
+        for index, (vcpus, ram, disk) in enumerate([(1, 512, 1), (1, 2048, 20), (2, 4096, 40), (4, 8192, 80),
+                                                    (8, 16384, 160), (16, 32768, 320), (2, 8192, 40),
+                                                    (4, 16384, 80)]):
+            self.flavors.append({
+                'id': f'{index + 1}', 'name': ['m1.tiny', 'm1.small', 'm1.medium', 'm1.large', 'm1.xlarge',
+                                               'm1.2xlarge', 'r1.medium', 'r1.large'][index],
+                'vcpus': vcpus, 'ram': ram, 'disk': disk, 'OS-FLV-EXT-DATA:ephemeral': 0, 'swap': '',
+                'os-flavor-access:is_public': True, 'rxtx_factor': 1.0, 'OS-FLV-DISABLED:disabled': False,
+                'description': None, 'extra_specs': {}, 'links': [],
+            })
+
+        self.images = [{
+            'id': _uuid(rng), 'name': f'image-{i:04d}', 'status': 'active', 'visibility': 'public',
+            'disk_format': 'qcow2', 'container_format': 'bare', 'size': rng.randint(300, 4000) * 2 ** 20,
+            'min_disk': 0, 'min_ram': 0, 'owner': PROJECT_ID, 'protected': False, 'tags': [],
+            'created_at': _iso(now - timedelta(days=rng.randint(1, 900))), 'updated_at': _iso(now),
+            'os_hidden': False, 'checksum': f'{rng.getrandbits(128):032x}', 'file': '', 'schema': '/v2/schemas/image',
+        } for i in range(images)]
+
+        zones = ['nova', 'az-2', 'az-3']
+        self.hypervisors = []
+        self.resource_providers = []
+        for i in range(hypervisors):
+            hostname = f'compute-{i:04d}.cloud.local'
+            hypervisor_id = _uuid(rng)
+            self.hypervisors.append({
+                'id': hypervisor_id, 'hypervisor_hostname': hostname, 'state': 'up', 'status': 'enabled',
+                'hypervisor_type': 'QEMU', 'hypervisor_version': 8002000, 'host_ip': f'10.0.{i // 250}.{i % 250 + 1}',
+                'service': {'host': hostname.split('.')[0], 'id': _uuid(rng), 'disabled_reason': None},
+                'vcpus': 64, 'memory_mb': 262144, 'local_gb': 2000, 'vcpus_used': 0, 'memory_mb_used': 0,
+                'local_gb_used': 0, 'running_vms': 0, 'free_ram_mb': 262144, 'free_disk_gb': 2000,
+                'current_workload': 0, 'disk_available_least': 2000, 'cpu_info': '{}',
+            })
+            self.resource_providers.append({
+                'uuid': hypervisor_id, 'name': hostname, 'generation': 1, 'parent_provider_uuid': None,
+                'root_provider_uuid': hypervisor_id, 'links': [],
+            })
+        self.aggregates = [{
+            'id': index + 1, 'name': f'agg-{zone}', 'availability_zone': zone, 'uuid': _uuid(rng),
+            'hosts': [h['service']['host'] for j, h in enumerate(self.hypervisors) if j % len(zones) == index],
+            'metadata': {'availability_zone': zone}, 'created_at': _iso(now), 'deleted': False,
+        } for index, zone in enumerate(zones)]
+
+        self.networks, self.subnets = [], []
+        for i in range(networks):
+            network_id, subnet_id = _uuid(rng), _uuid(rng)
+            external = i == 0
+            self.networks.append({
+                'id': network_id, 'name': 'public' if external else f'net-{i:04d}', 'status': 'ACTIVE',
+                'admin_state_up': True, 'shared': external, 'router:external': external, 'mtu': 1450,
+                'subnets': [subnet_id], 'project_id': PROJECT_ID, 'tenant_id': PROJECT_ID,
+                'provider:network_type': 'flat' if external else 'vxlan', 'provider:physical_network': None,
+                'provider:segmentation_id': None if external else 1000 + i, 'availability_zones': ['nova'],
+                'port_security_enabled': True, 'description': '', 'tags': [], 'is_default': external,
+                'created_at': _iso(now), 'updated_at': _iso(now), 'revision_number': 1,
+            })
+            self.subnets.append({
+                'id': subnet_id, 'name': f'subnet-{i:04d}', 'network_id': network_id, 'ip_version': 4,
+                'cidr': f'10.{i // 256}.{i % 256}.0/24' if not external else '203.0.113.0/24',
+                'gateway_ip': f'10.{i // 256}.{i % 256}.1' if not external else '203.0.113.1',
+                'enable_dhcp': not external, 'dns_nameservers': [], 'host_routes': [],
+                'allocation_pools': [], 'project_id': PROJECT_ID, 'tenant_id': PROJECT_ID,
+                'description': '', 'tags': [], 'created_at': _iso(now), 'updated_at': _iso(now),
+            })
+
+        self.security_groups, self.security_group_rules = [], []
+        for i in range(max(1, networks // 2)):
+            group_id = _uuid(rng)
+            rules = []
+            for j in range(5):
+                rule = {
+                    'id': _uuid(rng), 'security_group_id': group_id, 'direction': 'ingress' if j else 'egress',
+                    'ethertype': 'IPv4', 'protocol': 'tcp' if j else None, 'port_range_min': 20 + j if j else None,
+                    'port_range_max': 20 + j if j else None, 'remote_ip_prefix': '0.0.0.0/0',
+                    'remote_group_id': None, 'project_id': PROJECT_ID, 'tenant_id': PROJECT_ID,
+                    'description': '', 'created_at': _iso(now), 'updated_at': _iso(now),
+                }
+                rules.append(rule)
+            self.security_group_rules.extend(rules)
+            self.security_groups.append({
+                'id': group_id, 'name': 'default' if i == 0 else f'sg-{i:03d}', 'description': '',
+                'project_id': PROJECT_ID, 'tenant_id': PROJECT_ID, 'security_group_rules': rules,
+                'stateful': True, 'tags': [], 'created_at': _iso(now), 'updated_at': _iso(now),
+            })
+
+        statuses = ['ACTIVE'] * 17 + ['SHUTOFF', 'ERROR', 'BUILD']
+        self.servers, self.ports, self.volumes, self.instance_actions = [], [], [], {}
+        volume_index = 0
+        for i in range(servers):
+            server_id = _uuid(rng)
+            flavor = self.flavors[rng.randrange(len(self.flavors))]
+            network = self.networks[1 + rng.randrange(max(1, networks - 1))] if networks > 1 else self.networks[0]
+            subnet = self.subnets[self.networks.index(network)]
+            hypervisor = self.hypervisors[rng.randrange(len(self.hypervisors))] if self.hypervisors else None
+            status = statuses[rng.randrange(len(statuses))]
+            created = now - timedelta(days=rng.randint(1, 400), minutes=rng.randint(0, 1440))
+            ip = f"{subnet['cidr'].rsplit('.', 1)[0]}.{i % 250 + 2}"
+            mac = 'fa:16:3e:%02x:%02x:%02x' % (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            port_id = _uuid(rng)
+            self.ports.append(self._port(port_id, '', network, subnet, ip, mac, server_id, 'compute:nova',
+                                         hypervisor, now))
+
+            attached = []
+            if volume_index < volumes and rng.random() < 0.5:
+                attached.append(self._volume(rng, volume_index, now, server_id, hypervisor))
+                volume_index += 1
+            self.volumes.extend(attached)
+
+            if hypervisor is not None and status == 'ACTIVE':
+                hypervisor['vcpus_used'] += flavor['vcpus']
+                hypervisor['memory_mb_used'] += flavor['ram']
+                hypervisor['local_gb_used'] += flavor['disk']
+                hypervisor['running_vms'] += 1
+
+            self.servers.append({
+                'id': server_id, 'name': f'server-{i:05d}', 'status': status, 'tenant_id': PROJECT_ID,
+                'user_id': USER_ID, 'metadata': {}, 'hostId': f'{rng.getrandbits(224):056x}',
+                'image': {'id': self.images[rng.randrange(len(self.images))]['id'], 'links': []} if self.images else '',
+                'flavor': {'vcpus': flavor['vcpus'], 'ram': flavor['ram'], 'disk': flavor['disk'], 'ephemeral': 0,
+                           'swap': 0, 'original_name': flavor['name'], 'extra_specs': {}},
+                'created': _iso(created), 'updated': _iso(created), 'progress': 0,
+                'addresses': {network['name']: [{'version': 4, 'addr': ip, 'OS-EXT-IPS:type': 'fixed',
+                                                 'OS-EXT-IPS-MAC:mac_addr': mac}]},
+                'accessIPv4': '', 'accessIPv6': '', 'links': [], 'OS-DCF:diskConfig': 'MANUAL',
+                'OS-EXT-AZ:availability_zone': zones[self.hypervisors.index(hypervisor) % len(zones)] if hypervisor else 'nova',
+                'config_drive': '', 'key_name': f'key-{i % 10}', 'OS-SRV-USG:launched_at': _iso(created),
+                'OS-SRV-USG:terminated_at': None,
+                'OS-EXT-SRV-ATTR:host': hypervisor['service']['host'] if hypervisor else None,
+                'OS-EXT-SRV-ATTR:hypervisor_hostname': hypervisor['hypervisor_hostname'] if hypervisor else None,
+                'OS-EXT-SRV-ATTR:instance_name': f'instance-{i:08x}',
+                'OS-EXT-STS:task_state': None, 'OS-EXT-STS:vm_state': status.lower().replace('shutoff', 'stopped'),
+                'OS-EXT-STS:power_state': 1 if status == 'ACTIVE' else 4,
+                'os-extended-volumes:volumes_attached': [{'id': v['id'], 'delete_on_termination': False}
+                                                         for v in attached],
+                'security_groups': [{'name': 'default'}], 'locked': False, 'description': None, 'tags': [],
+                'trusted_image_certificates': None, 'server_groups': [],
+            })
+            self.instance_actions[server_id] = [{
+                'action': 'create', 'instance_uuid': server_id, 'request_id': f'req-{_uuid(rng)}',
+                'user_id': USER_ID, 'project_id': PROJECT_ID, 'start_time': _iso(created),
+                'updated_at': _iso(created), 'message': None,
+            }]
+
+        while volume_index < volumes:
+            self.volumes.append(self._volume(rng, volume_index, now, None, None))
+            volume_index += 1
+
+        # Routers with one interface port per attached network
+        self.routers = []
+        router_count = max(1, networks // 4)
+        for i in range(router_count):
+            router_id = _uuid(rng)
+            self.routers.append({
+                'id': router_id, 'name': f'router-{i:03d}', 'status': 'ACTIVE', 'admin_state_up': True,
+                'project_id': PROJECT_ID, 'tenant_id': PROJECT_ID, 'routes': [], 'distributed': False,
+                'ha': False, 'availability_zones': ['nova'], 'description': '', 'tags': [],
+                'external_gateway_info': {'network_id': self.networks[0]['id'], 'enable_snat': True,
+                                          'external_fixed_ips': []},
+                'created_at': _iso(now), 'updated_at': _iso(now),
+            })
+            for network_index in range(1 + i, networks, router_count):
+                network, subnet = self.networks[network_index], self.subnets[network_index]
+                self.ports.append(self._port(_uuid(rng), '', network, subnet, subnet['gateway_ip'],
+                                             'fa:16:3e:00:00:%02x' % (i % 256), router_id,
+                                             'network:router_interface', None, now))
+
+        # Floating IPs, associated with the first compute ports
+        self.floating_ips = []
+        for i in range(min(1000, max(1, servers // 10))):
+            port = self.ports[i] if i % 2 == 0 and i < len(self.ports) else None
+            self.floating_ips.append({
+                'id': _uuid(rng), 'floating_ip_address': f'203.0.113.{i % 250 + 2}',
+                'floating_network_id': self.networks[0]['id'], 'router_id': self.routers[0]['id'] if port else None,
+                'port_id': port['id'] if port else None,
+                'fixed_ip_address': port['fixed_ips'][0]['ip_address'] if port else None,
+                'status': 'ACTIVE' if port else 'DOWN', 'project_id': PROJECT_ID, 'tenant_id': PROJECT_ID,
+                'description': '', 'tags': [], 'port_details': None, 'dns_domain': '', 'dns_name': '',
+                'created_at': _iso(now), 'updated_at': _iso(now),
+            })
+
+        # Remaining ports: DHCP and unbound ports spread over the networks
+        while len(self.ports) < ports:
+            i = len(self.ports)
+            network_index = i % len(self.networks)
+            network, subnet = self.networks[network_index], self.subnets[network_index]
+            owner = 'network:dhcp' if i % 3 == 0 else ''
+            self.ports.append(self._port(_uuid(rng), f'port-{i:05d}', network, subnet,
+                                         f"{subnet['cidr'].rsplit('.', 1)[0]}.{200 + i % 50}",
+                                         'fa:16:3e:%02x:%02x:%02x' % (i >> 16 & 255, i >> 8 & 255, i & 255),
+                                         f'dhcp-{network["id"]}' if owner else '', owner, None, now))
+
+        self.snapshots = [{
+            'id': _uuid(rng), 'name': f'snap-{i:04d}', 'status': 'available', 'size': volume['size'],
+            'volume_id': volume['id'], 'created_at': _iso(now), 'updated_at': _iso(now), 'description': '',
+            'metadata': {}, 'os-extended-snapshot-attributes:project_id': PROJECT_ID,
+            'os-extended-snapshot-attributes:progress': '100%',
+        } for i, volume in enumerate(self.volumes[:max(1, volumes // 5)])]
+
+        self.volume_types = [{'id': _uuid(rng), 'name': name, 'description': '', 'is_public': True,
+                              'extra_specs': {}, 'os-volume-type-access:is_public': True}
+                             for name in ('__DEFAULT__', 'ssd', 'hdd')]
+
+        self.server_groups = [{
+            'id': _uuid(rng), 'name': f'group-{i:02d}', 'policy': 'anti-affinity', 'rules': {},
+            'members': [s['id'] for s in self.servers[i::max(1, len(self.servers) // 3 or 1)][:3]],
+            'project_id': PROJECT_ID, 'user_id': USER_ID,
+        } for i in range(10)]
+
+        self.keypairs = [{'keypair': {'name': f'key-{i}', 'type': 'ssh', 'fingerprint': f'{i:02x}:' * 15 + '00',
+                                      'public_key': 'ssh-ed25519 AAAA fake'}} for i in range(10)]
+
+        self.load_balancers, self.listeners, self.pools, self.members, self.health_monitors = [], [], [], [], []
+        for i in range(load_balancers):
+            lb_id = _uuid(rng)
+            listeners, pools = [], []
+            for j in range(2):
+                pool_id, listener_id, monitor_id = _uuid(rng), _uuid(rng), _uuid(rng)
+                members = [{
+                    'id': _uuid(rng), 'name': f'member-{k}', 'address': f'10.1.{i % 256}.{k + 10}',
+                    'protocol_port': 80, 'weight': 1, 'admin_state_up': True, 'subnet_id': self.subnets[-1]['id'],
+                    'provisioning_status': 'ACTIVE', 'operating_status': 'ONLINE', 'project_id': PROJECT_ID,
+                    'backup': False, 'monitor_address': None, 'monitor_port': None, 'tags': [],
+                    'created_at': _iso(now), 'updated_at': _iso(now), 'pool_id': pool_id,
+                } for k in range(3)]
+                self.members.extend(members)
+                self.health_monitors.append({
+                    'id': monitor_id, 'name': f'hm-{i}-{j}', 'type': 'HTTP', 'delay': 5, 'timeout': 3,
+                    'max_retries': 3, 'max_retries_down': 3, 'http_method': 'GET', 'url_path': '/',
+                    'expected_codes': '200', 'admin_state_up': True, 'pools': [{'id': pool_id}],
+                    'provisioning_status': 'ACTIVE', 'operating_status': 'ONLINE', 'project_id': PROJECT_ID,
+                    'tags': [], 'created_at': _iso(now), 'updated_at': _iso(now),
+                })
+                self.pools.append({
+                    'id': pool_id, 'name': f'pool-{i}-{j}', 'protocol': 'HTTP', 'lb_algorithm': 'ROUND_ROBIN',
+                    'admin_state_up': True, 'listeners': [{'id': listener_id}], 'loadbalancers': [{'id': lb_id}],
+                    'members': [{'id': m['id']} for m in members], 'healthmonitor_id': monitor_id,
+                    'provisioning_status': 'ACTIVE', 'operating_status': 'ONLINE', 'project_id': PROJECT_ID,
+                    'session_persistence': None, 'tags': [], 'created_at': _iso(now), 'updated_at': _iso(now),
+                })
+                self.listeners.append({
+                    'id': listener_id, 'name': f'listener-{i}-{j}', 'protocol': 'HTTP', 'protocol_port': 80 + j,
+                    'admin_state_up': True, 'default_pool_id': pool_id, 'loadbalancers': [{'id': lb_id}],
+                    'connection_limit': -1, 'provisioning_status': 'ACTIVE', 'operating_status': 'ONLINE',
+                    'project_id': PROJECT_ID, 'l7policies': [], 'tags': [],
+                    'created_at': _iso(now), 'updated_at': _iso(now),
+                })
+                listeners.append({'id': listener_id})
+                pools.append({'id': pool_id})
+            self.load_balancers.append({
+                'id': lb_id, 'name': f'lb-{i:03d}', 'vip_address': f'10.2.{i // 250}.{i % 250 + 1}',
+                'vip_port_id': _uuid(rng), 'vip_subnet_id': self.subnets[-1]['id'],
+                'vip_network_id': self.networks[-1]['id'], 'provisioning_status': 'ACTIVE',
+                'operating_status': 'ONLINE', 'admin_state_up': True, 'project_id': PROJECT_ID,
+                'provider': 'amphora', 'flavor_id': None, 'availability_zone': None,
+                'listeners': listeners, 'pools': pools, 'description': '', 'tags': [],
+                'created_at': _iso(now), 'updated_at': _iso(now),
+            })
+
+        self.stacks = [{
+            'id': _uuid(rng), 'stack_name': f'stack-{i:03d}', 'stack_status': 'CREATE_COMPLETE',
+            'stack_status_reason': 'Stack CREATE completed successfully', 'description': '',
+            'creation_time': _iso(now), 'updated_time': None, 'deletion_time': None, 'project': PROJECT_ID,
+            'stack_owner': None, 'parent': None, 'tags': None, 'links': [],
+        } for i in range(stacks)]
+
+        self.projects = [{'id': PROJECT_ID, 'name': PROJECT_NAME, 'domain_id': DOMAIN_ID, 'enabled': True,
+                          'description': 'Benchmark project', 'is_domain': False, 'parent_id': DOMAIN_ID,
+                          'tags': [], 'options': {}, 'links': {}}]
+        self.projects += [{'id': f'{rng.getrandbits(128):032x}', 'name': f'project-{i:03d}', 'domain_id': DOMAIN_ID,
+                           'enabled': True, 'description': '', 'is_domain': False, 'parent_id': DOMAIN_ID,
+                           'tags': [], 'options': {}, 'links': {}} for i in range(20)]
+        # (service, project ID) -> quota limits set through PUT
+        self.quota_overrides: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self.users = [{'id': USER_ID, 'name': 'admin', 'domain_id': DOMAIN_ID, 'enabled': True,
+                       'email': None, 'password_expires_at': None, 'options': {}, 'links': {}}]
+        self.roles = [{'id': f'{i:032x}', 'name': name, 'domain_id': None, 'links': {}}
+                      for i, name in enumerate(('admin', 'member', 'reader'), start=1)]
+
+        self.by_id: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for name in ('servers', 'flavors', 'images', 'networks', 'subnets', 'ports', 'routers', 'floating_ips',
+                     'security_groups', 'security_group_rules', 'volumes', 'snapshots', 'hypervisors',
+                     'load_balancers', 'listeners', 'pools', 'members', 'health_monitors', 'stacks',
+                     'server_groups', 'projects', 'users', 'volume_types'):
+            self.by_id[name] = {item['id']: item for item in getattr(self, name)}
+        self.by_id['resource_providers'] = {p['uuid']: p for p in self.resource_providers}
+
+    @staticmethod
+    def _port(port_id: str, name: str, network, subnet, ip: str, mac: str, device_id: str, owner: str,
+              hypervisor, now: datetime) -> Dict[str, Any]:
+        return {
+            'id': port_id, 'name': name, 'network_id': network['id'], 'mac_address': mac,
+            'fixed_ips': [{'subnet_id': subnet['id'], 'ip_address': ip}], 'device_id': device_id,
+            'device_owner': owner, 'status': 'ACTIVE' if device_id else 'DOWN', 'admin_state_up': True,
+            'project_id': PROJECT_ID, 'tenant_id': PROJECT_ID, 'security_groups': [],
+            'binding:host_id': hypervisor['service']['host'] if hypervisor else '',
+            'binding:vif_type': 'ovs' if device_id else 'unbound', 'binding:vnic_type': 'normal',
+            'allowed_address_pairs': [], 'extra_dhcp_opts': [], 'port_security_enabled': True,
+            'description': '', 'tags': [], 'created_at': _iso(now), 'updated_at': _iso(now), 'revision_number': 1,
+        }
+
+    def _volume(self, rng: random.Random, index: int, now: datetime, server_id: Optional[str],
+                hypervisor) -> Dict[str, Any]:
+        volume_id = _uuid(rng)
+        attachments = []
+        if server_id:
+            attachments.append({
+                'id': volume_id, 'attachment_id': _uuid(rng), 'volume_id': volume_id, 'server_id': server_id,
+                'host_name': hypervisor['service']['host'] if hypervisor else None, 'device': '/dev/vdb',
+                'attached_at': _iso(now),
+            })
+        return {
+            'id': volume_id, 'name': f'volume-{index:05d}', 'status': 'in-use' if server_id else 'available',
+            'size': rng.choice((10, 20, 50, 100, 500)), 'volume_type': rng.choice(('ssd', 'hdd')),
+            'availability_zone': 'nova', 'bootable': 'false', 'encrypted': False, 'multiattach': False,
+            'attachments': attachments, 'metadata': {}, 'description': None, 'snapshot_id': None,
+            'source_volid': None, 'user_id': USER_ID, 'os-vol-tenant-attr:tenant_id': PROJECT_ID,
+            'os-vol-host-attr:host': 'cinder@lvm#lvm', 'replication_status': None, 'consistencygroup_id': None,
+            'created_at': _iso(now - timedelta(days=rng.randint(1, 300))), 'updated_at': _iso(now), 'links': [],
+        }
+
+
+class FakeCloud:
+    """Dataset, injected faults and request statistics shared by all service ports."""
+
+    def __init__(self, dataset: Dataset, host: str, ports: Dict[str, int], latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 service_latency_ms: Optional[Dict[str, float]] = None):
+        self.dataset = dataset
+        self.host = host
+        self.ports = ports
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.service_latency_ms = service_latency_ms or {}
+        self.stats: Counter = Counter()
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(7)
+
+    def url(self, service: str) -> str:
+        return f"http://{self.host}:{self.ports[service]}"
+
+    def record(self, key: str, size: int) -> None:
+        with self._lock:
+            self.stats[key] += 1
+            self.bytes_sent += size
+
+    def snapshot_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'total_requests': sum(self.stats.values()), 'bytes_sent': self.bytes_sent,
+                    'requests': dict(self.stats.most_common())}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats.clear()
+            self.bytes_sent = 0
+
+    def inject(self, service: str) -> bool:
+        """Sleep the configured latency; return True if this request should fail with 503."""
+        with self._lock:
+            delay = self.service_latency_ms.get(service, self.latency_ms)
+            if self.jitter_ms:
+                delay += self._rng.uniform(0, self.jitter_ms)
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+        return fail
+
+
+def _path_template(path: str) -> str:
+    return '/' + '/'.join('{id}' if _ID_SEGMENT.match(s) else s for s in path.split('/') if s)
+
+
+def _matches(item: Dict[str, Any], key: str, values: List[str]) -> bool:
+    value = item.get(key)
+    if isinstance(value, bool):
+        return str(value).lower() in [v.lower() for v in values]
+    if isinstance(value, list):
+        return any(v in [str(x) for x in value] for v in values)
+    return str(value) in values
+
+
+class Response(Exception):
+    """Raised by handlers to return a non-200 status."""
+
+    def __init__(self, status: int, body: Any = None, headers: Optional[Dict[str, str]] = None):
+        super().__init__(status)
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+
+def _not_found(what: str) -> Response:
+    return Response(404, {'itemNotFound': {'code': 404, 'message': f'{what} could not be found.'}})
+
+
+class Request:
+    """Parsed request passed to route handlers."""
+
+    def __init__(self, cloud: FakeCloud, service: str, method: str, path: str, query: Dict[str, List[str]],
+                 body: Any):
+        self.cloud = cloud
+        self.data = cloud.dataset
+        self.service = service
+        self.method = method
+        self.path = path
+        self.query = query
+        self.body = body
+
+    def param(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        values = self.query.get(name)
+        return values[0] if values else default
+
+    def listing(self, items: List[Dict[str, Any]], key: str, filters: Tuple[str, ...] = (),
+                name_regex: bool = False, link_path: str = '', id_key: str = 'id') -> Dict[str, Any]:
+        """Filter, paginate and project a collection the way the real APIs do."""
+        for name in filters:
+            values = self.query.get(name)
+            if values:
+                if name == 'name' and name_regex:
+                    pattern = re.compile(values[0])
+                    items = [i for i in items if pattern.search(str(i.get('name') or ''))]
+                else:
+                    items = [i for i in items if _matches(i, name, values)]
+
+        marker = self.param('marker')
+        if marker:
+            ids = [i[id_key] for i in items]
+            if marker not in ids:
+                raise Response(400, {'badRequest': {'code': 400, 'message': f'marker [{marker}] not found'}})
+            items = items[ids.index(marker) + 1:]
+
+        limit = self.param('limit')
+        max_limit = MAX_LIMIT.get(self.service)
+        page_size = int(limit) if limit else max_limit
+        if max_limit:
+            page_size = min(page_size, 1000)
+        body: Dict[str, Any] = {}
+        if page_size and len(items) > page_size:
+            items = items[:page_size]
+            query = {k: v for k, v in self.query.items() if k != 'marker'}
+            query['marker'] = [items[-1][id_key]]
+            query.setdefault('limit', [str(page_size)])
+            href = f"{self.cloud.url(self.service)}{link_path}?{urlencode(query, doseq=True)}"
+            if self.service == 'image':
+                body['next'] = f"{link_path}?{urlencode(query, doseq=True)}"
+            else:
+                body[f'{key}_links'] = [{'rel': 'next', 'href': href}]
+
+        fields = self.query.get('fields')
+        if fields:
+            items = [{f: i.get(f) for f in fields} for i in items]
+        body[key] = items
+        return body
+
+
+Route = Tuple[str, str, Callable[..., Any]]
+
+
+def _server_summary(server: Dict[str, Any]) -> Dict[str, Any]:
+    return {'id': server['id'], 'name': server['name'], 'links': []}
+
+
+def _get(collection: str, what: str):
+    def handler(req: Request, item_id: str):
+        item = req.data.by_id[collection].get(item_id)
+        if item is None:
+            raise _not_found(f'{what} {item_id}')
+        return {what: item}
+    return handler
+
+
+# --- Identity ---------------------------------------------------------------
+
+def identity_versions(req: Request):
+    base = req.cloud.url('identity')
+    return {'versions': {'values': [{'id': 'v3.14', 'status': 'stable', 'updated': '2020-04-07T00:00:00Z',
+                                     'links': [{'rel': 'self', 'href': f'{base}/v3/'}],
+                                     'media-types': [{'base': 'application/json',
+                                                      'type': 'application/vnd.openstack.identity-v3+json'}]}]}}
+
+
+def identity_v3(req: Request):
+    return {'version': identity_versions(req)['versions']['values'][0]}
+
+
+def issue_token(req: Request):
+    now = datetime.now(timezone.utc)
+    catalog = []
+    for service_type, (name, version_path) in CATALOG.items():
+        port_service = {'volumev3': 'volume', 'block-storage': 'volume'}.get(service_type, service_type)
+        url = req.cloud.url(port_service) + version_path
+        catalog.append({
+            'type': service_type, 'name': name, 'id': f'{abs(hash(service_type)):032x}'[:32],
+            'endpoints': [{'id': f'{abs(hash(service_type + iface)):032x}'[:32], 'interface': iface,
+                           'region': 'RegionOne', 'region_id': 'RegionOne', 'url': url}
+                          for iface in ('public', 'internal', 'admin')],
+        })
+    token = {
+        'methods': ['password'], 'expires_at': _iso(now + timedelta(hours=12)).replace('Z', '.000000Z'),
+        'issued_at': _iso(now).replace('Z', '.000000Z'), 'audit_ids': ['fake'],
+        'user': {'id': USER_ID, 'name': 'admin', 'domain': {'id': DOMAIN_ID, 'name': 'Default'},
+                 'password_expires_at': None},
+        'project': {'id': PROJECT_ID, 'name': PROJECT_NAME, 'domain': {'id': DOMAIN_ID, 'name': 'Default'}},
+        'roles': [{'id': r['id'], 'name': r['name']} for r in req.data.roles],
+        'catalog': catalog, 'is_domain': False,
+    }
+    raise Response(201, {'token': token}, {'X-Subject-Token': f'fake-token-{uuid.uuid4().hex}'})
+
+
+def identity_routes() -> List[Route]:
+    return [
+        ('GET', r'/', identity_versions),
+        ('GET', r'/v3', identity_v3),
+        ('POST', r'/v3/auth/tokens', issue_token),
+        ('GET', r'/v3/auth/projects', lambda req: {'projects': req.data.projects[:1]}),
+        ('GET', r'/v3/projects', lambda req: req.listing(req.data.projects, 'projects', ('name', 'domain_id'))),
+        ('GET', r'/v3/projects/([^/]+)', _get('projects', 'project')),
+        ('GET', r'/v3/users', lambda req: req.listing(req.data.users, 'users', ('name',))),
+        ('GET', r'/v3/users/([^/]+)', _get('users', 'user')),
+        ('GET', r'/v3/roles', lambda req: req.listing(req.data.roles, 'roles', ('name',))),
+        ('GET', r'/v3/domains', lambda req: {'domains': [{'id': DOMAIN_ID, 'name': 'Default', 'enabled': True}]}),
+        ('GET', r'/v3/role_assignments', lambda req: {'role_assignments': [
+            {'role': {'id': req.data.roles[0]['id']}, 'user': {'id': USER_ID},
+             'scope': {'project': {'id': PROJECT_ID}}}]}),
+    ]
+
+
+# --- Compute ----------------------------------------------------------------
+
+def compute_versions(req: Request):
+    version = {'id': 'v2.1', 'status': 'CURRENT', 'version': '2.96', 'min_version': '2.1',
+               'updated': '2013-07-23T11:33:21Z', 'links': [{'rel': 'self', 'href': f"{req.cloud.url('compute')}/v2.1/"}]}
+    return {'versions': [version]} if req.path == '/' else {'version': version}
+
+
+def list_servers(req: Request, detailed: bool):
+    body = req.listing(req.data.servers, 'servers', ('status', 'name', 'host', 'flavor', 'image', 'ip'),
+                       name_regex=True, link_path='/v2.1/servers/detail' if detailed else '/v2.1/servers')
+    if not detailed:
+        body['servers'] = [_server_summary(s) for s in body['servers']]
+    return body
+
+
+def server_volume_attachments(req: Request, server_id: str):
+    server = req.data.by_id['servers'].get(server_id)
+    if server is None:
+        raise _not_found(f'Instance {server_id}')
+    return {'volumeAttachments': [{'id': v['id'], 'volumeId': v['id'], 'serverId': server_id,
+                                   'device': '/dev/vdb', 'tag': None, 'delete_on_termination': False}
+                                  for v in server['os-extended-volumes:volumes_attached']]}
+
+
+def server_actions(req: Request, server_id: str):
+    if server_id not in req.data.by_id['servers']:
+        raise _not_found(f'Instance {server_id}')
+    return {'instanceActions': req.data.instance_actions.get(server_id, [])}
+
+
+def server_action_detail(req: Request, server_id: str, request_id: str):
+    for action in req.data.instance_actions.get(server_id, []):
+        if action['request_id'] == request_id:
+            return {'instanceAction': dict(action, events=[{
+                'event': 'compute__do_build_and_run_instance', 'start_time': action['start_time'],
+                'finish_time': action['start_time'], 'result': 'Success', 'traceback': None,
+                'host': 'compute-0000', 'hostId': ''}])}
+    raise _not_found(f'Action {request_id}')
+
+
+def server_interfaces(req: Request, server_id: str):
+    return {'interfaceAttachments': [{
+        'port_id': p['id'], 'net_id': p['network_id'], 'mac_addr': p['mac_address'], 'port_state': p['status'],
+        'fixed_ips': p['fixed_ips'], 'tag': None} for p in req.data.ports if p['device_id'] == server_id]}
+
+
+def simple_tenant_usage(req: Request, project_id: Optional[str] = None):
+    hours = 24.0
+    usages = [{'instance_id': s['id'], 'name': s['name'], 'hours': hours, 'vcpus': s['flavor']['vcpus'],
+               'memory_mb': s['flavor']['ram'], 'local_gb': s['flavor']['disk'], 'flavor': s['flavor']['original_name'],
+               'state': s['OS-EXT-STS:vm_state'], 'started_at': s['created'], 'ended_at': None,
+               'uptime': 3600, 'tenant_id': PROJECT_ID} for s in req.data.servers]
+    body = req.listing(usages, 'server_usages', link_path=req.path, id_key='instance_id')
+    links = body.pop('server_usages_links', None)
+    usage = {'tenant_id': PROJECT_ID, 'server_usages': body['server_usages'],
+             'total_hours': hours * len(body['server_usages']), 'start': req.param('start'), 'stop': req.param('end')}
+    if project_id:
+        result = {'tenant_usage': usage}
+        if links:
+            result['tenant_usage_links'] = links
+    else:
+        result = {'tenant_usages': [usage]}
+        if links:
+            result['tenant_usages_links'] = links
+    return result
+
+
+def compute_limits(req: Request):
+    servers = req.data.servers
+    return {'limits': {'rate': [], 'absolute': {
+        'maxTotalInstances': 20000, 'maxTotalCores': 100000, 'maxTotalRAMSize': 10 ** 9,
+        'maxServerMeta': 128, 'maxTotalKeypairs': 100, 'maxServerGroups': 100, 'maxServerGroupMembers': 100,
+        'totalInstancesUsed': len(servers), 'totalCoresUsed': sum(s['flavor']['vcpus'] for s in servers),
+        'totalRAMUsed': sum(s['flavor']['ram'] for s in servers), 'totalServerGroupsUsed': len(req.data.server_groups)}}}
+
+
+def compute_quota(req: Request, project_id: str, detail: bool = False):
+    servers = req.data.servers
+    used = {'instances': len(servers), 'cores': sum(s['flavor']['vcpus'] for s in servers),
+            'ram': sum(s['flavor']['ram'] for s in servers), 'key_pairs': len(req.data.keypairs),
+            'server_groups': len(req.data.server_groups), 'server_group_members': 0, 'metadata_items': 0,
+            'injected_files': 0, 'injected_file_content_bytes': 0, 'injected_file_path_bytes': 0}
+    limits = {'instances': 20000, 'cores': 100000, 'ram': 10 ** 9, 'key_pairs': 100, 'server_groups': 100,
+              'server_group_members': 100, 'metadata_items': 128, 'injected_files': 5,
+              'injected_file_content_bytes': 10240, 'injected_file_path_bytes': 255}
+    limits.update(req.data.quota_overrides.get(('compute', project_id), {}))
+    if detail:
+        quota = {k: {'limit': limits[k], 'in_use': used[k], 'reserved': 0} for k in limits}
+    else:
+        quota = dict(limits)
+    quota['id'] = project_id
+    return {'quota_set': quota}
+
+
+def update_quota(service: str, key: str, getter):
+    def handler(req: Request, project_id: str):
+        updates = (req.body or {}).get(key) or {}
+        overrides = req.data.quota_overrides.setdefault((service, project_id), {})
+        overrides.update({k: int(v) for k, v in updates.items() if isinstance(v, (int, float, str))
+                          and str(v).lstrip('-').isdigit()})
+        return getter(req, project_id)
+    return handler
+
+
+def compute_routes() -> List[Route]:
+    data_routes: List[Route] = [
+        ('GET', r'/', compute_versions),
+        ('GET', r'/v2\.1', compute_versions),
+        ('GET', r'/servers', lambda req: list_servers(req, False)),
+        ('GET', r'/servers/detail', lambda req: list_servers(req, True)),
+        ('GET', r'/servers/([^/]+)', _get('servers', 'server')),
+        ('GET', r'/servers/([^/]+)/os-volume_attachments', server_volume_attachments),
+        ('GET', r'/servers/([^/]+)/os-instance-actions', server_actions),
+        ('GET', r'/servers/([^/]+)/os-instance-actions/([^/]+)', server_action_detail),
+        ('GET', r'/servers/([^/]+)/os-interface', server_interfaces),
+        ('GET', r'/servers/([^/]+)/diagnostics', lambda req, sid: {'state': 'running', 'driver': 'libvirt'}),
+        ('GET', r'/flavors', lambda req: {'flavors': [{'id': f['id'], 'name': f['name'], 'links': []}
+                                                      for f in req.data.flavors]}),
+        ('GET', r'/flavors/detail', lambda req: req.listing(req.data.flavors, 'flavors', link_path='/v2.1/flavors/detail')),
+        ('GET', r'/flavors/([^/]+)', _get('flavors', 'flavor')),
+        ('GET', r'/flavors/([^/]+)/os-extra_specs', lambda req, fid: {'extra_specs': {}}),
+        ('GET', r'/os-hypervisors', lambda req: {'hypervisors': [
+            {'id': h['id'], 'hypervisor_hostname': h['hypervisor_hostname'], 'state': h['state'],
+             'status': h['status']} for h in req.data.hypervisors]}),
+        ('GET', r'/os-hypervisors/detail', lambda req: req.listing(req.data.hypervisors, 'hypervisors',
+                                                                    link_path='/v2.1/os-hypervisors/detail')),
+        ('GET', r'/os-hypervisors/statistics', lambda req: {'hypervisor_statistics': {
+            'count': len(req.data.hypervisors), 'vcpus': sum(h['vcpus'] for h in req.data.hypervisors),
+            'vcpus_used': sum(h['vcpus_used'] for h in req.data.hypervisors),
+            'memory_mb': sum(h['memory_mb'] for h in req.data.hypervisors),
+            'memory_mb_used': sum(h['memory_mb_used'] for h in req.data.hypervisors),
+            'local_gb': sum(h['local_gb'] for h in req.data.hypervisors),
+            'local_gb_used': sum(h['local_gb_used'] for h in req.data.hypervisors),
+            'running_vms': sum(h['running_vms'] for h in req.data.hypervisors)}}),
+        ('GET', r'/os-hypervisors/([^/]+)', _get('hypervisors', 'hypervisor')),
+        ('GET', r'/os-aggregates', lambda req: {'aggregates': req.data.aggregates}),
+        ('GET', r'/os-availability-zone', lambda req: {'availabilityZoneInfo': [
+            {'zoneName': a['availability_zone'], 'zoneState': {'available': True}, 'hosts': None}
+            for a in req.data.aggregates]}),
+        ('GET', r'/os-availability-zone/detail', lambda req: {'availabilityZoneInfo': [
+            {'zoneName': a['availability_zone'], 'zoneState': {'available': True},
+             'hosts': {h: {'nova-compute': {'available': True, 'active': True, 'updated_at': None}}
+                       for h in a['hosts']}} for a in req.data.aggregates]}),
+        ('GET', r'/os-server-groups', lambda req: {'server_groups': req.data.server_groups}),
+        ('GET', r'/os-server-groups/([^/]+)', _get('server_groups', 'server_group')),
+        ('GET', r'/os-keypairs', lambda req: {'keypairs': req.data.keypairs}),
+        ('GET', r'/os-services', lambda req: {'services': [
+            {'id': i + 1, 'binary': 'nova-compute', 'host': h['service']['host'], 'zone': 'nova',
+             'status': 'enabled', 'state': 'up', 'updated_at': None, 'disabled_reason': None, 'forced_down': False}
+            for i, h in enumerate(req.data.hypervisors)]}),
+        ('GET', r'/limits', compute_limits),
+        ('GET', r'/os-quota-sets/([^/]+)', compute_quota),
+        ('PUT', r'/os-quota-sets/([^/]+)', update_quota('compute', 'quota_set', compute_quota)),
+        ('GET', r'/os-quota-sets/([^/]+)/detail', lambda req, pid: compute_quota(req, pid, detail=True)),
+        ('GET', r'/os-simple-tenant-usage', simple_tenant_usage),
+        ('GET', r'/os-simple-tenant-usage/([^/]+)', simple_tenant_usage),
+    ]
+    return data_routes
+
+
+# --- Network ----------------------------------------------------------------
+
+def network_versions(req: Request):
+    return {'versions': [{'id': 'v2.0', 'status': 'CURRENT',
+                          'links': [{'rel': 'self', 'href': f"{req.cloud.url('network')}/v2.0/"}]}]}
+
+
+NEUTRON_FILTERS = {
+    'networks': ('id', 'name', 'status', 'shared', 'router:external', 'project_id', 'tenant_id'),
+    'subnets': ('id', 'name', 'network_id', 'project_id', 'tenant_id', 'ip_version'),
+    'ports': ('id', 'name', 'network_id', 'device_id', 'device_owner', 'status', 'project_id', 'tenant_id',
+              'mac_address'),
+    'routers': ('id', 'name', 'status', 'project_id', 'tenant_id'),
+    'floatingips': ('id', 'floating_ip_address', 'port_id', 'status', 'project_id', 'tenant_id',
+                    'floating_network_id', 'router_id'),
+    'security-groups': ('id', 'name', 'project_id', 'tenant_id'),
+    'security-group-rules': ('id', 'security_group_id', 'direction', 'project_id', 'tenant_id'),
+}
+
+NEUTRON_COLLECTIONS = {
+    'networks': ('networks', 'network'),
+    'subnets': ('subnets', 'subnet'),
+    'ports': ('ports', 'port'),
+    'routers': ('routers', 'router'),
+    'floatingips': ('floating_ips', 'floatingip'),
+    'security-groups': ('security_groups', 'security_group'),
+    'security-group-rules': ('security_group_rules', 'security_group_rule'),
+}
+
+
+def neutron_list(resource: str):
+    attr, _singular = NEUTRON_COLLECTIONS[resource]
+    key = resource.replace('-', '_')
+    return lambda req: req.listing(getattr(req.data, attr), key, NEUTRON_FILTERS[resource],
+                                   link_path=f'/v2.0/{resource}')
+
+
+def neutron_get(resource: str):
+    attr, singular = NEUTRON_COLLECTIONS[resource]
+    return _get(attr, singular)
+
+
+def neutron_quota(req: Request, project_id: str, detail: bool = False):
+    data = req.data
+    used = {'network': len(data.networks), 'subnet': len(data.subnets), 'port': len(data.ports),
+            'router': len(data.routers), 'floatingip': len(data.floating_ips),
+            'security_group': len(data.security_groups), 'security_group_rule': len(data.security_group_rules)}
+    limits = {k: data.quota_overrides.get(('network', project_id), {}).get(k, -1) for k in used}
+    if detail:
+        return {'quota': {k: {'limit': limits[k], 'used': v, 'reserved': 0} for k, v in used.items()}}
+    return {'quota': limits}
+
+
+def network_routes() -> List[Route]:
+    routes: List[Route] = [
+        ('GET', r'/', network_versions),
+        ('GET', r'/extensions', lambda req: {'extensions': [
+            {'alias': alias, 'name': alias, 'description': '', 'updated': '', 'links': []}
+            for alias in ('router', 'security-group', 'quotas', 'quota_details', 'external-net', 'binding',
+                          'agent', 'availability_zone', 'standard-attr-tag', 'fip-port-details')]}),
+        ('GET', r'/quotas/([^/]+)', neutron_quota),
+        ('PUT', r'/quotas/([^/]+)', update_quota('network', 'quota', neutron_quota)),
+        ('GET', r'/quotas/([^/]+)/details(?:\.json)?', lambda req, pid: neutron_quota(req, pid, detail=True)),
+        ('GET', r'/agents', lambda req: {'agents': []}),
+        ('GET', r'/availability_zones', lambda req: {'availability_zones': [
+            {'name': 'nova', 'resource': 'network', 'state': 'available'}]}),
+    ]
+    for resource in NEUTRON_COLLECTIONS:
+        routes.append(('GET', rf'/{resource}', neutron_list(resource)))
+        routes.append(('GET', rf'/{resource}/([^/]+)', neutron_get(resource)))
+    return routes
+
+
+# --- Block storage ----------------------------------------------------------
+
+def volume_versions(req: Request):
+    version = {'id': 'v3.0', 'status': 'CURRENT', 'version': '3.70', 'min_version': '3.0',
+               'updated': '2023-01-01T00:00:00Z', 'links': [{'rel': 'self', 'href': f"{req.cloud.url('volume')}/v3/"}]}
+    return {'versions': [version]} if req.path == '/' else {'version': version}
+
+
+def list_volumes(req: Request, detailed: bool):
+    body = req.listing(req.data.volumes, 'volumes', ('status', 'name', 'bootable', 'availability_zone'),
+                       link_path='/v3/volumes/detail' if detailed else '/v3/volumes')
+    if not detailed:
+        body['volumes'] = [{'id': v['id'], 'name': v['name'], 'links': []} for v in body['volumes']]
+    return body
+
+
+def volume_limits(req: Request):
+    volumes = req.data.volumes
+    return {'limits': {'rate': [], 'absolute': {
+        'maxTotalVolumes': 100000, 'maxTotalVolumeGigabytes': 10 ** 7, 'maxTotalSnapshots': 100000,
+        'maxTotalBackups': 1000, 'maxTotalBackupGigabytes': 10 ** 6,
+        'totalVolumesUsed': len(volumes), 'totalGigabytesUsed': sum(v['size'] for v in volumes),
+        'totalSnapshotsUsed': len(req.data.snapshots), 'totalBackupsUsed': 0, 'totalBackupGigabytesUsed': 0}}}
+
+
+def volume_quota(req: Request, project_id: str):
+    volumes = req.data.volumes
+    usage = req.param('usage') in ('true', 'True', '1')
+    values = {'volumes': (100000, len(volumes)), 'gigabytes': (10 ** 7, sum(v['size'] for v in volumes)),
+              'snapshots': (100000, len(req.data.snapshots)), 'backups': (1000, 0),
+              'backup_gigabytes': (10 ** 6, 0), 'per_volume_gigabytes': (-1, 0), 'groups': (10, 0)}
+    for name, limit in req.data.quota_overrides.get(('volume', project_id), {}).items():
+        values[name] = (limit, values.get(name, (0, 0))[1])
+    quota = {k: ({'limit': limit, 'in_use': used, 'reserved': 0, 'allocated': 0} if usage else limit)
+             for k, (limit, used) in values.items()}
+    quota['id'] = project_id
+    return {'quota_set': quota}
+
+
+def volume_routes() -> List[Route]:
+    return [
+        ('GET', r'/', volume_versions),
+        ('GET', r'/v3', volume_versions),
+        ('GET', r'/volumes', lambda req: list_volumes(req, False)),
+        ('GET', r'/volumes/detail', lambda req: list_volumes(req, True)),
+        ('GET', r'/volumes/([^/]+)', _get('volumes', 'volume')),
+        ('GET', r'/snapshots', lambda req: req.listing(req.data.snapshots, 'snapshots', ('status', 'volume_id'),
+                                                       link_path='/v3/snapshots')),
+        ('GET', r'/snapshots/detail', lambda req: req.listing(req.data.snapshots, 'snapshots',
+                                                              ('status', 'volume_id'), link_path='/v3/snapshots/detail')),
+        ('GET', r'/snapshots/([^/]+)', _get('snapshots', 'snapshot')),
+        ('GET', r'/types', lambda req: {'volume_types': req.data.volume_types}),
+        ('GET', r'/types/([^/]+)', _get('volume_types', 'volume_type')),
+        ('GET', r'/limits', volume_limits),
+        ('GET', r'/os-quota-sets/([^/]+)', volume_quota),
+        ('PUT', r'/os-quota-sets/([^/]+)', update_quota('volume', 'quota_set', volume_quota)),
+        ('GET', r'/os-services', lambda req: {'services': [
+            {'binary': 'cinder-volume', 'host': 'cinder@lvm', 'zone': 'nova', 'status': 'enabled', 'state': 'up',
+             'updated_at': None}]}),
+        ('GET', r'/backups/detail', lambda req: {'backups': []}),
+    ]
+
+
+# --- Image ------------------------------------------------------------------
+
+def image_versions(req: Request):
+    return {'versions': [{'id': 'v2.16', 'status': 'CURRENT',
+                          'links': [{'rel': 'self', 'href': f"{req.cloud.url('image')}/v2/"}]}]}
+
+
+def image_routes() -> List[Route]:
+    return [
+        ('GET', r'/', image_versions),
+        ('GET', r'/images', lambda req: req.listing(req.data.images, 'images',
+                                                    ('name', 'status', 'visibility', 'owner'), link_path='/v2/images')),
+        ('GET', r'/images/([^/]+)', lambda req, image_id: _image(req, image_id)),
+        ('GET', r'/images/([^/]+)/members', lambda req, image_id: {'members': []}),
+        ('GET', r'/schemas/image', lambda req: {'name': 'image', 'properties': {}, 'additionalProperties': {'type': 'string'}}),
+    ]
+
+
+def _image(req: Request, image_id: str):
+    image = req.data.by_id['images'].get(image_id)
+    if image is None:
+        raise _not_found(f'Image {image_id}')
+    return image
+
+
+# --- Placement --------------------------------------------------------------
+
+def placement_versions(req: Request):
+    return {'versions': [{'id': 'v1.0', 'max_version': '1.39', 'min_version': '1.0', 'status': 'CURRENT',
+                          'links': [{'rel': 'self', 'href': ''}]}]}
+
+
+def _provider_hypervisor(req: Request, provider_uuid: str):
+    for hypervisor in req.data.hypervisors:
+        if hypervisor['id'] == provider_uuid:
+            return hypervisor
+    raise _not_found(f'Resource provider {provider_uuid}')
+
+
+def provider_inventories(req: Request, provider_uuid: str):
+    h = _provider_hypervisor(req, provider_uuid)
+    return {'resource_provider_generation': 1, 'inventories': {
+        'VCPU': {'total': h['vcpus'], 'reserved': 0, 'min_unit': 1, 'max_unit': h['vcpus'], 'step_size': 1,
+                 'allocation_ratio': 4.0},
+        'MEMORY_MB': {'total': h['memory_mb'], 'reserved': 2048, 'min_unit': 1, 'max_unit': h['memory_mb'],
+                      'step_size': 1, 'allocation_ratio': 1.0},
+        'DISK_GB': {'total': h['local_gb'], 'reserved': 0, 'min_unit': 1, 'max_unit': h['local_gb'],
+                    'step_size': 1, 'allocation_ratio': 1.0}}}
+
+
+def provider_usages(req: Request, provider_uuid: str):
+    h = _provider_hypervisor(req, provider_uuid)
+    return {'resource_provider_generation': 1, 'usages': {
+        'VCPU': h['vcpus_used'], 'MEMORY_MB': h['memory_mb_used'], 'DISK_GB': h['local_gb_used']}}
+
+
+def project_usages(req: Request):
+    servers = [s for s in req.data.servers if s['status'] == 'ACTIVE']
+    return {'usages': {'VCPU': sum(s['flavor']['vcpus'] for s in servers),
+                       'MEMORY_MB': sum(s['flavor']['ram'] for s in servers),
+                       'DISK_GB': sum(s['flavor']['disk'] for s in servers)}}
+
+
+def placement_routes() -> List[Route]:
+    return [
+        ('GET', r'/', placement_versions),
+        ('GET', r'/resource_providers', lambda req: {'resource_providers': req.data.resource_providers}),
+        ('GET', r'/resource_providers/([^/]+)/inventories', provider_inventories),
+        ('GET', r'/resource_providers/([^/]+)/usages', provider_usages),
+        ('GET', r'/usages', project_usages),
+    ]
+
+
+# --- Orchestration ----------------------------------------------------------
+
+def orchestration_versions(req: Request):
+    return {'versions': [{'id': 'v1.0', 'status': 'CURRENT', 'links': [
+        {'rel': 'self', 'href': f"{req.cloud.url('orchestration')}/v1/"}]}]}
+
+
+def orchestration_routes() -> List[Route]:
+    return [
+        ('GET', r'/', orchestration_versions),
+        ('GET', r'/v1', orchestration_versions),
+        ('GET', r'/stacks', lambda req: req.listing(req.data.stacks, 'stacks', ('stack_status',),
+                                                    link_path=f'/v1/{PROJECT_ID}/stacks')),
+        ('GET', r'/stacks/([^/]+)', _get('stacks', 'stack')),
+        ('GET', r'/stacks/([^/]+)/([^/]+)', lambda req, name, stack_id: _get('stacks', 'stack')(req, stack_id)),
+        ('GET', r'/stacks/([^/]+)/([^/]+)/resources', lambda req, name, stack_id: {'resources': []}),
+        ('GET', r'/services', lambda req: {'services': [
+            {'binary': 'heat-engine', 'host': 'controller', 'status': 'up', 'topic': 'engine',
+             'engine_id': 'fake', 'updated_at': None}]}),
+    ]
+
+
+# --- Load balancer ----------------------------------------------------------
+
+OCTAVIA_COLLECTIONS = {
+    'loadbalancers': ('load_balancers', 'loadbalancer'),
+    'listeners': ('listeners', 'listener'),
+    'pools': ('pools', 'pool'),
+    'healthmonitors': ('health_monitors', 'healthmonitor'),
+}
+
+
+# Octavia relation filters: collection -> query parameter -> field holding [{'id': ...}]
+OCTAVIA_RELATION_FILTERS = {
+    'listeners': {'load_balancer_id': 'loadbalancers'},
+    'pools': {'loadbalancer_id': 'loadbalancers', 'listener_id': 'listeners'},
+}
+
+
+def _octavia_related(req: Request, resource: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    for param, field in OCTAVIA_RELATION_FILTERS.get(resource, {}).items():
+        value = req.param(param)
+        if value:
+            items = [i for i in items if any(ref.get('id') == value for ref in i.get(field) or [])]
+    return items
+
+
+def load_balancer_routes() -> List[Route]:
+    routes: List[Route] = [
+        ('GET', r'/', lambda req: {'versions': [{'id': 'v2.0', 'status': 'CURRENT', 'links': [
+            {'rel': 'self', 'href': f"{req.cloud.url('load-balancer')}/v2"}]}]}),
+        ('GET', r'/lbaas/pools/([^/]+)/members',
+         lambda req, pool_id: req.listing([m for m in req.data.members if m['pool_id'] == pool_id], 'members',
+                                          ('name', 'address'), link_path=f'/v2/lbaas/pools/{pool_id}/members')),
+        ('GET', r'/lbaas/pools/([^/]+)/members/([^/]+)',
+         lambda req, pool_id, member_id: {'member': _lookup(req, 'members', member_id)}),
+        ('GET', r'/lbaas/l7policies', lambda req: {'l7policies': []}),
+        ('GET', r'/lbaas/providers', lambda req: {'providers': [{'name': 'amphora', 'description': 'Amphora'}]}),
+        ('GET', r'/lbaas/flavors', lambda req: {'flavors': []}),
+        ('GET', r'/lbaas/availabilityzones', lambda req: {'availability_zones': []}),
+        ('GET', r'/octavia/amphorae', lambda req: {'amphorae': []}),
+    ]
+    for resource, (attr, singular) in OCTAVIA_COLLECTIONS.items():
+        routes.append(('GET', rf'/lbaas/{resource}',
+                       (lambda a, r: lambda req: req.listing(_octavia_related(req, r, getattr(req.data, a)), r,
+                                                             ('name', 'project_id'),
+                                                             link_path=f'/v2/lbaas/{r}'))(attr, resource)))
+        routes.append(('GET', rf'/lbaas/{resource}/([^/]+)', _get(attr, singular)))
+    routes.append(('GET', r'/lbaas/loadbalancers/([^/]+)/status', lambda req, lb_id: {'statuses': {
+        'loadbalancer': {'id': lb_id, 'provisioning_status': 'ACTIVE', 'operating_status': 'ONLINE',
+                         'listeners': []}}}))
+    return routes
+
+
+def _lookup(req: Request, collection: str, item_id: str):
+    item = req.data.by_id[collection].get(item_id)
+    if item is None:
+        raise _not_found(item_id)
+    return item
+
+
+ROUTE_TABLES = {
+    'identity': identity_routes,
+    'compute': compute_routes,
+    'network': network_routes,
+    'volume': volume_routes,
+    'image': image_routes,
+    'placement': placement_routes,
+    'orchestration': orchestration_routes,
+    'load-balancer': load_balancer_routes,
+}
+
+
+def _compile_routes() -> Dict[str, List[Tuple[str, re.Pattern, Callable]]]:
+    return {service: [(method, re.compile(f'^{pattern}/?$'), handler) for method, pattern, handler in table()]
+            for service, table in ROUTE_TABLES.items()}
+
+
+def _normalize_path(service: str, path: str) -> str:
+    """Strip API version and project ID prefixes: /v3/<project>/volumes/detail -> /volumes/detail.
+
+    Heat only serves project-scoped paths (/v1/<project>/stacks); without the project
+    segment the path is left unmatched and answers 404 like a real Heat API.
+    """
+    segments = [s for s in path.split('/') if s]
+    if service == 'identity':
+        return '/' + '/'.join(segments)
+    if segments and _VERSION_SEGMENT.match(segments[0]):
+        if len(segments) == 1:
+            return f'/{segments[0]}'
+        segments = segments[1:]
+    if service == 'orchestration' and segments:
+        if segments[0] != PROJECT_ID:
+            return '/unscoped/' + '/'.join(segments)
+        segments = segments[1:]
+    elif segments and segments[0] in (PROJECT_ID,) and service in ('volume', 'compute'):
+        segments = segments[1:]
+    return '/' + '/'.join(segments)
+
+
+def make_handler(cloud: FakeCloud, service: str, routes: List[Tuple[str, re.Pattern, Callable]]):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are written separately; avoid Nagle + delayed-ACK stalls
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler signature
+            pass
+
+        def _send(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+            payload = b'' if body is None else json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.send_header('X-Openstack-Request-Id', f'req-{uuid.uuid4()}')
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            if self.command != 'HEAD':
+                self.wfile.write(payload)
+            cloud.record(f'{self.command} {service} {_path_template(urlparse(self.path).path)}', len(payload))
+
+        def _handle(self) -> None:
+            parsed = urlparse(self.path)
+            length = int(self.headers.get('Content-Length') or 0)
+            raw = self.rfile.read(length) if length else b''
+
+            if parsed.path.startswith('/__fake__/stats'):
+                if self.command == 'POST':
+                    cloud.reset_stats()
+                self._send_raw(200, cloud.snapshot_stats())
+                return
+
+            if service != 'identity' and cloud.inject(service):
+                self._send(503, {'error': {'code': 503, 'message': 'Injected fault'}})
+                return
+
+            path = _normalize_path(service, parsed.path)
+            try:
+                body = json.loads(raw) if raw else None
+            except ValueError:
+                body = None
+            request = Request(cloud, service, self.command, path, parse_qs(parsed.query), body)
+
+            for method, pattern, handler in routes:
+                match = pattern.match(path)
+                if match and method == self.command:
+                    try:
+                        self._send(200, handler(request, *match.groups()))
+                    except Response as r:
+                        self._send(r.status, r.body, r.headers)
+                    except Exception as e:  # pragma: no cover - surfaced to the client as a 500
+                        self._send(500, {'error': {'code': 500, 'message': f'{type(e).__name__}: {e}'}})
+                    return
+
+            self._send(404, {'error': {'code': 404, 'message': f'No fake route for {self.command} {path}'}})
+            print(f"fake-openstack: no route for {self.command} {service} {self.path}", file=sys.stderr)
+
+        def _send_raw(self, status: int, body: Any) -> None:
+            payload = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+    return Handler
+
+
+class FakeOpenStack:
+    """All fake service endpoints, each on its own port, served from background threads."""
+
+    def __init__(self, dataset: Dataset, host: str = '127.0.0.1', port_base: int = 0, **faults: Any):
+        self.host = host
+        self._servers: Dict[str, ThreadingHTTPServer] = {}
+        routes = _compile_routes()
+        ports: Dict[str, int] = {}
+        for index, service in enumerate(SERVICES):
+            server = ThreadingHTTPServer((host, port_base + index if port_base else 0), BaseHTTPRequestHandler)
+            server.daemon_threads = True
+            self._servers[service] = server
+            ports[service] = server.server_address[1]
+        self.cloud = FakeCloud(dataset, host, ports, **faults)
+        for service, server in self._servers.items():
+            server.RequestHandlerClass = make_handler(self.cloud, service, routes[service])
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def ports(self) -> Dict[str, int]:
+        return self.cloud.ports
+
+    def environment(self) -> Dict[str, str]:
+        """Environment variables pointing the MCP server at this fake cloud."""
+        env = {
+            'OS_AUTH_HOST': self.host, 'OS_AUTH_PROTOCOL': 'http', 'OS_PROJECT_NAME': PROJECT_NAME,
+            'OS_USERNAME': 'admin', 'OS_PASSWORD': 'fake', 'OS_USER_DOMAIN_NAME': 'Default',
+            'OS_PROJECT_DOMAIN_NAME': 'Default', 'OS_REGION_NAME': 'RegionOne',
+        }
+        env.update({var: str(self.ports[service]) for service, var in PORT_ENV.items()})
+        return env
+
+    def start(self) -> 'FakeOpenStack':
+        for service, server in self._servers.items():
+            thread = threading.Thread(target=server.serve_forever, name=f'fake-{service}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self) -> None:
+        for server in self._servers.values():
+            server.shutdown()
+            server.server_close()
+
+
+def _parse_service_latency(spec: str) -> Dict[str, float]:
+    result = {}
+    for item in filter(None, (s.strip() for s in spec.split(','))):
+        service, _, value = item.partition('=')
+        result[service.strip()] = float(value)
+    return result
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Fake OpenStack API server for benchmarks")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port-base', type=int, default=15000,
+                        help='First port; services use consecutive ports (0 = random free ports)')
+    parser.add_argument('--servers', type=int, default=1000)
+    parser.add_argument('--ports', type=int, default=5000)
+    parser.add_argument('--networks', type=int, default=100)
+    parser.add_argument('--volumes', type=int, default=1000)
+    parser.add_argument('--images', type=int, default=200)
+    parser.add_argument('--hypervisors', type=int, default=100)
+    parser.add_argument('--load-balancers', type=int, default=20)
+    parser.add_argument('--stacks', type=int, default=20)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Added latency per request')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Random extra latency up to this value')
+    parser.add_argument('--service-latency', default='', help='Per-service latency, e.g. compute=50,network=20')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests failing with 503')
+    parser.add_argument('--seed', type=int, default=42)
+    return parser
+
+
+def create_from_args(args: argparse.Namespace) -> FakeOpenStack:
+    dataset = Dataset(servers=args.servers, ports=args.ports, networks=args.networks, volumes=args.volumes,
+                      images=args.images, hypervisors=args.hypervisors, load_balancers=args.load_balancers,
+                      stacks=args.stacks, seed=args.seed)
+    return FakeOpenStack(dataset, host=args.host, port_base=args.port_base, latency_ms=args.latency_ms,
+                         jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                         service_latency_ms=_parse_service_latency(args.service_latency))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    started = time.monotonic()
+    fake = create_from_args(args).start()
+    data = fake.cloud.dataset
+    for name, value in fake.environment().items():
+        print(f"{name}={value}", flush=True)
+    # run_benchmarks.py waits for this line
+    print(f"Fake OpenStack ready in {time.monotonic() - started:.1f}s: {len(data.servers)} servers, "
+          f"{len(data.ports)} ports, {len(data.volumes)} volumes, {len(data.images)} images, "
+          f"{len(data.hypervisors)} hypervisors", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        fake.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
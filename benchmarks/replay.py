@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Record / Replay Performance Regression Harness
+
+Captures the upstream API traffic of a set of tool calls ("scenarios") once,
+anonymizes it into a JSON fixture, and later replays it deterministically
+without a cloud. Replay asserts per-scenario budgets for upstream calls and
+wall time, so a change that reintroduces an N+1 pattern (one GET per server,
+per port, per listener ...) fails the run with exit code 1. A scenario whose
+tool fails - an error result, or JSON reporting success: false or an error -
+is never recorded: the fixture is not written, since the failure's call count
+would become the budget.
+
+Traffic is captured at the requests transport adapter of each SDK session
+(http_pool.set_adapter_wrapper), below keystoneauth and the request pipeline:
+auth, version discovery and retries are recorded exactly as sent, and replay
+exercises the full client stack. Replayed responses are matched by method and
+URL (query parameters order-independent); repeated identical requests are
+answered in recorded order.
+
+Anonymization (on by default): host names in URLs, IPv4 addresses, tokens and
+identifying fields (names, host names, descriptions, e-mails, keys) are
+replaced by stable placeholders; request bodies (credentials) are never stored.
+
+Usage:
+    # record against the cloud configured in the OS_* environment
+    python benchmarks/replay.py record --output benchmarks/fixtures/mycloud.json \\
+        --scenario 'get_network_details' \\
+        --scenario 'get_load_balancer_details:{"lb_name_or_id": "web-lb"}'
+
+    # record against the fake cloud instead
+    python benchmarks/replay.py record --fake --servers 200 --output benchmarks/fixtures/fake-small.json
+
+    # replay and enforce budgets (recorded call counts, recorded time x 1.5)
+    python benchmarks/replay.py check benchmarks/fixtures/*.json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import ipaddress
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from run_benchmarks import BENCHMARK_ENV, DEFAULT_BENCHMARKS, add_dataset_arguments, start_fake_server
+
+FIXTURE_VERSION = 1
+DEFAULT_TIME_FACTOR = 1.5
+DEFAULT_TIME_SLACK_SECONDS = 0.5
+TOKEN_EXPIRY = "2999-12-31T00:00:00.000000Z"
+
+# Scenarios recorded by default: the benchmark set plus per-resource detail tools
+DEFAULT_SCENARIOS: List[Tuple[str, Dict[str, Any]]] = DEFAULT_BENCHMARKS + [
+    ("get_load_balancer_details", {"lb_name_or_id": "lb-000"}),
+    ("get_load_balancer_listeners", {"lb_name_or_id": "lb-000"}),
+]
+
+# Response headers kept in fixtures
+KEPT_HEADERS = ("content-type", "x-subject-token", "openstack-api-version", "x-openstack-nova-api-version", "location")
+
+# Response fields whose string values identify people, hosts or workloads
+IDENTIFYING_KEYS = {
+    "name", "display_name", "description", "email", "hostname", "host", "host_name", "hypervisor_hostname",
+    "binding:host_id", "OS-EXT-SRV-ATTR:host", "OS-EXT-SRV-ATTR:hypervisor_hostname",
+    "OS-EXT-SRV-ATTR:instance_name", "os-vol-host-attr:host", "key_name", "public_key", "fingerprint",
+    "stack_name", "user_name", "project_name", "zoneName", "dns_name", "dns_domain", "stack_status_reason",
+}
+
+# Well-known names tools may branch on (roles, default groups and zones) are kept as-is
+KEPT_VALUES = {"admin", "member", "reader", "_member_", "default", "Default", "nova", "public"}
+
+# Environment copied into the fixture so replay points the connection at the same (placeholder) endpoints
+ENDPOINT_ENV = ("OS_AUTH_HOST", "OS_AUTH_PORT", "OS_AUTH_PROTOCOL", "OS_COMPUTE_PORT", "OS_NETWORK_PORT",
+                "OS_VOLUME_PORT", "OS_IMAGE_PORT", "OS_PLACEMENT_PORT", "OS_HEAT_STACK_PORT",
+                "OS_HEAT_STACK_CFN_PORT", "OS_REGION_NAME", "OS_PROJECT_NAME", "OS_USERNAME",
+                "OS_USER_DOMAIN_NAME", "OS_PROJECT_DOMAIN_NAME", "OS_IDENTITY_API_VERSION")
+
+_URL_HOST = re.compile(r"(https?://)([^/:\"'\s?#]+)")
+_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}")
+_IPV4 = re.compile(r"(?<![\d.])(\d{1,3}(?:\.\d{1,3}){3})(?![\d.])")
+
+
+def _request_key(method: str, url: str) -> str:
+    parts = urlsplit(url)
+    # Time windows derived from "now" (usage reports, changes-since) differ between record and replay
+    query = urlencode(sorted((k, '{timestamp}' if _TIMESTAMP.match(v) else v)
+                             for k, v in parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{method.upper()} {urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip('/') or '/', query, ''))}"
+
+
+class _Scenario:
+    """Scenario currently running; interactions and call counts are attributed to it."""
+
+    index = -1
+
+
+class RecordingAdapter(BaseAdapter):
+    """Transport adapter passing requests to the real adapter and recording each exchange."""
+
+    def __init__(self, inner, interactions: List[Dict[str, Any]], lock: threading.Lock):
+        super().__init__()
+        self.inner = inner
+        self.interactions = interactions
+        self.lock = lock
+
+    def send(self, request, **kwargs):
+        started = time.monotonic()
+        response = self.inner.send(request, **kwargs)
+        elapsed = time.monotonic() - started
+        content = b"" if kwargs.get("stream") else response.content
+        with self.lock:
+            self.interactions.append({
+                "scenario": _Scenario.index,
+                "method": request.method,
+                "url": request.url,
+                "status": response.status_code,
+                "headers": {k: v for k, v in response.headers.items() if k.lower() in KEPT_HEADERS},
+                "body": content.decode("utf-8", errors="replace"),
+                "elapsed_ms": round(elapsed * 1000, 2),
+            })
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter answering requests from recorded interactions instead of the network."""
+
+    def __init__(self, interactions: List[Dict[str, Any]], bodies: Dict[str, str], latency: str,
+                 counters: Dict[int, int], unmatched: List[str], lock: threading.Lock):
+        super().__init__()
+        self.bodies = bodies
+        self.queues: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self.last: Dict[str, Dict[str, Any]] = {}
+        for interaction in interactions:
+            self.queues[_request_key(interaction["method"], interaction["url"])].append(interaction)
+        self.latency = latency
+        self.counters = counters
+        self.unmatched = unmatched
+        self.lock = lock
+
+    def _next(self, key: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            self.counters[_Scenario.index] = self.counters.get(_Scenario.index, 0) + 1
+            queue = self.queues.get(key)
+            if queue:
+                self.last[key] = queue.popleft()
+                return self.last[key]
+            # More identical requests than recorded: answer like the last one (budgets catch the extra calls)
+            if key in self.last:
+                return self.last[key]
+            self.unmatched.append(key)
+            return None
+
+    def send(self, request, **kwargs):
+        interaction = self._next(_request_key(request.method, request.url))
+        if interaction is None:
+            status, headers, body, delay = 404, {"Content-Type": "application/json"}, json.dumps(
+                {"error": {"code": 404, "message": f"No recorded response for {request.method} {request.url}"}}), 0.0
+        else:
+            status, headers = interaction["status"], interaction["headers"]
+            body = self.bodies[interaction["body"]]
+            delay = interaction["elapsed_ms"] / 1000.0 if self.latency == "recorded" else 0.0
+        if delay:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body.encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.reason = "Replayed"
+        return response
+
+    def close(self):
+        pass
+
+
+class Anonymizer:
+    """Replaces identifying values with stable placeholders across a whole fixture."""
+
+    def __init__(self):
+        self.hosts: Dict[str, str] = {}
+        self.ips: Dict[str, str] = {}
+        self.values: Dict[str, str] = {}
+
+    def _host(self, host: str) -> str:
+        if host.endswith(".invalid"):
+            return host
+        if host not in self.hosts:
+            self.hosts[host] = f"host-{len(self.hosts)}.invalid"
+        return self.hosts[host]
+
+    def _ip(self, match: re.Match) -> str:
+        address = match.group(1)
+        try:
+            parsed = ipaddress.IPv4Address(address)
+        except ValueError:
+            return address
+        if parsed.is_unspecified or parsed.is_loopback:
+            return address
+        if address not in self.ips:
+            n = len(self.ips) + 1
+            self.ips[address] = f"198.18.{n // 256}.{n % 256}"
+        return self.ips[address]
+
+    def _value(self, key: str, value: str) -> str:
+        if not value or value in KEPT_VALUES:
+            return value
+        if value not in self.values:
+            prefix = key.split(":")[-1].replace("_", "-")
+            self.values[value] = f"{prefix}-{len(self.values)}"
+        return self.values[value]
+
+    def collect(self, data: Any) -> None:
+        """First pass: assign placeholders to identifying values in a JSON document."""
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if key in IDENTIFYING_KEYS and isinstance(value, str):
+                    self._value(key, value)
+                else:
+                    self.collect(value)
+        elif isinstance(data, list):
+            for item in data:
+                self.collect(item)
+
+    def _apply(self, data: Any) -> Any:
+        if isinstance(data, dict):
+            result = {}
+            for key, value in data.items():
+                if key in IDENTIFYING_KEYS and isinstance(value, str):
+                    result[key] = self.values.get(value, value)
+                elif key == "addresses" and isinstance(value, dict):
+                    # Server addresses are keyed by network name
+                    result[key] = {self.values.get(k, k): self._apply(v) for k, v in value.items()}
+                else:
+                    result[key] = self._apply(value)
+            return result
+        if isinstance(data, list):
+            return [self._apply(item) for item in data]
+        return data
+
+    def text(self, text: str) -> str:
+        text = _URL_HOST.sub(lambda m: m.group(1) + self._host(m.group(2)), text)
+        return _IPV4.sub(self._ip, text)
+
+    def url(self, url: str) -> str:
+        parts = urlsplit(url)
+        path = "/".join(quote(self.values.get(segment, segment)) for segment in parts.path.split("/"))
+        query = urlencode([(k, self._query_value(v)) for k, v in parse_qsl(parts.query, keep_blank_values=True)])
+        return self.text(urlunsplit((parts.scheme, parts.netloc, path, query, "")))
+
+    def _query_value(self, value: str) -> str:
+        # Exact-name filters are sent as anchored regular expressions (Nova "name=^web\-1$")
+        match = re.fullmatch(r"\^(.*)\$", value)
+        if match:
+            name = re.sub(r"\\(.)", r"\1", match.group(1))
+            if name in self.values:
+                return f"^{re.escape(self.values[name])}$"
+        return self.values.get(value, value)
+
+    def arguments(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: self.values.get(v, v) if isinstance(v, str) else v for k, v in arguments.items()}
+
+    def body(self, body: str) -> str:
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return self.text(body)
+        return self.text(json.dumps(self._apply(data), ensure_ascii=False))
+
+    def anonymize(self, fixture: Dict[str, Any]) -> None:
+        bodies = []
+        for interaction in fixture["interactions"]:
+            try:
+                bodies.append(json.loads(interaction["body"]))
+            except ValueError:
+                bodies.append(None)
+        for data in bodies:
+            self.collect(data)
+        # Credentials used for the recording map to the placeholders of the names they match in the token response
+        env = fixture["environment"]
+        for interaction in fixture["interactions"]:
+            interaction["url"] = self.url(interaction["url"])
+            interaction["body"] = self.body(interaction["body"])
+            headers = interaction["headers"]
+            for name in list(headers):
+                if name.lower() == "x-subject-token":
+                    headers[name] = "replay-token"
+                elif name.lower() == "location":
+                    headers[name] = self.url(headers[name])
+        if env.get("OS_AUTH_HOST"):
+            env["OS_AUTH_HOST"] = self._host(env["OS_AUTH_HOST"])
+        for name in ("OS_PROJECT_NAME", "OS_USERNAME"):
+            if env.get(name):
+                env[name] = self.values.get(env[name], env[name])
+        for scenario in fixture["scenarios"]:
+            scenario["arguments"] = self.arguments(scenario["arguments"])
+
+
+def _extend_token_expiry(fixture: Dict[str, Any]) -> None:
+    """Keep recorded tokens valid forever so replays never re-authenticate mid-scenario."""
+    for interaction in fixture["interactions"]:
+        if interaction["method"] == "POST" and interaction["url"].rstrip("/").endswith("/auth/tokens"):
+            try:
+                body = json.loads(interaction["body"])
+                body["token"]["expires_at"] = TOKEN_EXPIRY
+            except (ValueError, KeyError, TypeError):
+                continue
+            interaction["body"] = json.dumps(body, ensure_ascii=False)
+
+
+def _deduplicate_bodies(fixture: Dict[str, Any]) -> None:
+    """Store each distinct response body once; interactions reference it by hash."""
+    bodies: Dict[str, str] = {}
+    for interaction in fixture["interactions"]:
+        digest = hashlib.sha256(interaction["body"].encode("utf-8")).hexdigest()[:16]
+        bodies.setdefault(digest, interaction["body"])
+        interaction["body"] = digest
+    fixture["bodies"] = bodies
+
+
+def _parse_scenario(spec: str) -> Tuple[str, Dict[str, Any]]:
+    tool, _, arguments = spec.partition(":")
+    return tool.strip(), json.loads(arguments) if arguments.strip() else {}
+
+
+def _reports_failure(data: Any, depth: int = 0) -> bool:
+    """Check a tool's JSON result (and the service results it wraps) for success: false or an error."""
+    if not isinstance(data, dict) or depth > 1:
+        return False
+    if data.get("success") is False or data.get("error"):
+        return True
+    return any(_reports_failure(value, depth + 1) for value in data.values())
+
+
+async def _call_tool(client, tool: str, arguments: Dict[str, Any]) -> Tuple[float, bool, str]:
+    started = time.perf_counter()
+    result = await client.call_tool(tool, arguments, raise_on_error=False)
+    elapsed = time.perf_counter() - started
+    text = result.content[0].text if result.content else ""
+    error = result.is_error or text.startswith("Error") or text.startswith("❌")
+    if not error:
+        try:
+            error = _reports_failure(json.loads(text))
+        except ValueError:
+            pass
+    return elapsed, error, text
+
+
+async def _run_scenarios(scenarios: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    from fastmcp import Client
+    from mcp_openstack_ops.connection import get_openstack_connection
+    from mcp_openstack_ops.mcp_main import mcp
+
+    # Authenticate outside the scenarios so the token request is not charged to the first tool
+    _Scenario.index = -1
+    get_openstack_connection()
+
+    results = []
+    async with Client(mcp) as client:
+        for index, (tool, arguments) in enumerate(scenarios):
+            _Scenario.index = index
+            elapsed, error, text = await _call_tool(client, tool, arguments)
+            results.append({"tool": tool, "arguments": arguments, "seconds": round(elapsed, 3), "error": error,
+                            "error_text": text[:200] if error else None})
+    _Scenario.index = -1
+    return results
+
+
+def record(args: argparse.Namespace) -> int:
+    from mcp_openstack_ops import http_pool
+
+    scenarios = [_parse_scenario(s) for s in args.scenario] if args.scenario else DEFAULT_SCENARIOS
+    process = None
+    os.environ.update(BENCHMARK_ENV)
+    if args.fake:
+        process, fake_env = start_fake_server(args)
+        os.environ.update(fake_env)
+
+    interactions: List[Dict[str, Any]] = []
+    lock = threading.Lock()
+    http_pool.set_adapter_wrapper(lambda inner: RecordingAdapter(inner, interactions, lock))
+    try:
+        results = asyncio.run(_run_scenarios(scenarios))
+    finally:
+        http_pool.set_adapter_wrapper(None)
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    # A fixture recorded while a tool failed would pin the failure's (usually tiny) call budget
+    failures = [result for result in results if result["error"]]
+    if failures:
+        print(f"Not writing {args.output}: {len(failures)} scenarios failed while recording")
+        for result in failures:
+            print(f"  {result['tool']} {json.dumps(result['arguments'])}: {result['error_text']}")
+        return 1
+
+    fixture = {
+        "version": FIXTURE_VERSION,
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "anonymized": not args.no_anonymize,
+        "environment": {name: os.environ[name] for name in ENDPOINT_ENV if os.environ.get(name)},
+        "scenarios": [],
+        "interactions": interactions,
+    }
+    for index, result in enumerate(results):
+        calls = sum(1 for i in interactions if i["scenario"] == index)
+        fixture["scenarios"].append({
+            "tool": result["tool"],
+            "arguments": result["arguments"],
+            "recorded": {"calls": calls, "seconds": result["seconds"], "error": False},
+            "budget": {"max_calls": calls,
+                       "max_seconds": round(result["seconds"] * args.time_factor + DEFAULT_TIME_SLACK_SECONDS, 2)},
+        })
+        print(f"{result['tool']:<36} {calls:>6} calls {result['seconds']:>8.2f}s  ok")
+
+    _extend_token_expiry(fixture)
+    if not args.no_anonymize:
+        Anonymizer().anonymize(fixture)
+    _deduplicate_bodies(fixture)
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(fixture, indent=1, ensure_ascii=False) + "\n")
+    print(f"\n{len(interactions)} interactions in {len(results)} scenarios written to {output}")
+    return 0
+
+
+def check(args: argparse.Namespace) -> int:
+    from mcp_openstack_ops import http_pool
+
+    failed = False
+    for path in args.fixtures:
+        fixture = json.loads(Path(path).read_text())
+        if fixture.get("version") != FIXTURE_VERSION:
+            print(f"{path}: unsupported fixture version {fixture.get('version')}")
+            failed = True
+            continue
+
+        os.environ.update(BENCHMARK_ENV)
+        os.environ.update(fixture["environment"])
+        os.environ.setdefault("OS_PASSWORD", "replay")
+        counters: Dict[int, int] = {}
+        unmatched: List[str] = []
+        lock = threading.Lock()
+        http_pool.set_adapter_wrapper(
+            lambda inner: ReplayAdapter(fixture["interactions"], fixture["bodies"], args.latency, counters,
+                                        unmatched, lock))
+        try:
+            _reset_connections()
+            scenarios = [(s["tool"], s["arguments"]) for s in fixture["scenarios"]]
+            results = asyncio.run(_run_scenarios(scenarios))
+        finally:
+            http_pool.set_adapter_wrapper(None)
+            _reset_connections()
+
+        print(f"\n{path}")
+        print(f"{'tool':<36} {'calls':>11} {'seconds':>15}  result")
+        for index, (scenario, result) in enumerate(zip(fixture["scenarios"], results)):
+            budget = scenario["budget"]
+            calls = counters.get(index, 0)
+            problems = []
+            if calls > budget["max_calls"]:
+                problems.append(f"{calls - budget['max_calls']} calls over budget")
+            if args.latency == "recorded" and result["seconds"] > budget["max_seconds"]:
+                problems.append("slower than budget")
+            if result["error"] and not scenario["recorded"]["error"]:
+                problems.append(f"error: {result['error_text']}")
+            failed = failed or bool(problems)
+            print(f"{scenario['tool']:<36} {calls:>5}/{budget['max_calls']:<5} "
+                  f"{result['seconds']:>7.2f}/{budget['max_seconds']:<7.2f}  {'; '.join(problems) or 'ok'}")
+        if unmatched:
+            failed = True
+            print(f"{len(unmatched)} requests not in the fixture (re-record it if the change is intended):")
+            for key in sorted(set(unmatched))[:20]:
+                print(f"  {key}")
+    return 1 if failed else 0
+
+
+def _reset_connections() -> None:
+    """Drop pooled connections so the next one is created with the current adapter wrapper."""
+    from mcp_openstack_ops.connection import reset_connection_cache
+
+    reset_connection_cache()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record and replay upstream traffic of MCP tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Run scenarios against a cloud and save a fixture")
+    record_parser.add_argument("--output", required=True, help="Fixture file to write")
+    record_parser.add_argument("--scenario", action="append", default=[],
+                               help="tool or tool:{json arguments}; repeatable (default: built-in set)")
+    record_parser.add_argument("--fake", action="store_true", help="Record against benchmarks/fake_openstack.py")
+    record_parser.add_argument("--no-anonymize", action="store_true", help="Store traffic unmodified")
+    record_parser.add_argument("--time-factor", type=float, default=DEFAULT_TIME_FACTOR,
+                               help="Time budget = recorded seconds x factor + 0.5s")
+    add_dataset_arguments(record_parser, servers=200, ports=1000)
+
+    check_parser = subparsers.add_parser("check", help="Replay fixtures and enforce their budgets")
+    check_parser.add_argument("fixtures", nargs="+")
+    check_parser.add_argument("--latency", choices=("recorded", "none"), default="recorded",
+                              help="Replay recorded response times (needed for time budgets) or answer at once")
+
+    args = parser.parse_args()
+    sys.exit(record(args) if args.command == "record" else check(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Scale Benchmarks
+
+Runs the main read tools against the fake OpenStack API server
+(benchmarks/fake_openstack.py) and reports, per tool:
+
+- latency of the first (cold) call and median of the repeated (warm) calls
+- upstream API calls and response bytes, counted by the fake server
+- peak Python memory allocated during one call (tracemalloc, separate run so
+  tracing overhead does not distort latency)
+
+The fake server runs in a subprocess, so neither its dataset nor its request
+handling shows up in the measured memory or competes for the GIL.
+
+Usage:
+    python benchmarks/run_benchmarks.py --servers 10000 --ports 50000 \\
+        --latency-ms 5 --repeat 3 --output benchmark-results.json
+
+    # only some tools
+    python benchmarks/run_benchmarks.py --tools get_volume_list,get_routers
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARK_DIR.parent / "src"))
+
+# (tool, arguments) run by default; instance names exist in every dataset of >= 10 servers
+DEFAULT_BENCHMARKS: List[Tuple[str, Dict[str, Any]]] = [
+    ("get_instance_details", {"all_instances": True, "limit": 50}),
+    ("get_instance_details", {"all_instances": True, "include_all": True}),
+    ("search_instances", {"search_term": "server-0004"}),
+    ("get_instance_by_name", {"instance_name": "server-00007"}),
+    ("get_server_events", {"instance_name": "server-00007"}),
+    ("get_server_volumes", {"instance_name": "server-00007"}),
+    ("get_network_details", {}),
+    ("get_routers", {}),
+    ("get_security_groups", {}),
+    ("get_floating_ips", {}),
+    ("get_volume_list", {}),
+    ("get_volume_snapshots", {}),
+    ("get_image_detail_list", {}),
+    ("get_hypervisor_details", {}),
+    ("get_resource_monitoring", {}),
+    ("get_quota", {}),
+    ("get_usage_statistics", {}),
+    ("get_load_balancer_list", {}),
+    ("get_heat_stacks", {}),
+]
+
+# Server-side settings that would make repeated runs measure caches instead of the tools
+BENCHMARK_ENV = {
+    "MCP_AUTH_CACHE_ENABLE": "false",
+    "MCP_USAGE_CACHE_ENABLE": "false",
+    "MCP_SAMPLER_ENABLE": "false",
+    "ALLOW_MODIFY_OPERATIONS": "false",
+}
+
+
+def start_fake_server(args: argparse.Namespace) -> Tuple[subprocess.Popen, Dict[str, str]]:
+    """Start the fake OpenStack server and return the process and the environment pointing at it."""
+    command = [
+        sys.executable, str(BENCHMARK_DIR / "fake_openstack.py"), "--port-base", "0",
+        "--servers", str(args.servers), "--ports", str(args.ports), "--networks", str(args.networks),
+        "--volumes", str(args.volumes), "--images", str(args.images), "--hypervisors", str(args.hypervisors),
+        "--load-balancers", str(args.load_balancers), "--stacks", str(args.stacks),
+        "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+        "--error-rate", str(args.error_rate), "--service-latency", args.service_latency,
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    env: Dict[str, str] = {}
+    for line in process.stdout:
+        line = line.strip()
+        if line.startswith("Fake OpenStack ready"):
+            print(line)
+            return process, env
+        name, _, value = line.partition("=")
+        if name.startswith("OS_"):
+            env[name] = value
+    process.wait()
+    raise RuntimeError(f"Fake OpenStack server exited with code {process.returncode}")
+
+
+def _stats_request(env: Dict[str, str], reset: bool) -> Dict[str, Any]:
+    url = f"http://{env['OS_AUTH_HOST']}:{env['OS_AUTH_PORT']}/__fake__/stats" + ("/reset" if reset else "")
+    request = urllib.request.Request(url, method="POST" if reset else "GET", data=b"" if reset else None)
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.loads(response.read())
+
+
+async def _call(client, tool: str, arguments: Dict[str, Any]) -> Tuple[float, str, bool]:
+    started = time.perf_counter()
+    result = await client.call_tool(tool, arguments, raise_on_error=False)
+    elapsed = time.perf_counter() - started
+    text = result.content[0].text if result.content else ""
+    return elapsed, text, result.is_error or text.startswith("Error") or text.startswith("❌")
+
+
+async def run_benchmark(client, env: Dict[str, str], tool: str, arguments: Dict[str, Any],
+                        repeat: int) -> Dict[str, Any]:
+    """Measure one tool: cold call with API counts, warm repeats, then one call under tracemalloc."""
+    _stats_request(env, reset=True)
+    cold, text, error = await _call(client, tool, arguments)
+    stats = _stats_request(env, reset=False)
+
+    warm = []
+    for _ in range(repeat):
+        elapsed, _, _ = await _call(client, tool, arguments)
+        warm.append(elapsed)
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        await _call(client, tool, arguments)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "tool": tool,
+        "arguments": arguments,
+        "error": error,
+        "error_text": text[:200] if error else None,
+        "cold_ms": round(cold * 1000, 1),
+        "warm_p50_ms": round(statistics.median(warm) * 1000, 1) if warm else None,
+        "warm_max_ms": round(max(warm) * 1000, 1) if warm else None,
+        "api_calls": stats["total_requests"],
+        "api_bytes": stats["bytes_sent"],
+        "api_endpoints": stats["requests"],
+        "peak_memory_mb": round(peak / 2 ** 20, 2),
+        "result_chars": len(text),
+    }
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    header = f"{'tool':<42} {'cold ms':>9} {'warm p50':>9} {'API calls':>9} {'API MB':>8} {'peak MB':>8}  status"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        label = r["tool"] + (" " + ",".join(f"{k}={v}" for k, v in r["arguments"].items()) if r["arguments"] else "")
+        print(f"{label[:42]:<42} {r['cold_ms']:>9.1f} {r['warm_p50_ms'] or 0:>9.1f} {r['api_calls']:>9} "
+              f"{r['api_bytes'] / 2 ** 20:>8.2f} {r['peak_memory_mb']:>8.2f}  {'ERROR' if r['error'] else 'ok'}")
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    benchmarks = DEFAULT_BENCHMARKS
+    if args.tools:
+        wanted = {t.strip() for t in args.tools.split(",") if t.strip()}
+        benchmarks = [b for b in DEFAULT_BENCHMARKS if b[0] in wanted]
+        benchmarks += [(t, {}) for t in sorted(wanted - {b[0] for b in DEFAULT_BENCHMARKS})]
+
+    process, fake_env = start_fake_server(args)
+    try:
+        os.environ.update(BENCHMARK_ENV)
+        os.environ.update(fake_env)
+
+        from fastmcp import Client
+        from mcp_openstack_ops.mcp_main import mcp
+
+        results = []
+        async with Client(mcp) as client:
+            for tool, arguments in benchmarks:
+                result = await run_benchmark(client, fake_env, tool, arguments, args.repeat)
+                results.append(result)
+                if args.verbose:
+                    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+        print()
+        print_table(results)
+        if args.output:
+            report = {
+                "dataset": {name: getattr(args, name) for name in (
+                    "servers", "ports", "networks", "volumes", "images", "hypervisors", "load_balancers", "stacks")},
+                "faults": {"latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms,
+                           "error_rate": args.error_rate, "service_latency": args.service_latency},
+                "repeat": args.repeat,
+                "results": results,
+            }
+            Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False))
+            print(f"\nResults written to {args.output}")
+        return 1 if any(r["error"] for r in results) and args.fail_on_error else 0
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def add_dataset_arguments(parser: argparse.ArgumentParser, servers: int = 10000, ports: int = 50000) -> None:
+    """Fake cloud size and fault injection options (shared with replay.py)."""
+    parser.add_argument("--servers", type=int, default=servers)
+    parser.add_argument("--ports", type=int, default=ports)
+    parser.add_argument("--networks", type=int, default=max(10, servers // 50))
+    parser.add_argument("--volumes", type=int, default=servers // 2)
+    parser.add_argument("--images", type=int, default=max(10, servers // 20))
+    parser.add_argument("--hypervisors", type=int, default=max(5, servers // 50))
+    parser.add_argument("--load-balancers", type=int, default=max(2, servers // 200))
+    parser.add_argument("--stacks", type=int, default=max(2, servers // 200))
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per API request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra latency up to this value")
+    parser.add_argument("--service-latency", default="", help="Per-service latency, e.g. compute=50,network=20")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of API requests failing with 503")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MCP tools against a fake OpenStack cloud")
+    add_dataset_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=3, help="Warm calls per tool after the cold call")
+    parser.add_argument("--tools", default="", help="Comma-separated tools to run (default: built-in set)")
+    parser.add_argument("--output", default="", help="Write results as JSON to this file")
+    parser.add_argument("--fail-on-error", action="store_true", help="Exit 1 if any tool returned an error")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Multi-Tenant Load Test
+
+Measures tool-call throughput of a running streamable-http server as the number
+of concurrent clients grows, with clients spread across several bearer tokens
+(each mapped to its own OpenStack project via REMOTE_TOKEN_MAP_FILE).
+
+Usage:
+    python load_test_multi_tenant.py --url http://127.0.0.1:8000/mcp \\
+        --tokens team-a-token,team-b-token,team-c-token \\
+        --concurrency 1,2,4,8,16 --duration 20 --tool get_volume_list
+
+Requirements:
+    - Server started with REMOTE_AUTH_ENABLE=true and a token map
+    - fastmcp installed (client side)
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+from fastmcp import Client
+from fastmcp.client.transports import StreamableHttpTransport
+
+
+async def _client_worker(url: str, token: str, tool: str, arguments: Dict, deadline: float,
+                         latencies: List[float], errors: List[str]) -> None:
+    transport = StreamableHttpTransport(url, auth=token)
+    async with Client(transport) as client:
+        while time.monotonic() < deadline:
+            started = time.monotonic()
+            try:
+                result = await client.call_tool(tool, arguments)
+                text = result.content[0].text if result.content else ""
+                if text.startswith("Error:") or text.startswith("❌"):
+                    errors.append(text[:120])
+                else:
+                    latencies.append(time.monotonic() - started)
+            except Exception as e:
+                errors.append(str(e)[:120])
+
+
+async def run_level(url: str, tokens: List[str], concurrency: int, duration: float,
+                    tool: str, arguments: Dict) -> Dict:
+    """Run `concurrency` clients round-robin over tokens for `duration` seconds."""
+    per_token_latencies = {token: [] for token in tokens}
+    errors: List[str] = []
+    deadline = time.monotonic() + duration
+
+    workers = []
+    for index in range(concurrency):
+        token = tokens[index % len(tokens)]
+        workers.append(_client_worker(url, token, tool, arguments, deadline,
+                                      per_token_latencies[token], errors))
+
+    started = time.monotonic()
+    await asyncio.gather(*workers)
+    elapsed = time.monotonic() - started
+
+    all_latencies = [lat for lats in per_token_latencies.values() for lat in lats]
+    all_latencies.sort()
+    return {
+        'concurrency': concurrency,
+        'calls': len(all_latencies),
+        'errors': len(errors),
+        'throughput_per_sec': round(len(all_latencies) / elapsed, 2) if elapsed else 0,
+        'p50_ms': round(statistics.median(all_latencies) * 1000, 1) if all_latencies else None,
+        'p95_ms': round(all_latencies[int(len(all_latencies) * 0.95) - 1] * 1000, 1) if len(all_latencies) >= 20 else None,
+        'calls_per_project': {f"token#{i + 1}": len(per_token_latencies[t]) for i, t in enumerate(tokens)},
+        'sample_errors': errors[:3],
+    }
+
+
+async def main_async(args) -> int:
+    tokens = [t.strip() for t in args.tokens.split(',') if t.strip()]
+    levels = [int(c) for c in args.concurrency.split(',')]
+    arguments = json.loads(args.arguments) if args.arguments else {}
+
+    print(f"Load test: tool={args.tool}, projects={len(tokens)}, duration={args.duration}s per level")
+    print(f"{'clients':>8} {'calls':>7} {'errors':>7} {'calls/s':>9} {'p50 ms':>8} {'p95 ms':>8}  speedup")
+
+    results = []
+    baseline = None
+    for level in levels:
+        result = await run_level(args.url, tokens, level, args.duration, args.tool, arguments)
+        results.append(result)
+        if baseline is None:
+            baseline = result['throughput_per_sec'] or None
+        speedup = f"{result['throughput_per_sec'] / baseline:.2f}x" if baseline else "n/a"
+        print(f"{level:>8} {result['calls']:>7} {result['errors']:>7} {result['throughput_per_sec']:>9} "
+              f"{str(result['p50_ms']):>8} {str(result['p95_ms']):>8}  {speedup}")
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    return 1 if any(r['errors'] for r in results) else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-tenant throughput load test for mcp-openstack-ops")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/mcp", help="MCP endpoint URL")
+    parser.add_argument("--tokens", required=True, help="Comma-separated bearer tokens (one per project)")
+    parser.add_argument("--concurrency", default="1,2,4,8,16", help="Comma-separated concurrent client counts")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per concurrency level")
+    parser.add_argument("--tool", default="get_volume_list", help="Read-only tool to call")
+    parser.add_argument("--arguments", default="", help="Tool arguments as a JSON object")
+    parser.add_argument("--json", action="store_true", help="Also print raw results as JSON")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
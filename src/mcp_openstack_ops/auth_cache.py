@@ -0,0 +1,198 @@
+"""
+Persistent Keystone Auth and Discovery Cache
+
+Opt-in on-disk cache for the Keystone token (auth state) and endpoint version
+discovery documents. A freshly started process - a short-lived stdio server or a
+restarted container - loads the cached state and skips the initial Keystone
+authentication and version discovery round-trips while the token is still valid.
+
+Cache files are keyed by auth URL, project, user and a hash of the credential
+secret, and are only written to and read from a directory and files accessible
+by the current user (0700 / 0600).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mcp-openstack-ops")
+
+# Tokens expiring within this window are not reused from disk
+TOKEN_EXPIRY_MARGIN_SECONDS = 300
+
+# Version discovery documents change only on upgrades
+DISCOVERY_TTL_SECONDS = 24 * 3600
+
+
+def is_auth_cache_enabled() -> bool:
+    """Check whether the on-disk auth cache is enabled via MCP_AUTH_CACHE_ENABLE."""
+    return os.environ.get("MCP_AUTH_CACHE_ENABLE", "false").strip().lower() in ("true", "1", "yes", "on")
+
+
+def get_cache_dir() -> str:
+    """Return the cache directory (MCP_AUTH_CACHE_DIR or ~/.cache/mcp-openstack-ops)."""
+    return os.environ.get("MCP_AUTH_CACHE_DIR") or DEFAULT_CACHE_DIR
+
+
+def build_cache_key(auth_url: str, project_name: str, project_domain: str,
+                    username: str, user_domain: str, secret: str = '') -> str:
+    """
+    Build a stable, non-reversible cache key from the identity of the credentials.
+
+    The secret (password or application credential secret) is part of the key, so
+    a wrong or rotated password never matches a token cached for the old one.
+    """
+    secret_hash = hashlib.sha256((secret or '').encode('utf-8')).hexdigest()
+    identity = '|'.join([auth_url, project_domain, project_name, user_domain, username, secret_hash])
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()[:32]
+
+
+def _cache_path(cache_key: str) -> str:
+    return os.path.join(get_cache_dir(), f"auth-{cache_key}.json")
+
+
+def _ensure_private_dir(path: str) -> None:
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    os.chmod(path, 0o700)
+
+
+def _is_private_file(path: str) -> bool:
+    """Refuse cache files that are not owned by us or are readable by others."""
+    st = os.stat(path)
+    if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+        return False
+    return not (st.st_mode & (stat.S_IRWXG | stat.S_IRWXO))
+
+
+def _token_expires_at(auth_state: Dict[str, Any]) -> Optional[float]:
+    token_body = auth_state.get('body', {}).get('token', {})
+    expires_at = token_body.get('expires_at')
+    if not expires_at:
+        return None
+    try:
+        parsed = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    except ValueError:
+        return None
+
+
+def load_auth_state(conn, cache_key: str) -> bool:
+    """
+    Install cached auth state and discovery documents into a new connection.
+
+    Args:
+        conn: Freshly created (not yet authenticated) OpenStack connection
+        cache_key: Key returned by build_cache_key()
+
+    Returns:
+        bool: True if a still-valid token was installed
+    """
+    path = _cache_path(cache_key)
+    if not os.path.exists(path):
+        return False
+
+    try:
+        if not _is_private_file(path):
+            logger.warning(f"Ignoring auth cache {path}: file is not private to the current user")
+            return False
+
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+
+        now = time.time()
+        token_loaded = False
+
+        auth_state = cached.get('auth_state')
+        expires_at = _token_expires_at(auth_state) if auth_state else None
+        if expires_at and expires_at - now > TOKEN_EXPIRY_MARGIN_SECONDS:
+            conn.session.auth.set_auth_state(json.dumps(auth_state))
+            token_loaded = True
+
+        discovery = cached.get('discovery', {})
+        discovery_saved_at = cached.get('discovery_saved_at', 0)
+        if discovery and now - discovery_saved_at < DISCOVERY_TTL_SECONDS:
+            from keystoneauth1 import discover
+
+            # Keep the original timestamp so re-saving does not extend the TTL
+            conn.session._mcp_discovery_saved_at = discovery_saved_at
+            for url, version_data in discovery.items():
+                disc = discover.Discover.__new__(discover.Discover)
+                disc._url = url
+                disc._data = version_data
+                conn.session._discovery_cache[url] = disc
+
+        logger.info(f"Loaded auth cache ({'token reused' if token_loaded else 'token expired'}, "
+                    f"{len(discovery)} discovery documents)")
+        return token_loaded
+
+    except Exception as e:
+        logger.warning(f"Failed to load auth cache {path}: {e}")
+        return False
+
+
+def save_auth_state(conn, cache_key: str) -> None:
+    """
+    Persist the connection's current auth state and discovery documents.
+
+    Args:
+        conn: Authenticated OpenStack connection
+        cache_key: Key returned by build_cache_key()
+    """
+    path = _cache_path(cache_key)
+    try:
+        auth_state = conn.session.auth.get_auth_state()
+        if not auth_state:
+            return
+
+        discovery = {
+            url: disc._data
+            for url, disc in getattr(conn.session, '_discovery_cache', {}).items()
+            if getattr(disc, '_data', None)
+        }
+
+        now = time.time()
+        payload = {
+            'saved_at': now,
+            'auth_state': json.loads(auth_state),
+            'discovery_saved_at': getattr(conn.session, '_mcp_discovery_saved_at', now),
+            'discovery': discovery,
+        }
+
+        cache_dir = get_cache_dir()
+        _ensure_private_dir(cache_dir)
+        # Unique temp file per writer (created 0600), so concurrent saves never share it
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_dir, prefix='auth-',
+                                         suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            json.dump(payload, f)
+        try:
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        logger.debug(f"Saved auth cache with {len(discovery)} discovery documents to {path}")
+
+    except Exception as e:
+        logger.warning(f"Failed to save auth cache {path}: {e}")
+
+
+def clear_auth_state(cache_key: str) -> None:
+    """Remove the cache file for the given key (e.g. after credentials were rejected)."""
+    path = _cache_path(cache_key)
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to remove auth cache {path}: {e}")
@@ -0,0 +1,228 @@
+"""
+Per-Service Circuit Breaker
+
+Pipeline interceptor that stops sending requests to an OpenStack service which
+is known to be down. Each service type (compute, network, orchestration, ...)
+has its own breaker:
+
+- closed: requests flow; consecutive connection failures, timeouts and 5xx
+  responses are counted, and MCP_BREAKER_FAILURE_THRESHOLD of them trip it
+- open: requests fail immediately with CircuitOpenError instead of waiting
+  for the SDK timeout, for MCP_BREAKER_RESET_SECONDS
+- half-open: a single probe request is let through; success closes the
+  breaker, failure re-opens it
+
+CircuitOpenError is a keystoneauth ConnectionError, so composite tools that
+already catch per-service failures return degraded results in milliseconds.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from keystoneauth1 import exceptions as ksa_exceptions
+
+from .request_pipeline import PipelineRequest
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_SECONDS = 30.0
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(ksa_exceptions.ConnectionError):
+    """Raised without contacting the service while its circuit breaker is open."""
+
+    def __init__(self, service_type: str, retry_in: float, last_error: Optional[str]):
+        self.service_type = service_type
+        self.retry_in = retry_in
+        message = (f"{service_type} service unavailable (circuit breaker open, "
+                   f"next probe in {retry_in:.0f}s)")
+        if last_error:
+            message += f": last error: {last_error}"
+        super().__init__(message)
+
+
+def _is_enabled() -> bool:
+    return os.environ.get("MCP_BREAKER_ENABLE", "true").strip().lower() in ("true", "1", "yes", "on")
+
+
+def _get_failure_threshold() -> int:
+    try:
+        return max(1, int(os.environ.get("MCP_BREAKER_FAILURE_THRESHOLD", DEFAULT_FAILURE_THRESHOLD)))
+    except ValueError:
+        return DEFAULT_FAILURE_THRESHOLD
+
+
+def _get_reset_seconds() -> float:
+    try:
+        return max(1.0, float(os.environ.get("MCP_BREAKER_RESET_SECONDS", DEFAULT_RESET_SECONDS)))
+    except ValueError:
+        return DEFAULT_RESET_SECONDS
+
+
+def _is_server_failure(status_code: int) -> bool:
+    # 501 Not Implemented is a client-visible API gap, not an unhealthy backend
+    return status_code >= 500 and status_code != 501
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one service."""
+
+    def __init__(self, service_type: str):
+        self.service_type = service_type
+        self._lock = threading.Lock()
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.last_error: Optional[str] = None
+        self.trips = 0
+        self.rejected = 0
+
+    def before_request(self) -> bool:
+        """
+        Admit or reject a request.
+
+        Returns:
+            True if the admitted request is the half-open probe
+
+        Raises:
+            CircuitOpenError: If the breaker is open (or a probe is already running)
+        """
+        reset_seconds = _get_reset_seconds()
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return False
+            elapsed = time.monotonic() - self.opened_at
+            if self.state == STATE_OPEN and elapsed >= reset_seconds:
+                self.state = STATE_HALF_OPEN
+            if self.state == STATE_HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return True
+            self.rejected += 1
+            retry_in = max(0.0, reset_seconds - elapsed)
+            last_error = self.last_error
+        raise CircuitOpenError(self.service_type, retry_in, last_error)
+
+    def record_success(self, probe: bool) -> None:
+        with self._lock:
+            if probe:
+                self.probe_in_flight = False
+            if self.state != STATE_CLOSED:
+                logger.info(f"Circuit breaker for {self.service_type} closed (service recovered)")
+            self.state = STATE_CLOSED
+            self.consecutive_failures = 0
+
+    def record_failure(self, probe: bool, error: str) -> None:
+        with self._lock:
+            if probe:
+                self.probe_in_flight = False
+            self.consecutive_failures += 1
+            self.last_error = error
+            should_open = probe or self.consecutive_failures >= _get_failure_threshold()
+            if should_open and self.state != STATE_OPEN:
+                self.trips += 1
+                logger.warning(f"Circuit breaker for {self.service_type} opened after "
+                               f"{self.consecutive_failures} consecutive failures: {error}")
+            if should_open:
+                self.state = STATE_OPEN
+                self.opened_at = time.monotonic()
+
+    def release_probe(self, probe: bool) -> None:
+        """Give up a probe slot without a verdict (e.g. interrupted request)."""
+        if probe:
+            with self._lock:
+                self.probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self.state
+            if state == STATE_OPEN and time.monotonic() - self.opened_at >= _get_reset_seconds():
+                state = STATE_HALF_OPEN
+            return {
+                'state': state,
+                'consecutive_failures': self.consecutive_failures,
+                'trips': self.trips,
+                'rejected_requests': self.rejected,
+                'last_error': self.last_error,
+            }
+
+
+_breakers_lock = threading.Lock()
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(service_type: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(service_type)
+        if breaker is None:
+            breaker = CircuitBreaker(service_type)
+            _breakers[service_type] = breaker
+        return breaker
+
+
+def circuit_breaker_interceptor(request: PipelineRequest, call_next):
+    """Pipeline interceptor failing fast for services whose breaker is open."""
+    if not _is_enabled():
+        return call_next(request)
+
+    breaker = get_breaker(request.service_type)
+    probe = breaker.before_request()
+    try:
+        response = call_next(request)
+    except ksa_exceptions.ConnectionError as e:
+        if (isinstance(e, ksa_exceptions.ConnectTimeout) and request.deadline is not None
+                and time.monotonic() >= request.deadline):
+            # Timed out on the caller's shortened deadline, not a verdict on the service
+            breaker.release_probe(probe)
+            raise
+        # Connect failures, timeouts and SSL errors
+        breaker.record_failure(probe, f"{type(e).__name__}: {e}")
+        raise
+    except ksa_exceptions.HttpError as e:
+        if _is_server_failure(e.http_status or 0):
+            breaker.record_failure(probe, f"HTTP {e.http_status}")
+        else:
+            breaker.record_success(probe)
+        raise
+    except BaseException:
+        breaker.release_probe(probe)
+        raise
+
+    if _is_server_failure(response.status_code):
+        breaker.record_failure(probe, f"HTTP {response.status_code}")
+    else:
+        breaker.record_success(probe)
+    return response
+
+
+def get_circuit_breaker_status() -> Dict[str, Any]:
+    """
+    Get circuit breaker state per OpenStack service.
+
+    Returns:
+        Dict with breaker configuration and per-service state
+    """
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {
+        'enabled': _is_enabled(),
+        'failure_threshold': _get_failure_threshold(),
+        'reset_seconds': _get_reset_seconds(),
+        'services': {name: breakers[name].snapshot() for name in sorted(breakers)},
+    }
+
+
+def get_open_circuits() -> Dict[str, Dict[str, Any]]:
+    """Get services whose breaker is not closed (failing fast or probing)."""
+    status = get_circuit_breaker_status()['services']
+    return {name: s for name, s in status.items() if s['state'] != STATE_CLOSED}
+
@@ -0,0 +1,51 @@
+"""
+Concurrency Helpers
+
+Small thread-pool utilities shared by background tasks and composite tools.
+OpenStack SDK calls are blocking, so independent upstream calls are fanned out
+to worker threads. Each task runs inside a copy of the caller's context so that
+context variables (project scope, deadlines, tracing) follow the work.
+"""
+
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def run_in_parallel(func: Callable[[Any], Any], items: Iterable[Any],
+                    max_workers: int = DEFAULT_MAX_WORKERS) -> List[Tuple[Any, Any, Exception]]:
+    """
+    Run func(item) for every item on a bounded thread pool.
+
+    Args:
+        func: Callable applied to each item
+        items: Items to process
+        max_workers: Upper bound on concurrently running calls
+
+    Returns:
+        List of (item, result, error) tuples in input order. Exactly one of
+        result/error is meaningful; error is None on success.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def _call(ctx: contextvars.Context, item: Any) -> Tuple[Any, Any, Exception]:
+        try:
+            return item, ctx.run(func, item), None
+        except Exception as e:
+            return item, None, e
+
+    workers = max(1, min(max_workers, len(items)))
+    if workers == 1:
+        return [_call(contextvars.copy_context(), item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-openstack") as executor:
+        futures = [executor.submit(_call, contextvars.copy_context(), item) for item in items]
+        return [future.result() for future in futures]
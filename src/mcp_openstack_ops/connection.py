@@ -4,46 +4,226 @@ OpenStack Connection Management Module
 This module handles OpenStack SDK connection establishment and caching.
 Separated to avoid circular imports with service modules.
 
+A single process can serve several projects and credentials: connections are
+pooled per credential set (LRU, bounded by MCP_CONNECTION_POOL_SIZE) and selected
+with project_scope() / credential_scope(). Connections obtained inside a
+connection_lease() (one per tool invocation) are reference-counted: an evicted
+connection is closed only once the last lease holding it is released.
+
 Added Project Isolation Security Features:
 - Current project ID verification
 - Resource project ownership validation 
 - Cross-project access prevention
 """
 
+import atexit
 import logging
 import os
-from typing import Optional, Any, Dict
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Any, Dict, List
 from dotenv import load_dotenv
 from openstack import connection
 
+from . import auth_cache
+from .http_pool import get_api_timeout, install_http_adapter
+from .request_pipeline import install_request_pipeline
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Global connection cache
-_connection_cache: Optional[connection.Connection] = None
+DEFAULT_CONNECTION_POOL_SIZE = 8
 
+# Pool of project-scoped connections keyed by credential identity, kept in LRU order.
+# Each connection owns its own keystoneauth session and therefore its own token cache.
+_connection_pool: "OrderedDict[str, connection.Connection]" = OrderedDict()
+_pool_lock = threading.Lock()
+_creation_locks: Dict[str, threading.Lock] = {}
+# id(connection) -> number of leases holding it; evicted connections still held wait in _retired
+_connection_refs: Dict[int, int] = {}
+_retired: Dict[int, Any] = {}
+_env_loaded = False
 
-def get_openstack_connection():
+# Project selected for the current tool invocation (None = OS_PROJECT_NAME)
+_active_project: ContextVar[Optional[str]] = ContextVar("mcp_openstack_active_project", default=None)
+
+# Credential profile of the current request (streamable-http token mapping), None = environment
+_active_credentials: ContextVar[Optional[Dict[str, Any]]] = ContextVar("mcp_openstack_active_credentials", default=None)
+
+# Connections held by the current lease (id -> connection), None outside connection_lease()
+_active_lease: ContextVar[Optional[Dict[int, Any]]] = ContextVar("mcp_openstack_active_lease", default=None)
+
+
+def _ensure_env_loaded() -> None:
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
+def get_allowed_projects() -> List[str]:
     """
-    Creates and caches OpenStack connection using proxy URLs for all services.
-    Returns cached connection if available to improve performance.
+    Get the project names this server may scope connections to.
+    
+    OS_PROJECT_NAME is always allowed; OS_ALLOWED_PROJECTS adds a comma-separated
+    list of further projects served from the same process. Inside a
+    credential_scope() the profile's own project list applies instead.
+    
+    Returns:
+        List of allowed project names (default project first)
     """
-    global _connection_cache
+    _ensure_env_loaded()
+    profile = _active_credentials.get()
+    if profile is not None:
+        # A mapped credential is confined to the projects of its own profile
+        default_project = profile.get('project_name') or os.environ.get("OS_PROJECT_NAME")
+        extra_projects = profile.get('allowed_projects', [])
+    else:
+        default_project = os.environ.get("OS_PROJECT_NAME")
+        extra_projects = os.environ.get("OS_ALLOWED_PROJECTS", "").split(',')
     
-    if _connection_cache is not None:
-        try:
-            # Test connection validity
-            _connection_cache.identity.get_token()
-            return _connection_cache
-        except Exception as e:
-            logger.warning(f"Cached connection invalid, creating new one: {e}")
-            _connection_cache = None
+    allowed = []
+    if default_project:
+        allowed.append(default_project)
+    for name in extra_projects:
+        name = name.strip()
+        if name and name not in allowed:
+            allowed.append(name)
+    return allowed
+
+
+def get_active_project_name() -> Optional[str]:
+    """Get the project the current invocation is scoped to (defaults to OS_PROJECT_NAME)."""
+    _ensure_env_loaded()
+    profile = _active_credentials.get() or {}
+    return _active_project.get() or profile.get('project_name') or os.environ.get("OS_PROJECT_NAME")
+
+
+@contextmanager
+def project_scope(project_name: Optional[str]):
+    """
+    Scope all connections obtained inside the block to the given project.
     
-    load_dotenv()
+    Args:
+        project_name: Allowed project name, or empty/None to keep the default project
+        
+    Raises:
+        ValueError: If the project is not in the allowed project list
+    """
+    if not project_name:
+        yield
+        return
+    
+    allowed = get_allowed_projects()
+    if project_name not in allowed:
+        raise ValueError(f"Project '{project_name}' is not served by this server. Allowed projects: {allowed}")
+    
+    token = _active_project.set(project_name)
+    try:
+        yield
+    finally:
+        _active_project.reset(token)
+
+
+@contextmanager
+def credential_scope(profile: Optional[Dict[str, Any]]):
+    """
+    Use a credential profile instead of the environment credentials inside the block.
+    
+    Args:
+        profile: Dict with any of project_name, username, password, user_domain_name,
+                 project_domain_name and allowed_projects; missing keys fall back to
+                 the environment. None keeps the environment credentials.
+    """
+    if profile is None:
+        yield
+        return
+    
+    token = _active_credentials.set(profile)
+    try:
+        yield
+    finally:
+        _active_credentials.reset(token)
+
+
+@contextmanager
+def connection_lease(detached: bool = False):
+    """
+    Hold every pooled connection obtained inside the block until the block exits.
+    
+    A connection evicted from the pool meanwhile (LRU) stays open for the holders
+    and is closed when the last lease holding it is released. Worker threads
+    started with a copy of the context (run_in_parallel) share the lease.
+    Nested leases are no-ops unless detached: a detached lease is taken
+    separately, for code that may keep running after the enclosing lease is
+    released (a tool body abandoned at its deadline).
+    """
+    if _active_lease.get() is not None and not detached:
+        yield
+        return
+    
+    held: Dict[int, Any] = {}
+    token = _active_lease.set(held)
+    try:
+        yield
+    finally:
+        _active_lease.reset(token)
+        to_close = []
+        with _pool_lock:
+            for conn_id in held:
+                remaining = _connection_refs.get(conn_id, 1) - 1
+                if remaining > 0:
+                    _connection_refs[conn_id] = remaining
+                    continue
+                _connection_refs.pop(conn_id, None)
+                if conn_id in _retired:
+                    to_close.append(_retired.pop(conn_id))
+        for key, conn in to_close:
+            _close_connection(key, conn)
+
+
+def _acquire(conn) -> None:
+    """Register conn with the current lease. Caller holds _pool_lock."""
+    held = _active_lease.get()
+    if held is None or id(conn) in held:
+        return
+    held[id(conn)] = conn
+    _connection_refs[id(conn)] = _connection_refs.get(id(conn), 0) + 1
+
+
+def _retire(key: str, conn) -> bool:
+    """
+    Close an evicted connection now, or defer closing while a lease still holds it.
+    Caller holds _pool_lock.
+    
+    Returns:
+        bool: True if the caller must close the connection now
+    """
+    if _connection_refs.get(id(conn), 0) > 0:
+        _retired[id(conn)] = (key, conn)
+        return False
+    return True
+
+
+def _get_pool_size() -> int:
+    try:
+        return max(1, int(os.environ.get("MCP_CONNECTION_POOL_SIZE", DEFAULT_CONNECTION_POOL_SIZE)))
+    except ValueError:
+        return DEFAULT_CONNECTION_POOL_SIZE
+
+
+def _resolve_credentials() -> Dict[str, str]:
+    """Build the credential set for the active scope from the profile and the environment."""
+    _ensure_env_loaded()
+    profile = _active_credentials.get() or {}
     
-    # Check required environment variables
+    # Check required environment variables (credentials may come from the profile)
     required_vars = ["OS_PROJECT_NAME", "OS_USERNAME", "OS_PASSWORD", "OS_AUTH_HOST", "OS_AUTH_PORT"]
-    missing_vars = [var for var in required_vars if not os.environ.get(var)]
+    profile_fields = {"OS_PROJECT_NAME": 'project_name', "OS_USERNAME": 'username', "OS_PASSWORD": 'password'}
+    missing_vars = [var for var in required_vars
+                    if not os.environ.get(var) and not profile.get(profile_fields.get(var, ''))]
     
     if missing_vars:
         error_msg = f"Missing required OpenStack environment variables: {missing_vars}"
@@ -51,6 +231,92 @@ def get_openstack_connection():
         logger.error("Please ensure your .env file contains OpenStack authentication credentials")
         raise ValueError(error_msg)
     
+    return {
+        'project_name': get_active_project_name(),
+        'project_domain_name': profile.get('project_domain_name') or os.environ.get("OS_PROJECT_DOMAIN_NAME", "Default"),
+        'username': profile.get('username') or os.environ.get("OS_USERNAME"),
+        'password': profile.get('password') or os.environ.get("OS_PASSWORD"),
+        'user_domain_name': profile.get('user_domain_name') or os.environ.get("OS_USER_DOMAIN_NAME", "Default"),
+    }
+
+
+def _get_auth_url() -> str:
+    os_auth_protocol = os.environ.get("OS_AUTH_PROTOCOL", "http").lower()
+    if os_auth_protocol not in ["http", "https"]:
+        os_auth_protocol = "http"
+    return f"{os_auth_protocol}://{os.environ.get('OS_AUTH_HOST')}:{os.environ.get('OS_AUTH_PORT')}"
+
+
+def _pool_key(credentials: Dict[str, str]) -> str:
+    return auth_cache.build_cache_key(
+        _get_auth_url(),
+        credentials['project_name'],
+        credentials['project_domain_name'],
+        credentials['username'],
+        credentials['user_domain_name'],
+        credentials['password'],
+    )
+
+
+def get_openstack_connection():
+    """
+    Creates and caches OpenStack connection using proxy URLs for all services.
+    Returns cached connection if available to improve performance.
+    
+    Connections are pooled per project (see project_scope()); the least recently
+    used connection is closed once MCP_CONNECTION_POOL_SIZE is exceeded.
+    """
+    credentials = _resolve_credentials()
+    key = _pool_key(credentials)
+    
+    with _pool_lock:
+        conn = _connection_pool.get(key)
+        if conn is not None:
+            _connection_pool.move_to_end(key)
+            _acquire(conn)
+        creation_lock = _creation_locks.setdefault(key, threading.Lock())
+    
+    if conn is not None:
+        try:
+            # Test connection validity
+            conn.identity.get_token()
+            return conn
+        except Exception as e:
+            logger.warning(f"Cached connection invalid, creating new one: {e}")
+            _evict(key, conn)
+    
+    # Only one thread authenticates per credential set; the others reuse its result
+    with creation_lock:
+        with _pool_lock:
+            conn = _connection_pool.get(key)
+            if conn is not None:
+                _acquire(conn)
+        if conn is not None:
+            return conn
+        
+        conn = _create_connection(credentials, key)
+        
+        with _pool_lock:
+            _connection_pool[key] = conn
+            _acquire(conn)
+            evicted = []
+            while len(_connection_pool) > _get_pool_size():
+                evicted_key, evicted_conn = _connection_pool.popitem(last=False)
+                if _retire(evicted_key, evicted_conn):
+                    evicted.append((evicted_key, evicted_conn))
+                else:
+                    logger.info(f"Connection pool full, closing connection for project "
+                                f"{evicted_conn.auth.get('project_name')} once in-flight calls release it")
+        
+        for evicted_key, evicted_conn in evicted:
+            logger.info(f"Connection pool full, closing least recently used connection for project "
+                        f"{evicted_conn.auth.get('project_name')}")
+            _close_connection(evicted_key, evicted_conn)
+        
+        return conn
+
+
+def _create_connection(credentials: Dict[str, str], key: str):
     # Get OpenStack connection parameters
     os_auth_host = os.environ.get("OS_AUTH_HOST")
     os_auth_port = os.environ.get("OS_AUTH_PORT")
@@ -88,16 +354,19 @@ def get_openstack_connection():
     heat_stack_port = os.environ.get("OS_HEAT_STACK_PORT", "8004")
     heat_stack_cfn_port = os.environ.get("OS_HEAT_STACK_CFN_PORT", "18888")
     
+    use_auth_cache = auth_cache.is_auth_cache_enabled()
+    
     try:
-        logger.info(f"Creating OpenStack connection with protocol: {os_auth_protocol}, host: {os_auth_host}")
-        _connection_cache = connection.Connection(
+        logger.info(f"Creating OpenStack connection with protocol: {os_auth_protocol}, host: {os_auth_host}, "
+                    f"project: {credentials['project_name']}")
+        conn = connection.Connection(
             auth_url=f"{os_auth_protocol}://{os_auth_host}:{os_auth_port}",
             verify=verify_ssl,
-            project_name=os.environ.get("OS_PROJECT_NAME"),
-            username=os.environ.get("OS_USERNAME"),
-            password=os.environ.get("OS_PASSWORD"),
-            user_domain_name=os.environ.get("OS_USER_DOMAIN_NAME", "Default"),
-            project_domain_name=os.environ.get("OS_PROJECT_DOMAIN_NAME", "Default"),
+            project_name=credentials['project_name'],
+            username=credentials['username'],
+            password=credentials['password'],
+            user_domain_name=credentials['user_domain_name'],
+            project_domain_name=credentials['project_domain_name'],
             region_name=os.environ.get("OS_REGION_NAME", "RegionOne"),
             identity_api_version=os.environ.get("OS_IDENTITY_API_VERSION", "3"),
             interface="internal",
@@ -109,33 +378,108 @@ def get_openstack_connection():
             image_endpoint=f"{os_auth_protocol}://{os_auth_host}:{image_port}",
             placement_endpoint=f"{os_auth_protocol}://{os_auth_host}:{placement_port}",
             orchestration_endpoint=f"{os_auth_protocol}://{os_auth_host}:{heat_stack_port}/v1",
-            timeout=10
+            timeout=get_api_timeout()
         )
+        install_http_adapter(conn)
+        install_request_pipeline(conn)
+        
+        # Reuse a still-valid token and discovery results from a previous process
+        if use_auth_cache:
+            auth_cache.load_auth_state(conn, key)
         
         # Test the connection
         try:
-            token = _connection_cache.identity.get_token()
+            token = conn.identity.get_token()
             logger.info(f"OpenStack connection successful. Token acquired: {token[:20]}...")
         except Exception as test_e:
             logger.error(f"Connection test failed: {test_e}")
+            if use_auth_cache:
+                auth_cache.clear_auth_state(key)
             raise
+        
+        # Heat serves its API under /v1/{project_id}; scope the endpoint before the proxy is built
+        conn.config.config['orchestration_endpoint_override'] = (
+            f"{os_auth_protocol}://{os_auth_host}:{heat_stack_port}/v1/{conn.current_project_id}")
+        
+        if use_auth_cache:
+            auth_cache.save_auth_state(conn, key)
             
-        return _connection_cache
+        return conn
     except Exception as e:
         logger.error(f"Failed to create OpenStack connection: {e}")
         logger.error("Please check your OpenStack credentials and network connectivity")
         raise
 
 
+def _close_connection(key: str, conn) -> None:
+    if auth_cache.is_auth_cache_enabled():
+        auth_cache.save_auth_state(conn, key)
+    try:
+        conn.close()
+    except Exception as e:
+        logger.debug(f"Error closing connection: {e}")
+
+
+def _evict(key: str, conn) -> None:
+    """Drop conn from the pool and close it, unless another thread already replaced it."""
+    with _pool_lock:
+        if _connection_pool.get(key) is not conn:
+            return
+        del _connection_pool[key]
+        close_now = _retire(key, conn)
+    if close_now:
+        _close_connection(key, conn)
+
+
 def reset_connection_cache():
     """
     Reset the connection cache. Useful for testing or when connection parameters change.
     """
-    global _connection_cache
-    _connection_cache = None
+    with _pool_lock:
+        connections = [(key, conn) for key, conn in _connection_pool.items() if _retire(key, conn)]
+        _connection_pool.clear()
+    for key, conn in connections:
+        _close_connection(key, conn)
     logger.info("OpenStack connection cache reset")
 
 
+def get_connection_pool_status() -> Dict[str, Any]:
+    """
+    Get the projects currently held in the connection pool (most recently used last).
+    
+    Returns:
+        Dict with pool size limit, pooled project names and evicted connections
+        still held by in-flight tool calls
+    """
+    with _pool_lock:
+        projects = [conn.auth.get('project_name') for conn in _connection_pool.values()]
+        retired = len(_retired)
+    return {
+        'max_size': _get_pool_size(),
+        'size': len(projects),
+        'projects': projects,
+        'evicted_awaiting_release': retired,
+        'allowed_projects': get_allowed_projects(),
+    }
+
+
+def persist_connection_state():
+    """
+    Write the current tokens and discovery results to the on-disk auth cache.
+    No-op unless MCP_AUTH_CACHE_ENABLE is set.
+    """
+    if not auth_cache.is_auth_cache_enabled():
+        return
+    with _pool_lock:
+        connections = list(_connection_pool.items())
+    for key, conn in connections:
+        auth_cache.save_auth_state(conn, key)
+
+
+# Discovery documents fetched lazily during the process lifetime are kept for the next process
+atexit.register(persist_connection_state)
+
+
 # =============================================================================
 # PROJECT ISOLATION SECURITY FUNCTIONS
 # =============================================================================
@@ -152,18 +496,17 @@ def get_current_project_id() -> str:
     """
     try:
         conn = get_openstack_connection()
-        # Get project ID from the token
-        token = conn.identity.get_token()
-        project_id = conn.auth.get('project_id') or conn.auth.get('tenant_id')
+        # Get project ID from the token (no API call once authenticated)
+        project_id = conn.current_project_id or conn.auth.get('project_id') or conn.auth.get('tenant_id')
         
         if not project_id:
-            # Fallback: get from project name
-            project_name = os.environ.get("OS_PROJECT_NAME")
+            # Fallback: resolve the project name through the identity catalog cache
+            project_name = get_active_project_name()
             if project_name:
-                for project in conn.identity.projects():
-                    if project.name == project_name:
-                        project_id = project.id
-                        break
+                from .services.identity_catalog import find_project
+                project = find_project(conn, project_name)
+                if project:
+                    project_id = project.id
         
         if not project_id:
             raise Exception("Unable to determine current project ID")
@@ -0,0 +1,127 @@
+"""
+Deadline Propagation
+
+Each tool invocation runs with an overall time budget (MCP_TOOL_TIMEOUT). The
+deadline is carried in a context variable, so it follows the call into worker
+threads and parallel sub-tasks. The pipeline interceptor then:
+
+- gives every upstream request the remaining budget as its timeout when that
+  is shorter than the configured SDK timeout
+- fails requests issued after the deadline immediately with DeadlineExceeded
+
+Composite tools already catch failures per section, so once the budget is
+spent the remaining sections fail fast and the partial result is returned.
+"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from keystoneauth1 import exceptions as ksa_exceptions
+
+from .request_pipeline import PipelineRequest
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOOL_TIMEOUT = 60.0
+
+# Absolute time.monotonic() deadline of the current tool invocation
+_deadline: ContextVar[Optional[float]] = ContextVar("mcp_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a tool invocation's time budget is spent."""
+
+
+def get_tool_timeout() -> float:
+    """Get the per-invocation time budget in seconds (MCP_TOOL_TIMEOUT, 0 disables)."""
+    try:
+        return max(0.0, float(os.environ.get("MCP_TOOL_TIMEOUT", DEFAULT_TOOL_TIMEOUT)))
+    except ValueError:
+        logger.warning(f"Invalid MCP_TOOL_TIMEOUT value, using default {DEFAULT_TOOL_TIMEOUT}")
+        return DEFAULT_TOOL_TIMEOUT
+
+
+def get_deadline() -> Optional[float]:
+    """Get the current deadline (time.monotonic() value), or None if unbounded."""
+    return _deadline.get()
+
+
+def get_remaining() -> Optional[float]:
+    """Get the seconds left before the current deadline, or None if unbounded."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def deadline_exceeded() -> bool:
+    """Check whether the current deadline has passed."""
+    remaining = get_remaining()
+    return remaining is not None and remaining <= 0
+
+
+def check_deadline(what: str = "operation") -> None:
+    """
+    Raise DeadlineExceeded if the current deadline has passed.
+
+    Args:
+        what: Description of the work being skipped, for the error message
+    """
+    if deadline_exceeded():
+        raise DeadlineExceeded(f"Deadline exceeded before {what}")
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]):
+    """
+    Run the enclosed code with a deadline `seconds` from now.
+
+    A nested scope never extends an enclosing deadline. None or 0 keeps the
+    current deadline unchanged.
+    """
+    if not seconds:
+        yield
+        return
+
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def deadline_interceptor(request: PipelineRequest, call_next):
+    """Pipeline interceptor applying the remaining time budget to each upstream request."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return call_next(request)
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded(
+            f"Deadline exceeded, {request.method} {request.service_type} request not sent"
+        )
+
+    default_timeout = request.kwargs.get('timeout') or getattr(request.session, 'timeout', None)
+    clamped = default_timeout is None or remaining < default_timeout
+    if clamped:
+        request.kwargs['timeout'] = remaining
+    request.deadline = deadline
+
+    try:
+        return call_next(request)
+    except ksa_exceptions.ConnectTimeout as e:
+        if clamped and time.monotonic() >= deadline:
+            raise DeadlineExceeded(
+                f"Deadline exceeded while waiting for {request.method} {request.service_type}"
+            ) from e
+        raise
@@ -16,6 +16,7 @@ logger = logging.getLogger(__name__)
 from .services.core import (
     get_service_status
 )
+from .services.identity_catalog import invalidate_identity_cache, list_identity_resources
 
 # Import connection utilities
 from .connection import reset_connection_cache
@@ -259,7 +260,7 @@ def set_roles(action: str, role_name: Optional[str] = None, **kwargs) -> Dict[st
         if action.lower() == 'list':
             roles = []
             try:
-                for role in conn.identity.roles():
+                for role in list_identity_resources(conn, 'roles'):
                     roles.append({
                         'id': role.id,
                         'name': role.name,
@@ -296,6 +297,7 @@ def set_roles(action: str, role_name: Optional[str] = None, **kwargs) -> Dict[st
                     description=description,
                     domain_id=domain_id
                 )
+                invalidate_identity_cache('roles')
                 return {
                     'success': True,
                     'message': f'Role "{role_name}" created successfully',
@@ -946,6 +948,7 @@ from .services.storage import (
     set_volume_groups,
     set_volume_qos,
     get_server_volumes,
+    get_server_volume_map,
     set_server_volume
 )
 
@@ -982,6 +985,17 @@ from .services.monitoring import (
     set_quota
 )
 
+# Import bulk quota functions from services
+from .services.quotas import (
+    get_quota_report,
+    set_quota_bulk
+)
+
+# Import capacity planning functions from services
+from .services.placement_simulator import (
+    get_capacity_plan
+)
+
 # Import orchestration functions from services
 from .services.orchestration import (
     get_heat_stacks,
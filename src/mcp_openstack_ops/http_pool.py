@@ -0,0 +1,197 @@
+"""
+HTTP Connection Pool Management
+
+Replaces the default requests adapter of each OpenStack SDK session with an
+explicitly sized, instrumented one:
+
+- per-endpoint pool size (OS_HTTP_POOL_MAXSIZE) and number of endpoint pools
+  (OS_HTTP_POOL_CONNECTIONS), blocking when exhausted instead of opening and
+  discarding throw-away connections (OS_HTTP_POOL_BLOCK)
+- persistent HTTP/1.1 connections with TCP keep-alive probes, so TCP and TLS
+  handshakes are paid once per pooled connection rather than per request
+- pool statistics per endpoint (in use, waiting, created, requests)
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 16
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_API_TIMEOUT = 10.0
+KEEPALIVE_IDLE_SECONDS = 30
+KEEPALIVE_INTERVAL_SECONDS = 10
+KEEPALIVE_PROBES = 3
+
+_stats_lock = threading.Lock()
+_endpoint_stats: Dict[str, Dict[str, Any]] = {}
+
+# Optional wrapper applied to the adapter of every new connection (record/replay harness)
+_adapter_wrapper: Optional[Callable[[HTTPAdapter], Any]] = None
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        logger.warning(f"Invalid {name} value, using default {default}")
+        return default
+
+
+def get_api_timeout() -> float:
+    """Get the SDK request timeout in seconds (OS_API_TIMEOUT, default 10)."""
+    try:
+        return float(os.environ.get("OS_API_TIMEOUT", DEFAULT_API_TIMEOUT))
+    except ValueError:
+        logger.warning(f"Invalid OS_API_TIMEOUT value, using default {DEFAULT_API_TIMEOUT}")
+        return DEFAULT_API_TIMEOUT
+
+
+def _stats_for(pool) -> Dict[str, Any]:
+    endpoint = f"{pool.scheme}://{pool.host}:{pool.port}"
+    with _stats_lock:
+        stats = _endpoint_stats.get(endpoint)
+        if stats is None:
+            stats = {
+                'endpoint': endpoint,
+                'max_size': pool.pool.maxsize if pool.pool is not None else 0,
+                'in_use': 0,
+                'waiting': 0,
+                'created': 0,
+                'requests': 0,
+                'total_wait_seconds': 0.0,
+                'max_wait_seconds': 0.0,
+            }
+            _endpoint_stats[endpoint] = stats
+        return stats
+
+
+class _InstrumentedPoolMixin:
+    """Counts connection checkouts, waits and creations for a urllib3 pool."""
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        stats = _stats_for(self)
+        with _stats_lock:
+            stats['created'] += 1
+        return conn
+
+    def _get_conn(self, timeout=None):
+        stats = _stats_for(self)
+        with _stats_lock:
+            stats['waiting'] += 1
+        started = time.monotonic()
+        try:
+            conn = super()._get_conn(timeout=timeout)
+        finally:
+            waited = time.monotonic() - started
+            with _stats_lock:
+                stats['waiting'] -= 1
+                stats['total_wait_seconds'] += waited
+                stats['max_wait_seconds'] = max(stats['max_wait_seconds'], waited)
+        with _stats_lock:
+            stats['in_use'] += 1
+            stats['requests'] += 1
+        return conn
+
+    def _put_conn(self, conn):
+        stats = _stats_for(self)
+        with _stats_lock:
+            stats['in_use'] = max(0, stats['in_use'] - 1)
+        return super()._put_conn(conn)
+
+
+class InstrumentedHTTPConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class InstrumentedHTTPSConnectionPool(_InstrumentedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+def _keepalive_socket_options() -> list:
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # Linux-specific tuning; other platforms keep the OS defaults
+    for name, value in (('TCP_KEEPIDLE', KEEPALIVE_IDLE_SECONDS),
+                        ('TCP_KEEPINTVL', KEEPALIVE_INTERVAL_SECONDS),
+                        ('TCP_KEEPCNT', KEEPALIVE_PROBES)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """requests adapter with explicit pool sizing, TCP keep-alive and pool statistics."""
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault('socket_options', _keepalive_socket_options())
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': InstrumentedHTTPConnectionPool,
+            'https': InstrumentedHTTPSConnectionPool,
+        }
+
+
+def install_http_adapter(conn) -> None:
+    """
+    Mount the pooled adapter on the requests session behind an SDK connection.
+
+    Args:
+        conn: OpenStack connection
+    """
+    block = os.environ.get("OS_HTTP_POOL_BLOCK", "true").strip().lower() in ("true", "1", "yes", "on")
+    adapter = PooledHTTPAdapter(
+        pool_connections=_env_int("OS_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS),
+        pool_maxsize=_env_int("OS_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE),
+        pool_block=block,
+    )
+    if _adapter_wrapper is not None:
+        adapter = _adapter_wrapper(adapter)
+    requests_session = conn.session.session
+    requests_session.mount('https://', adapter)
+    requests_session.mount('http://', adapter)
+
+
+def set_adapter_wrapper(wrapper: Optional[Callable[[HTTPAdapter], Any]]) -> None:
+    """
+    Wrap the transport adapter of connections created from now on.
+
+    Used by benchmarks/replay.py to record upstream traffic or replay it from a
+    fixture without a cloud. The wrapper receives the pooled adapter and returns
+    the requests adapter to mount; None removes it.
+    """
+    global _adapter_wrapper
+    _adapter_wrapper = wrapper
+
+
+def get_http_pool_stats() -> Dict[str, Any]:
+    """
+    Get HTTP connection pool statistics per OpenStack endpoint.
+
+    Returns:
+        Dict with pool configuration and per-endpoint counters: in_use and waiting
+        are current values; created, requests and wait times are cumulative
+    """
+    with _stats_lock:
+        endpoints = [dict(stats) for stats in _endpoint_stats.values()]
+    for stats in endpoints:
+        stats['total_wait_seconds'] = round(stats['total_wait_seconds'], 3)
+        stats['max_wait_seconds'] = round(stats['max_wait_seconds'], 3)
+        stats['reuse_ratio'] = round(1 - stats['created'] / stats['requests'], 3) if stats['requests'] else None
+    return {
+        'pool_maxsize': _env_int("OS_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE),
+        'pool_connections': _env_int("OS_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS),
+        'timeout_seconds': get_api_timeout(),
+        'endpoints': sorted(endpoints, key=lambda s: s['endpoint']),
+    }
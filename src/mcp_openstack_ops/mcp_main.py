@@ -129,6 +129,21 @@ def handle_operation_result(result: Dict[str, Any], operation_name: str, details
     return str(result) if result else "❌ **Operation Failed**: Empty response"
 
 from .connection import get_openstack_connection
+from .warmup import start_background_warmup, get_warmup_status
+from .sampler import is_sampler_enabled, start_background_sampler
+from .metrics import PROMETHEUS_CONTENT_TYPE, render_metrics
+from .middleware import (
+    ConnectionLeaseMiddleware,
+    CredentialScopeMiddleware,
+    DeadlineMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    ProjectScopeMiddleware,
+    TracingMiddleware,
+    run_in_tool_worker,
+)
+from .profiling import configure_profiling
+from .token_credentials import load_token_map, set_token_map
 from .functions import (
     get_instance_by_name as _get_instance_by_name,
     get_network_details as _get_network_details,
@@ -158,13 +173,19 @@ def _parse_bool_env(value: str) -> bool:
     return value.strip().lower() in TRUTHY_VALUES
 
 
-def _build_static_token_auth(secret_key: str) -> StaticTokenVerifier:
-    tokens = {
-        secret_key: {
+def _build_static_token_auth(secret_key: str, token_map: Optional[Dict[str, Dict[str, Any]]] = None) -> StaticTokenVerifier:
+    tokens = {}
+    if secret_key:
+        tokens[secret_key] = {
             "client_id": "openstack-ops-client",
             "scopes": ["read", "write"],
         }
-    }
+    # Tokens mapped to their own OpenStack credentials (REMOTE_TOKEN_MAP_FILE)
+    for token, profile in (token_map or {}).items():
+        tokens[token] = {
+            "client_id": profile["client_id"],
+            "scopes": ["read", "write"],
+        }
     return StaticTokenVerifier(tokens=tokens)
 
 
@@ -172,6 +193,15 @@ def _build_static_token_auth(secret_key: str) -> StaticTokenVerifier:
 # Runtime authentication is configured in main() before mcp.run().
 logger.info("Initializing MCP instance")
 mcp = FastMCP("mcp-openstack-ops")
+# Order matters: metrics and tracing outermost, deadline next, credential scope next, tool body on a worker
+# thread, profiling innermost (inside the worker thread)
+mcp.add_middleware(MetricsMiddleware())
+mcp.add_middleware(TracingMiddleware())
+mcp.add_middleware(DeadlineMiddleware())
+mcp.add_middleware(CredentialScopeMiddleware())
+mcp.add_middleware(ProjectScopeMiddleware())
+mcp.add_middleware(ConnectionLeaseMiddleware())
+mcp.add_middleware(ProfilingMiddleware())
 
 # =============================================================================
 # Safety Control Functions
@@ -247,7 +277,7 @@ ALLOW_MODIFY_OPERATIONS=true
 - get_keypair_list, get_security_groups
 - get_floating_ips, get_routers, get_volume_types
 - get_volume_snapshots, get_heat_stacks
-- get_resource_monitoring, get_usage_statistics, get_quota
+- get_resource_monitoring, get_usage_statistics, get_quota, get_quota_report
 - get_volume_list, get_image_detail_list, get_project_details
 """
     return ""
@@ -369,6 +399,27 @@ def prompt_template_section_prompt(section: Optional[str] = None) -> str:
     return f"Section '{section}' not found."
 
 
+# =============================================================================
+# Health Check and Metrics Routes (streamable-http only)
+# =============================================================================
+
+@mcp.custom_route("/health", methods=["GET"])
+async def health_check(request):
+    """Report server readiness including the background warm-up state."""
+    from starlette.responses import JSONResponse
+
+    status = get_warmup_status()
+    return JSONResponse(status, status_code=200 if status['healthy'] else 503)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request):
+    """Expose tool and upstream API metrics in the Prometheus text format."""
+    from starlette.responses import Response
+
+    return Response(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 # =============================================================================
 # Configuration Validation
 # =============================================================================
@@ -445,6 +496,38 @@ def main(argv: Optional[List[str]] = None) -> None:
         dest="secret_key",
         help="Secret key for Bearer token authentication. Required when auth is enabled.",
     )
+    parser.add_argument(
+        "--token-map",
+        dest="token_map",
+        help="JSON file mapping Bearer tokens to OpenStack credential profiles (streamable-http mode).",
+    )
+    warmup_group = parser.add_mutually_exclusive_group()
+    warmup_group.add_argument(
+        "--warmup",
+        dest="warmup_enable",
+        action="store_true",
+        default=None,
+        help="Authenticate and resolve all service endpoints in the background at startup.",
+    )
+    warmup_group.add_argument(
+        "--no-warmup",
+        dest="warmup_enable",
+        action="store_false",
+        default=None,
+        help="Disable background connection warm-up (connect lazily on first tool call).",
+    )
+    parser.add_argument(
+        "--profile",
+        dest="profile_enable",
+        action="store_true",
+        default=None,
+        help="Profile tool invocations with cProfile (see MCP_PROFILE_* for sampling and memory snapshots).",
+    )
+    parser.add_argument(
+        "--profile-tools",
+        dest="profile_tools",
+        help="Comma-separated tools to profile (default: env MCP_PROFILE_TOOLS or all tools).",
+    )
     
     # Allow future extension without breaking unknown args usage
     args = parser.parse_args(argv)
@@ -480,11 +563,20 @@ def main(argv: Optional[List[str]] = None) -> None:
     else:
         auth_enable = args.auth_enable
     secret_key = args.secret_key or os.getenv("REMOTE_SECRET_KEY", "")
+    token_map_file = args.token_map or os.getenv("REMOTE_TOKEN_MAP_FILE", "")
+    
+    token_map = {}
+    if token_map_file:
+        try:
+            token_map = load_token_map(token_map_file)
+        except Exception as e:
+            logger.error(f"ERROR: Failed to load token map {token_map_file}: {e}")
+            return
     
     # Validation for streamable-http mode with authentication
     if transport_type == "streamable-http":
         if auth_enable:
-            if not secret_key:
+            if not secret_key and not token_map:
                 logger.error("ERROR: Authentication is enabled but no secret key provided.")
                 logger.error("Please set REMOTE_SECRET_KEY environment variable or use --secret-key argument.")
                 return
@@ -496,10 +588,28 @@ def main(argv: Optional[List[str]] = None) -> None:
 
     # Configure authentication provider before server startup.
     if auth_enable:
-        mcp.auth = _build_static_token_auth(secret_key)
+        mcp.auth = _build_static_token_auth(secret_key, token_map)
+        set_token_map(token_map)
     else:
+        if token_map:
+            logger.warning("Token map ignored: Bearer token authentication is disabled")
         mcp.auth = None
 
+    # Background warm-up runs alongside transport startup
+    if args.warmup_enable is None:
+        warmup_enable = _parse_bool_env(os.getenv("MCP_WARMUP_ENABLE", "false"))
+    else:
+        warmup_enable = args.warmup_enable
+    if warmup_enable:
+        start_background_warmup()
+
+    # Per-invocation profiling: CLI flags override MCP_PROFILE_ENABLE / MCP_PROFILE_TOOLS
+    configure_profiling(enabled=args.profile_enable, tools=args.profile_tools)
+
+    # Resource history for trend / peak queries
+    if is_sampler_enabled():
+        start_background_sampler()
+
     # Execution based on transport mode
     if transport_type == "streamable-http":
         logger.info(f"Starting streamable-http server on {host}:{port}")
@@ -0,0 +1,245 @@
+"""
+Tool and Upstream API Metrics
+
+In-process counters and latency histograms, exposed in the Prometheus text
+format on the /metrics route (streamable-http mode):
+
+- per tool (MetricsMiddleware): invocations, errors and latency
+- per upstream service (metrics pipeline interceptor, innermost so every
+  attempt that reaches the network is counted once): requests by method and
+  status code, latency, response bytes, and requests per calling tool
+
+The tool being executed is carried in a context variable, so upstream calls
+made from worker threads and parallel sub-tasks are attributed to it.
+MCP_METRICS_ENABLE=false turns recording off.
+"""
+
+import bisect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from keystoneauth1 import exceptions as ksa_exceptions
+
+from .request_pipeline import PipelineRequest
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Latency histogram bucket upper bounds in seconds
+TOOL_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+UPSTREAM_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Name of the tool whose invocation is currently running
+_current_tool: ContextVar[Optional[str]] = ContextVar("mcp_current_tool", default=None)
+
+
+def is_metrics_enabled() -> bool:
+    """Check whether metrics recording is enabled via MCP_METRICS_ENABLE."""
+    return os.environ.get("MCP_METRICS_ENABLE", "true").strip().lower() in ("true", "1", "yes", "on")
+
+
+def get_current_tool() -> Optional[str]:
+    """Get the name of the tool invocation the caller runs in, if any."""
+    return _current_tool.get()
+
+
+@contextmanager
+def tool_scope(tool_name: str):
+    """Attribute upstream requests made in the enclosed code to a tool."""
+    token = _current_tool.set(tool_name)
+    try:
+        yield
+    finally:
+        _current_tool.reset(token)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (Prometheus semantics)."""
+
+    __slots__ = ('bounds', 'counts', 'total', 'count')
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def copy(self) -> 'Histogram':
+        copy = Histogram(self.bounds)
+        copy.counts = list(self.counts)
+        copy.total = self.total
+        copy.count = self.count
+        return copy
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        result, running = [], 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            result.append((f"{bound:g}", running))
+        result.append(("+Inf", self.count))
+        return result
+
+
+_lock = threading.Lock()
+# tool -> {'invocations', 'errors'} / Histogram
+_tool_counts: Dict[str, Dict[str, int]] = {}
+_tool_latency: Dict[str, Histogram] = {}
+# (service, method, status) -> requests
+_upstream_requests: Dict[Tuple[str, str, str], int] = {}
+_upstream_latency: Dict[str, Histogram] = {}
+_upstream_bytes: Dict[str, int] = {}
+# (tool, service) -> upstream requests made by the tool
+_tool_upstream_requests: Dict[Tuple[str, str], int] = {}
+
+
+def record_tool_call(tool_name: str, seconds: float, error: bool) -> None:
+    """Record one finished tool invocation."""
+    if not is_metrics_enabled():
+        return
+    with _lock:
+        counts = _tool_counts.setdefault(tool_name, {'invocations': 0, 'errors': 0})
+        counts['invocations'] += 1
+        counts['errors'] += int(error)
+        histogram = _tool_latency.get(tool_name)
+        if histogram is None:
+            histogram = _tool_latency[tool_name] = Histogram(TOOL_LATENCY_BUCKETS)
+        histogram.observe(seconds)
+
+
+def _response_size(request: PipelineRequest, response) -> int:
+    length = response.headers.get('Content-Length')
+    if length and length.isdigit():
+        return int(length)
+    if request.kwargs.get('stream'):
+        # Reading the body here would consume the stream
+        return 0
+    return len(response.content or b'')
+
+
+def _record_upstream(request: PipelineRequest, status: str, seconds: float, size: int) -> None:
+    tool_name = _current_tool.get() or 'none'
+    with _lock:
+        key = (request.service_type, request.method, status)
+        _upstream_requests[key] = _upstream_requests.get(key, 0) + 1
+        histogram = _upstream_latency.get(request.service_type)
+        if histogram is None:
+            histogram = _upstream_latency[request.service_type] = Histogram(UPSTREAM_LATENCY_BUCKETS)
+        histogram.observe(seconds)
+        _upstream_bytes[request.service_type] = _upstream_bytes.get(request.service_type, 0) + size
+        tool_key = (tool_name, request.service_type)
+        _tool_upstream_requests[tool_key] = _tool_upstream_requests.get(tool_key, 0) + 1
+
+
+def metrics_interceptor(request: PipelineRequest, call_next):
+    """Pipeline interceptor recording count, status, latency and size of every upstream request."""
+    if not is_metrics_enabled():
+        return call_next(request)
+
+    started = time.monotonic()
+    try:
+        response = call_next(request)
+    except ksa_exceptions.HttpError as e:
+        status = str(e.http_status) if e.http_status else 'error'
+        _record_upstream(request, status, time.monotonic() - started, 0)
+        raise
+    except ksa_exceptions.ConnectionError:
+        _record_upstream(request, 'connection_error', time.monotonic() - started, 0)
+        raise
+    except Exception:
+        _record_upstream(request, 'error', time.monotonic() - started, 0)
+        raise
+
+    try:
+        size = _response_size(request, response)
+    except Exception:
+        size = 0
+    _record_upstream(request, str(response.status_code), time.monotonic() - started, size)
+    return response
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels: str) -> str:
+    return ','.join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+
+
+def _histogram_lines(name: str, histograms: Dict[str, Histogram], label: str) -> List[str]:
+    lines = []
+    for key, histogram in sorted(histograms.items()):
+        for bound, count in histogram.cumulative():
+            lines.append(f'{name}_bucket{{{_labels(**{label: key})},le="{bound}"}} {count}')
+        lines.append(f'{name}_sum{{{_labels(**{label: key})}}} {histogram.total:.6f}')
+        lines.append(f'{name}_count{{{_labels(**{label: key})}}} {histogram.count}')
+    return lines
+
+
+def render_metrics() -> str:
+    """
+    Render all metrics in the Prometheus text exposition format.
+
+    Returns:
+        Metrics text for the /metrics route
+    """
+    with _lock:
+        tool_counts = {tool: dict(counts) for tool, counts in _tool_counts.items()}
+        tool_latency = {tool: h.copy() for tool, h in _tool_latency.items()}
+        upstream_requests = dict(_upstream_requests)
+        upstream_latency = {service: h.copy() for service, h in _upstream_latency.items()}
+        upstream_bytes = dict(_upstream_bytes)
+        tool_upstream_requests = dict(_tool_upstream_requests)
+
+    lines = [
+        '# HELP mcp_tool_invocations_total Tool invocations.',
+        '# TYPE mcp_tool_invocations_total counter',
+    ]
+    lines += [f'mcp_tool_invocations_total{{{_labels(tool=tool)}}} {counts["invocations"]}'
+              for tool, counts in sorted(tool_counts.items())]
+    lines += [
+        '# HELP mcp_tool_errors_total Tool invocations that failed or returned an error.',
+        '# TYPE mcp_tool_errors_total counter',
+    ]
+    lines += [f'mcp_tool_errors_total{{{_labels(tool=tool)}}} {counts["errors"]}'
+              for tool, counts in sorted(tool_counts.items())]
+    lines += [
+        '# HELP mcp_tool_duration_seconds Tool invocation latency.',
+        '# TYPE mcp_tool_duration_seconds histogram',
+    ]
+    lines += _histogram_lines('mcp_tool_duration_seconds', tool_latency, 'tool')
+    lines += [
+        '# HELP mcp_tool_upstream_requests_total Upstream OpenStack API requests made by each tool.',
+        '# TYPE mcp_tool_upstream_requests_total counter',
+    ]
+    lines += [f'mcp_tool_upstream_requests_total{{{_labels(tool=tool, service=service)}}} {count}'
+              for (tool, service), count in sorted(tool_upstream_requests.items())]
+    lines += [
+        '# HELP mcp_upstream_requests_total Upstream OpenStack API requests by service, method and status.',
+        '# TYPE mcp_upstream_requests_total counter',
+    ]
+    lines += [f'mcp_upstream_requests_total{{{_labels(service=service, method=method, status=status)}}} {count}'
+              for (service, method, status), count in sorted(upstream_requests.items())]
+    lines += [
+        '# HELP mcp_upstream_request_duration_seconds Upstream OpenStack API request latency.',
+        '# TYPE mcp_upstream_request_duration_seconds histogram',
+    ]
+    lines += _histogram_lines('mcp_upstream_request_duration_seconds', upstream_latency, 'service')
+    lines += [
+        '# HELP mcp_upstream_response_bytes_total Upstream OpenStack API response body bytes.',
+        '# TYPE mcp_upstream_response_bytes_total counter',
+    ]
+    lines += [f'mcp_upstream_response_bytes_total{{{_labels(service=service)}}} {size}'
+              for service, size in sorted(upstream_bytes.items())]
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,271 @@
+"""
+FastMCP Middleware
+
+Cross-cutting behaviour applied to every tool invocation without touching the
+individual tool modules.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import time
+import weakref
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+import anyio
+
+from fastmcp.exceptions import ToolError
+from fastmcp.server.dependencies import get_access_token
+from fastmcp.server.middleware import Middleware
+
+from .connection import connection_lease, credential_scope, get_allowed_projects, project_scope
+from .deadline import deadline_scope, get_tool_timeout
+from .metrics import record_tool_call, tool_scope
+from .profiling import profile_scope, should_profile
+from .token_credentials import get_profile_for_token
+from .tracing import is_tracing_enabled, summarize_trace, trace_scope
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+PROJECT_SELECTOR_ARG = "os_project_name"
+
+DEFAULT_TOOL_WORKERS = 8
+
+# Time a tool gets past its deadline to assemble and return a partial result
+DEADLINE_GRACE_SECONDS = 2.0
+
+# Tool selected for profiling by ProfilingMiddleware, picked up in the worker thread
+_profiled_tool: ContextVar[Optional[str]] = ContextVar("mcp_openstack_profiled_tool", default=None)
+
+_tool_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, anyio.CapacityLimiter]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _is_error_result(result) -> bool:
+    """Tools report most failures as an "Error: ..." text result instead of raising."""
+    if getattr(result, 'is_error', False):
+        return True
+    content = getattr(result, 'content', None) or []
+    text = getattr(content[0], 'text', '') if content else ''
+    return isinstance(text, str) and text.startswith('Error')
+
+
+class MetricsMiddleware(Middleware):
+    """
+    Records invocation count, latency and errors of every tool call (see
+    metrics), and attributes upstream requests made during the call to the
+    tool.
+    """
+
+    async def on_call_tool(self, context, call_next):
+        tool_name = context.message.name
+        started = time.monotonic()
+        error = True
+        try:
+            with tool_scope(tool_name):
+                result = await call_next(context)
+            error = _is_error_result(result)
+            return result
+        finally:
+            record_tool_call(tool_name, time.monotonic() - started, error)
+
+
+class TracingMiddleware(Middleware):
+    """
+    In debug mode (MCP_TRACE_ENABLE) records every upstream call made by a
+    tool invocation and attaches the summary to the result metadata under
+    "trace" (see tracing).
+    """
+
+    async def on_call_tool(self, context, call_next):
+        if not is_tracing_enabled():
+            return await call_next(context)
+
+        with trace_scope() as trace:
+            result = await call_next(context)
+        summary = summarize_trace(trace)
+        logger.debug(f"Tool {context.message.name}: {summary['upstream_calls']} upstream calls, "
+                     f"{summary['wall_time_ms']}ms wall, {summary['critical_path_ms']}ms critical path")
+        meta = dict(result.meta or {})
+        meta['trace'] = summary
+        return result.model_copy(update={'meta': meta})
+
+
+class DeadlineMiddleware(Middleware):
+    """
+    Gives each tool invocation an overall time budget (MCP_TOOL_TIMEOUT, 0
+    disables). Upstream requests get the remaining budget as their timeout and
+    fail fast once it is spent (see deadline). If the tool still has not
+    returned shortly after the deadline, the caller gets an error instead of
+    waiting for it.
+    """
+
+    async def on_call_tool(self, context, call_next):
+        budget = get_tool_timeout()
+        if not budget:
+            return await call_next(context)
+
+        with deadline_scope(budget):
+            try:
+                return await asyncio.wait_for(call_next(context), timeout=budget + DEADLINE_GRACE_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning(f"Tool {context.message.name} exceeded its {budget:g}s deadline")
+                raise ToolError(f"Tool {context.message.name} did not complete within its {budget:g}s deadline")
+
+
+class CredentialScopeMiddleware(Middleware):
+    """
+    Runs each request with the OpenStack credential profile mapped to the
+    caller's bearer token (see token_credentials). Requests authenticated with
+    an unmapped token, and stdio requests, keep the environment credentials.
+    """
+
+    def _profile_for_request(self) -> Optional[Dict[str, Any]]:
+        access_token = get_access_token()
+        if access_token is None:
+            return None
+        return get_profile_for_token(access_token.token)
+
+    async def on_list_tools(self, context, call_next):
+        with credential_scope(self._profile_for_request()):
+            return await call_next(context)
+
+    async def on_call_tool(self, context, call_next):
+        with credential_scope(self._profile_for_request()):
+            return await call_next(context)
+
+
+class ProjectScopeMiddleware(Middleware):
+    """
+    Adds an optional project selector argument to every tool when the server is
+    configured for several projects (OS_ALLOWED_PROJECTS), and runs the tool with
+    all OpenStack connections scoped to the selected project.
+    """
+
+    def _selector_schema(self, allowed: list) -> Dict[str, Any]:
+        return {
+            "type": "string",
+            "default": "",
+            "description": (
+                f"OpenStack project to run this tool in (optional, defaults to '{allowed[0]}'). "
+                f"Allowed: {', '.join(allowed)}"
+            ),
+        }
+
+    async def on_list_tools(self, context, call_next):
+        tools = await call_next(context)
+        allowed = get_allowed_projects()
+        if len(allowed) < 2:
+            return tools
+
+        scoped_tools = []
+        for tool in tools:
+            parameters = dict(tool.parameters or {})
+            properties = dict(parameters.get("properties", {}))
+            if PROJECT_SELECTOR_ARG not in properties:
+                properties[PROJECT_SELECTOR_ARG] = self._selector_schema(allowed)
+            parameters["properties"] = properties
+            scoped_tools.append(tool.model_copy(update={"parameters": parameters}))
+        return scoped_tools
+
+    async def on_call_tool(self, context, call_next):
+        arguments = dict(context.message.arguments or {})
+        if PROJECT_SELECTOR_ARG not in arguments:
+            return await call_next(context)
+
+        project_name = (arguments.pop(PROJECT_SELECTOR_ARG) or "").strip()
+        allowed = get_allowed_projects()
+        if project_name and project_name not in allowed:
+            logger.warning(f"Rejected tool call {context.message.name} for project '{project_name}'")
+            raise ToolError(f"Project '{project_name}' is not served by this server. Allowed projects: {allowed}")
+
+        message = context.message.model_copy(update={"arguments": arguments})
+        with project_scope(project_name):
+            return await call_next(context.copy(message=message))
+
+
+class ConnectionLeaseMiddleware(Middleware):
+    """
+    Holds the pooled OpenStack connections a tool invocation uses until it
+    returns, so an LRU eviction by a concurrent call never closes a connection
+    that is still in use (see connection.connection_lease). Tool bodies run by
+    run_in_tool_worker take their own lease, which is released only when the
+    worker thread finishes.
+    """
+
+    async def on_call_tool(self, context, call_next):
+        with connection_lease():
+            return await call_next(context)
+
+
+class ProfilingMiddleware(Middleware):
+    """
+    Selects sampled tool invocations for cProfile (and optionally tracemalloc)
+    profiling (see profiling). The profile itself is taken by
+    run_in_tool_worker in the thread executing the tool body.
+    """
+
+    async def on_call_tool(self, context, call_next):
+        tool_name = context.message.name
+        if not should_profile(tool_name):
+            return await call_next(context)
+
+        token = _profiled_tool.set(tool_name)
+        try:
+            return await call_next(context)
+        finally:
+            _profiled_tool.reset(token)
+
+
+def _get_tool_workers() -> int:
+    try:
+        return max(0, int(os.environ.get("MCP_TOOL_WORKERS", DEFAULT_TOOL_WORKERS)))
+    except ValueError:
+        return DEFAULT_TOOL_WORKERS
+
+
+def _get_tool_limiter(workers: int) -> anyio.CapacityLimiter:
+    # One limiter per event loop (tests and clients may run several loops)
+    loop = asyncio.get_running_loop()
+    limiter = _tool_limiters.get(loop)
+    if limiter is None:
+        limiter = _tool_limiters[loop] = anyio.CapacityLimiter(workers)
+    return limiter
+
+
+def _run_tool_body(func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+    # The body holds its own lease: abandoned at its deadline, it outlives the middleware's lease
+    with connection_lease(detached=True):
+        tool_name = _profiled_tool.get()
+        if tool_name is None:
+            return func(*args, **kwargs)
+        with profile_scope(tool_name):
+            return func(*args, **kwargs)
+
+
+def run_in_tool_worker(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorator for tool functions: runs the synchronous tool body on a worker
+    thread so blocking OpenStack SDK calls of concurrent requests do not
+    serialize on the event loop.
+
+    Only the body is offloaded (anyio.to_thread, context variables such as the
+    project / credential scope and the deadline are carried along); FastMCP's
+    own handling of the call - middleware, context, notifications and session
+    writes - stays on the server's event loop. MCP_TOOL_WORKERS bounds the
+    number of bodies running at once (default 8); 0 runs them on the event
+    loop.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        call = functools.partial(_run_tool_body, func, args, kwargs)
+        workers = _get_tool_workers()
+        if not workers:
+            return call()
+        # A caller abandoned at its deadline gets its error immediately; the body finishes on its own
+        return await anyio.to_thread.run_sync(call, limiter=_get_tool_limiter(workers), abandon_on_cancel=True)
+
+    return wrapper
@@ -0,0 +1,224 @@
+"""
+Per-Invocation Profiling
+
+Opt-in mode (MCP_PROFILE_ENABLE or --profile) that runs selected tool
+invocations under cProfile and, with MCP_PROFILE_MEMORY, tracemalloc, and
+writes the results next to each other:
+
+- ``<tool>-<timestamp>.pstats``: cProfile statistics of the tool's thread
+  (load with ``python -m pstats`` or snakeviz); time spent waiting on upstream
+  responses shows up in socket / future waits, Python-side work such as
+  subnet joins and JSON formatting in the service functions
+- ``<tool>-<timestamp>.snapshot``: tracemalloc snapshot taken when the tool
+  returns (``tracemalloc.Snapshot.load``)
+
+MCP_PROFILE_SAMPLE_RATE profiles only a fraction of invocations so the mode can
+stay enabled in production; MCP_PROFILE_TOOLS limits it to some tools and
+MCP_PROFILE_MAX_FILES bounds the number of result files kept.
+
+cProfile sees the thread running the tool body (run_in_tool_worker);
+work the tool hands to parallel helper threads appears as the wait for it.
+"""
+
+import cProfile
+import logging
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .auth_cache import DEFAULT_CACHE_DIR
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_RATE = 1.0
+DEFAULT_MAX_FILES = 200
+TRACEMALLOC_FRAMES = 10
+
+# Overrides set from command line flags (None = use the environment)
+_enabled_override: Optional[bool] = None
+_tools_override: Optional[str] = None
+
+_lock = threading.Lock()
+_tracemalloc_users = 0
+_stats = {'profiled': 0, 'skipped': 0, 'write_errors': 0, 'last_file': None}
+
+
+def configure_profiling(enabled: Optional[bool] = None, tools: Optional[str] = None) -> None:
+    """Override MCP_PROFILE_ENABLE / MCP_PROFILE_TOOLS (command line flags)."""
+    global _enabled_override, _tools_override
+    if enabled is not None:
+        _enabled_override = enabled
+    if tools is not None:
+        _tools_override = tools
+
+
+def is_profiling_enabled() -> bool:
+    """Check whether tool profiling is enabled via --profile or MCP_PROFILE_ENABLE."""
+    if _enabled_override is not None:
+        return _enabled_override
+    return os.environ.get("MCP_PROFILE_ENABLE", "false").strip().lower() in ("true", "1", "yes", "on")
+
+
+def _is_memory_profiling_enabled() -> bool:
+    return os.environ.get("MCP_PROFILE_MEMORY", "false").strip().lower() in ("true", "1", "yes", "on")
+
+
+def _get_profiled_tools() -> List[str]:
+    value = _tools_override if _tools_override is not None else os.environ.get("MCP_PROFILE_TOOLS", "")
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def _get_sample_rate() -> float:
+    try:
+        return min(1.0, max(0.0, float(os.environ.get("MCP_PROFILE_SAMPLE_RATE", DEFAULT_SAMPLE_RATE))))
+    except ValueError:
+        return DEFAULT_SAMPLE_RATE
+
+
+def _get_max_files() -> int:
+    try:
+        return max(1, int(os.environ.get("MCP_PROFILE_MAX_FILES", DEFAULT_MAX_FILES)))
+    except ValueError:
+        return DEFAULT_MAX_FILES
+
+
+def get_profile_dir() -> str:
+    """Get the directory profiling results are written to (MCP_PROFILE_DIR)."""
+    return os.environ.get("MCP_PROFILE_DIR") or os.path.join(DEFAULT_CACHE_DIR, "profiles")
+
+
+def should_profile(tool_name: str) -> bool:
+    """Decide whether this invocation of a tool is profiled (enabled, selected, sampled)."""
+    if not is_profiling_enabled():
+        return False
+    tools = _get_profiled_tools()
+    if tools and tool_name not in tools:
+        return False
+    if random.random() >= _get_sample_rate():
+        with _lock:
+            _stats['skipped'] += 1
+        return False
+    return True
+
+
+def _start_tracemalloc() -> None:
+    global _tracemalloc_users
+    with _lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        _tracemalloc_users += 1
+
+
+def _stop_tracemalloc() -> None:
+    global _tracemalloc_users
+    with _lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def _prune(directory: str) -> None:
+    """Delete the oldest result files beyond MCP_PROFILE_MAX_FILES."""
+    try:
+        paths = [os.path.join(directory, name) for name in os.listdir(directory)
+                 if name.endswith(('.pstats', '.snapshot'))]
+    except OSError:
+        return
+    excess = len(paths) - _get_max_files()
+    if excess <= 0:
+        return
+    for path in sorted(paths, key=os.path.getmtime)[:excess]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _write_results(tool_name: str, profile: cProfile.Profile, snapshot, seconds: float) -> None:
+    directory = get_profile_dir()
+    safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', tool_name)
+    base = os.path.join(directory, f"{safe_name}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        profile.dump_stats(f"{base}.pstats")
+        if snapshot is not None:
+            snapshot.dump(f"{base}.snapshot")
+        _prune(directory)
+    except OSError as e:
+        with _lock:
+            _stats['write_errors'] += 1
+        logger.warning(f"Failed to write profile of {tool_name} to {directory}: {e}")
+        return
+
+    with _lock:
+        _stats['profiled'] += 1
+        _stats['last_file'] = f"{base}.pstats"
+    hotspots = []
+    for (filename, line, function), (_cc, _nc, tottime, _ct, _callers) in sorted(
+            pstats.Stats(profile).stats.items(), key=lambda item: -item[1][2])[:3]:
+        hotspots.append(f"{os.path.basename(filename)}:{line}({function}) {tottime:.3f}s")
+    logger.info(f"Profiled {tool_name} ({seconds:.2f}s) -> {base}.pstats; top self time: {', '.join(hotspots)}")
+
+
+@contextmanager
+def profile_scope(tool_name: str):
+    """
+    Profile the enclosed code (one tool invocation) and write the results.
+
+    Yields:
+        None
+    """
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        # Another profiler is active in this thread (e.g. the server runs under cProfile)
+        logger.debug(f"Skipping profile of {tool_name}: another profiler is active")
+        yield
+        return
+
+    memory = _is_memory_profiling_enabled()
+    if memory:
+        _start_tracemalloc()
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        profile.disable()
+        seconds = time.monotonic() - started
+        snapshot = None
+        if memory:
+            try:
+                snapshot = tracemalloc.take_snapshot()
+            finally:
+                _stop_tracemalloc()
+        _write_results(tool_name, profile, snapshot, seconds)
+
+
+def get_profiling_status() -> Dict[str, Any]:
+    """
+    Get profiling configuration and counters.
+
+    Returns:
+        Dict with enabled flag, selection, sample rate, output directory and
+        number of profiled / sampled-out invocations
+    """
+    with _lock:
+        stats = dict(_stats)
+    return {
+        'enabled': is_profiling_enabled(),
+        'tools': _get_profiled_tools() or 'all',
+        'sample_rate': _get_sample_rate(),
+        'memory': _is_memory_profiling_enabled(),
+        'directory': get_profile_dir(),
+        'max_files': _get_max_files(),
+        **stats,
+    }
@@ -0,0 +1,216 @@
+"""
+Client-Side Rate Governor
+
+Pipeline interceptor that caps the request rate this server sends to each
+OpenStack service with a token bucket per service type. Parallel tool calls
+and bulk fan-out operations queue for tokens in FIFO order, so a single large
+operation cannot starve other concurrent tool calls.
+
+The governor is opt-in: enabled, it slows down tools with large fan-out
+(e.g. get_service_status on a big cloud) in exchange for protecting the
+APIs, so operators size the limits for their deployment.
+
+Configuration:
+- MCP_RATE_LIMIT_ENABLE: enable the governor (default false)
+- MCP_RATE_LIMIT_DEFAULT: "rate:burst" for services without an override
+  (default 20:40, i.e. 20 requests/s sustained with bursts of 40)
+- MCP_RATE_LIMITS: per-service overrides, e.g. "compute=10:20,network=15:30";
+  a rate of 0 leaves that service unthrottled
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .deadline import DeadlineExceeded
+from .request_pipeline import PipelineRequest
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 20.0
+DEFAULT_BURST = 40
+
+# Accept the names used elsewhere in this server for SDK service types
+SERVICE_ALIASES = {
+    'volume': 'block-storage',
+    'volumev3': 'block-storage',
+    'load_balancer': 'load-balancer',
+    'heat': 'orchestration',
+}
+
+
+def _is_enabled() -> bool:
+    return os.environ.get("MCP_RATE_LIMIT_ENABLE", "false").strip().lower() in ("true", "1", "yes", "on")
+
+
+def _parse_limit(value: str) -> Tuple[float, int]:
+    rate_text, _, burst_text = value.partition(':')
+    rate = max(0.0, float(rate_text))
+    burst = int(burst_text) if burst_text else max(1, int(rate))
+    return rate, max(1, burst)
+
+
+def _get_limit(service_type: str) -> Tuple[float, int]:
+    """Get the configured (rate per second, burst) for a service type."""
+    try:
+        limit = _parse_limit(os.environ.get("MCP_RATE_LIMIT_DEFAULT", f"{DEFAULT_RATE:g}:{DEFAULT_BURST}"))
+    except ValueError:
+        logger.warning("Invalid MCP_RATE_LIMIT_DEFAULT value, using default")
+        limit = (DEFAULT_RATE, DEFAULT_BURST)
+
+    for entry in os.environ.get("MCP_RATE_LIMITS", "").split(','):
+        name, sep, value = entry.partition('=')
+        name = name.strip().lower()
+        if not sep or SERVICE_ALIASES.get(name, name) != service_type:
+            continue
+        try:
+            limit = _parse_limit(value.strip())
+        except ValueError:
+            logger.warning(f"Invalid MCP_RATE_LIMITS entry '{entry.strip()}', ignoring")
+    return limit
+
+
+class TokenBucket:
+    """Token bucket with FIFO (ticket-ordered) admission of waiting callers."""
+
+    def __init__(self, service_type: str, rate: float, burst: int):
+        self.service_type = service_type
+        self.rate = rate
+        self.burst = burst
+        self._cond = threading.Condition()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._next_ticket = 0
+        self._serving = 0
+        self._abandoned = set()
+        self.admitted = 0
+        self.throttled = 0
+        self.max_queue_depth = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _advance(self) -> None:
+        self._serving += 1
+        while self._serving in self._abandoned:
+            self._abandoned.discard(self._serving)
+            self._serving += 1
+        self._cond.notify_all()
+
+    def acquire(self, deadline: Optional[float] = None) -> float:
+        """
+        Block until a token is available and this caller is at the head of the queue.
+
+        Args:
+            deadline: time.monotonic() value after which the caller gives up
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            DeadlineExceeded: If no token is granted before the deadline
+        """
+        started = time.monotonic()
+        with self._cond:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._next_ticket - self._serving)
+            try:
+                while True:
+                    wait_limit = None
+                    if deadline is not None:
+                        wait_limit = deadline - time.monotonic()
+                        if wait_limit <= 0:
+                            raise DeadlineExceeded(f"Deadline exceeded while queued by the {self.service_type} rate governor")
+                    if ticket == self._serving:
+                        self._refill()
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            break
+                        token_wait = (1 - self._tokens) / self.rate
+                        self._cond.wait(token_wait if wait_limit is None else min(token_wait, wait_limit))
+                    else:
+                        self._cond.wait(wait_limit)
+            except BaseException:
+                # Interrupted callers give up their place without blocking the queue
+                if ticket != self._serving:
+                    self._abandoned.add(ticket)
+                    raise
+                self._advance()
+                raise
+            self._advance()
+
+            waited = time.monotonic() - started
+            self.admitted += 1
+            if waited > 0.001:
+                self.throttled += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return waited
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            self._refill()
+            return {
+                'rate_per_second': self.rate,
+                'burst': self.burst,
+                'tokens_available': round(self._tokens, 2),
+                'queue_depth': self._next_ticket - self._serving - len(self._abandoned),
+                'max_queue_depth': self.max_queue_depth,
+                'admitted_requests': self.admitted,
+                'throttled_requests': self.throttled,
+                'total_wait_seconds': round(self.total_wait_seconds, 3),
+                'max_wait_seconds': round(self.max_wait_seconds, 3),
+                'avg_wait_ms': round(self.total_wait_seconds / self.admitted * 1000, 1) if self.admitted else 0.0,
+            }
+
+
+_buckets_lock = threading.Lock()
+_buckets: Dict[str, Optional[TokenBucket]] = {}
+
+
+def _get_bucket(service_type: str) -> Optional[TokenBucket]:
+    with _buckets_lock:
+        if service_type not in _buckets:
+            rate, burst = _get_limit(service_type)
+            # A rate of 0 means unthrottled; remember that to skip the lookup next time
+            _buckets[service_type] = TokenBucket(service_type, rate, burst) if rate > 0 else None
+        return _buckets[service_type]
+
+
+def rate_governor_interceptor(request: PipelineRequest, call_next):
+    """Pipeline interceptor admitting each upstream request through its service's token bucket."""
+    if not _is_enabled():
+        return call_next(request)
+
+    bucket = _get_bucket(SERVICE_ALIASES.get(request.service_type, request.service_type))
+    if bucket is not None:
+        waited = bucket.acquire(request.deadline)
+        if waited > 1.0:
+            logger.debug(f"Rate governor delayed {request.method} {request.service_type} by {waited:.2f}s")
+    return call_next(request)
+
+
+def get_rate_governor_stats() -> Dict[str, Any]:
+    """
+    Get rate governor configuration and queue metrics per service.
+
+    Returns:
+        Dict with per-service rate, burst, current queue depth and wait-time counters
+    """
+    with _buckets_lock:
+        buckets = dict(_buckets)
+    return {
+        'enabled': _is_enabled(),
+        'services': {
+            name: (bucket.snapshot() if bucket is not None else {'rate_per_second': 0, 'unthrottled': True})
+            for name, bucket in sorted(buckets.items())
+        },
+    }
@@ -0,0 +1,135 @@
+"""
+Upstream Request Pipeline
+
+Every HTTP request the OpenStack SDK issues goes through the keystoneauth
+session's request() method. install_request_pipeline() wraps that method so
+that a fixed, ordered chain of interceptors sees each upstream call at a single
+boundary, independent of which service function or tool issued it.
+
+An interceptor is a callable ``interceptor(request, call_next)`` that returns
+the ``requests.Response`` (usually ``call_next(request)``). Interceptors are
+listed outermost first in INTERCEPTOR_ORDER.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Outermost first
+INTERCEPTOR_ORDER = (
+    'deadline',
+    'trace',
+    'singleflight',
+    'circuit_breaker',
+    'retry',
+    'rate_governor',
+    'metrics',
+)
+
+
+class PipelineRequest:
+    """A single upstream SDK request as seen by interceptors."""
+
+    __slots__ = ('session', 'url', 'method', 'args', 'kwargs', 'service_type', 'deadline', 'attempts')
+
+    def __init__(self, session, url: str, method: str, args: Tuple, kwargs: Dict[str, Any]):
+        self.session = session
+        self.url = url
+        self.method = method.upper()
+        self.args = args
+        self.kwargs = kwargs
+        endpoint_filter = kwargs.get('endpoint_filter') or {}
+        # Requests without an endpoint filter are Keystone auth and version discovery calls
+        self.service_type = endpoint_filter.get('service_type') or 'identity'
+        # Set by the deadline interceptor when the tool invocation has a time budget
+        self.deadline: Optional[float] = None
+        # Requests actually sent (0 for GETs answered from a shared in-flight response)
+        self.attempts = 0
+
+
+def _resolve_interceptors() -> List[Tuple[str, Callable]]:
+    from .circuit_breaker import circuit_breaker_interceptor
+    from .deadline import deadline_interceptor
+    from .metrics import metrics_interceptor
+    from .rate_governor import rate_governor_interceptor
+    from .retry_policy import retry_interceptor
+    from .singleflight import singleflight_interceptor
+    from .tracing import trace_interceptor
+
+    available = {
+        'deadline': deadline_interceptor,
+        'trace': trace_interceptor,
+        'singleflight': singleflight_interceptor,
+        'circuit_breaker': circuit_breaker_interceptor,
+        'retry': retry_interceptor,
+        'rate_governor': rate_governor_interceptor,
+        'metrics': metrics_interceptor,
+    }
+    return [(name, available[name]) for name in INTERCEPTOR_ORDER]
+
+
+def _build_chain(interceptors: List[Tuple[str, Callable]], terminal: Callable) -> Callable:
+    handler = terminal
+    for _name, interceptor in reversed(interceptors):
+        handler = (lambda icpt, nxt: lambda request: icpt(request, nxt))(interceptor, handler)
+    return handler
+
+
+def install_request_pipeline(conn) -> None:
+    """
+    Route all requests of an SDK connection's session through the interceptor chain.
+
+    Args:
+        conn: OpenStack connection
+    """
+    session = conn.session
+    if getattr(session, '_mcp_pipeline_installed', False):
+        return
+
+    original_request = session.request
+
+    def terminal(request: PipelineRequest):
+        request.attempts += 1
+        return original_request(request.url, request.method, *request.args, **request.kwargs)
+
+    chain = _build_chain(_resolve_interceptors(), terminal)
+
+    def request(url, method, *args, **kwargs):
+        return chain(PipelineRequest(session, url, method, args, kwargs))
+
+    session.request = request
+    session._mcp_pipeline_installed = True
+    logger.debug(f"Request pipeline installed: {', '.join(INTERCEPTOR_ORDER)}")
+
+
+def request_fingerprint(request: PipelineRequest) -> Optional[Tuple]:
+    """
+    Build a hashable identity for an idempotent request (endpoint, collection, filters).
+
+    Returns:
+        Tuple key, or None for requests that must never be shared (streams, bodies)
+    """
+    kwargs = request.kwargs
+    if kwargs.get('stream') or kwargs.get('json') is not None or kwargs.get('data') is not None:
+        return None
+
+    params = kwargs.get('params') or {}
+    param_items = params.items() if isinstance(params, dict) else params
+    headers = {
+        k.lower(): v for k, v in (kwargs.get('headers') or {}).items()
+        if k.lower() != 'x-openstack-request-id'
+    }
+    try:
+        return (
+            id(request.session),
+            request.service_type,
+            request.method,
+            request.url,
+            tuple(sorted((str(k), str(v)) for k, v in param_items)),
+            tuple(sorted((k, str(v)) for k, v in headers.items())),
+            str(kwargs.get('microversion')),
+        )
+    except Exception:
+        return None
@@ -0,0 +1,230 @@
+"""
+Retry Policy for Transient Upstream Errors
+
+Pipeline interceptor that retries upstream requests failing with transient
+errors, using exponential backoff with full jitter. Retries are bounded by a
+maximum number of attempts, a total retry time budget and the tool
+invocation's deadline.
+
+Rules per error class (first match wins):
+- rate_limited: 429 on any request (honours Retry-After)
+- unavailable: 503 on any request (honours Retry-After)
+- gateway: 502 / 504 on idempotent requests only
+- lb_pending: 409 on load-balancer mutations while the parent load balancer is
+  in PENDING_* ("immutable"); waits for the load balancer to leave PENDING_*,
+  then retries
+- compute_task_state: 409 on compute mutations while the instance is busy
+  with another task (task_state set)
+
+Other 4xx responses (including 409 conflicts such as duplicate names or IPs in
+use) are returned unchanged.
+"""
+
+import logging
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from keystoneauth1 import exceptions as ksa_exceptions
+
+from .request_pipeline import PipelineRequest
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BUDGET_SECONDS = 60.0
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+MUTATING_METHODS = frozenset(('POST', 'PUT', 'PATCH', 'DELETE'))
+
+_LB_ID_PATTERN = re.compile(r"[Ll]oad [Bb]alancer ([0-9a-fA-F-]{36})")
+
+
+class RetryRule:
+    """Which failures a rule retries and how long to back off between attempts."""
+
+    __slots__ = ('name', 'status_codes', 'methods', 'service_types', 'body_markers',
+                 'base_delay', 'max_delay')
+
+    def __init__(self, name: str, status_codes, methods, base_delay: float, max_delay: float,
+                 service_types=None, body_markers=None):
+        self.name = name
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(methods) if methods else None
+        self.service_types = frozenset(service_types) if service_types else None
+        self.body_markers = tuple(body_markers or ())
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def matches(self, request: PipelineRequest, status_code: int, body: str) -> bool:
+        if status_code not in self.status_codes:
+            return False
+        if self.methods is not None and request.method not in self.methods:
+            return False
+        if self.service_types is not None and request.service_type not in self.service_types:
+            return False
+        if self.body_markers and not any(marker in body for marker in self.body_markers):
+            return False
+        return True
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given (0-based) retry attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+RETRY_RULES = (
+    RetryRule('rate_limited', (429,), None, base_delay=1.0, max_delay=20.0),
+    RetryRule('unavailable', (503,), None, base_delay=0.5, max_delay=8.0),
+    RetryRule('gateway', (502, 504), IDEMPOTENT_METHODS, base_delay=0.5, max_delay=8.0),
+    RetryRule('lb_pending', (409,), MUTATING_METHODS, base_delay=1.0, max_delay=10.0,
+              service_types=('load-balancer',), body_markers=('immutable', 'PENDING_')),
+    RetryRule('compute_task_state', (409,), MUTATING_METHODS, base_delay=1.0, max_delay=10.0,
+              service_types=('compute',), body_markers=('task_state',)),
+)
+
+
+def _is_enabled() -> bool:
+    return os.environ.get("MCP_RETRY_ENABLE", "true").strip().lower() in ("true", "1", "yes", "on")
+
+
+def _get_max_attempts() -> int:
+    try:
+        return max(1, int(os.environ.get("MCP_RETRY_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)))
+    except ValueError:
+        return DEFAULT_MAX_ATTEMPTS
+
+
+def _get_budget_seconds() -> float:
+    try:
+        return max(0.0, float(os.environ.get("MCP_RETRY_BUDGET_SECONDS", DEFAULT_BUDGET_SECONDS)))
+    except ValueError:
+        return DEFAULT_BUDGET_SECONDS
+
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _record(rule: str, outcome: str) -> None:
+    with _stats_lock:
+        stats = _stats.setdefault(rule, {'retries': 0, 'recovered': 0, 'exhausted': 0})
+        stats[outcome] += 1
+
+
+def _response_body(response) -> str:
+    try:
+        return response.text[:2000] if response.text else ''
+    except Exception:
+        return ''
+
+
+def _retry_after(response) -> Optional[float]:
+    value = response.headers.get('Retry-After') if response is not None else None
+    if not value:
+        return None
+    try:
+        return min(MAX_RETRY_AFTER_SECONDS, max(0.0, float(value)))
+    except ValueError:
+        return None
+
+
+def _wait_for_load_balancer(request: PipelineRequest, body: str, wait_until: float, rule: RetryRule) -> None:
+    """Poll the parent load balancer named in an 'immutable' conflict until it leaves PENDING_*."""
+    match = _LB_ID_PATTERN.search(body)
+    marker = request.url.find('lbaas/')
+    if not match or marker < 0:
+        time.sleep(max(0.0, min(rule.backoff(0), wait_until - time.monotonic())))
+        return
+
+    lb_url = f"{request.url[:marker]}lbaas/loadbalancers/{match.group(1)}"
+    kwargs = {key: request.kwargs[key] for key in ('endpoint_filter', 'endpoint_override') if key in request.kwargs}
+    attempt = 0
+    while time.monotonic() < wait_until:
+        time.sleep(max(0.0, min(rule.backoff(attempt), wait_until - time.monotonic())))
+        attempt += 1
+        try:
+            response = request.session.request(lb_url, 'GET', raise_exc=False, **kwargs)
+            status = response.json().get('loadbalancer', {}).get('provisioning_status', '')
+        except Exception as e:
+            logger.debug(f"Could not poll load balancer {match.group(1)}: {e}")
+            return
+        if not str(status).startswith('PENDING_'):
+            logger.info(f"Load balancer {match.group(1)} is {status}, retrying {request.method} {request.url}")
+            return
+
+
+def retry_interceptor(request: PipelineRequest, call_next):
+    """Pipeline interceptor retrying transient upstream failures with jittered backoff."""
+    if not _is_enabled():
+        return call_next(request)
+
+    max_attempts = _get_max_attempts()
+    retry_until = time.monotonic() + _get_budget_seconds()
+    if request.deadline is not None:
+        retry_until = min(retry_until, request.deadline)
+
+    attempt = 0
+    last_rule: Optional[RetryRule] = None
+    while True:
+        error: Optional[ksa_exceptions.HttpError] = None
+        try:
+            response = call_next(request)
+        except ksa_exceptions.HttpError as e:
+            if e.response is None:
+                raise
+            error, response = e, e.response
+
+        body = _response_body(response) if response.status_code == 409 else ''
+        rule = next((r for r in RETRY_RULES if r.matches(request, response.status_code, body)), None)
+        if rule is None:
+            if last_rule is not None and response.status_code < 400:
+                _record(last_rule.name, 'recovered')
+            if error is not None:
+                raise error
+            return response
+
+        delay = _retry_after(response)
+        if delay is None:
+            delay = rule.backoff(attempt)
+        if attempt + 1 >= max_attempts or time.monotonic() + delay > retry_until:
+            _record(rule.name, 'exhausted')
+            logger.warning(f"Giving up on {request.method} {request.service_type} {request.url} after "
+                           f"{attempt + 1} attempts (HTTP {response.status_code}, {rule.name})")
+            if error is not None:
+                raise error
+            return response
+
+        logger.info(f"Retrying {request.method} {request.service_type} {request.url} "
+                    f"(HTTP {response.status_code}, {rule.name}, attempt {attempt + 2}/{max_attempts})")
+        _record(rule.name, 'retries')
+        if rule.name == 'lb_pending':
+            _wait_for_load_balancer(request, body, retry_until, rule)
+        else:
+            time.sleep(delay)
+        attempt += 1
+        last_rule = rule
+        if request.deadline is not None and 'timeout' in request.kwargs:
+            # Later attempts only get what is left of the tool's time budget
+            request.kwargs['timeout'] = min(request.kwargs['timeout'], max(0.001, request.deadline - time.monotonic()))
+
+
+def get_retry_stats() -> Dict[str, Any]:
+    """
+    Get retry policy configuration and counters per error class.
+
+    Returns:
+        Dict with limits and per-rule retries, recovered and exhausted counts
+    """
+    with _stats_lock:
+        rules = {name: dict(counts) for name, counts in _stats.items()}
+    return {
+        'enabled': _is_enabled(),
+        'max_attempts': _get_max_attempts(),
+        'budget_seconds': _get_budget_seconds(),
+        'rules': rules,
+    }
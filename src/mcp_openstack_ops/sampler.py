@@ -0,0 +1,417 @@
+"""
+Resource Time-Series Sampler
+
+Optional background sampler (MCP_SAMPLER_ENABLE) that periodically collects
+cheap cluster and project aggregates - hypervisor vCPU / RAM / disk usage and
+capacity (one os-hypervisors/statistics call), instance counts by status (one
+server listing), volume count and GB, floating IP usage -
+into a fixed-size ring buffer (NumPy arrays, one column per metric). With
+MCP_SAMPLER_FILE set, the buffer is also written to a compact columnar .npz
+file after each sample and reloaded at startup, so history survives restarts.
+
+Trend, rate-of-change and peak queries are answered from the buffer without
+any OpenStack API calls.
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .concurrency import run_in_parallel
+from .connection import connection_lease, get_openstack_connection
+from .deadline import deadline_scope
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 60.0
+DEFAULT_CAPACITY = 1440  # 24h at the default interval
+
+# Instance statuses counted per sample (one server listing, bucketed client-side)
+SAMPLED_STATUSES = ('ACTIVE', 'SHUTOFF', 'ERROR', 'BUILD')
+
+# Metric columns of the ring buffer
+METRICS = (
+    'vcpus_used', 'vcpus_capacity',
+    'memory_mb_used', 'memory_mb_capacity',
+    'disk_gb_used', 'disk_gb_capacity',
+    'instances_active', 'instances_shutoff', 'instances_error', 'instances_build',
+    'volumes', 'volume_gb',
+    'floating_ips', 'floating_ips_associated',
+)
+
+# Usage metric -> capacity metric, for time-to-exhaustion projections
+CAPACITY_OF = {
+    'vcpus_used': 'vcpus_capacity',
+    'memory_mb_used': 'memory_mb_capacity',
+    'disk_gb_used': 'disk_gb_capacity',
+}
+
+
+def is_sampler_enabled() -> bool:
+    """Check whether the background sampler is enabled via MCP_SAMPLER_ENABLE."""
+    return os.environ.get("MCP_SAMPLER_ENABLE", "false").strip().lower() in ("true", "1", "yes", "on")
+
+
+def _get_interval() -> float:
+    try:
+        return max(5.0, float(os.environ.get("MCP_SAMPLER_INTERVAL", DEFAULT_INTERVAL_SECONDS)))
+    except ValueError:
+        return DEFAULT_INTERVAL_SECONDS
+
+
+def _get_capacity() -> int:
+    try:
+        return max(2, int(os.environ.get("MCP_SAMPLER_CAPACITY", DEFAULT_CAPACITY)))
+    except ValueError:
+        return DEFAULT_CAPACITY
+
+
+def _get_store_path() -> str:
+    path = os.environ.get("MCP_SAMPLER_FILE", "").strip()
+    return os.path.expanduser(path) if path else ""
+
+
+class RingBuffer:
+    """
+    Fixed-memory time series: `capacity` rows of (timestamp, metric values).
+
+    Missing values (a collector failed) are stored as NaN. Once full, the
+    oldest sample is overwritten.
+    """
+
+    def __init__(self, capacity: int, columns: Tuple[str, ...] = METRICS):
+        self.columns = columns
+        self.capacity = capacity
+        self._times = np.full(capacity, np.nan)
+        self._values = np.full((capacity, len(columns)), np.nan)
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, values: Dict[str, float]) -> None:
+        row = np.array([values.get(column, np.nan) for column in self.columns], dtype=float)
+        with self._lock:
+            self._times[self._next] = timestamp
+            self._values[self._next] = row
+            self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def snapshot(self, since: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get samples in chronological order.
+
+        Args:
+            since: Only samples with a timestamp >= since (epoch seconds)
+
+        Returns:
+            Tuple of (timestamps, values with one column per metric)
+        """
+        with self._lock:
+            order = (np.arange(self._count) + self._next - self._count) % self.capacity
+            times = self._times[order]
+            values = self._values[order]
+        if since is not None:
+            keep = times >= since
+            times, values = times[keep], values[keep]
+        return times, values
+
+    def save(self, path: str) -> None:
+        times, values = self.snapshot()
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez_compressed(tmp_path, times=times, values=values, columns=np.array(self.columns))
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> int:
+        """Load samples saved by save(); columns are matched by name. Returns samples loaded."""
+        with np.load(path, allow_pickle=False) as data:
+            times, values, columns = data['times'], data['values'], [str(c) for c in data['columns']]
+        for row in range(len(times))[-self.capacity:]:
+            self.append(float(times[row]), {c: values[row, i] for i, c in enumerate(columns)})
+        return min(len(times), self.capacity)
+
+
+_state_lock = threading.Lock()
+_sampler_thread: Optional[threading.Thread] = None
+_stop_event = threading.Event()
+_buffer: Optional[RingBuffer] = None
+_sampler_state: Dict[str, Any] = {
+    'enabled': False,
+    'interval_seconds': None,
+    'last_sample_at': None,
+    'last_duration_seconds': None,
+    'samples_taken': 0,
+    'errors': {},
+}
+
+
+def _collect_hypervisors(conn) -> Dict[str, float]:
+    # Import here to avoid circular imports
+    from .services.capacity import get_hypervisor_statistics
+
+    statistics = get_hypervisor_statistics(conn)
+    return {
+        'vcpus_used': statistics.get('vcpus_used', np.nan),
+        'vcpus_capacity': statistics.get('vcpus', np.nan),
+        'memory_mb_used': statistics.get('memory_mb_used', np.nan),
+        'memory_mb_capacity': statistics.get('memory_mb', np.nan),
+        'disk_gb_used': statistics.get('local_gb_used', np.nan),
+        'disk_gb_capacity': statistics.get('local_gb', np.nan),
+    }
+
+
+def _collect_instances(conn) -> Dict[str, float]:
+    counts = {f'instances_{status.lower()}': 0 for status in SAMPLED_STATUSES}
+    for server in conn.compute.servers():
+        key = f'instances_{(server.status or "").lower()}'
+        if key in counts:
+            counts[key] += 1
+    return counts
+
+
+def _collect_volumes(conn) -> Dict[str, float]:
+    response = conn.block_storage.get('/limits')
+    if response.status_code != 200:
+        raise Exception(f"Block storage API /limits returned HTTP {response.status_code}")
+    absolute = response.json().get('limits', {}).get('absolute', {})
+    return {
+        'volumes': absolute.get('totalVolumesUsed', np.nan),
+        'volume_gb': absolute.get('totalGigabytesUsed', np.nan),
+    }
+
+
+def _collect_floating_ips(conn) -> Dict[str, float]:
+    floating_ips = list(conn.network.ips(project_id=conn.current_project_id))
+    return {
+        'floating_ips': len(floating_ips),
+        'floating_ips_associated': len([ip for ip in floating_ips if ip.port_id]),
+    }
+
+
+COLLECTORS = {
+    'hypervisors': _collect_hypervisors,
+    'instances': _collect_instances,
+    'volumes': _collect_volumes,
+    'floating_ips': _collect_floating_ips,
+}
+
+
+def take_sample(buffer: RingBuffer) -> Dict[str, str]:
+    """
+    Collect one sample of all metrics concurrently and append it to the buffer.
+
+    Returns:
+        Dict of collector name -> error message for collectors that failed
+    """
+    # Keep the connection open for the collectors even if the pool evicts it meanwhile
+    with connection_lease():
+        conn = get_openstack_connection()
+        values: Dict[str, float] = {}
+        errors: Dict[str, str] = {}
+        # A slow API must not delay the next sample
+        with deadline_scope(_get_interval()):
+            for name, result, error in run_in_parallel(lambda collector: COLLECTORS[collector](conn),
+                                                       COLLECTORS.keys(), max_workers=len(COLLECTORS)):
+                if error is not None:
+                    errors[name] = str(error)
+                else:
+                    values.update(result)
+    buffer.append(time.time(), values)
+    return errors
+
+
+def _run_sampler(buffer: RingBuffer, interval: float, store_path: str) -> None:
+    while not _stop_event.is_set():
+        started = time.monotonic()
+        try:
+            errors = take_sample(buffer)
+            for name, error in errors.items():
+                logger.debug(f"Sampler could not collect {name}: {error}")
+            if store_path:
+                buffer.save(store_path)
+        except Exception as e:
+            errors = {'sample': str(e)}
+            logger.warning(f"Sampler round failed: {e}")
+
+        duration = time.monotonic() - started
+        with _state_lock:
+            _sampler_state['last_sample_at'] = datetime.now().isoformat()
+            _sampler_state['last_duration_seconds'] = round(duration, 3)
+            _sampler_state['samples_taken'] += 1
+            _sampler_state['errors'] = errors
+        _stop_event.wait(max(0.0, interval - duration))
+
+
+def start_background_sampler() -> threading.Thread:
+    """
+    Start the sampler in a daemon thread. Safe to call more than once.
+
+    Returns:
+        The sampler thread
+    """
+    global _sampler_thread, _buffer
+
+    interval, capacity, store_path = _get_interval(), _get_capacity(), _get_store_path()
+    with _state_lock:
+        if _sampler_thread is not None and _sampler_thread.is_alive():
+            return _sampler_thread
+
+        buffer = RingBuffer(capacity)
+        if store_path and os.path.exists(store_path):
+            try:
+                logger.info(f"Loaded {buffer.load(store_path)} samples from {store_path}")
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable sampler file {store_path}: {e}")
+        _buffer = buffer
+        _sampler_state['enabled'] = True
+        _sampler_state['interval_seconds'] = interval
+        _stop_event.clear()
+        _sampler_thread = threading.Thread(target=_run_sampler, args=(buffer, interval, store_path),
+                                           name="mcp-openstack-sampler", daemon=True)
+        _sampler_thread.start()
+
+    logger.info(f"Background resource sampler started (every {interval:g}s, {capacity} samples)")
+    return _sampler_thread
+
+
+def stop_background_sampler() -> None:
+    """Stop the sampler thread (the collected history is kept)."""
+    _stop_event.set()
+
+
+def get_sampler_status() -> Dict[str, Any]:
+    """
+    Get the sampler configuration and state.
+
+    Returns:
+        Dict with enabled flag, interval, buffer fill level and last round's errors
+    """
+    with _state_lock:
+        status = dict(_sampler_state)
+        status['errors'] = dict(_sampler_state['errors'])
+        buffer = _buffer
+    status['buffer_capacity'] = buffer.capacity if buffer else _get_capacity()
+    status['buffered_samples'] = len(buffer) if buffer else 0
+    status['store_file'] = _get_store_path() or None
+    if buffer is not None and len(buffer):
+        times, _values = buffer.snapshot()
+        status['history_from'] = _isoformat(times[0])
+        status['history_to'] = _isoformat(times[-1])
+    return status
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+def _select(metric: str, window_minutes: float) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Get metric names and their samples within the window (all metrics if metric is empty)."""
+    if _buffer is None:
+        raise RuntimeError("Resource sampler is not running (set MCP_SAMPLER_ENABLE=true)")
+    metrics = [m.strip() for m in metric.split(',') if m.strip()] if metric else list(METRICS)
+    unknown = [m for m in metrics if m not in METRICS]
+    if unknown:
+        raise ValueError(f"Unknown metric(s) {', '.join(unknown)}. Available: {', '.join(METRICS)}")
+    since = time.time() - window_minutes * 60 if window_minutes > 0 else None
+    times, values = _buffer.snapshot(since)
+    return metrics, times, values
+
+
+def get_metric_trends(metric: str = "", window_minutes: float = 60) -> Dict[str, Any]:
+    """
+    Summarize the trend of sampled metrics over a time window.
+
+    Args:
+        metric: Metric name or comma-separated names (all metrics if empty)
+        window_minutes: Look-back window in minutes (0 = whole history)
+
+    Returns:
+        Dict of metric -> first, last, min, max, mean, change, rate per hour and
+        (for usage metrics) projected hours until capacity is exhausted
+    """
+    metrics, times, values = _select(metric, window_minutes)
+    trends = {}
+    for name in metrics:
+        column = values[:, METRICS.index(name)]
+        valid = ~np.isnan(column)
+        if not valid.any():
+            trends[name] = {'samples': 0}
+            continue
+        t, v = times[valid], column[valid]
+        trend = {
+            'samples': int(v.size),
+            'first': float(v[0]),
+            'last': float(v[-1]),
+            'min': float(v.min()),
+            'max': float(v.max()),
+            'mean': round(float(v.mean()), 2),
+            'change': float(v[-1] - v[0]),
+        }
+        if v.size >= 2 and t[-1] > t[0]:
+            # Least-squares slope is robust against single noisy samples
+            slope_per_second = float(np.polyfit(t - t[0], v, 1)[0])
+            trend['rate_per_hour'] = round(slope_per_second * 3600, 3)
+            capacity_metric = CAPACITY_OF.get(name)
+            if capacity_metric and slope_per_second > 0:
+                capacity = values[:, METRICS.index(capacity_metric)]
+                capacity = capacity[~np.isnan(capacity)]
+                if capacity.size:
+                    headroom = float(capacity[-1] - v[-1])
+                    trend['hours_until_exhausted'] = round(max(headroom, 0.0) / (slope_per_second * 3600), 1)
+        trends[name] = trend
+
+    return {
+        'window_minutes': window_minutes,
+        'samples': int(times.size),
+        'from': _isoformat(times[0]) if times.size else None,
+        'to': _isoformat(times[-1]) if times.size else None,
+        'trends': trends,
+    }
+
+
+def get_metric_peaks(metric: str, window_minutes: float = 1440, top: int = 5) -> Dict[str, Any]:
+    """
+    Find the highest samples of a metric in a time window.
+
+    Args:
+        metric: Metric name (or comma-separated names)
+        window_minutes: Look-back window in minutes (0 = whole history)
+        top: Number of peak samples to report per metric
+
+    Returns:
+        Dict of metric -> list of {'timestamp', 'value'} (highest first) and the
+        largest increase between consecutive samples
+    """
+    metrics, times, values = _select(metric, window_minutes)
+    peaks = {}
+    for name in metrics:
+        column = values[:, METRICS.index(name)]
+        valid = ~np.isnan(column)
+        t, v = times[valid], column[valid]
+        order = np.argsort(-v, kind='stable')[:max(1, top)]
+        result = {
+            'peaks': [{'timestamp': _isoformat(t[i]), 'value': float(v[i])} for i in order],
+        }
+        if v.size >= 2:
+            steps = np.diff(v)
+            jump = int(np.argmax(steps))
+            result['largest_increase'] = {
+                'from': _isoformat(t[jump]),
+                'to': _isoformat(t[jump + 1]),
+                'change': float(steps[jump]),
+            }
+        peaks[name] = result
+
+    return {
+        'window_minutes': window_minutes,
+        'samples': int(times.size),
+        'peaks': peaks,
+    }
@@ -131,6 +131,7 @@ from .storage import (
     set_volume_groups,
     set_volume_qos,
     get_server_volumes,
+    get_server_volume_map,
     set_server_volume
 )
 
@@ -155,6 +156,7 @@ __all__ = [
     'get_flavor_list',
     'set_flavor',
     'get_server_volumes',
+    'get_server_volume_map',
     'set_server_volume',
     
     # Storage
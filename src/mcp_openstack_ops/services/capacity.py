@@ -0,0 +1,490 @@
+"""
+OpenStack Capacity Engine (Placement API)
+
+This module builds a cluster capacity model from the Placement API instead of
+quota values or per-hypervisor guesses. Resource provider inventories
+(total, reserved, allocation ratio, max unit) and usages are loaded into a
+NumPy table with one row per provider and one column per resource class, so
+free capacity per host, aggregate and availability zone is computed with array
+operations even for thousands of hypervisors.
+
+Upstream calls per refresh:
+- 1 provider list (includes each provider's generation, which Placement bumps
+  on any inventory or allocation change)
+- inventories + usages only for providers whose generation changed since the
+  previous refresh (fetched concurrently)
+- 1 Nova aggregate list for host -> aggregate / availability zone mapping
+
+Placement has no bulk endpoint for inventories or usages, so a cold Placement
+table costs 2N+1 requests for N providers (and allocations bump generations,
+so a busy cloud re-fetches most providers). Hot paths such as
+get_resource_monitoring therefore use build_hypervisor_table(), which reads
+the same physical totals and usage from one paginated Nova hypervisor detail
+listing; the Placement table (with allocation ratios and max units) is built
+only on explicit request and kept for reuse (get_cached_capacity_table).
+Nova does not report allocation ratios, so the hypervisor table applies the
+configured ones (MCP_CPU/RAM/DISK_ALLOCATION_RATIO, defaulting to Nova's
+initial_*_allocation_ratio defaults).
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..concurrency import run_in_parallel
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Resource classes tracked by the capacity table (column order)
+RESOURCE_CLASSES = ('VCPU', 'PCPU', 'MEMORY_MB', 'DISK_GB')
+
+# Resource provider listing with root/parent provider links
+PLACEMENT_MICROVERSION = '1.14'
+# Last compute microversion whose hypervisor details carry vCPU / memory / disk
+# figures (removed in 2.88); 2.53 reports hypervisor IDs as UUIDs
+HYPERVISOR_DETAIL_MICROVERSION = '2.53'
+DEFAULT_CAPACITY_WORKERS = 8
+# Age after which a cached Placement table is no longer reused for planning
+DEFAULT_CAPACITY_TABLE_TTL = 300.0
+
+# Overcommit applied to Nova hypervisor figures (Nova's initial_*_allocation_ratio defaults)
+DEFAULT_ALLOCATION_RATIOS = {'VCPU': 4.0, 'MEMORY_MB': 1.0, 'DISK_GB': 1.0}
+_ALLOCATION_RATIO_ENV = {'VCPU': 'MCP_CPU_ALLOCATION_RATIO', 'MEMORY_MB': 'MCP_RAM_ALLOCATION_RATIO',
+                         'DISK_GB': 'MCP_DISK_ALLOCATION_RATIO'}
+
+_cache_lock = threading.Lock()
+# Placement endpoint -> {provider uuid: (generation, inventories, usages)}
+_provider_cache: Dict[str, Dict[str, Tuple[int, Dict[str, Any], Dict[str, Any]]]] = {}
+# Placement endpoint -> (time.monotonic() when built, last Placement capacity table)
+_table_cache: Dict[str, Tuple[float, "CapacityTable"]] = {}
+
+
+def _get_capacity_workers() -> int:
+    try:
+        return max(1, int(os.environ.get("MCP_CAPACITY_WORKERS", DEFAULT_CAPACITY_WORKERS)))
+    except ValueError:
+        return DEFAULT_CAPACITY_WORKERS
+
+
+def get_allocation_ratios(overrides: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """
+    Allocation ratios applied to Nova hypervisor figures.
+
+    Args:
+        overrides: Resource class -> ratio taking precedence over the environment (values <= 0 are ignored)
+
+    Returns:
+        Dict of VCPU / MEMORY_MB / DISK_GB -> allocation ratio
+    """
+    ratios = {}
+    for resource_class, default in DEFAULT_ALLOCATION_RATIOS.items():
+        try:
+            ratio = float(os.environ.get(_ALLOCATION_RATIO_ENV[resource_class], default))
+        except ValueError:
+            ratio = default
+        override = (overrides or {}).get(resource_class)
+        if override is not None and override > 0:
+            ratio = float(override)
+        ratios[resource_class] = ratio if ratio > 0 else default
+    return ratios
+
+
+def get_capacity_table_ttl() -> float:
+    """Seconds a cached Placement capacity table may be reused (MCP_CAPACITY_TABLE_TTL)."""
+    try:
+        return max(0.0, float(os.environ.get("MCP_CAPACITY_TABLE_TTL", DEFAULT_CAPACITY_TABLE_TTL)))
+    except ValueError:
+        return DEFAULT_CAPACITY_TABLE_TTL
+
+
+class CapacityTable:
+    """
+    Capacity of all resource providers as NumPy arrays.
+
+    Arrays have shape (providers, len(RESOURCE_CLASSES)); providers without an
+    inventory of a class have zeros in that column.
+    """
+
+    def __init__(self, providers: List[Dict[str, Any]], total: np.ndarray, reserved: np.ndarray,
+                 allocation_ratio: np.ndarray, max_unit: np.ndarray, used: np.ndarray):
+        self.providers = providers
+        self.names = [p['name'] for p in providers]
+        self.total = total
+        self.reserved = reserved
+        self.allocation_ratio = allocation_ratio
+        self.max_unit = max_unit
+        self.used = used
+
+    def __len__(self) -> int:
+        return len(self.providers)
+
+    @property
+    def capacity(self) -> np.ndarray:
+        """Schedulable capacity: (total - reserved) * allocation_ratio."""
+        return np.floor(np.maximum(self.total - self.reserved, 0) * self.allocation_ratio)
+
+    @property
+    def free(self) -> np.ndarray:
+        return np.maximum(self.capacity - self.used, 0)
+
+    @property
+    def physical(self) -> np.ndarray:
+        """Usable physical capacity without overcommit: total - reserved."""
+        return np.maximum(self.total - self.reserved, 0)
+
+    def column(self, resource_class: str) -> int:
+        return RESOURCE_CLASSES.index(resource_class)
+
+    def group_totals(self, group_of_provider: List[List[str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Sum capacity, used and free per group (a provider may belong to several groups).
+
+        Args:
+            group_of_provider: For each provider row, the names of its groups
+
+        Returns:
+            Dict of group name -> summary
+        """
+        names = sorted({g for groups in group_of_provider for g in groups})
+        if not names:
+            return {}
+        index = {name: i for i, name in enumerate(names)}
+        rows, cols = [], []
+        for row, groups in enumerate(group_of_provider):
+            for group in groups:
+                rows.append(row)
+                cols.append(index[group])
+        membership = np.zeros((len(self), len(names)))
+        membership[rows, cols] = 1.0
+
+        capacity = membership.T @ self.capacity
+        used = membership.T @ self.used
+        physical = membership.T @ self.physical
+        hosts = membership.sum(axis=0)
+        return {
+            name: _summarize(capacity[i], used[i], physical[i], host_count=int(hosts[i]))
+            for name, i in index.items()
+        }
+
+
+def _summarize(capacity: np.ndarray, used: np.ndarray, physical: np.ndarray,
+               host_count: Optional[int] = None) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {}
+    if host_count is not None:
+        summary['hosts'] = host_count
+    for col, resource_class in enumerate(RESOURCE_CLASSES):
+        cap = float(capacity[col])
+        if cap <= 0 and physical[col] <= 0:
+            continue
+        use = float(used[col])
+        summary[resource_class] = {
+            'physical': int(physical[col]),
+            'capacity': int(cap),
+            'used': int(use),
+            'free': int(max(cap - use, 0)),
+            'utilization_percent': round(use / cap * 100, 1) if cap > 0 else 0.0
+        }
+    return summary
+
+
+def _placement_get(conn, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    response = conn.placement.get(path, params=params, microversion=PLACEMENT_MICROVERSION)
+    if response.status_code != 200:
+        raise Exception(f"Placement API {path} returned HTTP {response.status_code}")
+    return response.json()
+
+
+def _list_resource_providers(conn) -> List[Dict[str, Any]]:
+    return _placement_get(conn, '/resource_providers').get('resource_providers', [])
+
+
+def _fetch_provider_state(conn, provider_uuid: str) -> Tuple[int, Dict[str, Any], Dict[str, Any]]:
+    inventories = _placement_get(conn, f'/resource_providers/{provider_uuid}/inventories')
+    usages = _placement_get(conn, f'/resource_providers/{provider_uuid}/usages')
+    return (
+        inventories.get('resource_provider_generation', -1),
+        inventories.get('inventories', {}),
+        usages.get('usages', {})
+    )
+
+
+def _placement_cache_key(conn) -> str:
+    try:
+        return conn.placement.get_endpoint()
+    except Exception:
+        return 'placement'
+
+
+def _load_provider_states(conn, providers: List[Dict[str, Any]]) -> Dict[str, Tuple[int, Dict, Dict]]:
+    """Get inventories and usages for all providers, re-fetching only changed generations."""
+    cache_key = _placement_cache_key(conn)
+
+    with _cache_lock:
+        cached = dict(_provider_cache.get(cache_key, {}))
+
+    states = {}
+    stale = []
+    for provider in providers:
+        entry = cached.get(provider['uuid'])
+        if entry is not None and entry[0] == provider.get('generation'):
+            states[provider['uuid']] = entry
+        else:
+            stale.append(provider['uuid'])
+
+    for provider_uuid, state, error in run_in_parallel(lambda uuid: _fetch_provider_state(conn, uuid),
+                                                       stale, max_workers=_get_capacity_workers()):
+        if error is not None:
+            logger.warning(f"Could not load Placement state for provider {provider_uuid}: {error}")
+            continue
+        states[provider_uuid] = state
+
+    logger.info(f"Placement capacity: {len(providers)} providers, {len(stale)} refreshed")
+    with _cache_lock:
+        _provider_cache[cache_key] = states
+    return states
+
+
+def build_capacity_table(conn) -> CapacityTable:
+    """
+    Load Placement resource providers into a CapacityTable.
+
+    Args:
+        conn: OpenStack connection
+
+    Returns:
+        CapacityTable with one row per provider that has any tracked resource class
+    """
+    providers = _list_resource_providers(conn)
+    states = _load_provider_states(conn, providers)
+
+    rows = [p for p in providers
+            if p['uuid'] in states and any(rc in states[p['uuid']][1] for rc in RESOURCE_CLASSES)]
+    shape = (len(rows), len(RESOURCE_CLASSES))
+    total = np.zeros(shape)
+    reserved = np.zeros(shape)
+    allocation_ratio = np.ones(shape)
+    max_unit = np.zeros(shape)
+    used = np.zeros(shape)
+
+    for row, provider in enumerate(rows):
+        _generation, inventories, usages = states[provider['uuid']]
+        for col, resource_class in enumerate(RESOURCE_CLASSES):
+            inventory = inventories.get(resource_class)
+            if not inventory:
+                continue
+            total[row, col] = inventory.get('total', 0)
+            reserved[row, col] = inventory.get('reserved', 0)
+            allocation_ratio[row, col] = inventory.get('allocation_ratio', 1.0)
+            max_unit[row, col] = inventory.get('max_unit', inventory.get('total', 0))
+            used[row, col] = usages.get(resource_class, 0)
+
+    table = CapacityTable(rows, total, reserved, allocation_ratio, max_unit, used)
+    with _cache_lock:
+        _table_cache[_placement_cache_key(conn)] = (time.monotonic(), table)
+    return table
+
+
+def get_cached_capacity_table(conn, max_age: Optional[float] = None) -> Optional[Tuple[CapacityTable, float]]:
+    """
+    Get the last Placement capacity table built for this cloud without any API call.
+
+    Args:
+        conn: OpenStack connection
+        max_age: Ignore a table older than this many seconds (default MCP_CAPACITY_TABLE_TTL)
+
+    Returns:
+        (table, age in seconds), or None if no table was built yet or it expired
+    """
+    with _cache_lock:
+        entry = _table_cache.get(_placement_cache_key(conn))
+    if entry is None:
+        return None
+    built_at, table = entry
+    age = time.monotonic() - built_at
+    if age > (get_capacity_table_ttl() if max_age is None else max_age):
+        return None
+    return table, age
+
+
+def list_hypervisor_details(conn) -> List[Dict[str, Any]]:
+    """
+    List all hypervisors with their vCPU, memory and disk figures.
+
+    Uses one paginated GET /os-hypervisors/detail pinned to
+    HYPERVISOR_DETAIL_MICROVERSION, since newer microversions drop the
+    resource fields.
+    """
+    hypervisors: List[Dict[str, Any]] = []
+    url = '/os-hypervisors/detail'
+    while url:
+        response = conn.compute.get(url, microversion=HYPERVISOR_DETAIL_MICROVERSION)
+        if response.status_code != 200:
+            raise Exception(f"Compute API {url} returned HTTP {response.status_code}")
+        body = response.json()
+        hypervisors.extend(body.get('hypervisors', []))
+        url = next((link['href'] for link in body.get('hypervisors_links', []) if link.get('rel') == 'next'), None)
+    return hypervisors
+
+
+def build_hypervisor_table(conn, hypervisors: Optional[List[Dict[str, Any]]] = None,
+                           allocation_ratios: Optional[Dict[str, float]] = None) -> CapacityTable:
+    """
+    Build a CapacityTable from Nova hypervisor details (one listing).
+
+    Nova reports physical totals and usage but neither reserved amounts nor
+    allocation ratios, so the configured ratios (get_allocation_ratios) are
+    applied to every host.
+
+    Args:
+        conn: OpenStack connection
+        hypervisors: Already listed hypervisor dicts (optional)
+        allocation_ratios: Resource class -> ratio overriding the configured ones (optional)
+
+    Returns:
+        CapacityTable with one row per hypervisor
+    """
+    if hypervisors is None:
+        hypervisors = list_hypervisor_details(conn)
+    fields = {'VCPU': ('vcpus', 'vcpus_used'), 'MEMORY_MB': ('memory_mb', 'memory_mb_used'),
+              'DISK_GB': ('local_gb', 'local_gb_used')}
+
+    ratios = get_allocation_ratios(allocation_ratios)
+    providers = []
+    shape = (len(hypervisors), len(RESOURCE_CLASSES))
+    total = np.zeros(shape)
+    used = np.zeros(shape)
+    allocation_ratio = np.ones(shape)
+    for resource_class, ratio in ratios.items():
+        allocation_ratio[:, RESOURCE_CLASSES.index(resource_class)] = ratio
+    for row, hypervisor in enumerate(hypervisors):
+        providers.append({'name': hypervisor.get('hypervisor_hostname') or str(hypervisor.get('id')),
+                          'uuid': str(hypervisor.get('id')),
+                          'state': hypervisor.get('state'), 'status': hypervisor.get('status')})
+        for resource_class, (total_field, used_field) in fields.items():
+            col = RESOURCE_CLASSES.index(resource_class)
+            total[row, col] = hypervisor.get(total_field) or 0
+            used[row, col] = hypervisor.get(used_field) or 0
+
+    return CapacityTable(providers, total, np.zeros(shape), allocation_ratio, total.copy(), used)
+
+
+def get_host_groups(conn, table: CapacityTable) -> Tuple[List[List[str]], List[List[str]]]:
+    """Map each provider row to its Nova host aggregates and availability zone."""
+    aggregates_by_host: Dict[str, List[str]] = {}
+    zone_by_host: Dict[str, str] = {}
+    try:
+        for aggregate in conn.compute.aggregates():
+            zone = getattr(aggregate, 'availability_zone', None)
+            for host in getattr(aggregate, 'hosts', None) or []:
+                aggregates_by_host.setdefault(host, []).append(aggregate.name)
+                if zone:
+                    zone_by_host[host] = zone
+    except Exception as e:
+        logger.warning(f"Could not list host aggregates: {e}")
+
+    aggregates, zones = [], []
+    for name in table.names:
+        # Compute node providers are named after the hypervisor hostname (often the FQDN)
+        host = name if name in aggregates_by_host or name in zone_by_host else name.split('.')[0]
+        aggregates.append(aggregates_by_host.get(host, []))
+        zones.append([zone_by_host.get(host, 'nova')])
+    return aggregates, zones
+
+
+def _capacity_report(conn, table: CapacityTable, source: str, include_hosts: bool) -> Dict[str, Any]:
+    aggregates, zones = get_host_groups(conn, table)
+
+    result = {
+        'source': source,
+        'resource_providers': len(table),
+        'compute_hosts': int((table.total[:, table.column('VCPU')] > 0).sum()),
+        'totals': _summarize(table.capacity.sum(axis=0), table.used.sum(axis=0),
+                             table.physical.sum(axis=0), host_count=len(table)),
+        'by_availability_zone': table.group_totals(zones),
+        'by_aggregate': table.group_totals(aggregates),
+    }
+
+    if include_hosts:
+        capacity, used, physical, free = table.capacity, table.used, table.physical, table.free
+        hosts = []
+        for row, provider in enumerate(table.providers):
+            host = {
+                'name': provider['name'],
+                'uuid': provider['uuid'],
+                'availability_zone': zones[row][0],
+                'aggregates': aggregates[row],
+            }
+            host.update(_summarize(capacity[row], used[row], physical[row]))
+            for col, resource_class in enumerate(RESOURCE_CLASSES):
+                if resource_class in host:
+                    host[resource_class]['allocation_ratio'] = float(table.allocation_ratio[row, col])
+                    host[resource_class]['largest_allocatable'] = int(min(free[row, col], table.max_unit[row, col]))
+            hosts.append(host)
+        result['hosts'] = hosts
+
+    return result
+
+
+def get_placement_capacity(conn, include_hosts: bool = True) -> Dict[str, Any]:
+    """
+    Get real cluster capacity from Placement, per host, aggregate and availability zone.
+
+    Costs 2N+1 Placement requests for N changed providers (see module docstring);
+    use get_hypervisor_capacity() where a few calls must suffice.
+
+    Args:
+        conn: OpenStack connection
+        include_hosts: Include the per-host breakdown
+
+    Returns:
+        Dict with cluster totals, per-AZ and per-aggregate summaries and (optionally) hosts
+    """
+    return _capacity_report(conn, build_capacity_table(conn), 'placement', include_hosts)
+
+
+def get_hypervisor_capacity(conn, include_hosts: bool = False) -> Dict[str, Any]:
+    """
+    Get cluster capacity and usage from Nova in two calls (hypervisor detail
+    listing and aggregate listing), per host, aggregate and availability zone.
+    Capacity applies the configured allocation ratios; physical totals are
+    reported alongside.
+
+    Args:
+        conn: OpenStack connection
+        include_hosts: Include the per-host breakdown
+
+    Returns:
+        Dict with cluster totals, per-AZ and per-aggregate summaries and (optionally) hosts
+    """
+    report = _capacity_report(conn, build_hypervisor_table(conn), 'nova_hypervisors', include_hosts)
+    report['allocation_ratios'] = get_allocation_ratios()
+    return report
+
+
+def get_hypervisor_statistics(conn) -> Dict[str, Any]:
+    """
+    Get cluster-wide physical vCPU, memory and disk totals and usage from Nova
+    in a single call (GET /os-hypervisors/statistics).
+
+    Returns:
+        Dict with vcpus, vcpus_used, memory_mb, memory_mb_used, local_gb, local_gb_used, ...
+    """
+    response = conn.compute.get('/os-hypervisors/statistics', microversion=HYPERVISOR_DETAIL_MICROVERSION)
+    if response.status_code != 200:
+        raise Exception(f"Compute API /os-hypervisors/statistics returned HTTP {response.status_code}")
+    return response.json().get('hypervisor_statistics', {})
+
+
+def get_project_placement_usage(conn, project_id: str) -> Dict[str, int]:
+    """
+    Get a project's total resource usage from Placement in a single call.
+
+    Returns:
+        Dict of resource class -> amount used by the project
+    """
+    return _placement_get(conn, '/usages', params={'project_id': project_id}).get('usages', {})
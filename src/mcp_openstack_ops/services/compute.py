@@ -6,11 +6,32 @@ server events, and other compute-related components.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
+
+from openstack import exceptions
+
+from ..concurrency import run_in_parallel
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Flavor vCPU/RAM/disk never change after creation, so the cache can live long
+DEFAULT_FLAVOR_CACHE_TTL = 3600.0
+# Minimum time between listings triggered by unknown flavors (e.g. deleted ones)
+FLAVOR_MISS_REFRESH_INTERVAL = 60.0
+
+_flavor_cache_lock = threading.Lock()
+# project ID -> (listed at, flavor ID/name -> resources)
+_flavor_cache: Dict[str, Tuple[float, Dict[str, Dict[str, int]]]] = {}
+
+DEFAULT_SERVER_EVENT_WORKERS = 8
+
 
 def get_instance_details(
     instance_names: Optional[List[str]] = None,
@@ -824,13 +845,224 @@ def get_flavor_list() -> List[Dict[str, Any]]:
         ]
 
 
-def get_server_events(instance_name: str, limit: int = 50) -> Dict[str, Any]:
+def _get_flavor_cache_ttl() -> float:
+    try:
+        return max(0.0, float(os.environ.get("MCP_FLAVOR_CACHE_TTL", DEFAULT_FLAVOR_CACHE_TTL)))
+    except ValueError:
+        return DEFAULT_FLAVOR_CACHE_TTL
+
+
+def _list_flavor_resources(conn) -> Dict[str, Dict[str, int]]:
+    """List all flavors once and index their resources by ID and by name."""
+    resources = {}
+    for flavor in conn.compute.flavors(details=True):
+        entry = {
+            'vcpus': getattr(flavor, 'vcpus', 0) or 0,
+            'ram': getattr(flavor, 'ram', 0) or 0,
+            'disk': getattr(flavor, 'disk', 0) or 0,
+        }
+        resources[flavor.id] = entry
+        if getattr(flavor, 'name', None):
+            resources.setdefault(flavor.name, entry)
+    return resources
+
+
+def get_flavor_resources(conn, server_flavor) -> Optional[Dict[str, int]]:
+    """
+    Get vCPUs, RAM (MB) and disk (GB) of the flavor a server was booted with.
+
+    Servers listed with compute microversion 2.47+ embed the flavor's resources,
+    which are used directly. Older microversions only carry the flavor ID; it is
+    resolved through a per-project flavor cache filled by one flavor listing
+    (TTL MCP_FLAVOR_CACHE_TTL) instead of one flavor GET per server.
+
+    Args:
+        conn: OpenStack connection
+        server_flavor: The server's ``flavor`` attribute (dict or object)
+
+    Returns:
+        Dict with vcpus, ram and disk, or None if the flavor is unknown
+    """
+    if not server_flavor:
+        return None
+    if isinstance(server_flavor, dict):
+        embedded = server_flavor
+    else:
+        embedded = {name: getattr(server_flavor, name, None)
+                    for name in ('id', 'original_name', 'name', 'vcpus', 'ram', 'disk')}
+    # Every real flavor has vcpus >= 1; the SDK reports 0 when nothing was embedded
+    if embedded.get('vcpus'):
+        return {
+            'vcpus': embedded.get('vcpus') or 0,
+            'ram': embedded.get('ram') or 0,
+            'disk': embedded.get('disk') or 0,
+        }
+
+    keys = [key for key in (embedded.get('id'), embedded.get('original_name'), embedded.get('name')) if key]
+    if not keys:
+        return None
+
+    project_id = conn.current_project_id or ''
+    now = time.monotonic()
+    with _flavor_cache_lock:
+        listed_at, resources = _flavor_cache.get(project_id, (0.0, {}))
+    age = now - listed_at
+    stale = age > _get_flavor_cache_ttl()
+    missing = not any(key in resources for key in keys)
+    if stale or (missing and age > FLAVOR_MISS_REFRESH_INTERVAL):
+        resources = _list_flavor_resources(conn)
+        with _flavor_cache_lock:
+            _flavor_cache[project_id] = (now, resources)
+
+    for key in keys:
+        if key in resources:
+            return resources[key]
+    return None
+
+
+def invalidate_flavor_cache() -> None:
+    """Drop cached flavor resources (after flavors were created or deleted)."""
+    with _flavor_cache_lock:
+        _flavor_cache.clear()
+
+
+def find_server(conn, name_or_id: str):
+    """
+    Find a server of the current project by ID or exact name without listing all servers.
+
+    IDs are fetched directly (GET /servers/{id}); names use Nova's name filter
+    anchored to an exact match, so either way one request is made.
+
+    Args:
+        conn: OpenStack connection
+        name_or_id: Server name or ID
+
+    Returns:
+        SDK server resource, or None if not found / not owned by the current project
+    """
+    from ..connection import validate_resource_ownership
+
+    name_or_id = (name_or_id or '').strip()
+    if not name_or_id:
+        return None
+    try:
+        uuid.UUID(name_or_id)
+        looks_like_id = True
+    except ValueError:
+        looks_like_id = False
+
+    if looks_like_id:
+        try:
+            server = conn.compute.get_server(name_or_id)
+        except exceptions.NotFoundException:
+            server = None
+        if server is not None:
+            return server if validate_resource_ownership(server, "Instance") else None
+
+    # Nova matches the name filter as a regular expression
+    matches = list(conn.compute.servers(details=True, name=f'^{re.escape(name_or_id)}$'))
+    if len(matches) > 1:
+        logger.warning(f"{len(matches)} servers are named \"{name_or_id}\", using {matches[0].id}")
+    return matches[0] if matches else None
+
+
+def _get_server_event_workers() -> int:
+    try:
+        return max(1, int(os.environ.get("MCP_SERVER_EVENT_WORKERS", DEFAULT_SERVER_EVENT_WORKERS)))
+    except ValueError:
+        return DEFAULT_SERVER_EVENT_WORKERS
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp from Nova (naive values are UTC)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _format_action(action, server_id: str) -> Dict[str, Any]:
+    return {
+        'action': getattr(action, 'action', 'unknown'),
+        'instance_uuid': getattr(action, 'instance_uuid', None) or server_id,
+        'request_id': getattr(action, 'request_id', 'unknown'),
+        'user_id': getattr(action, 'user_id', 'unknown'),
+        'project_id': getattr(action, 'project_id', 'unknown'),
+        'start_time': str(getattr(action, 'start_time', 'unknown')),
+        'finish_time': str(getattr(action, 'finish_time', None)) if getattr(action, 'finish_time', None) else None,
+        'message': getattr(action, 'message', ''),
+        'details': getattr(action, 'details', {}),
+        'events': [],
+    }
+
+
+def _format_action_events(action) -> List[Dict[str, Any]]:
+    events = []
+    for event in getattr(action, 'events', None) or []:
+        if isinstance(event, dict):
+            get = event.get
+        else:
+            get = lambda name, default=None, _event=event: getattr(_event, name, default)
+        events.append({
+            'event': get('event', 'unknown'),
+            'start_time': str(get('start_time', 'unknown')),
+            'finish_time': str(get('finish_time')) if get('finish_time') else None,
+            'result': get('result', 'unknown'),
+            'traceback': get('traceback'),
+            'host': get('host'),
+        })
+    return events
+
+
+def _list_recent_actions(conn, server, limit: int, since: Optional[datetime]) -> List[Dict[str, Any]]:
+    """Newest actions of a server (Nova lists newest first), stopping at limit or at since."""
+    actions = []
+    for action in conn.compute.server_actions(server.id):
+        started = _parse_time(getattr(action, 'start_time', None))
+        if since is not None and started is not None and started < since:
+            break
+        actions.append(_format_action(action, server.id))
+        if len(actions) >= limit:
+            break
+    return actions
+
+
+def _expand_action_events(conn, server_actions: List[Tuple[Any, Dict[str, Any]]]) -> int:
+    """
+    Fetch the events of many actions concurrently (the action list omits them).
+
+    Returns:
+        Number of actions whose events could not be loaded
+    """
+    def fetch(item):
+        server, action = item
+        return _format_action_events(conn.compute.get_server_action(action['request_id'], server))
+
+    failed = 0
+    for (server, action), events, error in run_in_parallel(fetch, server_actions,
+                                                           max_workers=_get_server_event_workers()):
+        if error is not None:
+            failed += 1
+            logger.debug(f"Could not load events of action {action['request_id']} of server {server.id}: {error}")
+        else:
+            action['events'] = events
+    return failed
+
+
+def get_server_events(instance_name: str = "", limit: int = 50, instance_names: Optional[List[str]] = None,
+                      since: str = "", include_events: bool = True) -> Dict[str, Any]:
     """
-    Get server action/event history.
+    Get server action/event history of one server, or a merged timeline of several servers.
     
     Args:
-        instance_name: Name or ID of the server
-        limit: Maximum number of events to return
+        instance_name: Name or ID of the server (single-server mode)
+        limit: Maximum number of actions to return per server
+        instance_names: Names or IDs of several servers (multi-server mode, merged timeline)
+        since: Only actions started at or after this ISO 8601 time (optional)
+        include_events: Fetch the events of each action (concurrently, MCP_SERVER_EVENT_WORKERS)
         
     Returns:
         Dictionary containing server events
@@ -839,14 +1071,21 @@ def get_server_events(instance_name: str, limit: int = 50) -> Dict[str, Any]:
         # Import here to avoid circular imports
         from ..connection import get_openstack_connection
         conn = get_openstack_connection()
-        
-        # Find the server
-        server = None
-        for srv in conn.compute.servers():
-            if getattr(srv, 'name', '') == instance_name or srv.id == instance_name:
-                server = srv
-                break
-        
+
+        since_time = None
+        if since:
+            since_time = _parse_time(since)
+            if since_time is None:
+                return {
+                    'success': False,
+                    'message': f'Invalid since time "{since}", expected ISO 8601 (e.g. 2024-05-01T12:00:00Z)',
+                    'events': []
+                }
+
+        if instance_names:
+            return _get_multi_server_events(conn, instance_names, limit, since_time, include_events)
+
+        server = find_server(conn, instance_name)
         if not server:
             return {
                 'success': False,
@@ -855,45 +1094,11 @@ def get_server_events(instance_name: str, limit: int = 50) -> Dict[str, Any]:
             }
         
         events = []
+        failed_event_lookups = 0
         try:
-            # Get server actions (events)
-            for action in conn.compute.server_actions(server.id):
-                event_data = {
-                    'action': getattr(action, 'action', 'unknown'),
-                    'instance_uuid': getattr(action, 'instance_uuid', server.id),
-                    'request_id': getattr(action, 'request_id', 'unknown'),
-                    'user_id': getattr(action, 'user_id', 'unknown'),
-                    'project_id': getattr(action, 'project_id', 'unknown'),
-                    'start_time': str(getattr(action, 'start_time', 'unknown')),
-                    'finish_time': str(getattr(action, 'finish_time', None)) if getattr(action, 'finish_time', None) else None,
-                    'message': getattr(action, 'message', ''),
-                    'details': getattr(action, 'details', {})
-                }
-                
-                # Add events for this action if available
-                if hasattr(action, 'events'):
-                    events_list = getattr(action, 'events', None)
-                    if events_list:  # Check if events is not None and not empty
-                        action_events = []
-                        for event in events_list:
-                            action_events.append({
-                                'event': getattr(event, 'event', 'unknown'),
-                                'start_time': str(getattr(event, 'start_time', 'unknown')),
-                                'finish_time': str(getattr(event, 'finish_time', None)) if getattr(event, 'finish_time', None) else None,
-                                'result': getattr(event, 'result', 'unknown'),
-                                'traceback': getattr(event, 'traceback', None)
-                            })
-                        event_data['events'] = action_events
-                    else:
-                        event_data['events'] = []  # Empty events list if None
-                else:
-                    event_data['events'] = []  # No events attribute
-                
-                events.append(event_data)
-                
-                if len(events) >= limit:
-                    break
-                    
+            events = _list_recent_actions(conn, server, limit, since_time)
+            if include_events:
+                failed_event_lookups = _expand_action_events(conn, [(server, action) for action in events])
         except Exception as e:
             logger.warning(f"Could not get server actions: {e}")
             # Fallback to basic server info
@@ -907,13 +1112,16 @@ def get_server_events(instance_name: str, limit: int = 50) -> Dict[str, Any]:
                 'updated': str(getattr(server, 'updated_at', 'unknown'))
             })
         
-        return {
+        result = {
             'success': True,
             'server_name': getattr(server, 'name', 'unnamed'),
             'server_id': server.id,
             'events': events,
             'count': len(events)
         }
+        if failed_event_lookups:
+            result['event_lookup_errors'] = failed_event_lookups
+        return result
         
     except Exception as e:
         logger.error(f"Failed to get server events: {e}")
@@ -925,6 +1133,54 @@ def get_server_events(instance_name: str, limit: int = 50) -> Dict[str, Any]:
         }
 
 
+def _get_multi_server_events(conn, instance_names: List[str], limit: int, since: Optional[datetime],
+                             include_events: bool) -> Dict[str, Any]:
+    """Recent actions of several servers, fetched in parallel and merged newest first."""
+    workers = _get_server_event_workers()
+    names = list(dict.fromkeys(name.strip() for name in instance_names if name and name.strip()))
+
+    servers = []
+    not_found = []
+    for name, server, error in run_in_parallel(lambda name: find_server(conn, name), names, max_workers=workers):
+        if server is None:
+            not_found.append(name)
+            if error is not None:
+                logger.warning(f"Could not look up server {name}: {error}")
+        else:
+            servers.append(server)
+
+    timeline = []
+    errors = []
+    pending_events = []
+    for server, actions, error in run_in_parallel(lambda server: _list_recent_actions(conn, server, limit, since),
+                                                  servers, max_workers=workers):
+        if error is not None:
+            errors.append({'server': getattr(server, 'name', server.id), 'error': str(error)})
+            continue
+        for action in actions:
+            action['server_name'] = getattr(server, 'name', 'unnamed')
+            action['server_id'] = server.id
+            timeline.append(action)
+            pending_events.append((server, action))
+
+    failed_event_lookups = _expand_action_events(conn, pending_events) if include_events else 0
+    timeline.sort(key=lambda action: action['start_time'], reverse=True)
+
+    result = {
+        'success': bool(servers),
+        'servers': len(servers),
+        'servers_not_found': not_found,
+        'events': timeline,
+        'count': len(timeline),
+        'errors': errors,
+    }
+    if failed_event_lookups:
+        result['event_lookup_errors'] = failed_event_lookups
+    if not servers:
+        result['message'] = f'None of the servers were found: {", ".join(not_found)}'
+    return result
+
+
 def get_server_groups() -> List[Dict[str, Any]]:
     """
     Get list of server groups.
@@ -1781,6 +2037,7 @@ def set_flavor(flavor_name: str, action: str, **kwargs) -> Dict[str, Any]:
                     create_params['description'] = description
                 
                 flavor = conn.compute.create_flavor(**create_params)
+                invalidate_flavor_cache()
                 
                 # Set extra specs if provided
                 extra_specs = kwargs.get('extra_specs', {})
@@ -1826,6 +2083,7 @@ def set_flavor(flavor_name: str, action: str, **kwargs) -> Dict[str, Any]:
 
             try:
                 conn.compute.delete_flavor(flavor)
+                invalidate_flavor_cache()
                 return {
                     'success': True,
                     'message': f'Flavor "{flavor_name}" deleted'
@@ -4,11 +4,19 @@ OpenStack Core Connection and Cluster Management Functions
 This module contains core functions for OpenStack connection management and cluster-wide operations.
 """
 
+import contextvars
 import os
 import logging
-from typing import Dict, List, Any, Optional
+import statistics
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from ..connection import get_openstack_connection, reset_connection_cache
+from keystoneauth1.exceptions import ConnectTimeout
+from ..concurrency import run_in_parallel
+from ..connection import get_active_project_name, get_openstack_connection, reset_connection_cache
+from .compute import get_flavor_resources
+from .identity_catalog import list_identity_resources
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -397,7 +405,7 @@ def get_service_status(service_name: str = "") -> Dict[str, Any]:
                         
                         # Count listeners and pools for each LB (with timeout protection)
                         try:
-                            listeners = list(conn.load_balancer.listeners(loadbalancer_id=lb.id))
+                            listeners = list(conn.load_balancer.listeners(load_balancer_id=lb.id))
                             total_listeners += len(listeners)
                             
                             for listener in listeners[:5]:  # Limit listeners per LB
@@ -509,32 +517,14 @@ def get_service_status(service_name: str = "") -> Dict[str, Any]:
                     # Always calculate from instances and their flavors for accurate usage
                     for instance in instances:
                         try:
-                            # Get flavor information from instance
-                            flavor_id = None
-                            if hasattr(instance, 'flavor') and isinstance(instance.flavor, dict):
-                                flavor_id = instance.flavor.get('id')
-                            elif hasattr(instance, 'flavor') and hasattr(instance.flavor, 'id'):
-                                flavor_id = instance.flavor.id
-                            
-                            flavor = None
-                            if flavor_id:
-                                try:
-                                    # Try to get flavor by ID first
-                                    flavor = conn.compute.get_flavor(flavor_id)
-                                except Exception:
-                                    # If ID fails, try to find flavor by name
-                                    try:
-                                        flavors = list(conn.compute.flavors())
-                                        for f in flavors:
-                                            if getattr(f, 'name', '') == flavor_id or getattr(f, 'id', '') == flavor_id:
-                                                flavor = f
-                                                break
-                                    except Exception as e2:
-                                        logger.warning(f"Could not find flavor {flavor_id} by name either: {e2}")
+                            # Embedded flavor data, or the cached flavor listing on old microversions
+                            server_flavor = getattr(instance, 'flavor', None)
+                            flavor_id = server_flavor.get('id') if isinstance(server_flavor, dict) else getattr(server_flavor, 'id', None)
+                            flavor = get_flavor_resources(conn, server_flavor)
                             
                             if flavor:
-                                vcpus = getattr(flavor, 'vcpus', 0)
-                                ram_mb = getattr(flavor, 'ram', 0)
+                                vcpus = flavor['vcpus']
+                                ram_mb = flavor['ram']
                                 instance_vcpus += vcpus if vcpus else 0
                                 instance_ram_mb += ram_mb if ram_mb else 0
                                 logger.info(f"Instance {getattr(instance, 'id', 'unknown')} using flavor {flavor_id}: {vcpus} vCPUs, {ram_mb} MB RAM")
@@ -638,32 +628,14 @@ def get_service_status(service_name: str = "") -> Dict[str, Any]:
             # Always calculate from instances and their flavors for accurate usage
             for instance in instances:
                 try:
-                    # Get flavor information from instance
-                    flavor_id = None
-                    if hasattr(instance, 'flavor') and isinstance(instance.flavor, dict):
-                        flavor_id = instance.flavor.get('id')
-                    elif hasattr(instance, 'flavor') and hasattr(instance.flavor, 'id'):
-                        flavor_id = instance.flavor.id
-                    
-                    flavor = None
-                    if flavor_id:
-                        try:
-                            # Try to get flavor by ID first
-                            flavor = conn.compute.get_flavor(flavor_id)
-                        except Exception:
-                            # If ID fails, try to find flavor by name
-                            try:
-                                flavors = list(conn.compute.flavors())
-                                for f in flavors:
-                                    if getattr(f, 'name', '') == flavor_id or getattr(f, 'id', '') == flavor_id:
-                                        flavor = f
-                                        break
-                            except Exception as e2:
-                                logger.warning(f"Could not find flavor {flavor_id} by name either: {e2}")
+                    # Embedded flavor data, or the cached flavor listing on old microversions
+                    server_flavor = getattr(instance, 'flavor', None)
+                    flavor_id = server_flavor.get('id') if isinstance(server_flavor, dict) else getattr(server_flavor, 'id', None)
+                    flavor = get_flavor_resources(conn, server_flavor)
                     
                     if flavor:
-                        vcpus = getattr(flavor, 'vcpus', 0)
-                        ram_mb = getattr(flavor, 'ram', 0)
+                        vcpus = flavor['vcpus']
+                        ram_mb = flavor['ram']
                         current_vcpus_used += vcpus if vcpus else 0
                         current_ram_used += ram_mb if ram_mb else 0
                         logger.info(f"Instance {getattr(instance, 'id', 'unknown')} using flavor {flavor_id}: {vcpus} vCPUs, {ram_mb} MB RAM")
@@ -948,13 +920,151 @@ def get_service_status(service_name: str = "") -> Dict[str, Any]:
         }
 
 
-def get_service_status(service_name: str = "") -> Dict[str, Any]:
+# API probes per service: (connection proxy attribute, path, query parameters)
+SERVICE_PROBES = {
+    'compute': ('compute', '/servers', {'limit': 1}),
+    'network': ('network', '/networks', {'limit': 1}),
+    'volume': ('volume', '/volumes', {'limit': 1}),
+    'image': ('image', '/images', {'limit': 1}),
+    'identity': ('identity', '/auth/projects', None),
+    'orchestration': ('orchestration', '/stacks', {'limit': 1}),
+}
+
+DEFAULT_PROBE_SAMPLES = 3
+DEFAULT_SERVICE_STATUS_TTL = 30.0
+
+_status_cache_lock = threading.Lock()
+_status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_status_refreshing: set = set()
+
+
+def _get_probe_samples() -> int:
+    try:
+        return max(1, int(os.environ.get("MCP_SERVICE_PROBE_SAMPLES", DEFAULT_PROBE_SAMPLES)))
+    except ValueError:
+        return DEFAULT_PROBE_SAMPLES
+
+
+def _get_service_status_ttl() -> float:
+    try:
+        return max(0.0, float(os.environ.get("MCP_SERVICE_STATUS_TTL", DEFAULT_SERVICE_STATUS_TTL)))
+    except ValueError:
+        return DEFAULT_SERVICE_STATUS_TTL
+
+
+def _probe_service(conn, service: str) -> Dict[str, Any]:
+    """
+    Probe one service API through the shared pooled session and measure latency.
+
+    Returns:
+        Service status with endpoint, API version and p50/min/max latency over the samples
+    """
+    proxy_attr, path, params = SERVICE_PROBES[service]
+    proxy = getattr(conn, proxy_attr)
+    service_status = {
+        'available': False,
+        'endpoint': 'unknown',
+        'version': 'unknown',
+        'last_check': datetime.now().isoformat()
+    }
+
+    try:
+        service_status['endpoint'] = proxy.get_endpoint()
+        api_version = proxy.get_endpoint_data().api_version
+        if api_version:
+            service_status['version'] = 'v' + '.'.join(str(part) for part in api_version)
+    except Exception as e:
+        logger.debug(f"Could not resolve {service} endpoint data: {e}")
+
+    try:
+        latencies = []
+        for _ in range(_get_probe_samples()):
+            started = time.monotonic()
+            response = proxy.get(path, params=params)
+            latencies.append((time.monotonic() - started) * 1000)
+            # 403 still proves the API answers; any other error status means the probe path is not served
+            if response.status_code >= 400 and response.status_code != 403:
+                raise Exception(f"{service} API returned HTTP {response.status_code}")
+
+        service_status['available'] = True
+        service_status['http_status'] = response.status_code
+        service_status['latency_ms'] = {
+            'p50': round(statistics.median(latencies), 1),
+            'min': round(min(latencies), 1),
+            'max': round(max(latencies), 1),
+            'samples': len(latencies)
+        }
+    except Exception as e:
+        logger.warning(f"{service} service probe failed: {e}")
+        service_status['error'] = str(e)
+
+    return service_status
+
+
+def _probe_all_services(conn) -> Dict[str, Any]:
+    """Probe all service APIs concurrently."""
+    all_services = {}
+    for service, result, error in run_in_parallel(lambda name: _probe_service(conn, name),
+                                                  SERVICE_PROBES, max_workers=len(SERVICE_PROBES)):
+        all_services[service] = result if error is None else {
+            'available': False,
+            'error': str(error),
+            'last_check': datetime.now().isoformat()
+        }
+    return all_services
+
+
+def _get_all_service_status(conn, allow_stale: bool) -> Dict[str, Any]:
+    """
+    Get probe results for all services, optionally from the stale-OK cache.
+
+    With allow_stale, a cached result is returned immediately and, once older than
+    MCP_SERVICE_STATUS_TTL, refreshed on a background thread (one refresh at a time
+    per project). Without it, services are probed now and the cache is updated.
+    """
+    cache_key = get_active_project_name()
+
+    if allow_stale:
+        with _status_cache_lock:
+            cached = _status_cache.get(cache_key)
+            age = time.time() - cached[0] if cached else None
+            refresh = cached is not None and age > _get_service_status_ttl() and cache_key not in _status_refreshing
+            if refresh:
+                _status_refreshing.add(cache_key)
+
+        if cached is not None:
+            if refresh:
+                ctx = contextvars.copy_context()
+                threading.Thread(target=ctx.run, args=(_refresh_service_status, conn, cache_key),
+                                 name="mcp-service-status", daemon=True).start()
+            return {
+                service: {**status, 'cached': True, 'cache_age_seconds': round(age, 1)}
+                for service, status in cached[1].items()
+            }
+
+    return _refresh_service_status(conn, cache_key)
+
+
+def _refresh_service_status(conn, cache_key: str) -> Dict[str, Any]:
+    try:
+        all_services = _probe_all_services(conn)
+        with _status_cache_lock:
+            _status_cache[cache_key] = (time.time(), all_services)
+        return all_services
+    finally:
+        with _status_cache_lock:
+            _status_refreshing.discard(cache_key)
+
+
+def get_service_status(service_name: str = "", allow_stale: bool = False) -> Dict[str, Any]:
     """
     Get detailed status for specific OpenStack services.
     
     Args:
         service_name: Name of service to check (compute, network, volume, image, identity, orchestration)
                      If empty, returns status for all services
+        allow_stale: For all services, return the last cached result immediately
+                     (refreshed in the background once older than MCP_SERVICE_STATUS_TTL)
     
     Returns:
         Dict containing service status information
@@ -963,90 +1073,7 @@ def get_service_status(service_name: str = "") -> Dict[str, Any]:
         conn = get_openstack_connection()
         
         if not service_name:
-            # Return status for all services instead of using get_cluster_status
-            services = ['compute', 'network', 'volume', 'image', 'identity', 'orchestration']
-            all_services = {}
-            
-            for service in services:
-                try:
-                    service_status = {
-                        'available': True,
-                        'endpoint': 'unknown',
-                        'version': 'unknown',
-                        'last_check': datetime.now().isoformat()
-                    }
-                    
-                    if service == 'compute':
-                        # Test compute service
-                        list(conn.compute.servers(limit=1))
-                        service_status['endpoint'] = conn.compute.get_endpoint()
-                        
-                    elif service == 'network':
-                        # Test network service
-                        list(conn.network.networks(limit=1))
-                        service_status['endpoint'] = conn.network.get_endpoint()
-                        
-                    elif service == 'volume':
-                        # Test volume service
-                        list(conn.volume.volumes(limit=1))
-                        service_status['endpoint'] = conn.volume.get_endpoint()
-                        
-                    elif service == 'image':
-                        # Test image service
-                        list(conn.image.images(limit=1))
-                        service_status['endpoint'] = conn.image.get_endpoint()
-                        
-                    elif service == 'identity':
-                        # Test identity service
-                        conn.identity.get_token()
-                        try:
-                            service_status['endpoint'] = conn.session.get_endpoint(service_type='identity', interface='public')
-                        except Exception:
-                            service_status['endpoint'] = f"http://{os.environ.get('OS_AUTH_HOST', 'localhost')}:{os.environ.get('OS_AUTH_PORT', '5000')}"
-                        
-                    elif service == 'orchestration':
-                        # Test orchestration service (Heat) with manual API call
-                        try:
-                            import requests
-                            
-                            # Get project ID and token
-                            project_id = conn.current_project_id
-                            token = conn.identity.get_token()
-                            
-                            # Construct Heat API URL
-                            auth_host = os.environ.get('OS_AUTH_HOST', 'localhost')
-                            heat_port = os.environ.get('OS_HEAT_STACK_PORT', '8004')
-                            heat_url = f"http://{auth_host}:{heat_port}/v1/{project_id}/stacks"
-                            
-                            headers = {
-                                'X-Auth-Token': token,
-                                'Content-Type': 'application/json'
-                            }
-                            
-                            # Make a test call to Heat API (get stacks)
-                            response = requests.get(heat_url, headers=headers, timeout=10)
-                            
-                            if response.status_code in [200, 404]:  # 404 is OK - means no stacks
-                                service_status['endpoint'] = f"http://{auth_host}:{heat_port}"
-                                service_status['version'] = 'v1'
-                            else:
-                                raise Exception(f"Heat API returned status {response.status_code}")
-                                
-                        except Exception as heat_e:
-                            logger.warning(f"Heat service test failed: {heat_e}")
-                            service_status['available'] = False
-                            service_status['error'] = str(heat_e)
-                    
-                    all_services[service] = service_status
-                    
-                except Exception as e:
-                    all_services[service] = {
-                        'available': False,
-                        'error': str(e),
-                        'last_check': datetime.now().isoformat()
-                    }
-            
-            return all_services
+            return _get_all_service_status(conn, allow_stale)
         
         service_name = service_name.lower()
         supported_services = ['compute', 'network', 'volume', 'image', 'identity', 'orchestration']
@@ -1130,9 +1157,9 @@ def get_service_status(service_name: str = "") -> Dict[str, Any]:
                     service_status['endpoint'] = conn.session.get_endpoint(service_type='identity', interface='public')
                 except Exception:
                     service_status['endpoint'] = f"http://{os.environ.get('OS_AUTH_HOST', 'localhost')}:{os.environ.get('OS_AUTH_PORT', '5000')}"
-                projects = list(conn.identity.projects())
-                users = list(conn.identity.users())
-                roles = list(conn.identity.roles())
+                projects = list_identity_resources(conn, 'projects')
+                users = list_identity_resources(conn, 'users')
+                roles = list_identity_resources(conn, 'roles')
                 
                 service_status['available'] = True
                 service_status['details'] = {
@@ -1143,38 +1170,20 @@ def get_service_status(service_name: str = "") -> Dict[str, Any]:
                 }
                 
             elif service_name == 'orchestration':
-                # Detailed orchestration service check with direct API call
+                # Detailed orchestration service check through the shared SDK session
                 try:
-                    import requests
-                    import os
-                    
-                    # Get project ID and token
-                    project_id = conn.current_project_id
-                    token = conn.identity.get_token()
-                    
-                    # Construct Heat API URL
-                    auth_host = os.environ.get('OS_AUTH_HOST', 'localhost')
-                    heat_port = os.environ.get('OS_HEAT_STACK_PORT', '8004')
-                    heat_url = f"http://{auth_host}:{heat_port}/v1/{project_id}/stacks"
-                    
-                    headers = {'X-Auth-Token': token}
-                    
-                    # Test Heat API with timeout
-                    response = requests.get(heat_url, headers=headers, timeout=10)
+                    service_status['endpoint'] = conn.orchestration.get_endpoint()
+                    response = conn.orchestration.get('/stacks')
                     
                     if response.status_code == 200:
-                        data = response.json()
-                        stacks = data.get('stacks', [])
+                        stacks = response.json().get('stacks', [])
                         
                         # Also check Heat engine services status
                         heat_services = []
                         try:
-                            services_url = f"http://{auth_host}:{heat_port}/v1/{project_id}/services"
-                            services_response = requests.get(services_url, headers=headers, timeout=5)
-                            
+                            services_response = conn.orchestration.get('/services')
                             if services_response.status_code == 200:
-                                services_data = services_response.json()
-                                heat_services = services_data.get('services', [])
+                                heat_services = services_response.json().get('services', [])
                         except Exception as services_error:
                             logger.warning(f"Could not fetch Heat services details: {services_error}")
                         
@@ -1182,8 +1191,8 @@ def get_service_status(service_name: str = "") -> Dict[str, Any]:
                         up_services = [s for s in heat_services if s.get('status') == 'up']
                         down_services = [s for s in heat_services if s.get('status') == 'down']
                         
-                        service_status['endpoint'] = f"http://{auth_host}:{heat_port}/v1"
                         service_status['available'] = True
+                        service_status['version'] = 'v1'
                         service_status['details'] = {
                             'stacks': len(stacks),
                             'create_complete': len([s for s in stacks if s.get('stack_status') == 'CREATE_COMPLETE']),
@@ -1204,11 +1213,10 @@ def get_service_status(service_name: str = "") -> Dict[str, Any]:
                     else:
                         raise Exception(f"Heat API returned {response.status_code}: {response.text[:100]}")
                         
-                except requests.exceptions.Timeout:
+                except ConnectTimeout:
                     logger.warning("Heat detailed check timeout")
                     service_status['available'] = False
-                    service_status['endpoint'] = 'timeout'
-                    service_status['error'] = 'Detailed API call timeout (10s)'
+                    service_status['error'] = 'Detailed API call timeout'
                     service_status['details'] = {
                         'stacks': 0,
                         'note': 'API call timed out'
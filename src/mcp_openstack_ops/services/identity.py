@@ -7,6 +7,13 @@ This module contains functions for managing projects, users, roles, domains, and
 import logging
 from typing import Dict, List, Any, Optional
 from ..connection import get_openstack_connection
+from ..deadline import deadline_exceeded
+from .identity_catalog import (
+    find_identity_resource,
+    find_project,
+    invalidate_identity_cache,
+    list_identity_resources,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -54,7 +61,7 @@ def set_domains(action: str, domain_name: Optional[str] = None, **kwargs) -> Dic
         if action.lower() == 'list':
             domains = []
             try:
-                for domain in conn.identity.domains():
+                for domain in list_identity_resources(conn, 'domains'):
                     domains.append({
                         'id': domain.id,
                         'name': domain.name,
@@ -91,6 +98,7 @@ def set_domains(action: str, domain_name: Optional[str] = None, **kwargs) -> Dic
                     description=description,
                     enabled=enabled
                 )
+                invalidate_identity_cache('domains')
                 return {
                     'success': True,
                     'message': f'Domain "{domain_name}" created successfully',
@@ -200,9 +208,10 @@ def get_user_list() -> List[Dict[str, Any]]:
                 if user_id:
                     current_project_users.add(user_id)
         
-        # Get user details only for users in current project
-        for user in conn.identity.users():
-            if user.id in current_project_users:
+        # Get user details only for users in current project (from the catalog cache)
+        for user_id in sorted(current_project_users):
+            user = find_identity_resource(conn, 'users', user_id)
+            if user is not None:
                 users.append({
                     'id': user.id,
                     'name': user.name,
@@ -551,7 +560,9 @@ def _get_single_project_details(conn, project) -> Dict[str, Any]:
             'updated_at': str(getattr(project, 'updated_at', 'N/A')),
             'users': users,
             'user_count': len(users),
-            'resources': resources
+            'resources': resources,
+            # Sections skipped once the tool's time budget ran out are left at 0
+            'partial': deadline_exceeded()
         }
         
     except Exception as e:
@@ -583,7 +594,7 @@ def set_project(project_name: str, action: str, **kwargs) -> Dict[str, Any]:
         if action.lower() == 'list':
             projects = []
             try:
-                for project in conn.identity.projects():
+                for project in list_identity_resources(conn, 'projects'):
                     projects.append({
                         'id': project.id,
                         'name': project.name,
@@ -617,6 +628,7 @@ def set_project(project_name: str, action: str, **kwargs) -> Dict[str, Any]:
                     domain_id=domain_id,
                     is_enabled=enabled
                 )
+                invalidate_identity_cache('projects')
                 return {
                     'success': True,
                     'message': f'Project "{project_name}" created successfully',
@@ -635,11 +647,7 @@ def set_project(project_name: str, action: str, **kwargs) -> Dict[str, Any]:
                 
         elif action.lower() == 'delete':
             # Find the project
-            project = None
-            for proj in conn.identity.projects():
-                if proj.name == project_name or proj.id == project_name:
-                    project = proj
-                    break
+            project = find_project(conn, project_name)
                     
             if not project:
                 return {
@@ -649,6 +657,7 @@ def set_project(project_name: str, action: str, **kwargs) -> Dict[str, Any]:
                 
             try:
                 conn.identity.delete_project(project)
+                invalidate_identity_cache('projects')
                 return {
                     'success': True,
                     'message': f'Project "{project_name}" deleted successfully'
@@ -661,11 +670,7 @@ def set_project(project_name: str, action: str, **kwargs) -> Dict[str, Any]:
                 
         elif action.lower() == 'update':
             # Find the project
-            project = None
-            for proj in conn.identity.projects():
-                if proj.name == project_name or proj.id == project_name:
-                    project = proj
-                    break
+            project = find_project(conn, project_name)
                     
             if not project:
                 return {
@@ -681,6 +686,7 @@ def set_project(project_name: str, action: str, **kwargs) -> Dict[str, Any]:
                 
             try:
                 updated_project = conn.identity.update_project(project, **update_params)
+                invalidate_identity_cache('projects')
                 return {
                     'success': True,
                     'message': f'Project "{project_name}" updated successfully',
@@ -699,11 +705,7 @@ def set_project(project_name: str, action: str, **kwargs) -> Dict[str, Any]:
                 
         elif action.lower() == 'show':
             # Find the project
-            project = None
-            for proj in conn.identity.projects():
-                if proj.name == project_name or proj.id == project_name:
-                    project = proj
-                    break
+            project = find_project(conn, project_name)
                     
             if not project:
                 return {
@@ -0,0 +1,175 @@
+"""
+Keystone Catalog Cache
+
+Projects, domains, users and roles change rarely but are looked up by name in
+almost every identity-related tool (quota, project and user management). This
+module keeps one listing of each kind per identity endpoint and user, indexed
+by ID and by name, so lookups are O(1) dictionary hits instead of a full
+``GET /v3/projects`` (or users, ...) per call.
+
+- Listings are refreshed after MCP_IDENTITY_CACHE_TTL seconds
+- A name or ID that is not in the cache triggers one refresh (at most every
+  MISS_REFRESH_INTERVAL seconds), so resources created outside this server
+  become visible without waiting for the TTL
+- Create, update and delete actions of this server invalidate the kind they
+  changed
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+IDENTITY_KINDS = ('projects', 'domains', 'users', 'roles')
+
+DEFAULT_IDENTITY_CACHE_TTL = 300.0
+# Minimum time between refreshes caused by names or IDs missing from the cache
+MISS_REFRESH_INTERVAL = 10.0
+
+
+class _Catalog:
+    """One listing of an identity resource kind, indexed by ID and name."""
+
+    def __init__(self, resources: List[Any]):
+        self.listed_at = time.monotonic()
+        self.resources = resources
+        self.by_id: Dict[str, Any] = {}
+        self.by_name: Dict[str, List[Any]] = {}
+        for resource in resources:
+            self.by_id[resource.id] = resource
+            name = getattr(resource, 'name', None)
+            if name:
+                self.by_name.setdefault(name, []).append(resource)
+
+    def find(self, name_or_id: str, domain_id: Optional[str] = None) -> Optional[Any]:
+        resource = self.by_id.get(name_or_id)
+        if resource is not None:
+            return resource
+        for resource in self.by_name.get(name_or_id, []):
+            if domain_id is None or getattr(resource, 'domain_id', None) == domain_id:
+                return resource
+        return None
+
+
+_cache_lock = threading.Lock()
+# (identity endpoint, user ID, kind) -> catalog
+_catalogs: Dict[Tuple[str, str, str], _Catalog] = {}
+_stats = {'hits': 0, 'misses': 0, 'refreshes': 0}
+
+
+def _get_identity_cache_ttl() -> float:
+    try:
+        return max(0.0, float(os.environ.get("MCP_IDENTITY_CACHE_TTL", DEFAULT_IDENTITY_CACHE_TTL)))
+    except ValueError:
+        return DEFAULT_IDENTITY_CACHE_TTL
+
+
+def _cache_key(conn, kind: str) -> Tuple[str, str, str]:
+    # Listings depend on who asks (admin vs. domain admin), so key by user as well
+    try:
+        endpoint = conn.identity.get_endpoint()
+    except Exception:
+        endpoint = 'identity'
+    return endpoint, conn.current_user_id or '', kind
+
+
+def _refresh(conn, kind: str, key: Tuple[str, str, str]) -> _Catalog:
+    catalog = _Catalog(list(getattr(conn.identity, kind)()))
+    with _cache_lock:
+        _catalogs[key] = catalog
+        _stats['refreshes'] += 1
+    logger.debug(f"Identity catalog refreshed: {len(catalog.resources)} {kind}")
+    return catalog
+
+
+def _get_catalog(conn, kind: str) -> Tuple[_Catalog, Tuple[str, str, str], bool]:
+    """
+    Get the cached catalog of a kind, listing it if absent or expired.
+
+    Returns:
+        Tuple of (catalog, cache key, whether it was listed now)
+    """
+    if kind not in IDENTITY_KINDS:
+        raise ValueError(f"Unknown identity resource kind '{kind}'. Supported: {', '.join(IDENTITY_KINDS)}")
+    key = _cache_key(conn, kind)
+    with _cache_lock:
+        catalog = _catalogs.get(key)
+    if catalog is None or time.monotonic() - catalog.listed_at > _get_identity_cache_ttl():
+        return _refresh(conn, kind, key), key, True
+    return catalog, key, False
+
+
+def _count(listed: bool) -> None:
+    # A hit is a lookup answered without a listing call, whatever its outcome
+    with _cache_lock:
+        _stats['misses' if listed else 'hits'] += 1
+
+
+def find_identity_resource(conn, kind: str, name_or_id: str, domain_id: Optional[str] = None) -> Optional[Any]:
+    """
+    Find a project, domain, user or role by name or ID through the catalog cache.
+
+    Args:
+        conn: OpenStack connection
+        kind: One of IDENTITY_KINDS
+        name_or_id: Name or ID to resolve (IDs take precedence)
+        domain_id: Only match names in this domain (optional)
+
+    Returns:
+        SDK resource, or None if it does not exist after a refresh
+    """
+    if not name_or_id:
+        return None
+    catalog, key, listed = _get_catalog(conn, kind)
+    resource = catalog.find(name_or_id, domain_id)
+    if resource is None and not listed and time.monotonic() - catalog.listed_at > MISS_REFRESH_INTERVAL:
+        # Possibly created since the listing: refresh once before reporting "not found"
+        resource = _refresh(conn, kind, key).find(name_or_id, domain_id)
+        listed = True
+    _count(listed)
+    return resource
+
+
+def find_project(conn, name_or_id: str, domain_id: Optional[str] = None) -> Optional[Any]:
+    """Find a project by name or ID (see find_identity_resource)."""
+    return find_identity_resource(conn, 'projects', name_or_id, domain_id)
+
+
+def list_identity_resources(conn, kind: str) -> List[Any]:
+    """
+    List all resources of one kind from the catalog cache (at most
+    MCP_IDENTITY_CACHE_TTL seconds old).
+    """
+    catalog, _, listed = _get_catalog(conn, kind)
+    _count(listed)
+    return list(catalog.resources)
+
+
+def invalidate_identity_cache(kind: Optional[str] = None) -> None:
+    """Drop cached listings of one kind (after create/update/delete) or of all kinds."""
+    with _cache_lock:
+        for key in [key for key in _catalogs if kind is None or key[2] == kind]:
+            del _catalogs[key]
+
+
+def get_identity_cache_stats() -> Dict[str, Any]:
+    """
+    Get catalog cache counters.
+
+    Returns:
+        Dict with TTL, cached resources per kind, lookups answered from the
+        cache (hits) or needing a listing call (misses), and refreshes
+    """
+    with _cache_lock:
+        cached: Dict[str, int] = {}
+        for (_endpoint, _user, kind), catalog in _catalogs.items():
+            cached[kind] = cached.get(kind, 0) + len(catalog.resources)
+        return {
+            'ttl_seconds': _get_identity_cache_ttl(),
+            'cached': cached,
+            **_stats,
+        }
@@ -9,6 +9,7 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from ...connection import get_openstack_connection
+from ...deadline import DeadlineExceeded
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -54,7 +55,7 @@ def get_load_balancer_list(limit: int = 50, offset: int = 0, include_all: bool =
         for lb in load_balancers:
             try:
                 # Get listeners for this load balancer
-                listeners = list(conn.load_balancer.listeners(loadbalancer_id=lb.id))
+                listeners = list(conn.load_balancer.listeners(load_balancer_id=lb.id))
                 listener_summary = []
                 
                 for listener in listeners:
@@ -63,7 +64,7 @@ def get_load_balancer_list(limit: int = 50, offset: int = 0, include_all: bool =
                         'name': listener.name,
                         'protocol': listener.protocol,
                         'protocol_port': listener.protocol_port,
-                        'admin_state_up': listener.admin_state_up
+                        'admin_state_up': listener.is_admin_state_up
                     }
                     listener_summary.append(listener_info)
                 
@@ -77,7 +78,7 @@ def get_load_balancer_list(limit: int = 50, offset: int = 0, include_all: bool =
                     'vip_network_id': lb.vip_network_id,
                     'provisioning_status': lb.provisioning_status,
                     'operating_status': lb.operating_status,
-                    'admin_state_up': lb.admin_state_up,
+                    'admin_state_up': lb.is_admin_state_up,
                     'project_id': lb.project_id,
                     'provider': getattr(lb, 'provider', 'Unknown'),
                     'created_at': str(lb.created_at) if hasattr(lb, 'created_at') else 'N/A',
@@ -166,7 +167,7 @@ def get_load_balancer_details(lb_name_or_id: str) -> Dict[str, Any]:
             'vip_network_id': lb.vip_network_id,
             'provisioning_status': lb.provisioning_status,
             'operating_status': lb.operating_status,
-            'admin_state_up': lb.admin_state_up,
+            'admin_state_up': lb.is_admin_state_up,
             'project_id': lb.project_id,
             'provider': getattr(lb, 'provider', 'Unknown'),
             'created_at': str(lb.created_at) if hasattr(lb, 'created_at') else 'N/A',
@@ -174,41 +175,47 @@ def get_load_balancer_details(lb_name_or_id: str) -> Dict[str, Any]:
         }
         
         # Get listeners
-        listeners = list(conn.load_balancer.listeners(loadbalancer_id=lb.id))
+        listeners = list(conn.load_balancer.listeners(load_balancer_id=lb.id))
         listener_details = []
         
         for listener in listeners:
-            # Get pools for this listener
-            pools = list(conn.load_balancer.pools(listener_id=listener.id))
-            pool_summary = []
+            try:
+                # Get pools for this listener
+                pools = list(conn.load_balancer.pools(listener_id=listener.id))
+                pool_summary = []
             
-            for pool in pools:
-                # Get members for this pool
-                members = list(conn.load_balancer.members(pool_id=pool.id))
-                member_summary = [{'id': m.id, 'address': m.address, 'protocol_port': m.protocol_port} for m in members]
+                for pool in pools:
+                    # Get members for this pool
+                    members = list(conn.load_balancer.members(pool.id))
+                    member_summary = [{'id': m.id, 'address': m.address, 'protocol_port': m.protocol_port} for m in members]
                 
-                pool_info = {
-                    'id': pool.id,
-                    'name': pool.name,
-                    'protocol': pool.protocol,
-                    'lb_algorithm': pool.lb_algorithm,
-                    'admin_state_up': pool.admin_state_up,
-                    'members': member_summary,
-                    'member_count': len(member_summary)
-                }
-                pool_summary.append(pool_info)
+                    pool_info = {
+                        'id': pool.id,
+                        'name': pool.name,
+                        'protocol': pool.protocol,
+                        'lb_algorithm': pool.lb_algorithm,
+                        'admin_state_up': pool.is_admin_state_up,
+                        'members': member_summary,
+                        'member_count': len(member_summary)
+                    }
+                    pool_summary.append(pool_info)
             
-            listener_info = {
-                'id': listener.id,
-                'name': listener.name,
-                'protocol': listener.protocol,
-                'protocol_port': listener.protocol_port,
-                'admin_state_up': listener.admin_state_up,
-                'pools': pool_summary,
-                'pool_count': len(pool_summary)
-            }
-            listener_details.append(listener_info)
-        
+                listener_info = {
+                    'id': listener.id,
+                    'name': listener.name,
+                    'protocol': listener.protocol,
+                    'protocol_port': listener.protocol_port,
+                    'admin_state_up': listener.is_admin_state_up,
+                    'pools': pool_summary,
+                    'pool_count': len(pool_summary)
+                }
+                listener_details.append(listener_info)
+            except DeadlineExceeded as e:
+                # Out of time budget: return the listeners collected so far
+                logger.warning(f"Load balancer details for {lb_name_or_id} truncated: {e}")
+                lb_details['partial'] = True
+                break
+
         lb_details['listeners'] = listener_details
         lb_details['listener_count'] = len(listener_details)
         
@@ -335,7 +342,7 @@ def set_load_balancer(action: str, **kwargs) -> Dict[str, Any]:
                     'id': updated_lb.id,
                     'name': updated_lb.name,
                     'description': updated_lb.description,
-                    'admin_state_up': updated_lb.admin_state_up
+                    'admin_state_up': updated_lb.is_admin_state_up
                 }
             }
         
@@ -457,7 +464,7 @@ def set_load_balancer(action: str, **kwargs) -> Dict[str, Any]:
                         'name': lb.name,
                         'provisioning_status': lb.provisioning_status,
                         'operating_status': lb.operating_status,
-                        'admin_state_up': lb.admin_state_up,
+                        'admin_state_up': lb.is_admin_state_up,
                         'vip_address': lb.vip_address
                     }
                 }
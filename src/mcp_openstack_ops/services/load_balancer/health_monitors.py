@@ -55,7 +55,7 @@ def get_load_balancer_health_monitors(pool_name_or_id: str = "") -> Dict[str, An
                 'timeout': monitor.timeout,
                 'max_retries': monitor.max_retries,
                 'max_retries_down': getattr(monitor, 'max_retries_down', None),
-                'admin_state_up': monitor.admin_state_up,
+                'admin_state_up': monitor.is_admin_state_up,
                 'provisioning_status': monitor.provisioning_status,
                 'operating_status': monitor.operating_status,
                 'pool_id': getattr(monitor, 'pool_id', None),
@@ -228,7 +228,7 @@ def set_load_balancer_health_monitor(action: str, monitor_name_or_id: str = "",
                     'timeout': monitor.timeout,
                     'max_retries': monitor.max_retries,
                     'max_retries_down': getattr(monitor, 'max_retries_down', None),
-                    'admin_state_up': monitor.admin_state_up,
+                    'admin_state_up': monitor.is_admin_state_up,
                     'provisioning_status': monitor.provisioning_status,
                     'operating_status': monitor.operating_status,
                     'pool_id': getattr(monitor, 'pool_id', None),
@@ -295,7 +295,7 @@ def set_load_balancer_health_monitor(action: str, monitor_name_or_id: str = "",
                     'delay': updated_monitor.delay,
                     'timeout': updated_monitor.timeout,
                     'max_retries': updated_monitor.max_retries,
-                    'admin_state_up': updated_monitor.admin_state_up,
+                    'admin_state_up': updated_monitor.is_admin_state_up,
                     'provisioning_status': updated_monitor.provisioning_status,
                     'operating_status': updated_monitor.operating_status
                 }
@@ -34,7 +34,7 @@ def get_load_balancer_listeners(lb_name_or_id: str) -> Dict[str, Any]:
             }
         
         # Get listeners
-        listeners = list(conn.load_balancer.listeners(loadbalancer_id=lb.id))
+        listeners = list(conn.load_balancer.listeners(load_balancer_id=lb.id))
         listener_details = []
         
         for listener in listeners:
@@ -44,8 +44,8 @@ def get_load_balancer_listeners(lb_name_or_id: str) -> Dict[str, Any]:
                 'description': listener.description,
                 'protocol': listener.protocol,
                 'protocol_port': listener.protocol_port,
-                'admin_state_up': listener.admin_state_up,
-                'loadbalancer_id': listener.loadbalancer_id,
+                'admin_state_up': listener.is_admin_state_up,
+                'loadbalancer_id': lb.id,
                 'default_pool_id': getattr(listener, 'default_pool_id', None),
                 'created_at': str(listener.created_at) if hasattr(listener, 'created_at') else 'N/A',
                 'updated_at': str(listener.updated_at) if hasattr(listener, 'updated_at') else 'N/A'
@@ -131,7 +131,7 @@ def set_load_balancer_listener(action: str, **kwargs) -> Dict[str, Any]:
                     'name': listener.name,
                     'protocol': listener.protocol,
                     'protocol_port': listener.protocol_port,
-                    'admin_state_up': listener.admin_state_up
+                    'admin_state_up': listener.is_admin_state_up
                 }
             }
         
@@ -190,7 +190,7 @@ def set_load_balancer_listener(action: str, **kwargs) -> Dict[str, Any]:
                     'id': updated_listener.id,
                     'name': updated_listener.name,
                     'description': updated_listener.description,
-                    'admin_state_up': updated_listener.admin_state_up
+                    'admin_state_up': updated_listener.is_admin_state_up
                 }
             }
         
@@ -287,8 +287,8 @@ def set_load_balancer_listener(action: str, **kwargs) -> Dict[str, Any]:
                     'description': listener.description,
                     'protocol': listener.protocol,
                     'protocol_port': listener.protocol_port,
-                    'admin_state_up': listener.admin_state_up,
-                    'loadbalancer_id': listener.loadbalancer_id,
+                    'admin_state_up': listener.is_admin_state_up,
+                    'loadbalancer_id': next((ref.get('id') for ref in listener.load_balancers or []), None),
                     'default_pool_id': getattr(listener, 'default_pool_id', None)
                 }
             }
@@ -7,7 +7,12 @@ getting usage statistics, quotas, and availability information.
 
 import logging
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
+from ..concurrency import run_in_parallel
+from .capacity import get_hypervisor_capacity, get_project_placement_usage
+from .compute import get_flavor_resources
+from .identity_catalog import find_project, list_identity_resources
+from .usage_history import get_usage_history
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -70,68 +75,76 @@ def get_resource_monitoring() -> Dict[str, Any]:
                     total_used_ram_mb += ram_mb
                     total_used_disk_gb += total_instance_disk
             
-            # Try to get hypervisor totals (physical capacity)
+            # Capacity from Nova hypervisor details (one listing plus the aggregate
+            # listing) with the configured allocation ratios; the per-provider
+            # Placement walk is too costly here
+            capacity_source = 'nova_hypervisors'
             total_physical_vcpus = 0
             total_physical_ram_mb = 0
             total_physical_disk_gb = 0
             hypervisor_count = 0
+            capacity = None
+            schedulable = {}
             
             try:
-                hypervisors = list(conn.compute.hypervisors())
-                hypervisor_count = len(hypervisors)
+                capacity = get_hypervisor_capacity(conn)
+                totals = capacity['totals']
+                hypervisor_count = capacity['compute_hosts']
+                total_physical_vcpus = totals.get('VCPU', {}).get('physical', 0)
+                total_physical_ram_mb = totals.get('MEMORY_MB', {}).get('physical', 0)
+                total_physical_disk_gb = totals.get('DISK_GB', {}).get('physical', 0)
+                schedulable = {
+                    'schedulable_vcpus': totals.get('VCPU', {}).get('capacity', 0),
+                    'schedulable_memory_mb': totals.get('MEMORY_MB', {}).get('capacity', 0),
+                    'schedulable_disk_gb': totals.get('DISK_GB', {}).get('capacity', 0)
+                }
                 
-                # Since hypervisor detailed stats are not available in this environment,
-                # try to get quota limits as a reasonable approximation of capacity
+                # Project usage as recorded by Placement allocations (one call)
+                try:
+                    project_usage = get_project_placement_usage(conn, current_project_id)
+                    total_used_vcpus = project_usage.get('VCPU', 0) + project_usage.get('PCPU', 0)
+                    total_used_ram_mb = project_usage.get('MEMORY_MB', 0)
+                    total_used_disk_gb = project_usage.get('DISK_GB', 0)
+                except Exception as placement_error:
+                    logger.info(f"Placement usage unavailable, using instance flavors: {placement_error}")
+            except Exception as capacity_error:
+                # Hypervisor details are admin-only by default; fall back to quota-based estimates
+                logger.info(f"Hypervisor capacity unavailable, using quota estimates: {capacity_error}")
+                capacity_source = 'quota_estimate'
+                capacity = None
                 try:
                     quota = conn.compute.get_quota_set(current_project_id)
-                    # Use quota limits as approximate capacity indicators
-                    if hasattr(quota, 'cores') and quota.cores and quota.cores > 0:
+                    if getattr(quota, 'cores', 0) and quota.cores > 0:
                         total_physical_vcpus = quota.cores
-                    if hasattr(quota, 'ram') and quota.ram and quota.ram > 0:
+                    if getattr(quota, 'ram', 0) and quota.ram > 0:
                         total_physical_ram_mb = quota.ram
-                        
                 except Exception as quota_error:
                     logger.info(f"Could not get quota for capacity estimation: {quota_error}")
-                
-                # Alternative: Try to get aggregate/availability zone stats
-                try:
-                    # Some deployments provide compute service stats
-                    services = list(conn.compute.services(binary='nova-compute'))
-                    if services and hypervisor_count > 0:
-                        # Rough estimation: assume each compute service represents similar capacity
-                        # This is just a fallback when hypervisor stats aren't available
-                        if total_physical_vcpus == 0:
-                            # Very rough estimate: if we can't get real data, 
-                            # assume some reasonable default per hypervisor
-                            estimated_vcpus_per_hypervisor = max(total_used_vcpus * 2, 8)  # At least double usage or 8
-                            total_physical_vcpus = estimated_vcpus_per_hypervisor * hypervisor_count
-                            
-                        if total_physical_ram_mb == 0:
-                            estimated_ram_per_hypervisor = max(total_used_ram_mb * 2, 16384)  # At least double usage or 16GB
-                            total_physical_ram_mb = estimated_ram_per_hypervisor * hypervisor_count
-                            
-                except Exception:
-                    pass
-                    
-            except Exception:
-                # If hypervisor access fails, we'll still show instance usage
-                pass
             
             compute_stats = {
                 'total_servers': len(servers),
                 'running_servers': running_servers,
                 'total_hypervisors': hypervisor_count,
-                # Physical capacity (from hypervisors)
+                'capacity_source': capacity_source,
+                # Physical capacity (Nova hypervisor totals)
                 'total_vcpus': total_physical_vcpus,
                 'total_memory_mb': total_physical_ram_mb,
                 'total_disk_gb': total_physical_disk_gb,
-                # Usage (from instances)
+                # Usage (Placement allocations, or instance flavors as fallback)
                 'used_vcpus': total_used_vcpus,
                 'used_memory_mb': total_used_ram_mb,
-                'used_disk_gb': total_used_disk_gb,  # Calculated from instance flavors
+                'used_disk_gb': total_used_disk_gb,
                 'project_server_count': len(servers)
             }
             
+            if capacity is not None:
+                # Capacity with overcommit applied (physical alongside), cluster-wide and per AZ / aggregate
+                compute_stats['allocation_ratios'] = capacity['allocation_ratios']
+                compute_stats.update(schedulable)
+                compute_stats['cluster_capacity'] = capacity['totals']
+                compute_stats['capacity_by_availability_zone'] = capacity['by_availability_zone']
+                compute_stats['capacity_by_aggregate'] = capacity['by_aggregate']
+            
             monitoring_data['compute'] = compute_stats
         except Exception as e:
             monitoring_data['compute'] = {'error': str(e)}
@@ -204,8 +217,8 @@ def get_resource_monitoring() -> Dict[str, Any]:
         
         # Identity monitoring
         try:
-            projects = list(conn.identity.projects())
-            users = list(conn.identity.users())
+            projects = list_identity_resources(conn, 'projects')
+            users = list_identity_resources(conn, 'users')
             
             identity_stats = {
                 'total_projects': len(projects),
@@ -288,132 +301,103 @@ def get_compute_quota_usage(conn) -> Dict[str, Any]:
         }
 
 
-def get_usage_statistics(start_date: str = "", end_date: str = "") -> Dict[str, Any]:
+def _network_usage(conn) -> Dict[str, Any]:
+    """Current network resource counts (networks, subnets, ports, floating IPs)."""
+    networks = list(conn.network.networks())
+    subnets = list(conn.network.subnets())
+    ports = list(conn.network.ports())
+    floating_ips = list(conn.network.ips())
+    
+    network_stats = {
+        'total_networks': len(networks),
+        'total_subnets': len(subnets),
+        'total_ports': len(ports),
+        'ports_by_status': {},
+        'floating_ips': {
+            'total': len(floating_ips),
+            'allocated': len([f for f in floating_ips if f.fixed_ip_address]),
+            'available': len([f for f in floating_ips if not f.fixed_ip_address])
+        }
+    }
+    
+    for port in ports:
+        status = port.status
+        network_stats['ports_by_status'][status] = network_stats['ports_by_status'].get(status, 0) + 1
+    
+    return network_stats
+
+
+def _storage_usage(conn) -> Dict[str, Any]:
+    """Current volume and snapshot counts and sizes."""
+    volumes = list(conn.volume.volumes())
+    snapshots = list(conn.volume.snapshots())
+    
+    storage_stats = {
+        'volumes': {
+            'total_count': len(volumes),
+            'total_size_gb': sum(getattr(v, 'size', 0) or 0 for v in volumes),
+            'volumes_by_status': {},
+            'volumes_by_type': {}
+        },
+        'snapshots': {
+            'total_count': len(snapshots),
+            'total_size_gb': sum(getattr(s, 'size', 0) or 0 for s in snapshots),
+            'snapshots_by_status': {}
+        }
+    }
+    
+    for volume in volumes:
+        status = volume.status
+        volume_type = getattr(volume, 'volume_type', 'unknown')
+        storage_stats['volumes']['volumes_by_status'][status] = storage_stats['volumes']['volumes_by_status'].get(status, 0) + 1
+        storage_stats['volumes']['volumes_by_type'][volume_type] = storage_stats['volumes']['volumes_by_type'].get(volume_type, 0) + 1
+    
+    for snapshot in snapshots:
+        status = snapshot.status
+        storage_stats['snapshots']['snapshots_by_status'][status] = storage_stats['snapshots']['snapshots_by_status'].get(status, 0) + 1
+    
+    return storage_stats
+
+
+def get_usage_statistics(start_date: str = "", end_date: str = "", all_projects: bool = False) -> Dict[str, Any]:
     """
-    Get usage statistics for the current project.
+    Get compute usage statistics over a period (os-simple-tenant-usage).
+    
+    Current network and storage counts are collected alongside the compute
+    usage history; a failure in either is reported in its section only.
     
     Args:
         start_date: Start date for statistics (YYYY-MM-DD format)
-        end_date: End date for statistics (YYYY-MM-DD format)
+        end_date: End date for statistics, inclusive (YYYY-MM-DD format)
+        all_projects: Report usage of all projects (requires an admin role) instead of the current project
     
     Returns:
-        Dict containing usage statistics
+        Dict containing server hours, vCPU-hours, RAM MB-hours and disk GB-hours per flavor and instance,
+        plus current network and storage counts
     """
     try:
         # Import here to avoid circular imports
         from ..connection import get_openstack_connection
         conn = get_openstack_connection()
         
-        # Set default dates if not provided
-        if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        if not start_date:
-            start_datetime = datetime.now() - timedelta(days=30)
-            start_date = start_datetime.strftime('%Y-%m-%d')
-        
-        usage_stats = {
-            'period': {
-                'start_date': start_date,
-                'end_date': end_date
-            },
-            'compute': {},
-            'network': {},
-            'storage': {}
+        sections = {
+            'usage_statistics': lambda: get_usage_history(conn, start_date, end_date, all_projects=all_projects),
+            'network': lambda: _network_usage(conn),
+            'storage': lambda: _storage_usage(conn)
         }
+        results = {name: (result, error) for name, result, error in
+                   run_in_parallel(lambda name: sections[name](), list(sections), max_workers=len(sections))}
         
-        # Compute usage
-        try:
-            servers = list(conn.compute.servers())
-            flavors = {f.id: f for f in conn.compute.flavors()}
-            
-            server_stats = {
-                'total_servers': len(servers),
-                'servers_by_status': {},
-                'servers_by_flavor': {},
-                'total_vcpus': 0,
-                'total_memory_mb': 0
-            }
-            
-            for server in servers:
-                status = server.status
-                server_stats['servers_by_status'][status] = server_stats['servers_by_status'].get(status, 0) + 1
-                
-                flavor_id = getattr(server, 'flavor', {}).get('id')
-                if flavor_id and flavor_id in flavors:
-                    flavor_name = flavors[flavor_id].name
-                    server_stats['servers_by_flavor'][flavor_name] = server_stats['servers_by_flavor'].get(flavor_name, 0) + 1
-                    server_stats['total_vcpus'] += getattr(flavors[flavor_id], 'vcpus', 0)
-                    server_stats['total_memory_mb'] += getattr(flavors[flavor_id], 'ram', 0)
-            
-            usage_stats['compute'] = server_stats
-            
-        except Exception as e:
-            usage_stats['compute'] = {'error': str(e)}
-            logger.warning(f"Failed to get compute usage: {e}")
-        
-        # Network usage
-        try:
-            networks = list(conn.network.networks())
-            subnets = list(conn.network.subnets())
-            ports = list(conn.network.ports())
-            floating_ips = list(conn.network.ips())
-            
-            network_stats = {
-                'total_networks': len(networks),
-                'total_subnets': len(subnets),
-                'total_ports': len(ports),
-                'ports_by_status': {},
-                'floating_ips': {
-                    'total': len(floating_ips),
-                    'allocated': len([f for f in floating_ips if f.fixed_ip_address]),
-                    'available': len([f for f in floating_ips if not f.fixed_ip_address])
-                }
-            }
-            
-            for port in ports:
-                status = port.status
-                network_stats['ports_by_status'][status] = network_stats['ports_by_status'].get(status, 0) + 1
-            
-            usage_stats['network'] = network_stats
-            
-        except Exception as e:
-            usage_stats['network'] = {'error': str(e)}
-            logger.warning(f"Failed to get network usage: {e}")
+        usage_stats, error = results['usage_statistics']
+        if error is not None:
+            raise error
         
-        # Storage usage
-        try:
-            volumes = list(conn.volume.volumes())
-            snapshots = list(conn.volume.snapshots())
-            
-            storage_stats = {
-                'volumes': {
-                    'total_count': len(volumes),
-                    'total_size_gb': sum(getattr(v, 'size', 0) for v in volumes),
-                    'volumes_by_status': {},
-                    'volumes_by_type': {}
-                },
-                'snapshots': {
-                    'total_count': len(snapshots),
-                    'total_size_gb': sum(getattr(s, 'size', 0) for s in snapshots),
-                    'snapshots_by_status': {}
-                }
-            }
-            
-            for volume in volumes:
-                status = volume.status
-                volume_type = getattr(volume, 'volume_type', 'unknown')
-                storage_stats['volumes']['volumes_by_status'][status] = storage_stats['volumes']['volumes_by_status'].get(status, 0) + 1
-                storage_stats['volumes']['volumes_by_type'][volume_type] = storage_stats['volumes']['volumes_by_type'].get(volume_type, 0) + 1
-            
-            for snapshot in snapshots:
-                status = snapshot.status
-                storage_stats['snapshots']['snapshots_by_status'][status] = storage_stats['snapshots']['snapshots_by_status'].get(status, 0) + 1
-            
-            usage_stats['storage'] = storage_stats
-            
-        except Exception as e:
-            usage_stats['storage'] = {'error': str(e)}
-            logger.warning(f"Failed to get storage usage: {e}")
+        for name in ('network', 'storage'):
+            result, error = results[name]
+            if error is not None:
+                logger.warning(f"Failed to get {name} usage: {error}")
+                result = {'error': str(error)}
+            usage_stats[name] = result
         
         return {
             'success': True,
@@ -446,11 +430,7 @@ def get_quota(project_name: str = "") -> Dict[str, Any]:
         
         # Get project ID
         if project_name:
-            project = None
-            for proj in conn.identity.projects():
-                if proj.name == project_name:
-                    project = proj
-                    break
+            project = find_project(conn, project_name)
             
             if not project:
                 return {
@@ -498,11 +478,13 @@ def get_quota(project_name: str = "") -> Dict[str, Any]:
             total_cores = 0
             total_ram = 0
             
+            # Embedded flavor data (or one cached flavor listing) instead of a GET per instance
             for instance in instances:
                 try:
-                    flavor = conn.compute.get_flavor(instance.flavor['id'])
-                    total_cores += getattr(flavor, 'vcpus', 0)
-                    total_ram += getattr(flavor, 'ram', 0)
+                    flavor = get_flavor_resources(conn, getattr(instance, 'flavor', None))
+                    if flavor:
+                        total_cores += flavor['vcpus']
+                        total_ram += flavor['ram']
                 except Exception:
                     pass
             
@@ -539,13 +521,15 @@ def get_quota(project_name: str = "") -> Dict[str, Any]:
             floatingips = list(conn.network.ips(project_id=project_id))
             security_groups = list(conn.network.security_groups(project_id=project_id))
             
-            total_sg_rules = 0
-            for sg in security_groups:
-                try:
-                    rules = list(conn.network.security_group_rules(security_group_id=sg.id))
-                    total_sg_rules += len(rules)
-                except Exception:
-                    pass
+            # One project-wide rule listing grouped by group instead of a listing per group
+            rules_per_group: Dict[str, int] = {}
+            try:
+                for rule in conn.network.security_group_rules(project_id=project_id):
+                    group_id = getattr(rule, 'security_group_id', None)
+                    rules_per_group[group_id] = rules_per_group.get(group_id, 0) + 1
+            except Exception:
+                pass
+            total_sg_rules = sum(rules_per_group.get(sg.id, 0) for sg in security_groups)
             
             quota_data['network']['usage'] = {
                 'networks': len(networks),
@@ -837,11 +821,7 @@ def set_quota(project_name: str, service: str, **kwargs) -> Dict[str, Any]:
         conn = get_openstack_connection()
         
         # Find project
-        project = None
-        for proj in conn.identity.projects():
-            if proj.name == project_name or proj.id == project_name:
-                project = proj
-                break
+        project = find_project(conn, project_name)
         
         if not project:
             return {
@@ -0,0 +1,368 @@
+"""
+OpenStack Instance Placement Simulator
+
+This module answers capacity-planning questions such as "can we fit 40 more
+m1.xlarge in AZ nova?" by simulating placement of flavor x count requests on
+the free capacity of every hypervisor. Capacity comes from the last Placement
+capacity table built (its allocation ratios applied) when one is cached and
+younger than MCP_CAPACITY_TABLE_TTL, otherwise from a single Nova hypervisor
+detail listing with the configured or given allocation ratios applied; a fresh
+Placement walk (2N+1 requests) is only made when source='placement' is asked
+for explicitly.
+
+Identical instances of a request are placed with array operations rather than
+one by one, so simulations over 10k hypervisors take milliseconds:
+- first_fit: requests sorted by size (largest first), each filling hosts in
+  order (first-fit decreasing, packs hosts densely)
+- spread: instances placed round-robin on the hosts with most headroom
+- anti-affinity server groups: at most one instance per host, excluding hosts
+  already running group members; affinity groups: all on one host
+"""
+
+import json
+import logging
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..concurrency import run_in_parallel
+from .capacity import (
+    RESOURCE_CLASSES,
+    CapacityTable,
+    build_capacity_table,
+    build_hypervisor_table,
+    get_allocation_ratios,
+    get_cached_capacity_table,
+    get_host_groups,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ('first_fit', 'spread')
+CAPACITY_SOURCES = ('auto', 'hypervisors', 'placement')
+
+# Per-host placements reported in the result (busiest first)
+MAX_REPORTED_HOSTS = 50
+
+
+def _flavor_extra_specs(conn, flavor) -> Dict[str, str]:
+    """Fetch a flavor's extra specs (find_flavor does not reliably include them)."""
+    try:
+        return dict(getattr(conn.compute.fetch_flavor_extra_specs(flavor), 'extra_specs', None) or {})
+    except Exception as e:
+        logger.warning(f"Could not fetch extra specs of flavor {flavor.name}: {e}")
+        return {}
+
+
+def _flavor_demand(flavor, extra_specs: Dict[str, str]) -> np.ndarray:
+    """Resource vector of one instance of a flavor, in RESOURCE_CLASSES order."""
+    demand = np.zeros(len(RESOURCE_CLASSES))
+    vcpus = getattr(flavor, 'vcpus', 0) or 0
+    if extra_specs.get('hw:cpu_policy') == 'dedicated':
+        demand[RESOURCE_CLASSES.index('PCPU')] = vcpus
+    else:
+        demand[RESOURCE_CLASSES.index('VCPU')] = vcpus
+    demand[RESOURCE_CLASSES.index('MEMORY_MB')] = getattr(flavor, 'ram', 0) or 0
+    # Nova claims root + ephemeral disk and swap (MB, rounded up to GB) as DISK_GB
+    swap_mb = getattr(flavor, 'swap', 0) or 0
+    disk_gb = (getattr(flavor, 'disk', 0) or 0) + (getattr(flavor, 'ephemeral', 0) or 0) + math.ceil(swap_mb / 1024)
+    demand[RESOURCE_CLASSES.index('DISK_GB')] = disk_gb
+    return demand
+
+
+def _fit_counts(free: np.ndarray, max_unit: np.ndarray, demand: np.ndarray, eligible: np.ndarray) -> np.ndarray:
+    """Number of instances with the given demand that fit on each host."""
+    needed = demand > 0
+    if not needed.any():
+        return np.where(eligible, np.iinfo(np.int64).max // 2, 0)
+    per_class = np.floor(free[:, needed] / demand[needed])
+    fits = per_class.min(axis=1)
+    # A single allocation may not exceed the provider's max_unit
+    fits[(max_unit[:, needed] < demand[needed]).any(axis=1)] = 0
+    fits[~eligible] = 0
+    return fits.astype(np.int64)
+
+
+def _place_first_fit(fits: np.ndarray, count: int) -> np.ndarray:
+    """Fill hosts in order: host i takes min(fits[i], what is left after hosts 0..i-1)."""
+    before = np.cumsum(fits) - fits
+    return np.clip(count - before, 0, fits)
+
+
+def _place_spread(free: np.ndarray, capacity: np.ndarray, demand: np.ndarray, fits: np.ndarray,
+                  count: int, per_host_limit: Optional[int]) -> np.ndarray:
+    """Place one instance per round on the hosts with most relative headroom."""
+    placed = np.zeros(len(fits), dtype=np.int64)
+    needed = demand > 0
+    remaining = count
+    while remaining > 0:
+        room = fits - placed
+        if per_host_limit is not None:
+            room = np.minimum(room, per_host_limit - placed)
+        candidates = np.flatnonzero(room > 0)
+        if candidates.size == 0:
+            break
+        # Headroom: the scarcest resource's free fraction after placements so far
+        left = free[candidates][:, needed] - placed[candidates, None] * demand[needed]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            headroom = np.nan_to_num(left / capacity[candidates][:, needed]).min(axis=1)
+        take = candidates[np.argsort(-headroom, kind='stable')[:remaining]]
+        placed[take] += 1
+        remaining -= take.size
+    return placed
+
+
+def _resolve_server_group(conn, server_group: str) -> Tuple[Optional[str], List[str]]:
+    """
+    Get a server group's policy and the hypervisors its members run on.
+
+    Returns:
+        Tuple of (policy, hypervisor hostnames of existing members)
+    """
+    group = conn.compute.find_server_group(server_group, ignore_missing=False)
+    policy = getattr(group, 'policy', None) or next(iter(getattr(group, 'policies', None) or []), None)
+    members = list(getattr(group, 'members', None) or [])
+
+    hosts = []
+    for member, server, error in run_in_parallel(conn.compute.get_server, members):
+        if error is not None:
+            logger.warning(f"Could not resolve host of server group member {member}: {error}")
+            continue
+        host = getattr(server, 'hypervisor_hostname', None) or getattr(server, 'compute_host', None)
+        if host:
+            hosts.append(host)
+    return policy, hosts
+
+
+def _host_mask(table: CapacityTable, hosts: List[str]) -> np.ndarray:
+    """Boolean row mask of providers matching hypervisor or short host names."""
+    wanted = set(hosts) | {h.split('.')[0] for h in hosts}
+    return np.array([name in wanted or name.split('.')[0] in wanted for name in table.names], dtype=bool)
+
+
+def simulate_placement(table: CapacityTable, requests: List[Dict[str, Any]], strategy: str = 'first_fit',
+                       eligible: Optional[np.ndarray] = None, policy: Optional[str] = None,
+                       group_hosts: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """
+    Simulate placing flavor x count requests on the capacity table.
+
+    Args:
+        table: Capacity table (one row per resource provider)
+        requests: List of {'flavor': name, 'count': n, 'demand': np.ndarray}
+        strategy: 'first_fit' (first-fit decreasing) or 'spread'
+        eligible: Row mask of hosts that may be used (e.g. availability zone)
+        policy: Server group policy ('anti-affinity', 'soft-anti-affinity', 'affinity', ...)
+        group_hosts: Row mask of hosts already running group members
+
+    Returns:
+        Dict with per-request placed / unplaced counts and per-host placements
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy}'. Supported: {', '.join(STRATEGIES)}")
+
+    hosts = len(table)
+    eligible = np.ones(hosts, dtype=bool) if eligible is None else eligible.copy()
+    group_hosts = np.zeros(hosts, dtype=bool) if group_hosts is None else group_hosts
+    anti_affinity = policy in ('anti-affinity', 'soft-anti-affinity')
+    affinity = policy in ('affinity', 'soft-affinity')
+    if anti_affinity:
+        eligible &= ~group_hosts
+    if affinity and group_hosts.any():
+        eligible &= group_hosts
+
+    capacity = table.capacity
+    free = table.free.copy()
+    placements = np.zeros(hosts, dtype=np.int64)
+    used_by_group = group_hosts.copy()
+
+    # First-fit decreasing: largest flavors first (by their scarcest-resource share)
+    cluster_capacity = np.maximum(capacity.sum(axis=0), 1)
+    order = sorted(range(len(requests)), key=lambda i: -(requests[i]['demand'] / cluster_capacity).max())
+
+    results = [None] * len(requests)
+    for index in order:
+        request = requests[index]
+        demand, count = request['demand'], request['count']
+        candidates = eligible & ~used_by_group if anti_affinity else eligible
+        fits = _fit_counts(free, table.max_unit, demand, candidates)
+
+        if anti_affinity:
+            fits = np.minimum(fits, 1)
+        if affinity:
+            # Everything on one host: the first (or most spacious) host that takes the whole request
+            whole = np.flatnonzero(fits >= count)
+            placed = np.zeros(hosts, dtype=np.int64)
+            if whole.size:
+                host = whole[0] if strategy == 'first_fit' else whole[np.argmax(fits[whole])]
+                placed[host] = count
+                eligible &= np.arange(hosts) == host
+        elif strategy == 'first_fit':
+            placed = _place_first_fit(fits, count)
+        else:
+            placed = _place_spread(free, capacity, demand, fits, count, 1 if anti_affinity else None)
+
+        free -= placed[:, None] * demand[None, :]
+        placements += placed
+        if anti_affinity:
+            used_by_group |= placed > 0
+
+        total_placed = int(placed.sum())
+        results[index] = {
+            'flavor': request['flavor'],
+            'requested': count,
+            'placed': total_placed,
+            'unplaced': count - total_placed,
+            'fits': total_placed == count,
+            'hosts_used': int((placed > 0).sum())
+        }
+
+    busiest = np.flatnonzero(placements)
+    busiest = busiest[np.argsort(-placements[busiest], kind='stable')][:MAX_REPORTED_HOSTS]
+    return {
+        'strategy': strategy,
+        'server_group_policy': policy,
+        'eligible_hosts': int(eligible.sum()),
+        'all_fit': all(r['fits'] for r in results),
+        'requests': results,
+        'host_placements': [
+            {'host': table.names[i], 'instances': int(placements[i])} for i in busiest
+        ],
+        'remaining_free_after_placement': {
+            resource_class: int(free[eligible, col].sum())
+            for col, resource_class in enumerate(RESOURCE_CLASSES) if capacity[:, col].any()
+        }
+    }
+
+
+def parse_capacity_requests(spec: str) -> List[Tuple[str, int]]:
+    """
+    Parse "flavor:count,flavor:count" or a JSON list of {"flavor": ..., "count": ...}.
+
+    Returns:
+        List of (flavor name or ID, count)
+    """
+    spec = (spec or '').strip()
+    if not spec:
+        raise ValueError("At least one flavor request is required, e.g. 'm1.xlarge:40'")
+    if spec.startswith('['):
+        return [(str(item['flavor']), int(item.get('count', 1))) for item in json.loads(spec)]
+
+    parsed = []
+    for entry in spec.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, _, count = entry.rpartition(':') if ':' in entry else (entry, '', '1')
+        parsed.append((name.strip(), int(count)))
+    return parsed
+
+
+def _load_capacity_table(conn, source: str, allocation_ratios: Dict[str, float]
+                         ) -> Tuple[CapacityTable, str, Optional[float]]:
+    """
+    Get the capacity table to plan against.
+
+    Args:
+        conn: OpenStack connection
+        source: One of CAPACITY_SOURCES
+        allocation_ratios: Explicit ratios for the hypervisor table; in 'auto'
+                           mode they also take precedence over a cached Placement table
+
+    Returns:
+        Tuple of (table, source used, age in seconds of a cached table or None)
+    """
+    if source not in CAPACITY_SOURCES:
+        raise ValueError(f"Unknown capacity source '{source}'. Supported: {', '.join(CAPACITY_SOURCES)}")
+    if source == 'placement':
+        return build_capacity_table(conn), 'placement', None
+    if source == 'auto' and not allocation_ratios:
+        # Expired tables (MCP_CAPACITY_TABLE_TTL) are not returned
+        cached = get_cached_capacity_table(conn)
+        if cached is not None:
+            table, age = cached
+            return table, 'placement_cached', round(age, 1)
+    return build_hypervisor_table(conn, allocation_ratios=allocation_ratios), 'nova_hypervisors', None
+
+
+def get_capacity_plan(requests_spec: str, availability_zone: str = "", strategy: str = "first_fit",
+                      server_group: str = "", source: str = "auto", cpu_allocation_ratio: float = 0.0,
+                      ram_allocation_ratio: float = 0.0, disk_allocation_ratio: float = 0.0) -> Dict[str, Any]:
+    """
+    Check whether flavor x count requests fit on the current free capacity.
+
+    Args:
+        requests_spec: Requests as "flavor:count,..." or JSON list
+        availability_zone: Restrict placement to hosts in this availability zone
+        strategy: 'first_fit' (first-fit decreasing) or 'spread'
+        server_group: Server group name or ID whose (anti-)affinity policy applies
+        source: 'auto' (cached Placement table, else Nova hypervisor listing),
+                'hypervisors' or 'placement' (fresh Placement walk)
+        cpu_allocation_ratio: vCPU overcommit for hypervisor data (0 = MCP_CPU_ALLOCATION_RATIO)
+        ram_allocation_ratio: Memory overcommit for hypervisor data (0 = MCP_RAM_ALLOCATION_RATIO)
+        disk_allocation_ratio: Disk overcommit for hypervisor data (0 = MCP_DISK_ALLOCATION_RATIO)
+
+    Returns:
+        Dict with simulation results and per-flavor maximum additional instances
+    """
+    try:
+        # Import here to avoid circular imports
+        from ..connection import get_openstack_connection
+        conn = get_openstack_connection()
+
+        given_ratios = {resource_class: ratio for resource_class, ratio in
+                        (('VCPU', cpu_allocation_ratio), ('MEMORY_MB', ram_allocation_ratio),
+                         ('DISK_GB', disk_allocation_ratio)) if ratio and ratio > 0}
+        table, table_source, table_age = _load_capacity_table(conn, source, given_ratios)
+        # Nova hypervisor stats have no PCPU inventory: dedicated CPUs come out of the vCPU pool there
+        pcpu, vcpu = RESOURCE_CLASSES.index('PCPU'), RESOURCE_CLASSES.index('VCPU')
+        has_pcpu = bool(table.total[:, pcpu].any())
+
+        requests = []
+        for flavor_name, count in parse_capacity_requests(requests_spec):
+            flavor = conn.compute.find_flavor(flavor_name, ignore_missing=False)
+            demand = _flavor_demand(flavor, _flavor_extra_specs(conn, flavor))
+            if not has_pcpu:
+                demand[vcpu], demand[pcpu] = demand[vcpu] + demand[pcpu], 0
+            requests.append({'flavor': flavor.name, 'count': count, 'demand': demand})
+
+        eligible = table.total[:, [RESOURCE_CLASSES.index('VCPU'), RESOURCE_CLASSES.index('PCPU')]].any(axis=1)
+        if availability_zone:
+            _aggregates, zones = get_host_groups(conn, table)
+            eligible &= np.array([zone[0] == availability_zone for zone in zones], dtype=bool)
+
+        policy, group_hosts = None, None
+        if server_group:
+            policy, member_hosts = _resolve_server_group(conn, server_group)
+            group_hosts = _host_mask(table, member_hosts)
+
+        simulation = simulate_placement(table, requests, strategy, eligible, policy, group_hosts)
+
+        # How many of each flavor would fit on their own (ignoring the other requests)
+        free = table.free
+        max_additional = {}
+        for request in requests:
+            fits = _fit_counts(free, table.max_unit, request['demand'], eligible)
+            max_additional[request['flavor']] = int(fits.sum())
+
+        return {
+            'success': True,
+            'capacity_source': table_source,
+            'capacity_age_seconds': table_age,
+            # Placement tables carry per-host ratios; hypervisor tables use the configured / given ones
+            'allocation_ratios': (get_allocation_ratios(given_ratios)
+                                  if table_source == 'nova_hypervisors' else 'placement_inventories'),
+            'availability_zone': availability_zone or 'all',
+            'compute_hosts': int(eligible.sum()),
+            'simulation': simulation,
+            'max_additional_instances_per_flavor': max_additional
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to simulate capacity plan: {e}")
+        return {
+            'success': False,
+            'error': str(e),
+            'message': 'Failed to simulate capacity plan'
+        }
@@ -0,0 +1,363 @@
+"""
+Bulk Quota Engine
+
+Reads or applies compute, network and volume quota sets for many projects in
+one invocation instead of one get_quota / set_quota call per project:
+
+- Projects are selected by a list of names/IDs or a name pattern and resolved
+  through the identity catalog cache (one project listing for the whole run)
+- The quota sets of all (project, service) pairs are fetched concurrently on
+  a bounded worker pool (MCP_BULK_QUOTA_WORKERS); every quota read and update
+  first takes a token from a per-service bucket (MCP_BULK_QUOTA_RATE, always
+  on), so large runs are paced rather than bursting the APIs. The opt-in rate
+  governor and the circuit breaker of the request pipeline apply on top
+- Updates are diffed against the current limits: dry runs report what would
+  change, and real runs send one update per (project, service) containing only
+  the limits that differ
+
+Results are compact tables (``columns`` + ``rows``) rather than one nested
+document per project.
+"""
+
+import fnmatch
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..concurrency import run_in_parallel
+from ..deadline import deadline_exceeded, get_deadline
+from ..rate_governor import TokenBucket
+from .identity_catalog import find_project, list_identity_resources
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Quota keys per service, as named by the SDK quota resources
+QUOTA_KEYS: Dict[str, Tuple[str, ...]] = {
+    'compute': ('instances', 'cores', 'ram', 'key_pairs', 'metadata_items', 'server_groups',
+                'server_group_members'),
+    'network': ('networks', 'subnets', 'ports', 'routers', 'floating_ips', 'security_groups',
+                'security_group_rules'),
+    'volume': ('volumes', 'snapshots', 'gigabytes', 'backups', 'backup_gigabytes'),
+}
+
+# Alternative spellings accepted in update specifications (Neutron API / CLI names)
+QUOTA_KEY_ALIASES = {
+    'floatingips': 'floating_ips',
+    'floating-ips': 'floating_ips',
+    'secgroups': 'security_groups',
+    'secgroup_rules': 'security_group_rules',
+    'keypairs': 'key_pairs',
+}
+
+DEFAULT_BULK_QUOTA_WORKERS = 8
+# Quota requests per second (and burst) per service, shared by all bulk quota calls
+DEFAULT_BULK_QUOTA_RATE = 10.0
+DEFAULT_BULK_QUOTA_BURST = 20
+# Upper bound on projects per invocation, protects against an accidental "*" on huge clouds
+MAX_BULK_PROJECTS = 2000
+
+
+def _get_bulk_quota_workers() -> int:
+    try:
+        return max(1, int(os.environ.get("MCP_BULK_QUOTA_WORKERS", DEFAULT_BULK_QUOTA_WORKERS)))
+    except ValueError:
+        return DEFAULT_BULK_QUOTA_WORKERS
+
+
+def _get_bulk_quota_limit() -> Tuple[float, int]:
+    """Get (rate per second, burst) from MCP_BULK_QUOTA_RATE ("rate:burst"); a rate of 0 disables pacing."""
+    value = os.environ.get("MCP_BULK_QUOTA_RATE", f"{DEFAULT_BULK_QUOTA_RATE:g}:{DEFAULT_BULK_QUOTA_BURST}")
+    try:
+        rate_text, _, burst_text = value.partition(':')
+        rate = max(0.0, float(rate_text))
+        burst = int(burst_text) if burst_text else max(1, int(rate))
+        return rate, max(1, burst)
+    except ValueError:
+        logger.warning("Invalid MCP_BULK_QUOTA_RATE value, using default")
+        return DEFAULT_BULK_QUOTA_RATE, DEFAULT_BULK_QUOTA_BURST
+
+
+_bulk_buckets_lock = threading.Lock()
+_bulk_buckets: Dict[str, Optional[TokenBucket]] = {}
+
+
+def _pace(service: str) -> None:
+    """Wait for this service's bulk quota token; raises DeadlineExceeded once the tool deadline passes."""
+    with _bulk_buckets_lock:
+        if service not in _bulk_buckets:
+            rate, burst = _get_bulk_quota_limit()
+            _bulk_buckets[service] = TokenBucket(f"bulk {service} quota", rate, burst) if rate > 0 else None
+        bucket = _bulk_buckets[service]
+    if bucket is not None:
+        bucket.acquire(get_deadline())
+
+
+def _parse_services(services: str) -> List[str]:
+    selected = [s.strip().lower() for s in (services or '').split(',') if s.strip()] or list(QUOTA_KEYS)
+    unknown = [s for s in selected if s not in QUOTA_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown service(s) {', '.join(unknown)}. Supported: {', '.join(QUOTA_KEYS)}")
+    return selected
+
+
+def _parse_quota_updates(quotas: Any) -> Dict[str, Dict[str, int]]:
+    """
+    Parse "cores=64,ram=131072,volume.gigabytes=2000" or a JSON object into
+    {service: {key: limit}}. Keys are unique across services, so the service
+    prefix is optional.
+    """
+    if isinstance(quotas, dict):
+        items = list(quotas.items())
+    else:
+        text = (quotas or '').strip()
+        if text.startswith('{'):
+            items = list(json.loads(text).items())
+        else:
+            items = []
+            for part in text.split(','):
+                if not part.strip():
+                    continue
+                key, sep, value = part.partition('=')
+                if not sep:
+                    raise ValueError(f"Invalid quota '{part.strip()}', expected key=value")
+                items.append((key, value))
+
+    updates: Dict[str, Dict[str, int]] = {}
+    for raw_key, value in items:
+        service, _, key = str(raw_key).strip().lower().rpartition('.')
+        key = QUOTA_KEY_ALIASES.get(key, key)
+        services = [service] if service else [name for name, keys in QUOTA_KEYS.items() if key in keys]
+        if not services or services[0] not in QUOTA_KEYS or key not in QUOTA_KEYS[services[0]]:
+            raise ValueError(f"Unknown quota '{raw_key}'. Supported: "
+                             + ', '.join(f"{name}.{k}" for name, keys in QUOTA_KEYS.items() for k in keys))
+        try:
+            updates.setdefault(services[0], {})[key] = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Quota '{raw_key}' must be an integer (-1 for unlimited), got {value!r}")
+    if not updates:
+        raise ValueError("No quota limits given")
+    return updates
+
+
+def _select_projects(conn, projects: str, pattern: str) -> Tuple[List[Any], List[str]]:
+    """Resolve project names/IDs and a name pattern to projects; returns (projects, names not found)."""
+    selected: Dict[str, Any] = {}
+    not_found = []
+    for name in [p.strip() for p in (projects or '').split(',') if p.strip()]:
+        project = find_project(conn, name)
+        if project is None:
+            not_found.append(name)
+        else:
+            selected[project.id] = project
+    if pattern:
+        for project in list_identity_resources(conn, 'projects'):
+            if fnmatch.fnmatchcase(getattr(project, 'name', '') or '', pattern):
+                selected.setdefault(project.id, project)
+    return sorted(selected.values(), key=lambda p: getattr(p, 'name', '') or p.id), not_found
+
+
+def _fetch_quota(conn, service: str, project_id: str, include_usage: bool) -> Dict[str, Tuple[int, Optional[int]]]:
+    """Get {key: (limit, in_use)} for one service; in_use is None without include_usage."""
+    _pace(service)
+    if service == 'compute':
+        quota = conn.compute.get_quota_set(project_id, usage=include_usage)
+    elif service == 'network':
+        quota = conn.network.get_quota(project_id, details=include_usage)
+    else:
+        quota = conn.volume.get_quota_set(project_id, usage=include_usage)
+
+    usage = getattr(quota, 'usage', None) or {}
+    values = {}
+    for key in QUOTA_KEYS[service]:
+        value = getattr(quota, key, None)
+        if isinstance(value, dict):
+            # Neutron quota details: {'limit': ..., 'used': ..., 'reserved': ...}
+            values[key] = (value.get('limit', -1), value.get('used'))
+        else:
+            values[key] = (value if value is not None else -1, usage.get(key) if include_usage else None)
+    return values
+
+
+def _update_quota(conn, service: str, project_id: str, limits: Dict[str, int]) -> None:
+    _pace(service)
+    if service == 'compute':
+        conn.compute.update_quota_set(project_id, **limits)
+    elif service == 'network':
+        conn.network.update_quota(project_id, **limits)
+    else:
+        conn.volume.update_quota_set(project_id, **limits)
+
+
+def _fetch_all(conn, tasks: List[Tuple[Any, str]], include_usage: bool):
+    return run_in_parallel(lambda task: _fetch_quota(conn, task[1], task[0].id, include_usage),
+                           tasks, max_workers=_get_bulk_quota_workers())
+
+
+def get_quota_report(projects: str = "", pattern: str = "", services: str = "",
+                     include_usage: bool = False) -> Dict[str, Any]:
+    """
+    Get quota limits (and optionally usage) of many projects as one table.
+
+    Args:
+        projects: Comma-separated project names or IDs
+        pattern: Shell-style project name pattern (e.g. "team-*"); combined with projects
+        services: Comma-separated services to include (compute, network, volume; default all)
+        include_usage: Also report usage ("in_use/limit" cells); one detail request per service
+
+    Returns:
+        Dict with columns (project, then service.key) and one row per project
+    """
+    try:
+        from ..connection import get_openstack_connection
+        conn = get_openstack_connection()
+        selected_services = _parse_services(services)
+
+        if not projects and not pattern:
+            # Current project only (readable without permission to list all projects)
+            selected, not_found = [conn.identity.get_project(conn.current_project_id)], []
+        else:
+            selected, not_found = _select_projects(conn, projects, pattern)
+        if len(selected) > MAX_BULK_PROJECTS:
+            return {
+                'success': False,
+                'error': f'{len(selected)} projects selected, at most {MAX_BULK_PROJECTS} per call; narrow the pattern'
+            }
+
+        tasks = [(project, service) for project in selected for service in selected_services]
+        logger.info(f"Quota report: {len(selected)} projects x {len(selected_services)} services")
+        fetched = {(project.id, service): (values, error)
+                   for (project, service), values, error in _fetch_all(conn, tasks, include_usage)}
+
+        columns = ['project'] + [f"{service}.{key}" for service in selected_services for key in QUOTA_KEYS[service]]
+        rows = []
+        errors = []
+        for project in selected:
+            row = [getattr(project, 'name', None) or project.id]
+            for service in selected_services:
+                values, error = fetched[(project.id, service)]
+                if error is not None:
+                    errors.append({'project': row[0], 'service': service, 'error': str(error)})
+                    row.extend([None] * len(QUOTA_KEYS[service]))
+                    continue
+                for key in QUOTA_KEYS[service]:
+                    limit, used = values[key]
+                    row.append(f"{used}/{limit}" if include_usage else limit)
+            rows.append(row)
+
+        return {
+            'success': True,
+            'projects': len(rows),
+            'services': selected_services,
+            'include_usage': include_usage,
+            'columns': columns,
+            'rows': rows,
+            'projects_not_found': not_found,
+            'errors': errors,
+            'partial': deadline_exceeded(),
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to build quota report: {e}")
+        return {
+            'success': False,
+            'error': str(e),
+            'message': 'Failed to build quota report'
+        }
+
+
+def set_quota_bulk(quotas: Any, projects: str = "", pattern: str = "", dry_run: bool = True) -> Dict[str, Any]:
+    """
+    Apply the same quota limits to many projects, showing the diff first.
+
+    Args:
+        quotas: Limits as "key=value,..." (e.g. "cores=64,ram=131072,volume.gigabytes=2000") or JSON object
+        projects: Comma-separated project names or IDs
+        pattern: Shell-style project name pattern (e.g. "team-*"); combined with projects
+        dry_run: Only report the changes (default); False applies them
+
+    Returns:
+        Dict with one row per changed limit (project, service, quota, current, new, status) and counters
+    """
+    try:
+        from ..connection import get_openstack_connection
+        conn = get_openstack_connection()
+        updates = _parse_quota_updates(quotas)
+
+        if not projects and not pattern:
+            return {
+                'success': False,
+                'error': 'Select projects with projects="a,b" and/or pattern="team-*"'
+            }
+        selected, not_found = _select_projects(conn, projects, pattern)
+        if len(selected) > MAX_BULK_PROJECTS:
+            return {
+                'success': False,
+                'error': f'{len(selected)} projects selected, at most {MAX_BULK_PROJECTS} per call; narrow the pattern'
+            }
+
+        tasks = [(project, service) for project in selected for service in updates]
+        logger.info(f"Bulk quota {'dry run' if dry_run else 'update'}: {len(selected)} projects, "
+                    f"{sum(len(limits) for limits in updates.values())} limits")
+
+        # Diff against the current limits
+        changes: List[Tuple[Any, str, Dict[str, int], Dict[str, int]]] = []
+        errors = []
+        unchanged = 0
+        for (project, service), values, error in _fetch_all(conn, tasks, include_usage=False):
+            if error is not None:
+                errors.append({'project': getattr(project, 'name', project.id), 'service': service,
+                               'error': f'Failed to read quota: {error}'})
+                continue
+            current = {key: values[key][0] for key in updates[service]}
+            changed = {key: limit for key, limit in updates[service].items() if current[key] != limit}
+            unchanged += len(updates[service]) - len(changed)
+            if changed:
+                changes.append((project, service, current, changed))
+
+        applied = {}
+        if not dry_run and changes:
+            results = run_in_parallel(lambda change: _update_quota(conn, change[1], change[0].id, change[3]),
+                                      changes, max_workers=_get_bulk_quota_workers())
+            for (project, service, _current, _changed), _, error in results:
+                applied[(project.id, service)] = error
+                if error is not None:
+                    errors.append({'project': getattr(project, 'name', project.id), 'service': service,
+                                   'error': f'Failed to update quota: {error}'})
+
+        rows = []
+        counts = {'would_change': 0, 'changed': 0, 'failed': 0}
+        for project, service, current, changed in changes:
+            if dry_run:
+                status = 'would_change'
+            else:
+                status = 'failed' if applied.get((project.id, service)) is not None else 'changed'
+            for key, limit in changed.items():
+                rows.append([getattr(project, 'name', None) or project.id, service, key, current[key], limit, status])
+                counts[status] += 1
+
+        return {
+            'success': not errors,
+            'dry_run': dry_run,
+            'projects': len(selected),
+            'columns': ['project', 'service', 'quota', 'current', 'new', 'status'],
+            'rows': rows,
+            'summary': {**counts, 'unchanged': unchanged},
+            'projects_not_found': not_found,
+            'errors': errors,
+            'partial': deadline_exceeded(),
+            'message': (f"{'Would change' if dry_run else 'Changed'} "
+                        f"{counts['would_change'] if dry_run else counts['changed']} limits in "
+                        f"{len({c[0].id for c in changes})} of {len(selected)} projects"
+                        + (f", {len(errors)} errors" if errors else '')),
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to apply bulk quota update: {e}")
+        return {
+            'success': False,
+            'error': str(e),
+            'message': 'Failed to apply bulk quota update'
+        }
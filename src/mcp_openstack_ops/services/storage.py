@@ -6,8 +6,12 @@ volume types, and other storage-related components.
 """
 
 import logging
+import os
 from typing import Dict, List, Any, Optional
 
+from ..concurrency import run_in_parallel
+from .compute import find_server
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -763,10 +767,93 @@ def set_volume_qos(action: str, qos_name: Optional[str] = None, **kwargs) -> Dic
         }
 
 
+DEFAULT_SERVER_VOLUME_WORKERS = 8
+
+
+def _get_server_volume_workers() -> int:
+    try:
+        return max(1, int(os.environ.get("MCP_SERVER_VOLUME_WORKERS", DEFAULT_SERVER_VOLUME_WORKERS)))
+    except ValueError:
+        return DEFAULT_SERVER_VOLUME_WORKERS
+
+
+def _attachment_for_server(volume, server_id: str) -> Dict[str, Any]:
+    for attachment in getattr(volume, 'attachments', None) or []:
+        if attachment.get('server_id') == server_id:
+            return attachment
+    return {}
+
+
+def _format_server_volume(volume, server_id: str) -> Dict[str, Any]:
+    """Attached volume entry; device and attachment come from the volume's own attachment record."""
+    attachment = _attachment_for_server(volume, server_id)
+    return {
+        'volume_id': volume.id,
+        'volume_name': getattr(volume, 'name', None) or 'unnamed',
+        'device': attachment.get('device', 'unknown'),
+        'size': getattr(volume, 'size', 0),
+        'status': getattr(volume, 'status', 'unknown'),
+        'volume_type': getattr(volume, 'volume_type', 'unknown'),
+        'bootable': getattr(volume, 'is_bootable', False),
+        'encrypted': getattr(volume, 'is_encrypted', False),
+        'attachment_id': attachment.get('attachment_id', 'unknown'),
+        'attached_at': str(attachment.get('attached_at', 'unknown'))
+    }
+
+
+def build_volume_server_index(conn) -> Dict[str, List[Any]]:
+    """
+    Build a reverse index server ID -> attached volumes from one volume listing.
+
+    Args:
+        conn: OpenStack connection
+
+    Returns:
+        Dict mapping server IDs to the SDK volume resources attached to them
+    """
+    index: Dict[str, List[Any]] = {}
+    for volume in conn.volume.volumes(details=True):
+        for attachment in getattr(volume, 'attachments', None) or []:
+            server_id = attachment.get('server_id')
+            if server_id:
+                index.setdefault(server_id, []).append(volume)
+    return index
+
+
+def _list_server_volumes(conn, server) -> List[Dict[str, Any]]:
+    """Attached volumes of a resolved server, volume details fetched concurrently."""
+    # Servers embed their attached volume IDs (os-extended-volumes); older
+    # deployments without the extension need the attachments listing
+    volume_ids = [attached.get('id') for attached in getattr(server, 'attached_volumes', None) or []]
+    if not volume_ids and getattr(server, 'attached_volumes', None) is None:
+        volume_ids = [attachment.volume_id for attachment in conn.compute.volume_attachments(server.id)]
+
+    attached_volumes = []
+    results = run_in_parallel(conn.volume.get_volume, [v for v in volume_ids if v],
+                              max_workers=_get_server_volume_workers())
+    for volume_id, volume, error in results:
+        if error is not None:
+            # If we can't get volume details, use basic info
+            attached_volumes.append({
+                'volume_id': volume_id,
+                'volume_name': 'unknown',
+                'size': 0,
+                'status': 'unknown',
+                'error': f'Could not retrieve volume details: {error}'
+            })
+            continue
+        attached_volumes.append(_format_server_volume(volume, server.id))
+    return attached_volumes
+
+
 def get_server_volumes(instance_name: str) -> List[Dict[str, Any]]:
     """
     Get volumes attached to a specific server/instance.
-    
+
+    The server is looked up directly by ID or exact name, its attached volume IDs
+    are taken from the server itself and the volume details are fetched
+    concurrently (MCP_SERVER_VOLUME_WORKERS).
+
     Args:
         instance_name: Name or ID of the server
         
@@ -778,78 +865,64 @@ def get_server_volumes(instance_name: str) -> List[Dict[str, Any]]:
         from ..connection import get_openstack_connection
         conn = get_openstack_connection()
         
-        # Find the server first
-        server = None
-        for srv in conn.compute.servers():
-            if getattr(srv, 'name', '') == instance_name or srv.id == instance_name:
-                server = srv
-                break
-        
+        server = find_server(conn, instance_name)
         if not server:
             return []
         
-        attached_volumes = []
-        
-        # Get volume attachments for this server
-        try:
-            for attachment in conn.compute.volume_attachments(server.id):
-                # Get detailed volume information
-                volume_id = getattr(attachment, 'volume_id', attachment.get('volumeId', 'unknown'))
-                
-                try:
-                    volume = conn.volume.get_volume(volume_id)
-                    volume_info = {
-                        'volume_id': volume_id,
-                        'volume_name': getattr(volume, 'name', 'unnamed'),
-                        'device': getattr(attachment, 'device', 'unknown'),
-                        'size': getattr(volume, 'size', 0),
-                        'status': getattr(volume, 'status', 'unknown'),
-                        'volume_type': getattr(volume, 'volume_type', 'unknown'),
-                        'bootable': getattr(volume, 'is_bootable', False),
-                        'encrypted': getattr(volume, 'is_encrypted', False),
-                        'attachment_id': getattr(attachment, 'id', 'unknown'),
-                        'attached_at': str(getattr(attachment, 'attached_at', 'unknown'))
-                    }
-                except Exception as e:
-                    # If we can't get volume details, use basic info
-                    volume_info = {
-                        'volume_id': volume_id,
-                        'volume_name': 'unknown',
-                        'device': getattr(attachment, 'device', 'unknown'),
-                        'size': 0,
-                        'status': 'unknown',
-                        'attachment_id': getattr(attachment, 'id', 'unknown'),
-                        'error': f'Could not retrieve volume details: {e}'
-                    }
-                
-                attached_volumes.append(volume_info)
-                
-        except Exception as e:
-            logger.error(f"Failed to get volume attachments: {e}")
-            # Fallback: check volume attachments from volume side
-            for volume in conn.volume.volumes():
-                attachments = getattr(volume, 'attachments', [])
-                for attachment in attachments:
-                    if attachment.get('server_id') == server.id:
-                        attached_volumes.append({
-                            'volume_id': volume.id,
-                            'volume_name': getattr(volume, 'name', 'unnamed'),
-                            'device': attachment.get('device', 'unknown'),
-                            'size': getattr(volume, 'size', 0),
-                            'status': getattr(volume, 'status', 'unknown'),
-                            'volume_type': getattr(volume, 'volume_type', 'unknown'),
-                            'bootable': getattr(volume, 'is_bootable', False),
-                            'attachment_id': attachment.get('attachment_id', 'unknown'),
-                            'method': 'volume_fallback'
-                        })
-        
-        return attached_volumes
+        return _list_server_volumes(conn, server)
         
     except Exception as e:
         logger.error(f"Failed to get server volumes: {e}")
         return [{'error': str(e), 'instance_name': instance_name}]
 
 
+def get_server_volume_map() -> Dict[str, Any]:
+    """
+    Get the attached volumes of every server in the current project.
+
+    Built from two API calls: one server listing and one volume listing,
+    joined through the volume -> server reverse index.
+
+    Returns:
+        Dict with one entry per server (including servers without volumes) and totals
+    """
+    try:
+        # Import here to avoid circular imports
+        from ..connection import get_openstack_connection
+        conn = get_openstack_connection()
+
+        servers = list(conn.compute.servers(details=True))
+        index = build_volume_server_index(conn)
+
+        server_map = []
+        for server in servers:
+            volumes = [_format_server_volume(volume, server.id) for volume in index.get(server.id, [])]
+            server_map.append({
+                'server_id': server.id,
+                'server_name': getattr(server, 'name', None) or 'unnamed',
+                'server_status': getattr(server, 'status', 'unknown'),
+                'volumes': volumes,
+                'volume_count': len(volumes),
+                'total_size_gb': sum(v['size'] or 0 for v in volumes)
+            })
+
+        return {
+            'success': True,
+            'servers': server_map,
+            'server_count': len(server_map),
+            'servers_with_volumes': sum(1 for entry in server_map if entry['volumes']),
+            'attached_volume_count': sum(entry['volume_count'] for entry in server_map)
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to get server volume map: {e}")
+        return {
+            'success': False,
+            'message': f'Failed to get server volume map: {str(e)}',
+            'error': str(e)
+        }
+
+
 def set_server_volume(instance_name: str, action: str, **kwargs) -> Dict[str, Any]:
     """
     Manage server volume attachments (attach, detach, list).
@@ -868,11 +941,7 @@ def set_server_volume(instance_name: str, action: str, **kwargs) -> Dict[str, An
         conn = get_openstack_connection()
         
         # Find the server first
-        server = None
-        for srv in conn.compute.servers():
-            if getattr(srv, 'name', '') == instance_name or srv.id == instance_name:
-                server = srv
-                break
+        server = find_server(conn, instance_name)
         
         if not server:
             return {
@@ -881,7 +950,7 @@ def set_server_volume(instance_name: str, action: str, **kwargs) -> Dict[str, An
             }
         
         if action.lower() == 'list':
-            attached_volumes = get_server_volumes(instance_name)
+            attached_volumes = _list_server_volumes(conn, server)
             return {
                 'success': True,
                 'server_name': getattr(server, 'name', 'unnamed'),
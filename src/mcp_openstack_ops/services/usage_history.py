@@ -0,0 +1,364 @@
+"""
+OpenStack Historical Usage (os-simple-tenant-usage)
+
+This module reports compute usage over a period - server hours, vCPU-hours,
+RAM MB-hours and disk GB-hours per flavor and per instance - from Nova's
+simple tenant usage API instead of counting the resources that exist now.
+
+The period is split into calendar-month windows (UTC) that are fetched
+concurrently, each in pages (microversion 2.40 limit / marker). Windows that
+ended before the request are final, so their per-instance usage is cached on
+disk and repeated reports over the same months need no upstream calls; only
+the current month is fetched live. Cache entries are keyed by the calling
+user and project as well as the scope, and the all-projects report requires
+an admin role on the token, so cross-tenant usage is never served from the
+cache to a caller who could not fetch it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from ..auth_cache import DEFAULT_CACHE_DIR
+from ..concurrency import run_in_parallel
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Paginated simple tenant usage (limit / marker)
+USAGE_MICROVERSION = '2.40'
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_USAGE_WORKERS = 4
+
+# Instances reported individually (by vCPU-hours, largest first)
+MAX_REPORTED_INSTANCES = 100
+
+# Bump when the cached window format changes
+CACHE_FORMAT_VERSION = 2
+
+# Token roles allowed to report usage of all projects
+ADMIN_ROLES = ('admin',)
+
+_NOVA_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+
+def is_usage_cache_enabled() -> bool:
+    """Check whether finished usage windows are cached on disk (MCP_USAGE_CACHE_ENABLE)."""
+    return os.environ.get("MCP_USAGE_CACHE_ENABLE", "true").strip().lower() in ("true", "1", "yes", "on")
+
+
+def get_usage_cache_dir() -> str:
+    """Return the usage cache directory (MCP_USAGE_CACHE_DIR or ~/.cache/mcp-openstack-ops/usage)."""
+    return os.environ.get("MCP_USAGE_CACHE_DIR") or os.path.join(DEFAULT_CACHE_DIR, "usage")
+
+
+def _get_page_size() -> int:
+    try:
+        return max(1, int(os.environ.get("MCP_USAGE_PAGE_SIZE", DEFAULT_PAGE_SIZE)))
+    except ValueError:
+        return DEFAULT_PAGE_SIZE
+
+
+def _parse_date(value: str, name: str) -> datetime:
+    try:
+        return datetime.strptime(value.strip(), '%Y-%m-%d')
+    except ValueError:
+        raise ValueError(f"Invalid {name} '{value}', expected YYYY-MM-DD")
+
+
+def resolve_period(start_date: str, end_date: str, now: datetime) -> Tuple[datetime, datetime]:
+    """
+    Resolve the reporting period as naive UTC datetimes [start, end).
+
+    end_date is inclusive (the whole day is reported) and the period is capped
+    at `now`. Defaults: the last 30 days up to now.
+    """
+    end = _parse_date(end_date, 'end_date') + timedelta(days=1) if end_date else now
+    end = min(end, now)
+    start = _parse_date(start_date, 'start_date') if start_date else end - timedelta(days=30)
+    if start >= end:
+        raise ValueError("start_date must be before end_date (and not in the future)")
+    return start, end
+
+
+def split_into_windows(start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+    """Split [start, end) at calendar month boundaries."""
+    windows = []
+    cursor = start
+    while cursor < end:
+        next_month = (cursor.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+                      + timedelta(days=32)).replace(day=1)
+        window_end = min(next_month, end)
+        windows.append((cursor, window_end))
+        cursor = window_end
+    return windows
+
+
+def _cache_path(cache_key: str) -> str:
+    return os.path.join(get_usage_cache_dir(), f"usage-{cache_key}.json")
+
+
+def has_admin_role(conn) -> bool:
+    """Check the roles of the connection's token (no API call) for an admin role."""
+    try:
+        role_names = conn.session.auth.get_access(conn.session).role_names or []
+    except Exception as e:
+        logger.warning(f"Could not read token roles: {e}")
+        return False
+    return any(role in ADMIN_ROLES for role in role_names)
+
+
+def _caller_identity(conn) -> str:
+    """User and project the connection's token was issued to."""
+    return f"{conn.current_user_id or ''}@{conn.current_project_id or ''}"
+
+
+def _window_cache_key(endpoint: str, caller: str, scope: str, start: datetime, end: datetime) -> str:
+    identity = '|'.join([str(CACHE_FORMAT_VERSION), endpoint, caller, scope,
+                         start.strftime(_NOVA_TIME_FORMAT), end.strftime(_NOVA_TIME_FORMAT)])
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()[:32]
+
+
+def _load_cached_window(cache_key: str) -> Optional[List[Dict[str, Any]]]:
+    path = _cache_path(cache_key)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)['server_usages']
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable usage cache {path}: {e}")
+        return None
+
+
+def _save_cached_window(cache_key: str, server_usages: List[Dict[str, Any]]) -> None:
+    path = _cache_path(cache_key)
+    try:
+        directory = get_usage_cache_dir()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'server_usages': server_usages}, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Failed to save usage cache {path}: {e}")
+
+
+def _next_marker(links: List[Dict[str, Any]]) -> Optional[str]:
+    for link in links or []:
+        if link.get('rel') == 'next':
+            markers = parse_qs(urlparse(link.get('href', '')).query).get('marker')
+            if markers:
+                return markers[0]
+    return None
+
+
+def _compact_server_usage(usage: Dict[str, Any], project_id: str) -> Dict[str, Any]:
+    """Keep only the fields the report needs (this is what gets cached)."""
+    return {
+        'instance_id': usage.get('instance_id'),
+        'name': usage.get('name'),
+        'project_id': usage.get('tenant_id') or project_id,
+        'flavor': usage.get('flavor') or 'unknown',
+        'state': usage.get('state'),
+        'hours': usage.get('hours') or 0.0,
+        'vcpus': usage.get('vcpus') or 0,
+        'memory_mb': usage.get('memory_mb') or 0,
+        'local_gb': usage.get('local_gb') or 0,
+        'started_at': usage.get('started_at'),
+        'ended_at': usage.get('ended_at'),
+    }
+
+
+def _fetch_window(conn, project_id: Optional[str], start: datetime, end: datetime) -> List[Dict[str, Any]]:
+    """Fetch all server usages of a window, following limit / marker pagination."""
+    path = f'/os-simple-tenant-usage/{project_id}' if project_id else '/os-simple-tenant-usage'
+    params = {
+        'start': start.strftime(_NOVA_TIME_FORMAT),
+        'end': end.strftime(_NOVA_TIME_FORMAT),
+        'detailed': 1,
+        'limit': _get_page_size(),
+    }
+
+    server_usages = []
+    pages = 0
+    while True:
+        response = conn.compute.get(path, params=params, microversion=USAGE_MICROVERSION)
+        if response.status_code != 200:
+            raise Exception(f"Compute API {path} returned HTTP {response.status_code}")
+        body = response.json()
+        pages += 1
+
+        if project_id:
+            tenant_usages = [body.get('tenant_usage') or {}]
+            links = body.get('tenant_usage_links')
+        else:
+            tenant_usages = body.get('tenant_usages') or []
+            links = body.get('tenant_usages_links')
+
+        for tenant_usage in tenant_usages:
+            tenant_id = tenant_usage.get('tenant_id') or project_id
+            for usage in tenant_usage.get('server_usages') or []:
+                server_usages.append(_compact_server_usage(usage, tenant_id))
+
+        marker = _next_marker(links)
+        if not marker:
+            break
+        params['marker'] = marker
+
+    logger.debug(f"Fetched {len(server_usages)} server usages for {start:%Y-%m-%d}..{end:%Y-%m-%d} in {pages} pages")
+    return server_usages
+
+
+def _get_window(conn, endpoint: str, caller: str, project_id: Optional[str], window: Tuple[datetime, datetime],
+                now: datetime) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Get a window's server usages, from the disk cache when the window is finished.
+
+    Returns:
+        Tuple of (server usages, served from cache)
+    """
+    start, end = window
+    # The window ending at `now` is still open (usage keeps accruing)
+    finished = end < now and is_usage_cache_enabled()
+    cache_key = _window_cache_key(endpoint, caller, project_id or 'all', start, end) if finished else None
+    if cache_key:
+        cached = _load_cached_window(cache_key)
+        if cached is not None:
+            return cached, True
+
+    server_usages = _fetch_window(conn, project_id, start, end)
+    if cache_key:
+        _save_cached_window(cache_key, server_usages)
+    return server_usages, False
+
+
+def _usage_totals() -> Dict[str, float]:
+    return {'servers': 0, 'hours': 0.0, 'vcpu_hours': 0.0, 'ram_mb_hours': 0.0, 'disk_gb_hours': 0.0}
+
+
+def _add_usage(totals: Dict[str, float], usage: Dict[str, Any]) -> None:
+    hours = usage['hours']
+    totals['hours'] += hours
+    totals['vcpu_hours'] += usage['vcpus'] * hours
+    totals['ram_mb_hours'] += usage['memory_mb'] * hours
+    totals['disk_gb_hours'] += usage['local_gb'] * hours
+
+
+def _round_totals(totals: Dict[str, float]) -> Dict[str, Any]:
+    return {key: round(value, 2) if isinstance(value, float) else value for key, value in totals.items()}
+
+
+def aggregate_usage(server_usages: List[Dict[str, Any]], by_project: bool = False) -> Dict[str, Any]:
+    """
+    Aggregate server usages of one or more windows per flavor, instance and project.
+
+    An instance that spans several windows is reported once with summed hours.
+    """
+    totals = _usage_totals()
+    flavors: Dict[str, Dict[str, float]] = {}
+    projects: Dict[str, Dict[str, float]] = {}
+    instances: Dict[str, Dict[str, Any]] = {}
+
+    for usage in server_usages:
+        _add_usage(totals, usage)
+        _add_usage(flavors.setdefault(usage['flavor'], _usage_totals()), usage)
+        if by_project:
+            _add_usage(projects.setdefault(usage['project_id'], _usage_totals()), usage)
+
+        instance = instances.get(usage['instance_id'])
+        if instance is None:
+            instance = instances[usage['instance_id']] = {
+                'instance_id': usage['instance_id'],
+                'name': usage['name'],
+                'project_id': usage['project_id'],
+                'flavor': usage['flavor'],
+                'vcpus': usage['vcpus'],
+                'memory_mb': usage['memory_mb'],
+                'local_gb': usage['local_gb'],
+                'started_at': usage['started_at'],
+                **_usage_totals()
+            }
+            del instance['servers']
+            totals['servers'] += 1
+            flavors[usage['flavor']]['servers'] += 1
+            if by_project:
+                projects[usage['project_id']]['servers'] += 1
+        _add_usage(instance, usage)
+        # Windows are processed oldest first, so the last one has the current state
+        instance['state'] = usage['state']
+        instance['ended_at'] = usage['ended_at']
+
+    top = sorted(instances.values(), key=lambda i: i['vcpu_hours'], reverse=True)[:MAX_REPORTED_INSTANCES]
+    result = {
+        'totals': _round_totals(totals),
+        'by_flavor': {name: _round_totals(t) for name, t in sorted(flavors.items())},
+        'instances_total': len(instances),
+        'instances': [_round_totals(instance) for instance in top],
+    }
+    if by_project:
+        result['by_project'] = {project: _round_totals(t) for project, t in sorted(projects.items())}
+    return result
+
+
+def get_usage_history(conn, start_date: str = "", end_date: str = "", all_projects: bool = False) -> Dict[str, Any]:
+    """
+    Get compute usage over a period from os-simple-tenant-usage.
+
+    Args:
+        conn: OpenStack connection
+        start_date: Start date (YYYY-MM-DD, defaults to 30 days before end_date)
+        end_date: End date, inclusive (YYYY-MM-DD, defaults to today)
+        all_projects: Report all projects (admin) instead of the current project
+
+    Returns:
+        Dict with the period, window / cache information and aggregated usage
+
+    Raises:
+        PermissionError: all_projects was requested without an admin role
+    """
+    if all_projects and not has_admin_role(conn):
+        raise PermissionError("Reporting usage of all projects requires an admin role")
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    start, end = resolve_period(start_date, end_date, now)
+    windows = split_into_windows(start, end)
+    project_id = None if all_projects else conn.current_project_id
+    caller = _caller_identity(conn)
+
+    try:
+        endpoint = conn.compute.get_endpoint()
+    except Exception:
+        endpoint = 'compute'
+
+    results = run_in_parallel(lambda window: _get_window(conn, endpoint, caller, project_id, window, now),
+                              windows, max_workers=DEFAULT_USAGE_WORKERS)
+
+    server_usages = []
+    cached_windows = 0
+    for window, result, error in results:
+        if error is not None:
+            raise Exception(f"Failed to get usage for {window[0]:%Y-%m-%d}..{window[1]:%Y-%m-%d}: {error}")
+        usages, from_cache = result
+        cached_windows += from_cache
+        server_usages.extend(usages)
+
+    report = {
+        'period': {
+            'start': start.strftime(_NOVA_TIME_FORMAT),
+            'end': end.strftime(_NOVA_TIME_FORMAT),
+            'hours': round((end - start).total_seconds() / 3600, 2)
+        },
+        'scope': 'all_projects' if all_projects else project_id,
+        'windows': {
+            'total': len(windows),
+            'from_cache': cached_windows
+        }
+    }
+    report.update(aggregate_usage(server_usages, by_project=all_projects))
+    return report
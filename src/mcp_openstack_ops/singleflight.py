@@ -0,0 +1,142 @@
+"""
+Request Coalescing (Singleflight)
+
+When several tool calls issue the same upstream GET at the same time - e.g. two
+clients listing all servers, or get_instance and get_resource_monitoring running
+in parallel - only the first request goes to OpenStack. Concurrent identical
+requests (same session, endpoint, collection and filters) wait for it and share
+its response. Nothing is cached after the in-flight call completes.
+
+Disable with MCP_SINGLEFLIGHT_ENABLE=false.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .deadline import DeadlineExceeded, get_remaining
+from .request_pipeline import PipelineRequest, request_fingerprint
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class _InFlightCall:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None):
+        """
+        Run fn() once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the call
+            fn: Function executed by the first caller
+            timeout: Maximum seconds a follower waits for the first caller
+
+        Returns:
+            Tuple of (result, shared) where shared is True for callers that
+            received the result of another caller's in-flight call
+
+        Raises:
+            DeadlineExceeded: If a follower's timeout elapses first
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise DeadlineExceeded("Deadline exceeded while waiting for a shared in-flight request")
+            if isinstance(call.error, DeadlineExceeded):
+                # The first caller ran out of its own budget; this caller may have more
+                return fn(), False
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+
+_group = SingleFlight()
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _is_enabled() -> bool:
+    return os.environ.get("MCP_SINGLEFLIGHT_ENABLE", "true").strip().lower() in ("true", "1", "yes", "on")
+
+
+def _record(service_type: str, shared: bool) -> None:
+    with _stats_lock:
+        stats = _stats.setdefault(service_type, {'upstream_calls': 0, 'coalesced_calls': 0})
+        stats['coalesced_calls' if shared else 'upstream_calls'] += 1
+
+
+def singleflight_interceptor(request: PipelineRequest, call_next):
+    """Pipeline interceptor sharing in-flight GET responses between identical concurrent requests."""
+    if request.method != 'GET' or not _is_enabled():
+        return call_next(request)
+
+    key = request_fingerprint(request)
+    if key is None:
+        return call_next(request)
+
+    def fetch():
+        response = call_next(request)
+        # Read the body once so every sharer can parse it independently
+        _ = response.content
+        return response
+
+    remaining = get_remaining()
+    response, shared = _group.do(key, fetch, timeout=max(0.0, remaining) if remaining is not None else None)
+    _record(request.service_type, shared)
+    if shared:
+        logger.debug(f"Coalesced concurrent GET {request.service_type} {request.url}")
+    return response
+
+
+def get_singleflight_stats() -> Dict[str, Any]:
+    """
+    Get request coalescing counters per service.
+
+    Returns:
+        Dict with per-service upstream (leader) and coalesced (shared) GET counts
+    """
+    with _stats_lock:
+        services = {name: dict(counts) for name, counts in _stats.items()}
+    total_upstream = sum(s['upstream_calls'] for s in services.values())
+    total_coalesced = sum(s['coalesced_calls'] for s in services.values())
+    total = total_upstream + total_coalesced
+    return {
+        'enabled': _is_enabled(),
+        'upstream_calls': total_upstream,
+        'coalesced_calls': total_coalesced,
+        'coalesced_ratio': round(total_coalesced / total, 3) if total else 0.0,
+        'services': services,
+    }
@@ -0,0 +1,96 @@
+"""
+Bearer Token to OpenStack Credential Mapping
+
+In streamable-http mode a single deployment can serve several teams: each bearer
+token is mapped to its own OpenStack credential profile (project and optionally
+user), loaded from the JSON file referenced by REMOTE_TOKEN_MAP_FILE:
+
+    {
+      "team-a-token": {
+        "client_id": "team-a",
+        "project_name": "team-a",
+        "username": "svc-team-a",
+        "password": "secret",
+        "allowed_projects": ["team-a-staging"]
+      },
+      "team-b-token": {"project_name": "team-b"}
+    }
+
+Fields other than project_name are optional; missing credentials fall back to
+the OS_* environment variables.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+PROFILE_FIELDS = (
+    'client_id',
+    'project_name',
+    'project_domain_name',
+    'username',
+    'password',
+    'user_domain_name',
+    'allowed_projects',
+)
+
+_token_map: Dict[str, Dict[str, Any]] = {}
+
+
+def load_token_map(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load and validate the bearer token to credential profile mapping.
+
+    Args:
+        path: Path to the JSON mapping file
+
+    Returns:
+        Dict mapping bearer token to credential profile
+
+    Raises:
+        ValueError: If the file is malformed
+    """
+    with open(os.path.expanduser(path), 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+
+    if not isinstance(raw, dict) or not raw:
+        raise ValueError(f"Token map {path} must be a non-empty JSON object of token -> profile")
+
+    token_map = {}
+    for index, (token, profile) in enumerate(raw.items(), 1):
+        if not token or not isinstance(profile, dict):
+            raise ValueError(f"Token map entry #{index} must map a non-empty token to an object")
+        if not profile.get('project_name'):
+            raise ValueError(f"Token map entry #{index} is missing 'project_name'")
+        unknown = set(profile) - set(PROFILE_FIELDS)
+        if unknown:
+            raise ValueError(f"Token map entry #{index} has unknown fields: {sorted(unknown)}")
+        allowed_projects = profile.get('allowed_projects', [])
+        if not isinstance(allowed_projects, list):
+            raise ValueError(f"Token map entry #{index}: 'allowed_projects' must be a list")
+
+        token_map[token] = {
+            **profile,
+            'client_id': profile.get('client_id') or f"openstack-ops-{profile['project_name']}",
+            'allowed_projects': allowed_projects,
+        }
+
+    logger.info(f"Loaded {len(token_map)} bearer token credential mappings from {path}")
+    return token_map
+
+
+def set_token_map(token_map: Dict[str, Dict[str, Any]]) -> None:
+    """Install the mapping used by get_profile_for_token()."""
+    global _token_map
+    _token_map = dict(token_map)
+
+
+def get_profile_for_token(token: str) -> Optional[Dict[str, Any]]:
+    """Return the credential profile mapped to a bearer token, or None for unmapped tokens."""
+    if not token:
+        return None
+    return _token_map.get(token)
@@ -6,10 +6,12 @@ from ..functions import get_availability_zones as _get_availability_zones
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_availability_zones() -> str:
+@run_in_tool_worker
+def get_availability_zones() -> str:
     """
     List availability zones and their status
     
@@ -0,0 +1,57 @@
+"""Tool implementation for get_capacity_plan."""
+
+import json
+from datetime import datetime
+from ..functions import get_capacity_plan as _get_capacity_plan
+from ..mcp_main import (
+    logger,
+    mcp,
+    run_in_tool_worker,
+)
+
+@mcp.tool()
+@run_in_tool_worker
+def get_capacity_plan(requests: str, availability_zone: str = "", strategy: str = "first_fit",
+                            server_group: str = "", source: str = "auto", cpu_allocation_ratio: float = 0.0,
+                            ram_allocation_ratio: float = 0.0, disk_allocation_ratio: float = 0.0) -> str:
+    """
+    Simulates whether additional instances fit on the cluster's current free capacity.
+    
+    Functions:
+    - Load free vCPU/RAM/disk of every hypervisor: the cached Placement capacity table (its allocation ratios applied) if a recent one exists, otherwise one Nova hypervisor detail listing with overcommit ratios applied (configured defaults or the ratio arguments)
+    - Simulate placement of flavor x count requests with first-fit decreasing or spread bin-packing
+    - Honor server group anti-affinity / affinity policies (hosts of existing members included)
+    - Report placed / unplaced instances per flavor, hosts used and maximum additional instances per flavor
+    
+    Use when user asks capacity planning questions like "can we fit 40 more m1.xlarge in AZ nova?".
+    
+    Args:
+        requests: Flavor requests as "flavor:count,flavor:count" (e.g. "m1.xlarge:40,m1.small:100") or JSON list of {"flavor": ..., "count": ...}
+        availability_zone: Only place on hosts in this availability zone (optional)
+        strategy: Placement strategy - "first_fit" (pack hosts densely) or "spread" (balance across hosts)
+        server_group: Server group name or ID whose anti-affinity / affinity policy applies (optional)
+        source: Capacity data - "auto" (cached Placement table, else hypervisor listing), "hypervisors", or "placement" (fresh Placement walk, one request pair per provider)
+        cpu_allocation_ratio: vCPU overcommit ratio applied to hypervisor data (optional, 0 = server default, e.g. 4.0)
+        ram_allocation_ratio: RAM overcommit ratio applied to hypervisor data (optional, 0 = server default)
+        disk_allocation_ratio: Disk overcommit ratio applied to hypervisor data (optional, 0 = server default)
+    
+    Returns:
+        Capacity simulation results in JSON format.
+    """
+    try:
+        logger.info(f"Simulating capacity plan: requests={requests}, az={availability_zone or 'all'}, strategy={strategy}")
+        plan = _get_capacity_plan(requests, availability_zone.strip(), strategy.strip().lower(),
+                                  server_group.strip(), source.strip().lower() or "auto",
+                                  cpu_allocation_ratio, ram_allocation_ratio, disk_allocation_ratio)
+        
+        result = {
+            "timestamp": datetime.now().isoformat(),
+            "capacity_plan": plan
+        }
+        
+        return json.dumps(result, indent=2, ensure_ascii=False)
+        
+    except Exception as e:
+        error_msg = f"Error: Failed to simulate capacity plan - {str(e)}"
+        logger.error(error_msg)
+        return error_msg
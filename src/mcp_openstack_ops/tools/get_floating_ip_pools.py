@@ -6,10 +6,12 @@ from ..functions import get_floating_ip_pools as _get_floating_ip_pools
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_floating_ip_pools() -> str:
+@run_in_tool_worker
+def get_floating_ip_pools() -> str:
     """
     Get list of floating IP pools (external networks).
     
@@ -6,10 +6,12 @@ from ..functions import get_floating_ips as _get_floating_ips
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_floating_ips() -> str:
+@run_in_tool_worker
+def get_floating_ips() -> str:
     """
     Get list of floating IPs with their associations.
     
@@ -6,10 +6,12 @@ from ..functions import get_heat_stacks as _get_heat_stacks
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_heat_stacks() -> str:
+@run_in_tool_worker
+def get_heat_stacks() -> str:
     """
     Get list of Heat orchestration stacks.
     
@@ -6,10 +6,12 @@ from ..functions import get_hypervisor_details as _get_hypervisor_details
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_hypervisor_details(
+@run_in_tool_worker
+def get_hypervisor_details(
     hypervisor_name: str = "all"
 ) -> str:
     """
@@ -6,10 +6,12 @@ from ..functions import get_image_detail_list as _get_image_detail_list
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_image_detail_list() -> str:
+@run_in_tool_worker
+def get_image_detail_list() -> str:
     """
     Get detailed list of all images with comprehensive metadata.
     
@@ -9,11 +9,13 @@ from ..functions import (
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 from ..services.compute import search_instances as _search_instances
 
 @mcp.tool()
-async def get_instance(
+@run_in_tool_worker
+def get_instance(
     names: str = "",
     ids: str = "",
     status: str = "",
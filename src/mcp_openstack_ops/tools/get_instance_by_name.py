@@ -6,10 +6,12 @@ from ..functions import get_instance_by_name as _get_instance_by_name
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_instance_by_name(instance_name: str) -> str:
+@run_in_tool_worker
+def get_instance_by_name(instance_name: str) -> str:
     """
     Get detailed information for a specific instance by name.
     
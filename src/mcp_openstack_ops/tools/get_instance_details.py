@@ -6,10 +6,12 @@ from ..functions import get_instance_details as _get_instance_details
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_instance_details(
+@run_in_tool_worker
+def get_instance_details(
     instance_names: str = "", 
     instance_ids: str = "", 
     all_instances: bool = False,
@@ -6,10 +6,12 @@ from ..functions import get_instances_by_status as _get_instances_by_status
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_instances_by_status(status: str) -> str:
+@run_in_tool_worker
+def get_instances_by_status(status: str) -> str:
     """
     Get instances filtered by status.
     
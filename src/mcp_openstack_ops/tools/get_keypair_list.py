@@ -6,10 +6,12 @@ from ..functions import get_keypair_list as _get_keypair_list
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_keypair_list() -> str:
+@run_in_tool_worker
+def get_keypair_list() -> str:
     """
     Get list of SSH keypairs for the current user.
     
@@ -6,10 +6,12 @@ from ..functions import get_load_balancer_amphorae as _get_load_balancer_amphora
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_load_balancer_amphorae(lb_name_or_id: str = "") -> str:
+@run_in_tool_worker
+def get_load_balancer_amphorae(lb_name_or_id: str = "") -> str:
     """
     Get amphora instances for a load balancer or all amphorae.
     
@@ -6,10 +6,12 @@ from ..functions import get_load_balancer_availability_zones as _get_load_balanc
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_load_balancer_availability_zones() -> str:
+@run_in_tool_worker
+def get_load_balancer_availability_zones() -> str:
     """
     Get load balancer availability zones.
     
@@ -6,10 +6,12 @@ from ..functions import get_load_balancer_flavors as _get_load_balancer_flavors
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_load_balancer_flavors() -> str:
+@run_in_tool_worker
+def get_load_balancer_flavors() -> str:
     """
     Get load balancer flavors.
     
@@ -5,10 +5,12 @@ from datetime import datetime
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_load_balancer_health_monitors(pool_name_or_id: str = "") -> str:
+@run_in_tool_worker
+def get_load_balancer_health_monitors(pool_name_or_id: str = "") -> str:
     """
     Get health monitors, optionally filtered by pool.
 
@@ -6,10 +6,12 @@ from ..functions import get_load_balancer_l7_policies as _get_load_balancer_l7_p
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_load_balancer_l7_policies(listener_name_or_id: str = "") -> str:
+@run_in_tool_worker
+def get_load_balancer_l7_policies(listener_name_or_id: str = "") -> str:
     """
     Get L7 policies for a listener or all L7 policies.
     
@@ -6,10 +6,12 @@ from ..functions import get_load_balancer_l7_rules as _get_load_balancer_l7_rule
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_load_balancer_l7_rules(policy_name_or_id: str) -> str:
+@run_in_tool_worker
+def get_load_balancer_l7_rules(policy_name_or_id: str) -> str:
     """
     Get L7 rules for a specific L7 policy.
     
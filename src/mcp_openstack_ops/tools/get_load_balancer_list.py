@@ -6,10 +6,12 @@ from ..functions import get_load_balancer_list as _get_load_balancer_list
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_load_balancer_list(
+@run_in_tool_worker
+def get_load_balancer_list(
     limit: int = 50,
     offset: int = 0,
     include_all: bool = False
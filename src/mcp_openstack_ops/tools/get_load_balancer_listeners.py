@@ -6,10 +6,12 @@ from ..functions import get_load_balancer_listeners as _get_load_balancer_listen
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_load_balancer_listeners(lb_name_or_id: str) -> str:
+@run_in_tool_worker
+def get_load_balancer_listeners(lb_name_or_id: str) -> str:
     """
     Get listeners for a specific OpenStack load balancer.
     
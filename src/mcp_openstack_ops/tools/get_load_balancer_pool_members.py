@@ -5,10 +5,12 @@ from datetime import datetime
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_load_balancer_pool_members(pool_name_or_id: str) -> str:
+@run_in_tool_worker
+def get_load_balancer_pool_members(pool_name_or_id: str) -> str:
     """
     Get members for a specific OpenStack load balancer pool.
 
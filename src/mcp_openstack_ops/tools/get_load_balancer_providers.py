@@ -6,10 +6,12 @@ from ..functions import get_load_balancer_providers as _get_load_balancer_provid
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_load_balancer_providers() -> str:
+@run_in_tool_worker
+def get_load_balancer_providers() -> str:
     """
     Get load balancer providers.
     
@@ -6,10 +6,12 @@ from ..functions import get_load_balancer_quotas as _get_load_balancer_quotas
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_load_balancer_quotas(project_id: str = "") -> str:
+@run_in_tool_worker
+def get_load_balancer_quotas(project_id: str = "") -> str:
     """
     Get load balancer quotas for a project or all projects.
     
@@ -6,10 +6,12 @@ from ..functions import get_network_details as _get_network_details
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_network_details(network_name: str = "all") -> str:
+@run_in_tool_worker
+def get_network_details(network_name: str = "all") -> str:
     """
     Provides detailed information for OpenStack networks, subnets, routers, and security groups.
     
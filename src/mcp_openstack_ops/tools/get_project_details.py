@@ -6,10 +6,12 @@ from ..functions import get_project_details as _get_project_details
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_project_details(project_name: str = "") -> str:
+@run_in_tool_worker
+def get_project_details(project_name: str = "") -> str:
     """
     Get OpenStack project details (similar to 'openstack project list/show').
     
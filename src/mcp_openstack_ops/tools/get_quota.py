@@ -6,10 +6,12 @@ from ..functions import get_quota as _get_quota
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_quota(project_name: str = "") -> str:
+@run_in_tool_worker
+def get_quota(project_name: str = "") -> str:
     """
     Get quota information for projects (similar to 'openstack quota show').
     
@@ -0,0 +1,52 @@
+"""Tool implementation for get_quota_report."""
+
+import json
+from datetime import datetime
+from ..functions import get_quota_report as _get_quota_report
+from ..mcp_main import (
+    logger,
+    mcp,
+    run_in_tool_worker,
+)
+
+@mcp.tool()
+@run_in_tool_worker
+def get_quota_report(projects: str = "", pattern: str = "", services: str = "",
+                           include_usage: bool = False) -> str:
+    """
+    Reports compute, network and volume quotas of many projects in one table.
+    
+    Functions:
+    - Select projects by comma-separated names/IDs and/or a name pattern (e.g. "team-*")
+    - Fetch all quota sets concurrently (one request per project and service)
+    - Optionally include usage as "in_use/limit" cells
+    - Return one compact row per project with columns like "compute.cores", "volume.gigabytes"
+    
+    Use when user asks to compare or audit quotas across projects ("show cores and RAM quotas of all team-* projects").
+    For a single project with detailed usage use get_quota.
+    
+    Args:
+        projects: Comma-separated project names or IDs (default: current project if no pattern)
+        pattern: Shell-style project name pattern, e.g. "team-*" (optional)
+        services: Comma-separated services: compute, network, volume (default: all)
+        include_usage: Include current usage next to each limit (default: False)
+    
+    Returns:
+        Quota table in JSON format (columns + rows, -1 means unlimited).
+    """
+    try:
+        logger.info(f"Building quota report: projects={projects or '-'}, pattern={pattern or '-'}, "
+                    f"services={services or 'all'}, usage={include_usage}")
+        report = _get_quota_report(projects.strip(), pattern.strip(), services.strip(), include_usage)
+        
+        result = {
+            "timestamp": datetime.now().isoformat(),
+            "quota_report": report
+        }
+        
+        return json.dumps(result, indent=2, ensure_ascii=False)
+        
+    except Exception as e:
+        error_msg = f"Error: Failed to build quota report - {str(e)}"
+        logger.error(error_msg)
+        return error_msg
@@ -6,17 +6,20 @@ from ..functions import get_resource_monitoring as _get_resource_monitoring
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_resource_monitoring() -> str:
+@run_in_tool_worker
+def get_resource_monitoring() -> str:
     """
     Monitors real-time resource usage across the OpenStack cluster.
     
     Functions:
     - Monitor cluster-wide CPU, memory, and storage usage rates
     - Collect hypervisor statistics and resource allocation
-    - Track resource utilization trends and capacity planning data
+    - Report physical capacity and usage from Nova hypervisor details (two API calls), per availability zone and host aggregate
+    - Report current utilization and capacity planning data (trends over time: get_resource_trends)
     - Provide resource usage summaries and utilization percentages
     
     Use when user requests resource monitoring, capacity planning, usage analysis, or performance monitoring.
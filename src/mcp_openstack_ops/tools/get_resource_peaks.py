@@ -0,0 +1,47 @@
+"""Tool implementation for get_resource_peaks."""
+
+import json
+from datetime import datetime
+from ..sampler import get_metric_peaks
+from ..mcp_main import (
+    logger,
+    mcp,
+    run_in_tool_worker,
+)
+
+@mcp.tool()
+@run_in_tool_worker
+def get_resource_peaks(metric: str, window_minutes: float = 1440, top: int = 5) -> str:
+    """
+    Finds peak values of sampled resource metrics from the background resource sampler history.
+    
+    Functions:
+    - List the highest samples of a metric with their timestamps
+    - Show the largest increase between consecutive samples (sudden spikes)
+    - Answer from in-memory history only (no OpenStack API calls); requires MCP_SAMPLER_ENABLE=true
+    
+    Use when user asks about peak usage, busiest times, or sudden spikes (e.g. "when did vCPU usage peak today?").
+    
+    Args:
+        metric: Metric name or comma-separated names (e.g. "vcpus_used", "instances_error,volume_gb")
+        window_minutes: Look-back window in minutes (default: 1440 = 24h, 0 = whole history)
+        top: Number of peak samples to report per metric (default: 5)
+    
+    Returns:
+        Peak samples per metric in JSON format.
+    """
+    try:
+        logger.info(f"Finding resource peaks: metric={metric}, window={window_minutes}m")
+        peaks = get_metric_peaks(metric.strip(), window_minutes, top)
+        
+        result = {
+            "timestamp": datetime.now().isoformat(),
+            "resource_peaks": peaks
+        }
+        
+        return json.dumps(result, indent=2, ensure_ascii=False)
+        
+    except Exception as e:
+        error_msg = f"Error: Failed to find resource peaks - {str(e)}"
+        logger.error(error_msg)
+        return error_msg
@@ -0,0 +1,51 @@
+"""Tool implementation for get_resource_trends."""
+
+import json
+from datetime import datetime
+from ..sampler import get_metric_trends
+from ..mcp_main import (
+    logger,
+    mcp,
+    run_in_tool_worker,
+)
+
+@mcp.tool()
+@run_in_tool_worker
+def get_resource_trends(metric: str = "", window_minutes: float = 60) -> str:
+    """
+    Shows utilization trends and rate of change from the background resource sampler history.
+    
+    Functions:
+    - Summarize first, last, min, max and mean values of sampled metrics over a time window
+    - Calculate rate of change per hour (least-squares slope)
+    - Project hours until vCPU / RAM / disk capacity is exhausted at the current growth rate
+    - Answer from in-memory history only (no OpenStack API calls); requires MCP_SAMPLER_ENABLE=true
+    
+    Metrics: vcpus_used, vcpus_capacity, memory_mb_used, memory_mb_capacity, disk_gb_used,
+    disk_gb_capacity, instances_active, instances_shutoff, instances_error, instances_build,
+    volumes, volume_gb, floating_ips, floating_ips_associated
+    
+    Use when user asks how usage is trending, how fast resources grow, or when capacity runs out.
+    
+    Args:
+        metric: Metric name or comma-separated names (optional, all metrics if empty)
+        window_minutes: Look-back window in minutes (default: 60, 0 = whole history)
+    
+    Returns:
+        Trend summary per metric in JSON format.
+    """
+    try:
+        logger.info(f"Computing resource trends: metric={metric or 'all'}, window={window_minutes}m")
+        trends = get_metric_trends(metric.strip(), window_minutes)
+        
+        result = {
+            "timestamp": datetime.now().isoformat(),
+            "resource_trends": trends
+        }
+        
+        return json.dumps(result, indent=2, ensure_ascii=False)
+        
+    except Exception as e:
+        error_msg = f"Error: Failed to compute resource trends - {str(e)}"
+        logger.error(error_msg)
+        return error_msg
@@ -6,10 +6,12 @@ from ..functions import get_role_assignments as _get_role_assignments
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_role_assignments() -> str:
+@run_in_tool_worker
+def get_role_assignments() -> str:
     """
     Get role assignments for the current project.
     
@@ -6,10 +6,12 @@ from ..functions import get_routers as _get_routers
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_routers() -> str:
+@run_in_tool_worker
+def get_routers() -> str:
     """
     Get list of routers with their configuration.
     
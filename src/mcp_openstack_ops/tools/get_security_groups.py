@@ -6,10 +6,12 @@ from ..functions import get_security_groups as _get_security_groups
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_security_groups() -> str:
+@run_in_tool_worker
+def get_security_groups() -> str:
     """
     Get list of security groups with their rules.
     
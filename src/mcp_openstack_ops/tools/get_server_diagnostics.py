@@ -0,0 +1,66 @@
+"""Tool implementation for get_server_diagnostics."""
+
+import json
+from datetime import datetime
+from ..circuit_breaker import get_circuit_breaker_status
+from ..connection import get_connection_pool_status
+from ..http_pool import get_http_pool_stats
+from ..profiling import get_profiling_status
+from ..rate_governor import get_rate_governor_stats
+from ..services.identity_catalog import get_identity_cache_stats
+from ..retry_policy import get_retry_stats
+from ..sampler import get_sampler_status
+from ..singleflight import get_singleflight_stats
+from ..warmup import get_warmup_status
+from ..mcp_main import (
+    logger,
+    mcp,
+    run_in_tool_worker,
+)
+
+@mcp.tool()
+@run_in_tool_worker
+def get_server_diagnostics() -> str:
+    """
+    Reports internal runtime state of this MCP server (not of the OpenStack cloud).
+
+    Functions:
+    - Show startup warm-up readiness per service endpoint
+    - Show pooled project-scoped OpenStack connections
+    - Show HTTP connection pool statistics per endpoint (in use, waiting, created, reuse ratio)
+    - Show request coalescing counters per service (upstream vs. shared GET responses)
+    - Show circuit breaker state per service (closed, open, half_open) and last failure
+    - Show rate governor limits, queue depth and wait times per service
+    - Show retries of transient upstream errors per error class (retried, recovered, exhausted)
+    - Show background resource sampler state (interval, buffered samples, collector errors)
+    - Show identity catalog cache contents and lookups (projects, domains, users, roles; hits, misses, refreshes)
+    - Show tool profiling settings and profiled invocations (sample rate, output directory, last file)
+
+    Use when diagnosing slow tool calls, connection exhaustion or server-side bottlenecks.
+
+    Returns:
+        Server runtime diagnostics in JSON format.
+    """
+    try:
+        logger.info("Collecting MCP server diagnostics")
+
+        result = {
+            "timestamp": datetime.now().isoformat(),
+            "warmup": get_warmup_status(),
+            "connection_pool": get_connection_pool_status(),
+            "http_pool": get_http_pool_stats(),
+            "request_coalescing": get_singleflight_stats(),
+            "circuit_breakers": get_circuit_breaker_status(),
+            "rate_governor": get_rate_governor_stats(),
+            "retries": get_retry_stats(),
+            "resource_sampler": get_sampler_status(),
+            "identity_cache": get_identity_cache_stats(),
+            "profiling": get_profiling_status(),
+        }
+
+        return json.dumps(result, indent=2, ensure_ascii=False)
+
+    except Exception as e:
+        error_msg = f"Error: Failed to collect server diagnostics - {str(e)}"
+        logger.error(error_msg)
+        return error_msg
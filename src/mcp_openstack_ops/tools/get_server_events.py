@@ -6,40 +6,64 @@ from ..functions import get_server_events as _get_server_events
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_server_events(
-    instance_name: str,
-    limit: int = 50
+@run_in_tool_worker
+def get_server_events(
+    instance_name: str = "",
+    limit: int = 50,
+    instance_names: str = "",
+    since: str = "",
+    include_events: bool = True
 ) -> str:
     """
-    Get recent events for a specific server
-    
+    Get recent events (instance actions) for a server, or an incident timeline across several servers
+
+    Functions:
+    - Look up the server directly by ID or exact name
+    - List its actions (create, reboot, migrate, ...) newest first
+    - Load the events of each action (host, result, traceback) concurrently
+    - Multi-server mode: actions of several servers fetched in parallel and merged newest first
+
+    Use when user asks what happened to a server, or for a timeline of several servers during an incident.
+
     Args:
         instance_name: Name or ID of the server instance
-        limit: Maximum number of events to return (default: 50)
-    
+        limit: Maximum number of actions to return per server (default: 50)
+        instance_names: Comma-separated server names or IDs for a merged timeline (replaces instance_name)
+        since: Only actions started at or after this ISO 8601 time, e.g. "2024-05-01T12:00:00Z" (optional)
+        include_events: Include the events of each action (default: True)
+
     Returns:
         JSON string with server events information
     """
     try:
-        logger.info(f"Getting events for server: {instance_name}")
-        
-        events_result = _get_server_events(instance_name=instance_name, limit=limit)
-        
+        names = [name.strip() for name in instance_names.split(",") if name.strip()]
+        if not names and not instance_name.strip():
+            return "Error: instance_name or instance_names is required"
+        logger.info(f"Getting events for server(s): {', '.join(names) if names else instance_name}")
+
+        events_result = _get_server_events(instance_name=instance_name.strip(), limit=limit,
+                                           instance_names=names, since=since.strip(),
+                                           include_events=include_events)
+
         response = {
             "timestamp": datetime.now().isoformat(),
             "operation": "get_server_events",
             "parameters": {
                 "instance_name": instance_name,
-                "limit": limit
+                "instance_names": names,
+                "limit": limit,
+                "since": since or None,
+                "include_events": include_events
             },
             "result": events_result
         }
-        
+
         return json.dumps(response, indent=2, ensure_ascii=False)
-        
+
     except Exception as e:
         error_msg = f"Error: Failed to get server events - {str(e)}"
         logger.error(error_msg)
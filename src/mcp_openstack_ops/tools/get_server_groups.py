@@ -6,10 +6,12 @@ from ..functions import get_server_groups as _get_server_groups
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_server_groups() -> str:
+@run_in_tool_worker
+def get_server_groups() -> str:
     """
     List all server groups with their details
     
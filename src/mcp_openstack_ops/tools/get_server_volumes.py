@@ -2,35 +2,50 @@
 
 import json
 from datetime import datetime
-from ..functions import get_server_volumes as _get_server_volumes
+from ..functions import get_server_volumes as _get_server_volumes, get_server_volume_map as _get_server_volume_map
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_server_volumes(
-    instance_name: str
+@run_in_tool_worker
+def get_server_volumes(
+    instance_name: str = "",
+    all_servers: bool = False
 ) -> str:
     """
-    Get all volumes attached to a specific server
+    Get all volumes attached to a specific server, or a server -> volumes map of the whole project
+    
+    Functions:
+    - Look up the server directly by ID or exact name
+    - Fetch the details of its attached volumes concurrently
+    - Project mode: every server with its attached volumes from one server and one volume listing
     
     Args:
         instance_name: Name or ID of the server instance
+        all_servers: Map all servers of the current project to their volumes (replaces instance_name)
     
     Returns:
         JSON string with server volumes information
     """
     try:
-        logger.info(f"Getting volumes for server: {instance_name}")
-        
-        volumes_result = _get_server_volumes(instance_name=instance_name)
+        if all_servers:
+            logger.info("Getting volumes of all servers")
+            volumes_result = _get_server_volume_map()
+        elif instance_name.strip():
+            logger.info(f"Getting volumes for server: {instance_name}")
+            volumes_result = _get_server_volumes(instance_name=instance_name.strip())
+        else:
+            return "Error: instance_name is required unless all_servers is true"
         
         response = {
             "timestamp": datetime.now().isoformat(),
             "operation": "get_server_volumes",
             "parameters": {
-                "instance_name": instance_name
+                "instance_name": instance_name,
+                "all_servers": all_servers
             },
             "result": volumes_result
         }
@@ -2,31 +2,39 @@
 
 import json
 from datetime import datetime
+from ..circuit_breaker import get_open_circuits
 from ..functions import get_service_status as _get_service_status
+from ..services.core import get_service_status as _get_api_status
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_service_status() -> str:
+@run_in_tool_worker
+def get_service_status(allow_stale: bool = False) -> str:
     """
     Provides status and health check information for each OpenStack service.
     
     Functions:
     - Check active status of all OpenStack services
-    - Verify API endpoint responsiveness for each service
+    - Verify API endpoint responsiveness for each service (probed concurrently, p50 latency)
     - Collect detailed status and version information per service
     - Detect and report service failures or error conditions
     
     Use when user requests service status, API status, health checks, or service troubleshooting.
     
+    Args:
+        allow_stale: Return the last cached API probe results immediately (refreshed in the background); use for frequent dashboard polling
+    
     Returns:
         Service status information in JSON format with service details and health summary.
     """
     try:
         logger.info("Fetching OpenStack service status")
         services = _get_service_status()
+        api_endpoints = _get_api_status(allow_stale=allow_stale)
         
         # services is a list, not a dict
         enabled_services = [s for s in services if s.get('status') == 'enabled']
@@ -35,13 +43,21 @@ async def get_service_status() -> str:
         result = {
             "timestamp": datetime.now().isoformat(),
             "service_status": services,
+            "api_endpoints": api_endpoints,
             "summary": {
                 "total_services": len(services),
                 "enabled_services": len(enabled_services),
                 "running_services": len(running_services),
-                "service_types": list(set(s.get('service_type', 'unknown') for s in services))
+                "service_types": list(set(s.get('service_type', 'unknown') for s in services)),
+                "available_apis": [name for name, status in api_endpoints.items()
+                                   if isinstance(status, dict) and status.get('available')]
             }
         }
+
+        # Services skipped because their circuit breaker is open
+        open_circuits = get_open_circuits()
+        if open_circuits:
+            result["degraded_services"] = open_circuits
         
         return json.dumps(result, indent=2, ensure_ascii=False)
         
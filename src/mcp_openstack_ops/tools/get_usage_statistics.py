@@ -6,38 +6,44 @@ from ..functions import get_usage_statistics as _get_usage_statistics
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_usage_statistics(start_date: str = "", end_date: str = "") -> str:
+@run_in_tool_worker
+def get_usage_statistics(start_date: str = "", end_date: str = "", all_projects: bool = False) -> str:
     """
     Get usage statistics for projects (similar to 'openstack usage list' command).
     
     Functions:
-    - Show project usage statistics over a specified time period
-    - Display servers, RAM MB-Hours, CPU Hours, and Disk GB-Hours
-    - Provide detailed server usage breakdown when available
-    - Calculate usage summary across all projects
+    - Show project usage statistics over a specified time period (Nova os-simple-tenant-usage)
+    - Display server hours, vCPU-Hours, RAM MB-Hours, and Disk GB-Hours
+    - Break usage down per flavor and per instance (largest consumers first)
+    - Calculate usage summary across all projects (requires an admin role on the token)
+    - Include current network (networks, subnets, ports, floating IPs) and storage (volumes, snapshots) counts
+    - Finished months are served from an on-disk cache, so repeated reports are instant
     
     Use when user requests usage statistics, billing information, resource consumption analysis, or project usage reports.
     
     Args:
         start_date: Start date in YYYY-MM-DD format (optional, defaults to 30 days ago)
-        end_date: End date in YYYY-MM-DD format (optional, defaults to today)
+        end_date: End date in YYYY-MM-DD format, inclusive (optional, defaults to today)
+        all_projects: Report usage of all projects instead of the current project (requires an admin role)
         
     Returns:
         Usage statistics in JSON format with project usage data, server details, and summary information.
     """
     try:
         logger.info(f"Fetching usage statistics from {start_date or 'default'} to {end_date or 'default'}")
-        usage_stats = _get_usage_statistics(start_date=start_date, end_date=end_date)
+        usage_stats = _get_usage_statistics(start_date=start_date, end_date=end_date, all_projects=all_projects)
         
         response = {
             "timestamp": datetime.now().isoformat(),
             "operation": "get_usage_statistics",
             "parameters": {
                 "start_date": start_date or "auto (30 days ago)",
-                "end_date": end_date or "auto (today)"
+                "end_date": end_date or "auto (today)",
+                "all_projects": all_projects
             },
             "usage_data": usage_stats
         }
@@ -6,10 +6,12 @@ from ..functions import get_user_list as _get_user_list
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_user_list() -> str:
+@run_in_tool_worker
+def get_user_list() -> str:
     """
     Get list of OpenStack users in the current domain.
     
@@ -6,10 +6,12 @@ from ..functions import get_volume_list as _get_volume_list
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_volume_list() -> str:
+@run_in_tool_worker
+def get_volume_list() -> str:
     """
     Get list of all volumes with detailed information.
     
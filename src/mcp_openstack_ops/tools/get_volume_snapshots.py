@@ -6,10 +6,12 @@ from ..functions import get_volume_snapshots as _get_volume_snapshots
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_volume_snapshots() -> str:
+@run_in_tool_worker
+def get_volume_snapshots() -> str:
     """
     Get list of volume snapshots.
     
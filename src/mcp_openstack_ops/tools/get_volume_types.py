@@ -6,10 +6,12 @@ from ..functions import get_volume_types as _get_volume_types
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 
 @mcp.tool()
-async def get_volume_types() -> str:
+@run_in_tool_worker
+def get_volume_types() -> str:
     """
     Get list of volume types with their specifications.
     
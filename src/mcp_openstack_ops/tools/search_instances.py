@@ -5,11 +5,13 @@ from datetime import datetime
 from ..mcp_main import (
     logger,
     mcp,
+    run_in_tool_worker,
 )
 from ..services.compute import search_instances as _search_instances
 
 @mcp.tool()
-async def search_instances(
+@run_in_tool_worker
+def search_instances(
     search_term: str, 
     search_in: str = "name",
     limit: int = 50,
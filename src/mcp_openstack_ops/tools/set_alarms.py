@@ -5,10 +5,12 @@ from ..functions import set_alarms as _set_alarms
 from ..mcp_main import (
     _is_modify_operation_allowed,
     conditional_tool,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_alarms(
+@run_in_tool_worker
+def set_alarms(
     action: str,
     alarm_name: str = "",
     resource_id: str = "",
@@ -2,10 +2,11 @@
 
 import json
 from ..functions import set_compute_agents as _set_compute_agents
-from ..mcp_main import conditional_tool
+from ..mcp_main import conditional_tool, run_in_tool_worker
 
 @conditional_tool
-async def set_compute_agents(
+@run_in_tool_worker
+def set_compute_agents(
     action: str,
     agent_id: str = "",
     host: str = ""
@@ -5,10 +5,12 @@ from ..functions import set_domains as _set_domains
 from ..mcp_main import (
     _is_modify_operation_allowed,
     conditional_tool,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_domains(
+@run_in_tool_worker
+def set_domains(
     action: str,
     domain_name: str = "",
     description: str = "",
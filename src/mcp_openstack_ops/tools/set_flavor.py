@@ -6,10 +6,12 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_flavor(
+@run_in_tool_worker
+def set_flavor(
     flavor_name: str,
     action: str,
     vcpus: Optional[int] = None,
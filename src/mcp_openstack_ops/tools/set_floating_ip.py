@@ -5,10 +5,12 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_floating_ip(action: str, floating_network_id: str = "", port_id: str = "", floating_ip_id: str = "", 
+@run_in_tool_worker
+def set_floating_ip(action: str, floating_network_id: str = "", port_id: str = "", floating_ip_id: str = "", 
                          floating_ip_address: str = "", description: str = "") -> str:
     """
     Manage floating IPs (create, delete, associate, disassociate, set, show, unset, list).
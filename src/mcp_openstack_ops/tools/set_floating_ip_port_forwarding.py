@@ -6,10 +6,12 @@ from ..functions import set_floating_ip_port_forwarding as _set_floating_ip_port
 from ..mcp_main import (
     conditional_tool,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_floating_ip_port_forwarding(
+@run_in_tool_worker
+def set_floating_ip_port_forwarding(
     action: str,
     floating_ip_id: str = "",
     floating_ip_address: str = "",
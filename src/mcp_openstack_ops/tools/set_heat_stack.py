@@ -7,10 +7,12 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_heat_stack(stack_names: str, action: str, template: str = "", parameters: str = "") -> str:
+@run_in_tool_worker
+def set_heat_stack(stack_names: str, action: str, template: str = "", parameters: str = "") -> str:
     """
     Manage Heat orchestration stacks (create, delete, update).
     Supports both single stack and bulk operations.
@@ -5,10 +5,12 @@ from ..functions import set_identity_groups as _set_identity_groups
 from ..mcp_main import (
     _is_modify_operation_allowed,
     conditional_tool,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_identity_groups(
+@run_in_tool_worker
+def set_identity_groups(
     action: str,
     group_name: str = "",
     description: str = "",
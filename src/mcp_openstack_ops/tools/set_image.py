@@ -8,10 +8,12 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_image(image_names: str, action: str, container_format: str = "bare", disk_format: str = "qcow2", 
+@run_in_tool_worker
+def set_image(image_names: str, action: str, container_format: str = "bare", disk_format: str = "qcow2", 
                    visibility: str = "private", min_disk: int = 0, min_ram: int = 0, properties: str = "{}") -> str:
     """
     Manage images (create, delete, update, list).
@@ -5,10 +5,12 @@ from ..functions import set_image_visibility as _set_image_visibility
 from ..mcp_main import (
     _is_modify_operation_allowed,
     conditional_tool,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_image_visibility(
+@run_in_tool_worker
+def set_image_visibility(
     action: str,
     image_name: str,
     visibility: str = ""
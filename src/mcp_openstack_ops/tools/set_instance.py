@@ -11,11 +11,13 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 from ..services.compute import search_instances as _search_instances
 
 @conditional_tool
-async def set_instance(
+@run_in_tool_worker
+def set_instance(
     instance_names: str = "", 
     action: str = "",
     # Filtering parameters for automatic target identification
@@ -10,10 +10,12 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_keypair(
+@run_in_tool_worker
+def set_keypair(
     action: str,
     keypair_names: str = "",
     # Filtering parameters for automatic target identification  
@@ -6,10 +6,12 @@ from ..functions import set_load_balancer_availability_zone as _set_load_balance
 from ..mcp_main import (
     conditional_tool,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_load_balancer_availability_zone(
+@run_in_tool_worker
+def set_load_balancer_availability_zone(
     action: str,
     az_name: str = "",
     name: str = "",
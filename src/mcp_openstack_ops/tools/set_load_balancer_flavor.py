@@ -6,10 +6,12 @@ from ..functions import set_load_balancer_flavor as _set_load_balancer_flavor
 from ..mcp_main import (
     conditional_tool,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_load_balancer_flavor(
+@run_in_tool_worker
+def set_load_balancer_flavor(
     action: str,
     flavor_name_or_id: str = "",
     name: str = "",
@@ -6,10 +6,12 @@ from ..functions import set_load_balancer_l7_rule as _set_load_balancer_l7_rule
 from ..mcp_main import (
     conditional_tool,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_load_balancer_l7_rule(
+@run_in_tool_worker
+def set_load_balancer_l7_rule(
     action: str,
     policy_name_or_id: str = "",
     rule_id: str = "",
@@ -7,10 +7,12 @@ from ..mcp_main import (
     _is_modify_operation_allowed,
     conditional_tool,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_load_balancer_listener(
+@run_in_tool_worker
+def set_load_balancer_listener(
     action: str,
     listener_name_or_id: str = "",
     name: str = "",
@@ -5,10 +5,12 @@ from datetime import datetime
 from ..mcp_main import (
     conditional_tool,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_load_balancer_pool_member(
+@run_in_tool_worker
+def set_load_balancer_pool_member(
     action: str,
     pool_name_or_id: str,
     member_id: str = "",
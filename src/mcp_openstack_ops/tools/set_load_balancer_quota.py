@@ -6,10 +6,12 @@ from ..functions import set_load_balancer_quota as _set_load_balancer_quota
 from ..mcp_main import (
     conditional_tool,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_load_balancer_quota(
+@run_in_tool_worker
+def set_load_balancer_quota(
     action: str,
     project_id: str = "",
     load_balancer: int = -1,
@@ -2,10 +2,11 @@
 
 import json
 from ..functions import set_metrics as _set_metrics
-from ..mcp_main import conditional_tool
+from ..mcp_main import conditional_tool, run_in_tool_worker
 
 @conditional_tool
-async def set_metrics(
+@run_in_tool_worker
+def set_metrics(
     action: str,
     resource_type: str = "compute",
     resource_id: str = ""
@@ -5,10 +5,12 @@ from ..functions import set_network_agents as _set_network_agents
 from ..mcp_main import (
     _is_modify_operation_allowed,
     conditional_tool,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_network_agents(
+@run_in_tool_worker
+def set_network_agents(
     action: str,
     agent_id: str = ""
 ) -> str:
@@ -11,10 +11,12 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_networks(
+@run_in_tool_worker
+def set_networks(
     action: str,
     network_names: str = "",
     # Filtering parameters for automatic target identification  
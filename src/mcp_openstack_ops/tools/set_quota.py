@@ -5,10 +5,12 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_quota(
+@run_in_tool_worker
+def set_quota(
     project_name: str, 
     action: str, 
     cores: int = None,
@@ -0,0 +1,48 @@
+"""Tool implementation for set_quota_bulk."""
+
+import json
+from ..functions import set_quota_bulk as _set_quota_bulk
+from ..mcp_main import (
+    conditional_tool,
+    logger,
+    run_in_tool_worker,
+)
+
+@conditional_tool
+@run_in_tool_worker
+def set_quota_bulk(quotas: str, projects: str = "", pattern: str = "", dry_run: bool = True) -> str:
+    """
+    Sets the same quota limits on many projects at once, with a diff / dry run.
+    
+    Functions:
+    - Select projects by comma-separated names/IDs and/or a name pattern (e.g. "team-*")
+    - Read current compute, network and volume quotas concurrently and diff them against the new limits
+    - Dry run (default): report which limits would change
+    - Apply: send one update per project and service with only the changed limits
+    
+    Use when user requests quota changes for several projects ("raise cores to 64 for all team-* projects").
+    Always run with dry_run=True first and show the diff before applying.
+    
+    Args:
+        quotas: New limits as "key=value,..." (e.g. "cores=64,ram=131072,gigabytes=2000") or JSON object.
+                Keys: instances, cores, ram, key_pairs, metadata_items, server_groups, server_group_members,
+                networks, subnets, ports, routers, floating_ips, security_groups, security_group_rules,
+                volumes, snapshots, gigabytes, backups, backup_gigabytes (-1 = unlimited)
+        projects: Comma-separated project names or IDs
+        pattern: Shell-style project name pattern, e.g. "team-*"
+        dry_run: Only show the changes (default: True); False applies them
+    
+    Returns:
+        Diff table in JSON format (project, service, quota, current, new, status) with a summary.
+    """
+    try:
+        logger.info(f"Bulk quota {'dry run' if dry_run else 'update'}: quotas={quotas}, "
+                    f"projects={projects or '-'}, pattern={pattern or '-'}")
+        result = _set_quota_bulk(quotas, projects.strip(), pattern.strip(), dry_run)
+        
+        return json.dumps(result, indent=2, ensure_ascii=False)
+        
+    except Exception as e:
+        error_msg = f"Error: Failed to update quotas - {str(e)}"
+        logger.error(error_msg)
+        return error_msg
@@ -5,10 +5,12 @@ from ..functions import set_roles as _set_roles
 from ..mcp_main import (
     _is_modify_operation_allowed,
     conditional_tool,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_roles(
+@run_in_tool_worker
+def set_roles(
     action: str,
     role_name: str = "",
     description: str = "",
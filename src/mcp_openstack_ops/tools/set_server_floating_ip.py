@@ -7,10 +7,12 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_server_floating_ip(
+@run_in_tool_worker
+def set_server_floating_ip(
     instance_name: str,
     action: str,
     floating_ip: str,
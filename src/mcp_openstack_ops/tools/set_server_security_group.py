@@ -7,10 +7,12 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_server_security_group(
+@run_in_tool_worker
+def set_server_security_group(
     instance_name: str,
     action: str,
     security_group: str
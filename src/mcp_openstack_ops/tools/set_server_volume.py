@@ -6,10 +6,12 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_server_volume(
+@run_in_tool_worker
+def set_server_volume(
     instance_name: str,
     action: str,
     volume_id: Optional[str] = None,
@@ -2,10 +2,11 @@
 
 import json
 from ..functions import set_service_logs as _set_service_logs
-from ..mcp_main import conditional_tool
+from ..mcp_main import conditional_tool, run_in_tool_worker
 
 @conditional_tool
-async def set_service_logs(
+@run_in_tool_worker
+def set_service_logs(
     action: str,
     service_name: str = "",
     log_level: str = "INFO"
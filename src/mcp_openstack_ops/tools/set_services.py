@@ -2,10 +2,11 @@
 
 import json
 from ..functions import set_services as _set_services
-from ..mcp_main import conditional_tool
+from ..mcp_main import conditional_tool, run_in_tool_worker
 
 @conditional_tool
-async def set_services(
+@run_in_tool_worker
+def set_services(
     action: str,
     service_name: str = ""
 ) -> str:
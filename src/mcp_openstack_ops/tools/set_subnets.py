@@ -5,10 +5,12 @@ from ..functions import set_subnets as _set_subnets
 from ..mcp_main import (
     _is_modify_operation_allowed,
     conditional_tool,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_subnets(
+@run_in_tool_worker
+def set_subnets(
     action: str,
     subnet_name: str = "",
     network_id: str = "",
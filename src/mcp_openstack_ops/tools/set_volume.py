@@ -7,10 +7,12 @@ from ..mcp_main import (
     conditional_tool,
     handle_operation_result,
     logger,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_volume(volume_names: str, action: str, size: int = 1, instance_name: str = "", 
+@run_in_tool_worker
+def set_volume(volume_names: str, action: str, size: int = 1, instance_name: str = "", 
                    new_size: int = 0, source_volume: str = "", backup_name: str = "",
                    snapshot_name: str = "", transfer_name: str = "", host: str = "",
                    description: str = "", volume_type: str = "", availability_zone: str = "",
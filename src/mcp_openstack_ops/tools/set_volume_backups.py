@@ -5,10 +5,12 @@ from ..functions import set_volume_backups as _set_volume_backups
 from ..mcp_main import (
     _is_modify_operation_allowed,
     conditional_tool,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_volume_backups(
+@run_in_tool_worker
+def set_volume_backups(
     action: str,
     backup_name: str = "",
     volume_name: str = "",
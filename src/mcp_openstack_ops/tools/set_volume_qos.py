@@ -5,10 +5,12 @@ from ..functions import set_volume_qos as _set_volume_qos
 from ..mcp_main import (
     _is_modify_operation_allowed,
     conditional_tool,
+    run_in_tool_worker,
 )
 
 @conditional_tool
-async def set_volume_qos(
+@run_in_tool_worker
+def set_volume_qos(
     action: str,
     qos_name: str = "",
     consumer: str = "back-end",
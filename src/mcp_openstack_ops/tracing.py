@@ -0,0 +1,197 @@
+"""
+Per-Invocation Upstream Call Tracing
+
+Opt-in debug mode (MCP_TRACE_ENABLE) that records every upstream HTTP call
+made during one tool invocation - method, service, path template, status,
+start offset, duration, response bytes, attempts and whether the response was
+shared with a concurrent identical request (cache hit). TracingMiddleware
+attaches a compact summary to the tool result's metadata (``_meta.trace``):
+
+- call count, bytes and time per endpoint (method + path template), which
+  makes N+1 patterns such as one GET /images/{id} per server stand out
+- total wall time vs. time spent in upstream calls
+- the critical path: the chain of sequential calls that determined the wall
+  time (calls overlapping with it ran in parallel), its slowest steps listed
+
+The individual calls are only included with MCP_TRACE_INCLUDE_CALLS, so the
+metadata stays small by default.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from .request_pipeline import PipelineRequest
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CALLS = 200
+
+# Critical path steps listed in the summary (slowest first chosen, kept in call order)
+MAX_CRITICAL_PATH_STEPS = 10
+
+# Path segments replaced by {id} in path templates: UUIDs, hex IDs, numbers
+_ID_SEGMENT = re.compile(r"^([0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}"
+                         r"|[0-9a-fA-F]{32,64}|\d+)$")
+# API version prefixes dropped from templates (v2.1, v3, v2.0, ...)
+_VERSION_SEGMENT = re.compile(r"^v\d+(\.\d+)?$")
+
+
+class CallTrace:
+    """Upstream calls recorded during one tool invocation."""
+
+    def __init__(self, max_calls: int):
+        self.started = time.monotonic()
+        self.max_calls = max_calls
+        self.calls: List[Dict[str, Any]] = []
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def add(self, call: Dict[str, Any]) -> None:
+        with self._lock:
+            if len(self.calls) < self.max_calls:
+                self.calls.append(call)
+            else:
+                self.dropped += 1
+
+
+_trace: ContextVar[Optional[CallTrace]] = ContextVar("mcp_call_trace", default=None)
+
+
+def is_tracing_enabled() -> bool:
+    """Check whether per-invocation call tracing is enabled via MCP_TRACE_ENABLE."""
+    return os.environ.get("MCP_TRACE_ENABLE", "false").strip().lower() in ("true", "1", "yes", "on")
+
+
+def is_call_listing_enabled() -> bool:
+    """Check whether the individual calls are attached to the summary (MCP_TRACE_INCLUDE_CALLS)."""
+    return os.environ.get("MCP_TRACE_INCLUDE_CALLS", "false").strip().lower() in ("true", "1", "yes", "on")
+
+
+def _get_max_calls() -> int:
+    try:
+        return max(1, int(os.environ.get("MCP_TRACE_MAX_CALLS", DEFAULT_MAX_CALLS)))
+    except ValueError:
+        return DEFAULT_MAX_CALLS
+
+
+@contextmanager
+def trace_scope():
+    """
+    Record upstream calls made in the enclosed code.
+
+    Yields:
+        The CallTrace collecting the calls
+    """
+    trace = CallTrace(_get_max_calls())
+    token = _trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _trace.reset(token)
+
+
+def path_template(url: str) -> str:
+    """Reduce a request URL to its path with IDs replaced by {id}, e.g. /servers/{id}/os-interface."""
+    path = urlparse(url).path if '://' in url else url.split('?', 1)[0]
+    segments = []
+    for segment in path.split('/'):
+        if not segment or _VERSION_SEGMENT.match(segment):
+            continue
+        segments.append('{id}' if _ID_SEGMENT.match(segment) else segment)
+    return '/' + '/'.join(segments)
+
+
+def trace_interceptor(request: PipelineRequest, call_next):
+    """Pipeline interceptor adding each upstream call to the invocation's trace."""
+    trace = _trace.get()
+    if trace is None:
+        return call_next(request)
+
+    started = time.monotonic()
+    status: Any = None
+    size = 0
+    try:
+        response = call_next(request)
+        status = response.status_code
+        length = response.headers.get('Content-Length')
+        if length and length.isdigit():
+            size = int(length)
+        elif not request.kwargs.get('stream'):
+            size = len(response.content or b'')
+        return response
+    except Exception as e:
+        status = getattr(e, 'http_status', None) or type(e).__name__
+        raise
+    finally:
+        finished = time.monotonic()
+        trace.add({
+            'method': request.method,
+            'service': request.service_type,
+            'path': path_template(request.url),
+            'status': status,
+            'start_ms': round((started - trace.started) * 1000, 1),
+            'duration_ms': round((finished - started) * 1000, 1),
+            'bytes': size,
+            'attempts': request.attempts,
+            'cache': 'hit' if request.attempts == 0 and isinstance(status, int) else 'miss',
+        })
+
+
+def _critical_path(calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Walk back from the last call to finish, each step taking the latest call that ended before it started."""
+    remaining = sorted(calls, key=lambda c: c['start_ms'] + c['duration_ms'])
+    path = []
+    while remaining:
+        call = remaining.pop()
+        path.append(call)
+        remaining = [c for c in remaining if c['start_ms'] + c['duration_ms'] <= call['start_ms']]
+    return list(reversed(path))
+
+
+def summarize_trace(trace: CallTrace) -> Dict[str, Any]:
+    """
+    Build the compact summary attached to the tool response.
+
+    Returns:
+        Dict with totals, per-endpoint counts, the critical path's slowest steps
+        and (with MCP_TRACE_INCLUDE_CALLS) the individual calls
+    """
+    with trace._lock:
+        calls = list(trace.calls)
+        dropped = trace.dropped
+
+    endpoints: Dict[str, Dict[str, Any]] = {}
+    for call in calls:
+        key = f"{call['method']} {call['service']} {call['path']}"
+        endpoint = endpoints.setdefault(key, {'calls': 0, 'cache_hits': 0, 'total_ms': 0.0, 'bytes': 0})
+        endpoint['calls'] += 1
+        endpoint['cache_hits'] += call['cache'] == 'hit'
+        endpoint['total_ms'] = round(endpoint['total_ms'] + call['duration_ms'], 1)
+        endpoint['bytes'] += call['bytes']
+
+    critical_path = _critical_path(calls)
+    slowest = sorted(range(len(critical_path)), key=lambda i: -critical_path[i]['duration_ms'])
+    listed_steps = [critical_path[i] for i in sorted(slowest[:MAX_CRITICAL_PATH_STEPS])]
+    summary = {
+        'upstream_calls': len(calls) + dropped,
+        'wall_time_ms': round((time.monotonic() - trace.started) * 1000, 1),
+        'upstream_time_ms': round(sum(c['duration_ms'] for c in calls), 1),
+        'bytes': sum(c['bytes'] for c in calls),
+        'cache_hits': sum(1 for c in calls if c['cache'] == 'hit'),
+        'endpoints': dict(sorted(endpoints.items(), key=lambda item: -item[1]['calls'])),
+        'critical_path_ms': round(sum(c['duration_ms'] for c in critical_path), 1),
+        'critical_path_steps': len(critical_path),
+        'critical_path': [f"{c['method']} {c['path']} ({c['duration_ms']}ms)" for c in listed_steps],
+    }
+    if is_call_listing_enabled():
+        summary['calls'] = calls
+        summary['calls_not_recorded'] = dropped
+    return summary
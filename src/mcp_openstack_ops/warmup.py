@@ -0,0 +1,168 @@
+"""
+OpenStack Connection Warm-up
+
+Optional background warm-up executed at server start. It authenticates against
+Keystone and touches every configured service endpoint concurrently so that
+catalog parsing and endpoint version discovery are already done when the first
+tool call arrives. The readiness state is exposed for health checks.
+
+If authentication fails (e.g. Keystone not reachable yet while the cloud is
+booting) the warm-up retries with exponential backoff, so the readiness state
+recovers on its own instead of staying 'failed'.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .concurrency import run_in_parallel
+from .connection import connection_lease, get_openstack_connection, persist_connection_state
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Service proxy attribute -> service type reported in the readiness state
+WARMUP_SERVICES = {
+    'compute': 'compute',
+    'network': 'network',
+    'volume': 'block-storage',
+    'image': 'image',
+    'placement': 'placement',
+    'orchestration': 'orchestration',
+    'load_balancer': 'load-balancer',
+}
+
+# Backoff between authentication attempts while the warm-up fails
+WARMUP_RETRY_INITIAL_DELAY = 2.0
+WARMUP_RETRY_MAX_DELAY = 60.0
+
+_state_lock = threading.Lock()
+_warmup_thread: Optional[threading.Thread] = None
+_warmup_state: Dict[str, Any] = {
+    'enabled': False,
+    'status': 'disabled',
+    'started_at': None,
+    'finished_at': None,
+    'duration_seconds': None,
+    'services': {},
+    'error': None,
+    'attempts': 0,
+}
+
+
+def _update_state(**changes: Any) -> None:
+    with _state_lock:
+        _warmup_state.update(changes)
+
+
+def _touch_service(conn, service_attr: str) -> Dict[str, Any]:
+    """Instantiate the service proxy and resolve its endpoint (runs version discovery)."""
+    started = time.monotonic()
+    proxy = getattr(conn, service_attr)
+    endpoint = proxy.get_endpoint()
+    try:
+        endpoint_data = proxy.get_endpoint_data()
+        api_version = getattr(endpoint_data, 'api_version', None)
+    except Exception as e:
+        # Endpoint resolved but discovery document unavailable - still usable
+        logger.debug(f"Version discovery failed for {service_attr}: {e}")
+        api_version = None
+    return {
+        'ready': True,
+        'endpoint': endpoint,
+        'api_version': '.'.join(str(v) for v in api_version) if api_version else 'unknown',
+        'latency_ms': round((time.monotonic() - started) * 1000, 1),
+    }
+
+
+def _authenticate_with_retry(started: float):
+    """Get a connection, retrying with exponential backoff until authentication succeeds."""
+    delay = WARMUP_RETRY_INITIAL_DELAY
+    attempts = 0
+    while True:
+        attempts += 1
+        _update_state(attempts=attempts)
+        try:
+            return get_openstack_connection()
+        except Exception as e:
+            logger.error(f"Warm-up failed during authentication (attempt {attempts}), retrying in {delay:.0f}s: {e}")
+            _update_state(status='failed', error=f'Authentication failed: {str(e)}',
+                          finished_at=datetime.now().isoformat(),
+                          duration_seconds=round(time.monotonic() - started, 3))
+            time.sleep(delay)
+            delay = min(delay * 2, WARMUP_RETRY_MAX_DELAY)
+            _update_state(status='warming', finished_at=None, duration_seconds=None)
+
+
+def _run_warmup() -> None:
+    # Keep the connection open while its endpoints are touched, even if the pool evicts it
+    with connection_lease():
+        _warm_up()
+
+
+def _warm_up() -> None:
+    started = time.monotonic()
+    _update_state(status='warming', started_at=datetime.now().isoformat(), error=None, services={}, attempts=0)
+
+    conn = _authenticate_with_retry(started)
+
+    services: Dict[str, Any] = {}
+    for service_attr, result, error in run_in_parallel(lambda attr: _touch_service(conn, attr),
+                                                       WARMUP_SERVICES.keys(),
+                                                       max_workers=len(WARMUP_SERVICES)):
+        service_type = WARMUP_SERVICES[service_attr]
+        if error is not None:
+            logger.warning(f"Warm-up could not reach {service_type}: {error}")
+            services[service_type] = {'ready': False, 'error': str(error)}
+        else:
+            services[service_type] = result
+
+    # Let the next process skip the discovery calls made above
+    persist_connection_state()
+
+    duration = round(time.monotonic() - started, 3)
+    ready_count = len([s for s in services.values() if s.get('ready')])
+    logger.info(f"Warm-up finished in {duration}s: {ready_count}/{len(services)} service endpoints ready")
+
+    # Authentication succeeded, so the server is usable even if an optional
+    # service (e.g. Octavia or Heat) is not deployed.
+    _update_state(status='ready', services=services, error=None,
+                  finished_at=datetime.now().isoformat(), duration_seconds=duration)
+
+
+def start_background_warmup() -> threading.Thread:
+    """
+    Start the warm-up in a daemon thread. Safe to call more than once.
+
+    Returns:
+        The warm-up thread
+    """
+    global _warmup_thread
+
+    with _state_lock:
+        if _warmup_thread is not None and _warmup_thread.is_alive():
+            return _warmup_thread
+        _warmup_state['enabled'] = True
+        _warmup_state['status'] = 'pending'
+        _warmup_thread = threading.Thread(target=_run_warmup, name="mcp-openstack-warmup", daemon=True)
+        _warmup_thread.start()
+
+    logger.info("Background connection warm-up started")
+    return _warmup_thread
+
+
+def get_warmup_status() -> Dict[str, Any]:
+    """
+    Get a snapshot of the warm-up readiness state.
+
+    Returns:
+        Dict with 'status' (disabled, pending, warming, ready, failed), timing, authentication
+        attempts and per-service results. 'failed' is temporary: authentication is retried with backoff.
+    """
+    with _state_lock:
+        snapshot = dict(_warmup_state)
+        snapshot['services'] = dict(_warmup_state['services'])
+    snapshot['healthy'] = snapshot['status'] in ('disabled', 'ready')
+    return snapshot